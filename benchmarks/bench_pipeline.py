@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark of the video pipeline on a synthetic episode.
+
+Builds slide PNGs, a PDF, thumbnail, last slide and audio in a scratch
+project, then runs each stage (prepare_slides, generate_concat,
+generate_video, verification) in its own child process. Per stage it
+records wall time, CPU time (including ffmpeg children), peak RSS and
+output bytes.
+
+A fixed SHA-256 workload is timed as calibration. CPU times divided by it
+("normalized") can be compared between machines; raw numbers can only be
+compared on the same host.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+SCRIPT_DIR = BENCH_DIR.parent
+SCRIPTS_DIR = SCRIPT_DIR / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from benchmark_encoding import make_audio, make_slides  # noqa: E402
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+EPISODE = "99-synthetic"
+STAGES = ["prepare", "concat", "video", "verify"]
+CALIBRATION_BYTES = 256 * 1024 * 1024
+
+
+class Fixture:
+    """Paths of the scratch project used by all stages."""
+
+    def __init__(self, work_dir: Path):
+        self.work_dir = work_dir
+        self.youtube_dir = work_dir / "youtube"
+        self.assets_dir = self.youtube_dir / "pl"
+        self.slides_dir = self.assets_dir / "slides"
+        self.episode_dir = self.slides_dir / EPISODE
+        self.pdf = self.slides_dir / f"{EPISODE}.pdf"
+        self.audio = self.assets_dir / "audio" / f"{EPISODE}.m4a"
+        self.thumbnail = self.youtube_dir / "thumbnails" / f"{EPISODE}.png"
+        self.last_slide = self.slides_dir / "last-slide.png"
+        self.concat = self.episode_dir / "concat.txt"
+        self.video = self.youtube_dir / "output" / f"{EPISODE}.mp4"
+        self.meta = work_dir / "fixture.json"
+        self.logs = work_dir / "logs"
+
+
+def build_fixture(fixture: Fixture, slides: int, minutes: float) -> bool:
+    """Create synthetic inputs. Returns False if the PDF could not be built."""
+    for path in (fixture.slides_dir, fixture.audio.parent, fixture.thumbnail.parent):
+        path.mkdir(parents=True, exist_ok=True)
+    fixture.video.parent.mkdir(parents=True, exist_ok=True)
+    fixture.logs.mkdir(parents=True, exist_ok=True)
+
+    images = make_slides(fixture.work_dir / "source", slides + 2)
+    shutil.copy(images[0], fixture.thumbnail)
+    shutil.copy(images[-1], fixture.last_slide)
+    content = images[1:-1]
+    make_audio(fixture.audio, minutes * 60)
+
+    has_pdf = Image is not None
+    if has_pdf:
+        pages = [Image.open(p).convert("RGB") for p in content]
+        pages[0].save(fixture.pdf, save_all=True, append_images=pages[1:])
+    else:
+        # Without Pillow there is no way to build the PDF; start from PNGs
+        fixture.episode_dir.mkdir()
+        for i, image in enumerate(content, 1):
+            shutil.copy(image, fixture.episode_dir / f"slide-{i:02d}.png")
+        shutil.copy(fixture.thumbnail, fixture.episode_dir / "thumbnail.png")
+        shutil.copy(fixture.last_slide, fixture.episode_dir / "last-slide.png")
+
+    fixture.meta.write_text(json.dumps({"slides": slides, "seconds": minutes * 60}))
+    return has_pdf
+
+
+def run_stage(stage: str, fixture: Fixture, profile: str) -> int:
+    """Run one pipeline stage in this process (called in the child)."""
+    meta = json.loads(fixture.meta.read_text())
+
+    if stage == "prepare":
+        import prepare_slides
+
+        prepare_slides.SCRIPT_DIR = fixture.work_dir
+        prepare_slides.YOUTUBE_DIR = fixture.youtube_dir
+        prepare_slides.ASSETS_DIR = fixture.assets_dir
+        prepare_slides.THUMBNAILS_DIR = fixture.thumbnail.parent
+        prepare_slides.LAST_SLIDE = fixture.last_slide
+        return prepare_slides.prepare_episode(fixture.pdf, os.cpu_count() or 1, force=True)
+
+    if stage == "concat":
+        import generate_concat
+
+        generate_concat.SLIDES_BASE = fixture.slides_dir
+        # Intro and outro add 10s; content fills the rest of audio + 5s outro
+        slides = sorted(
+            fixture.episode_dir.glob("slide-*.png"), key=lambda p: int(p.stem.split("-")[1])
+        )
+        per_slide = round((meta["seconds"] - 5) / len(slides), 3)
+        durations = [(slide.stem, per_slide) for slide in slides]
+        fixture.concat.write_text(generate_concat.generate_concat(EPISODE, durations))
+        return 0
+
+    import generate_video
+
+    generate_video.SEGMENTS_DIR = fixture.work_dir / ".segments"
+    if stage == "video":
+        result = generate_video.generate_video(
+            fixture.concat, fixture.audio, fixture.video, profile=profile
+        )
+        print(result.stderr)
+        return result.returncode
+
+    if stage == "verify":
+        check = generate_video.analyze_video(fixture.video)
+        expected = meta["seconds"] + 5
+        print(check)
+        ok = abs(check.duration - expected) <= 0.5 and check.start_ok and check.end_ok
+        return 0 if ok else 1
+
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def output_bytes(stage: str, fixture: Fixture) -> int:
+    """Size of what a stage produced."""
+    if stage == "prepare":
+        return sum(p.stat().st_size for p in fixture.episode_dir.glob("*.png"))
+    if stage == "concat":
+        return fixture.concat.stat().st_size if fixture.concat.exists() else 0
+    if stage == "video":
+        return fixture.video.stat().st_size if fixture.video.exists() else 0
+    return 0
+
+
+def measure_stage(stage: str, fixture: Fixture, profile: str) -> dict:
+    """Run a stage in a child process and collect its resource usage."""
+    log_file = fixture.logs / f"{stage}.log"
+    cmd = [
+        sys.executable,
+        __file__,
+        "--run-stage",
+        stage,
+        "--keep",
+        str(fixture.work_dir),
+        "--profile",
+        profile,
+    ]
+    with log_file.open("w") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "stage": stage,
+        "returncode": proc.returncode,
+        "wall": round(wall, 3),
+        "cpu": round(usage.ru_utime + usage.ru_stime, 3),
+        "peak_rss": usage.ru_maxrss * rss_unit,
+        "output_bytes": output_bytes(stage, fixture),
+        "log": str(log_file),
+    }
+
+
+def calibrate() -> float:
+    """Time a fixed single-threaded hashing workload."""
+    block = b"\0" * (1024 * 1024)
+    digest = hashlib.sha256()
+    start = time.process_time()
+    for _ in range(CALIBRATION_BYTES // len(block)):
+        digest.update(block)
+    return time.process_time() - start
+
+
+def git_commit() -> str | None:
+    """Return current commit hash, if available."""
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=SCRIPT_DIR
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def ffmpeg_version() -> str | None:
+    """Return the first line of `ffmpeg -version`."""
+    try:
+        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    return result.stdout.splitlines()[0] if result.stdout else None
+
+
+def compare(results: dict, baseline: dict) -> list[str]:
+    """Describe per-stage change in normalized CPU and wall time vs. baseline."""
+    previous = {s["stage"]: s for s in baseline.get("stages", [])}
+    lines = []
+    for stage in results["stages"]:
+        old = previous.get(stage["stage"])
+        if not old or stage.get("skipped") or old.get("skipped"):
+            continue
+        cpu = stage["normalized_cpu"] / old["normalized_cpu"] if old["normalized_cpu"] else 0
+        wall = stage["wall"] / old["wall"] if old["wall"] else 0
+        lines.append(f"{stage['stage']:<8} cpu {cpu:>5.2f}x  wall {wall:>5.2f}x")
+    return lines
+
+
+def print_results(results: dict) -> None:
+    """Print a per-stage table."""
+    print()
+    print(f"{'stage':<8} {'wall':>8} {'cpu':>8} {'norm':>7} {'rss':>8} {'output':>10}")
+    print("━" * 54)
+    for s in results["stages"]:
+        if s.get("skipped"):
+            print(f"{s['stage']:<8} skipped: {s['skipped']}")
+            continue
+        status = "" if s["returncode"] == 0 else f"  ❌ see {s['log']}"
+        print(
+            f"{s['stage']:<8} {s['wall']:>7.2f}s {s['cpu']:>7.2f}s {s['normalized_cpu']:>7.2f} "
+            f"{s['peak_rss'] / 1e6:>6.0f}MB {s['output_bytes'] / 1e6:>8.2f}MB{status}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark prepare/concat/video/verify on a synthetic episode",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --slides 30 --minutes 30 --json results.json
+  %(prog)s --json new.json --compare old.json
+        """,
+    )
+    parser.add_argument("--slides", type=int, default=20, help="Content slides (default: 20)")
+    parser.add_argument(
+        "--minutes", type=float, default=5, help="Audio length in minutes (default: 5)"
+    )
+    parser.add_argument("--profile", default="default", help="generate_video encoding profile")
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="Previous JSON results to compare against")
+    parser.add_argument("--keep", type=Path, help="Build fixture in this directory and keep it")
+    parser.add_argument("--run-stage", choices=STAGES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        return run_stage(args.run_stage, Fixture(args.keep), args.profile)
+
+    work_dir = args.keep or Path(tempfile.mkdtemp(prefix="bench-pipeline-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    fixture = Fixture(work_dir)
+    try:
+        print(f"🧪 Fixture: {args.slides} slides, {args.minutes:g} min audio")
+        has_pdf = build_fixture(fixture, args.slides, args.minutes)
+        calibration = calibrate()
+        print(f"   ⏱️  Calibration: {calibration:.3f}s")
+
+        stages = []
+        for stage in STAGES:
+            if stage == "prepare" and not has_pdf:
+                stages.append({"stage": stage, "skipped": "Pillow not installed"})
+                continue
+            print(f"🔄 {stage}...")
+            result = measure_stage(stage, fixture, args.profile)
+            result["normalized_cpu"] = round(result["cpu"] / calibration, 3)
+            stages.append(result)
+            if result["returncode"] != 0:
+                break
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "ffmpeg": ffmpeg_version(),
+        },
+        "fixture": {"slides": args.slides, "minutes": args.minutes, "profile": args.profile},
+        "calibration": round(calibration, 4),
+        "stages": stages,
+    }
+
+    print_results(results)
+    if args.compare:
+        print()
+        print(f"📈 Compared to {args.compare}:")
+        for line in compare(results, json.loads(args.compare.read_text())):
+            print(f"   {line}")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\n📄 Results written to {args.json}")
+
+    failed = any(s.get("returncode", 0) != 0 for s in stages)
+    return 1 if failed or len(stages) < len(STAGES) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ import json
 import logging
 import re
 import shutil
+import sys
 import tempfile
 
 from pathlib import Path
@@ -36,16 +37,35 @@ def _sort_papers_by_episode(papers: list[dict[str, Any]]) -> list[dict[str, Any]
     return sorted(papers, key=lambda p: int(p.get("episode", "0")))
 
 
-def _get_status_utils() -> Any:
-    """Lazy load status_utils module from parent project."""
-    if not hasattr(_get_status_utils, "cached_module"):
-        module_path = Path(__file__).parent.parent.parent / "scripts" / "status_utils.py"
-        spec = importlib.util.spec_from_file_location("status_utils", module_path)
+def _load_script(name: str) -> Any:
+    """Lazy load a module from the parent project's scripts/ directory."""
+    modules = _load_script.__dict__.setdefault("cached_modules", {})
+    if name not in modules:
+        module_path = Path(__file__).parent.parent.parent / "scripts" / f"{name}.py"
+        spec = importlib.util.spec_from_file_location(name, module_path)
         if spec and spec.loader:
             module = importlib.util.module_from_spec(spec)
+            # dataclasses look their module up in sys.modules while it executes
+            sys.modules[name] = module
             spec.loader.exec_module(module)
-            _get_status_utils.cached_module = module
-    return getattr(_get_status_utils, "cached_module", None)
+            modules[name] = module
+    return modules.get(name)
+
+
+def _get_status_utils() -> Any:
+    """Lazy load status_utils module from parent project."""
+    return _load_script("status_utils")
+
+
+def _invalid_pdf_reason(path: Path) -> str | None:
+    """Why a local PDF should not be uploaded (scripts/pdf_check.py), or None."""
+    if path.suffix.lower() != ".pdf":
+        return None
+    try:
+        check = _load_script("pdf_check").validate_pdf(path)
+    except OSError as e:
+        return f"Unreadable file: {e}"
+    return None if check.ok else check.reason
 
 
 PAPER_EXTENSIONS = (".pdf", ".txt")
@@ -223,6 +243,10 @@ def _resolve_notebook_inputs(
         console.print(f"[red]File not found:[/] {pdf_file}")
         raise typer.Exit(1)
 
+    if pdf_file and (reason := _invalid_pdf_reason(pdf_file)):
+        console.print(f"[red]Invalid PDF:[/] {pdf_file} ({reason})")
+        raise typer.Exit(1)
+
     return notebook_name, pdf_file
 
 
@@ -339,6 +363,10 @@ def _notebook_create_all(dry_run: bool) -> None:
                     console.print("  [red]Paper file not found[/]")
                     failed += 1
                     continue
+                if reason := _invalid_pdf_reason(paper_path):
+                    console.print(f"  [red]Invalid PDF:[/] {reason}")
+                    failed += 1
+                    continue
 
                 url = await notebook_mgr.create_notebook(page, notebook_name)
                 if not url:
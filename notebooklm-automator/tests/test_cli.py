@@ -0,0 +1,128 @@
+"""Tests for the PDF validation gate in front of notebook uploads."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import typer
+
+from src.cli import _invalid_pdf_reason, _notebook_create_all, _resolve_notebook_inputs
+
+
+def make_pdf() -> bytes:
+    """One-page PDF with a correct xref table, larger than the minimum size."""
+    content = b"BT /F1 12 Tf 72 720 Td (" + b"x" * 1000 + b") Tj ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    return out + b"startxref\n%d\n%%%%EOF\n" % xref
+
+
+@pytest.fixture
+def papers(tmp_path):
+    """A valid, a truncated and a non-PDF paper file."""
+    good = tmp_path / "01-good.pdf"
+    good.write_bytes(make_pdf())
+    truncated = tmp_path / "02-truncated.pdf"
+    truncated.write_bytes(make_pdf()[:-200])
+    html = tmp_path / "03-html.pdf"
+    html.write_bytes(b"<html>" + b"x" * 2000 + b"</html>")
+    return good, truncated, html
+
+
+class TestInvalidPdfReason:
+    def test_valid_pdf(self, papers):
+        assert _invalid_pdf_reason(papers[0]) is None
+
+    def test_truncated_and_non_pdf(self, papers):
+        assert "no %%EOF" in _invalid_pdf_reason(papers[1])
+        assert "Not a PDF" in _invalid_pdf_reason(papers[2])
+
+    def test_missing_file(self, tmp_path):
+        assert "Unreadable file" in _invalid_pdf_reason(tmp_path / "missing.pdf")
+
+    def test_text_papers_are_not_checked(self, tmp_path):
+        paper = tmp_path / "04-rfc.txt"
+        paper.write_text("RFC")
+        assert _invalid_pdf_reason(paper) is None
+
+
+class TestResolveNotebookInputs:
+    def test_valid_file_is_returned(self, papers):
+        assert _resolve_notebook_inputs("01", "01 good", None, papers[0]) == (
+            "01 good",
+            papers[0],
+        )
+
+    @pytest.mark.parametrize("index", [1, 2])
+    def test_invalid_pdf_aborts(self, papers, index, capsys):
+        with pytest.raises(typer.Exit):
+            _resolve_notebook_inputs("02", "02 bad", None, papers[index])
+        assert "Invalid PDF" in capsys.readouterr().out
+
+    def test_missing_file_aborts(self, tmp_path, capsys):
+        with pytest.raises(typer.Exit):
+            _resolve_notebook_inputs("05", "05 gone", None, tmp_path / "gone.pdf")
+        assert "File not found" in capsys.readouterr().out
+
+
+class TestNotebookCreateAll:
+    def test_skips_invalid_and_missing_papers(self, papers, capsys):
+        good, truncated, _ = papers
+        paths = {"01": good, "02": truncated, "03": None}
+        page = MagicMock()
+
+        @asynccontextmanager
+        async def session():
+            manager = MagicMock()
+            manager.is_logged_in = AsyncMock(return_value=True)
+            yield manager, page
+
+        notebooks = MagicMock()
+        notebooks.create_notebook = AsyncMock(return_value="https://nb/1")
+        sources = MagicMock()
+        sources.add_file = AsyncMock()
+        sources.wait_for_processing = AsyncMock()
+
+        with (
+            patch(
+                "src.cli._get_papers_missing_notebooks",
+                return_value=[
+                    {"episode": ep, "name": name, "category": "llm"}
+                    for ep, name in [
+                        ("01", "good"),
+                        ("02", "truncated"),
+                        ("03", "gone"),
+                    ]
+                ],
+            ),
+            patch("src.cli._find_paper_path", side_effect=lambda ep, *_: paths[ep]),
+            patch("src.cli.browser_session", session),
+            patch("src.cli.NotebookManager", return_value=notebooks),
+            patch("src.cli.SourcesManager", return_value=sources),
+            patch("src.cli.update_notebook_status") as update,
+        ):
+            _notebook_create_all(dry_run=False)
+
+        notebooks.create_notebook.assert_awaited_once_with(page, "01 good")
+        sources.add_file.assert_awaited_once_with(page, good)
+        update.assert_called_once_with("01", "https://nb/1")
+        out = capsys.readouterr().out
+        assert "Invalid PDF" in out
+        assert "Paper file not found" in out
+        assert "1 created, 2 failed" in out
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Time slides to the podcast by aligning their text with the transcript.
+
+Each slide's text (from the PDF, or OCR of its PNG when the page has no text
+layer) is compared with every transcript segment, using TF-IDF weights over
+the slides and words cut to a common prefix (Polish inflects word endings).
+Dynamic time warping then assigns segments to slides in order, every slide
+getting at least one, and the slide changes are placed in the gaps between
+segments.
+
+The durations cover the audio after the thumbnail intro exactly and are
+written as the timings JSON read by generate_concat.py --json.
+"""
+
+import argparse
+import json
+import math
+import shutil
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from analyze_transcript import WORD, format_timestamp
+from generate_concat import INTRO_SECONDS
+from generate_video import get_duration
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+SCRIPT_DIR = Path(__file__).parent.parent
+ASSETS_DIR = SCRIPT_DIR / "youtube" / "pl"
+
+# Words are compared by this many leading letters, a crude stemmer
+STEM_LENGTH = 6
+# Pull towards an even spread where the text gives no evidence
+PRIOR_WEIGHT = 0.05
+# Pages with fewer words than this are OCR'd from their PNG if tesseract exists
+MIN_PAGE_WORDS = 3
+MIN_SLIDE_SECONDS = 3.0
+
+
+@dataclass
+class SlideTiming:
+    """A slide, when it appears in the audio and how well it matched."""
+
+    slide: str
+    start: float
+    duration: float
+    similarity: float
+
+
+def stems(text: str) -> list[str]:
+    """Lowercased words of at least 3 letters, cut to STEM_LENGTH."""
+    return [word[:STEM_LENGTH] for word in WORD.findall(text.lower())]
+
+
+def pdf_page_texts(pdf_file: Path) -> list[str]:
+    """Text layer of each page, with PyMuPDF or else poppler's pdftotext."""
+    if pymupdf is not None:
+        with pymupdf.open(pdf_file) as doc:
+            return [page.get_text() for page in doc]
+    result = subprocess.run(
+        ["pdftotext", "-enc", "UTF-8", str(pdf_file), "-"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # pdftotext ends every page with a form feed
+    return result.stdout.split("\f")[:-1]
+
+
+def ocr_text(image: Path, language: str = "pol+eng") -> str:
+    """Text of a slide image from tesseract, or "" where it is not installed."""
+    if not shutil.which("tesseract") or not image.exists():
+        return ""
+    result = subprocess.run(
+        ["tesseract", str(image), "stdout", "-l", language],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout if result.returncode == 0 else ""
+
+
+def slide_texts(pdf_file: Path, slides: list[Path]) -> list[str]:
+    """Text of each slide, OCR'ing the PNG of pages without a usable text layer."""
+    texts = pdf_page_texts(pdf_file) if pdf_file.exists() else [""] * len(slides)
+    if len(texts) != len(slides):
+        raise ValueError(
+            f"{pdf_file.name} has {len(texts)} pages but there are {len(slides)} slides"
+        )
+    return [
+        text if len(stems(text)) >= MIN_PAGE_WORDS else ocr_text(slide) or text
+        for text, slide in zip(texts, slides, strict=True)
+    ]
+
+
+def similarity_matrix(texts: list[str], segments: list[dict]) -> list[list[float]]:
+    """Cosine similarity of each slide with each segment.
+
+    Words are weighted by how few slides use them (a word on every slide,
+    like the paper's title, weighs nothing) and only words that appear on
+    some slide count. Segments are not pooled with their neighbours: the
+    alignment already sums evidence over each slide's run of segments.
+    """
+    slide_counts = [Counter(stems(text)) for text in texts]
+    document_frequency = Counter(word for counts in slide_counts for word in counts)
+    idf = {word: math.log(len(texts) / df) for word, df in document_frequency.items()}
+    slide_vectors = []
+    for counts in slide_counts:
+        vector = {word: count * idf[word] for word, count in counts.items() if idf[word] > 0}
+        norm = math.sqrt(sum(v * v for v in vector.values()))
+        slide_vectors.append((vector, norm))
+
+    segment_vectors = []
+    for segment in segments:
+        counts = Counter(word for word in stems(segment.get("text", "")) if idf.get(word, 0) > 0)
+        vector = {word: count * idf[word] for word, count in counts.items()}
+        segment_vectors.append((vector, math.sqrt(sum(v * v for v in vector.values()))))
+
+    matrix = []
+    for slide_vector, slide_norm in slide_vectors:
+        row = []
+        for segment_vector, segment_norm in segment_vectors:
+            if not slide_norm or not segment_norm:
+                row.append(0.0)
+                continue
+            dot = sum(
+                weight * slide_vector.get(word, 0.0) for word, weight in segment_vector.items()
+            )
+            row.append(dot / (slide_norm * segment_norm))
+        matrix.append(row)
+    return matrix
+
+
+def align(similarity: list[list[float]], segments: list[dict]) -> list[int]:
+    """Index of the first segment of each slide, by DTW over the similarity.
+
+    Segments are assigned to slides in order (a slide stays or advances by
+    one per segment) maximizing total similarity, minus PRIOR_WEIGHT times
+    each segment's distance from where an even spread would put its slide.
+    """
+    slides, n = len(similarity), len(segments)
+    if n < slides:
+        raise ValueError(f"{n} transcript segments cannot cover {slides} slides")
+    begin, end = segments[0]["start"], segments[-1]["end"]
+    span = (end - begin) or 1.0
+    position = [((s["start"] + s["end"]) / 2 - begin) / span for s in segments]
+
+    best = [[-math.inf] * n for _ in range(slides)]
+    advanced = [[False] * n for _ in range(slides)]
+    for i in range(slides):
+        expected = (i + 0.5) / slides
+        row, previous = best[i], best[i - 1] if i else None
+        # Slide i needs segments i.. and leaves one for each later slide
+        for j in range(i, n - (slides - 1 - i)):
+            score = similarity[i][j] - PRIOR_WEIGHT * abs(position[j] - expected)
+            if j == 0:
+                row[j] = score
+                continue
+            stay = row[j - 1]
+            advance = previous[j - 1] if previous else -math.inf
+            advanced[i][j] = advance > stay
+            row[j] = score + max(stay, advance)
+
+    firsts = [0] * slides
+    i = slides - 1
+    for j in range(n - 1, 0, -1):
+        if advanced[i][j]:
+            firsts[i] = j
+            i -= 1
+    return firsts
+
+
+def slide_timings(
+    names: list[str],
+    firsts: list[int],
+    segments: list[dict],
+    similarity: list[list[float]],
+    audio_duration: float,
+) -> list[SlideTiming]:
+    """Durations of slides starting at the given segments, covering the audio after the intro.
+
+    Each slide change is placed in the middle of the gap before its first
+    segment. Boundaries are kept MIN_SLIDE_SECONDS apart (less when the audio
+    is too short, so it is shared evenly) and are rounded to milliseconds, so
+    the durations add up to the covered audio exactly.
+
+    Raises ValueError if there is no audio after the intro.
+    """
+    count = len(names)
+    covered = audio_duration - INTRO_SECONDS
+    if covered <= 0:
+        raise ValueError(f"Audio ({audio_duration:.1f}s) ends within the {INTRO_SECONDS}s intro")
+    gap = min(MIN_SLIDE_SECONDS, covered / count)
+    bounds = [float(INTRO_SECONDS)]
+    for first in firsts[1:]:
+        bounds.append((segments[first - 1]["end"] + segments[first]["start"]) / 2)
+    bounds.append(audio_duration)
+
+    for k in range(1, count):
+        bounds[k] = max(bounds[k], bounds[k - 1] + gap)
+    for k in range(count - 1, 0, -1):
+        bounds[k] = min(bounds[k], bounds[k + 1] - gap)
+    millis = [round(bound * 1000) for bound in bounds]
+
+    timings = []
+    for k, name in enumerate(names):
+        last = firsts[k + 1] if k + 1 < count else len(segments)
+        matched = similarity[k][firsts[k] : last]
+        timings.append(
+            SlideTiming(
+                slide=name,
+                start=millis[k] / 1000,
+                duration=(millis[k + 1] - millis[k]) / 1000,
+                similarity=sum(matched) / len(matched) if matched else 0.0,
+            )
+        )
+    return timings
+
+
+def find_episode(ep_num: str) -> str | None:
+    """Episode name (e.g. 55-olmo) from its audio file."""
+    matches = sorted((ASSETS_DIR / "audio").glob(f"{ep_num}-*.m4a"))
+    return matches[0].stem if matches else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time slides by aligning their text with the transcript",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s 55                       # writes youtube/pl/slides/55-*/timings.json
+  %(prog)s 55 --dry-run
+  %(prog)s 55 --output timings.json
+
+Then: mise run generate-concat -- 55 --json youtube/pl/slides/55-*/timings.json
+        """,
+    )
+    parser.add_argument("episode", help="Episode number (e.g., 55)")
+    parser.add_argument("--output", type=Path, help="Timings JSON path (default: slides dir)")
+    parser.add_argument("--dry-run", action="store_true", help="Print timings without writing")
+    args = parser.parse_args()
+
+    ep_name = find_episode(args.episode)
+    if ep_name is None:
+        print(f"❌ No audio file found for episode {args.episode}")
+        return 1
+    audio = ASSETS_DIR / "audio" / f"{ep_name}.m4a"
+    transcript = ASSETS_DIR / "transcripts" / f"{ep_name}.json"
+    slides_dir = ASSETS_DIR / "slides" / ep_name
+    pdf_file = ASSETS_DIR / "slides" / f"{ep_name}.pdf"
+
+    if not transcript.exists():
+        print(f"❌ Transcript not found: {transcript}")
+        return 1
+    slides = sorted(slides_dir.glob("slide-*.png"))
+    if not slides:
+        print(f"❌ No slides in {slides_dir} (run: mise run prepare -- {args.episode})")
+        return 1
+
+    print(f"🎯 Aligning {len(slides)} slides with transcript: {ep_name}")
+    segments = json.loads(transcript.read_text(encoding="utf-8")).get("segments", [])
+    try:
+        texts = slide_texts(pdf_file, slides)
+        similarity = similarity_matrix(texts, segments)
+        firsts = align(similarity, segments)
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        print(f"❌ {e}")
+        return 1
+    if not any(stems(text) for text in texts):
+        print("⚠️  No slide text found (no text layer, tesseract not installed): even spread")
+
+    try:
+        audio_duration = get_duration(audio)
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        audio_duration = segments[-1]["end"]
+        print(f"⚠️  Could not read audio duration, using transcript end ({audio_duration:.1f}s)")
+
+    names = [slide.stem for slide in slides]
+    try:
+        timings = slide_timings(names, firsts, segments, similarity, audio_duration)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print()
+    print(f"{'slide':<10} {'start':>7} {'duration':>9} {'match':>6}")
+    print("━" * 35)
+    for t in timings:
+        print(
+            f"{t.slide:<10} {format_timestamp(t.start):>7} {t.duration:>8.1f}s {t.similarity:>6.2f}"
+        )
+    total = sum(t.duration for t in timings)
+    print(f"\n   Slides: {total:.3f}s + {INTRO_SECONDS}s intro = {audio_duration:.3f}s audio")
+
+    if args.dry_run:
+        return 0
+    output = args.output or slides_dir / "timings.json"
+    data = [{"slide": t.slide, "duration": t.duration} for t in timings]
+    output.write_text(json.dumps(data, indent=2) + "\n")
+    print(f"✅ Written to: {output}")
+    print(f"   Next: mise run generate-concat -- {args.episode} --json {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
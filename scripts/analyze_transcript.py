@@ -4,15 +4,62 @@
 Usage:
   mise run analyze-transcript -- 73
   python scripts/analyze_transcript.py 73
+  python scripts/analyze_transcript.py terms --top 30   # all episodes
+  python scripts/analyze_transcript.py search Paxos     # which episodes, when
+
+Technical terms are counted segment by segment: runs of capitalized words
+that are not stopwords (data/stopwords/*.txt), with every sub-phrase of up
+to three words, keeping the top terms with a heap.
+
+Slide boundaries are placed where the vocabulary changes: each gap between
+segments scores 1 - cosine similarity of the TF-IDF vectors of the windows
+before and after it, and dynamic programming picks the cuts that maximize
+that novelty while keeping slides near equal length. Without NumPy the
+transcript is split into equal chunks of segments.
 """
 
+import argparse
+import heapq
 import json
 import re
 import sys
+import time
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from functools import cache
+from itertools import pairwise
+from operator import itemgetter
 from pathlib import Path
 
+from transcript_index import INDEX_FILE, SEARCH_LIMIT, TranscriptIndex, transcript_files
+from transcript_reader import iter_segments
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 SCRIPT_DIR = Path(__file__).parent.parent
 TRANSCRIPTS_DIR = SCRIPT_DIR / "youtube/pl/transcripts"
+STOPWORDS_DIR = Path(__file__).parent / "data" / "stopwords"
+STOPWORD_LANGUAGES = ("pl", "en")
+
+WORD = re.compile(r"[^\W\d_]{3,}")
+# Words (keeping inner hyphens, as in "GPT-4") and single punctuation marks
+TOKEN = re.compile(r"\w+(?:-\w+)*|[^\w\s]")
+MAX_PHRASE_WORDS = 3
+TOP_TERMS = 20
+MIN_TERM_COUNT = 2
+TABLE_TERMS = 50
+# Words are hashed into this many TF-IDF columns, bounding memory and time
+HASH_DIMS = 1024
+# Segments on each side of a gap compared for novelty (~1 minute of speech)
+NOVELTY_WINDOW = 8
+# Weight of a slide's squared relative deviation from the mean slide length
+LENGTH_WEIGHT = 1.0
+# Shortest slide allowed, as a fraction of the mean slide length
+MIN_SLIDE_FRACTION = 0.3
 
 
 def find_transcript(ep_num: str) -> Path | None:
@@ -36,178 +83,200 @@ def extract_final_question(segments: list) -> str | None:
     return None
 
 
+@cache
+def load_stopwords(languages: tuple[str, ...] = STOPWORD_LANGUAGES) -> frozenset[str]:
+    """Lowercase stopwords from data/stopwords/<language>.txt ("#" starts a comment)."""
+    words = set()
+    for language in languages:
+        for line in (STOPWORDS_DIR / f"{language}.txt").read_text(encoding="utf-8").splitlines():
+            word = line.split("#", 1)[0].strip()
+            if word:
+                words.add(word.lower())
+    return frozenset(words)
+
+
+def term_phrases(text: str, stopwords: frozenset[str]) -> Iterator[str]:
+    """Every capitalized term of up to MAX_PHRASE_WORDS words in text.
+
+    A term is a run of capitalized words ("Paxos", "AppendEntries", "RPC",
+    "Leader Election") not broken by punctuation or a stopword. Each run
+    yields all of its n-grams, so "Strong Leader" also counts as "Leader".
+    """
+    run: list[str] = []
+    for match in TOKEN.finditer(text):
+        token = match.group()
+        if len(token) >= 2 and token[0].isupper() and token.lower() not in stopwords:
+            run.append(token)
+            continue
+        yield from _ngrams(run)
+        run = []
+    yield from _ngrams(run)
+
+
+def _ngrams(words: list[str]) -> Iterator[str]:
+    for size in range(1, min(len(words), MAX_PHRASE_WORDS) + 1):
+        for i in range(len(words) - size + 1):
+            yield " ".join(words[i : i + size])
+
+
+def count_terms(texts: Iterable[str], stopwords: frozenset[str] | None = None) -> Counter:
+    """Term counts over texts (e.g. one per segment), read one at a time."""
+    if stopwords is None:
+        stopwords = load_stopwords()
+    counts: Counter = Counter()
+    for text in texts:
+        counts.update(term_phrases(text, stopwords))
+    return counts
+
+
+def top_terms(counts: Counter, k: int = TOP_TERMS, min_count: int = MIN_TERM_COUNT) -> list[str]:
+    """The k most frequent terms seen at least min_count times.
+
+    A term is left out when every occurrence was inside one longer phrase
+    (same count), so "Leader Election" is listed rather than "Election".
+    """
+    subsumed = set()
+    for phrase, count in counts.items():
+        if " " in phrase and count >= min_count:
+            subsumed.update(
+                sub for sub in _ngrams(phrase.split()) if sub != phrase and counts[sub] == count
+            )
+    candidates = (
+        (term, count)
+        for term, count in counts.items()
+        if count >= min_count and term not in subsumed
+    )
+    # nlargest is stable, so ties keep first-seen order
+    return [term for term, _ in heapq.nlargest(k, candidates, key=itemgetter(1))]
+
+
 def find_technical_terms(text: str) -> list[str]:
     """Extract capitalized technical terms."""
-    # Find sequences like "Paxos", "Leader Election", "AppendEntries", "RPC"
-    # Matches both regular capitalized words and CamelCase
-    pattern = r"\b[A-Z][a-z]*(?:[A-Z][a-z]*)*(?:\s+[A-Z][a-z]*(?:[A-Z][a-z]*)*)*\b"
-    matches = re.findall(pattern, text)
-
-    # Filter common words (English and Polish)
-    common = {
-        # English
-        "The",
-        "A",
-        "An",
-        "In",
-        "On",
-        "At",
-        "To",
-        "For",
-        "And",
-        "Or",
-        "But",
-        "If",
-        "This",
-        "That",
-        "With",
-        "From",
-        "By",
-        "As",
-        "Of",
-        "It",
-        "Is",
-        "Was",
-        "Are",
-        "Were",
-        "Be",
-        "Been",
-        "Being",
-        "Has",
-        "Have",
-        "Had",
-        "Do",
-        "Does",
-        "Did",
-        "Will",
-        "Would",
-        "Should",
-        "Could",
-        "Can",
-        "May",
-        "Might",
-        "Must",
-        "Shall",
-        "So",
-        "Then",
-        "Now",
-        "Just",
-        "Very",
-        "Too",
-        "Only",
-        "Also",
-        "Even",
-        "When",
-        "Where",
-        "Why",
-        "How",
-        "What",
-        "Which",
-        "Who",
-        "Whom",
-        "Whose",
-        # Polish
-        "I",
-        "W",
-        "Z",
-        "Na",
-        "O",
-        "Po",
-        "Dla",
-        "Przez",
-        "Bez",
-        "Przed",
-        "Za",
-        "Od",
-        "U",
-        "Przy",
-        "Nad",
-        "Pod",
-        "Czyli",
-        "Co",
-        "Tak",
-        "Nie",
-        "Jak",
-        "Ale",
-        "Bo",
-        "Czy",
-        "Jest",
-        "Są",
-        "Ten",
-        "Ta",
-        "Te",
-        "Tego",
-        "Tej",
-        "Tym",
-        "Tutaj",
-        "Tam",
-        "Tu",
-        "Teraz",
-        "Wtedy",
-        "Już",
-        "Jeszcze",
-        "Właśnie",
-        "Więc",
-        "Tylko",
-        "Bardzo",
-        "Kiedy",
-        "Gdzie",
-        "Dlaczego",
-        "Które",
-        "Który",
-        "Która",
-        "Jakie",
-        "Jaki",
-        "Jaka",
-        "Autorzy",
-        "Jego",
-        "Jej",
-        "Ich",
-        "Im",
-        "Zamiast",
-        "Dobrze",
-        "Dopiero",
-        "Okej",
-        "Jasne",
-        "Zanim",
-        "Potem",
-        "Jednak",
-        "Zawsze",
-        "Nigdy",
-        "Może",
-        "Można",
-        "Musi",
-        "Musisz",
-        "Możesz",
-        "Wszystko",
-        "Wszystkie",
-        "Każdy",
-        "Każda",
-        "Każde",
-        "Żaden",
-        "Nic",
-        "Nikt",
-        "Nigdzie",
+    return top_terms(count_terms([text]))
+
+
+def term_table(paths: Iterable[Path], k: int = TABLE_TERMS) -> list[dict]:
+    """Cross-episode frequency of the k most frequent terms over the transcripts.
+
+    Transcripts are streamed a segment at a time and only the running
+    totals are kept. Each row has the term, its total count, how many episodes use it, and
+    the episode using it most.
+    """
+    stopwords = load_stopwords()
+    totals: Counter = Counter()
+    episodes: Counter = Counter()
+    peak: dict[str, tuple[int, str]] = {}
+    for path in paths:
+        counts = count_terms((segment.text for segment in iter_segments(path)), stopwords)
+        totals.update(counts)
+        episodes.update(counts.keys())
+        for term, count in counts.items():
+            if count > peak.get(term, (0, ""))[0]:
+                peak[term] = (count, path.stem)
+    return [
+        {"term": term, "count": totals[term], "episodes": episodes[term], "top": peak[term][1]}
+        for term in top_terms(totals, k)
+    ]
+
+
+def novelty_curve(segments: list, window: int = NOVELTY_WINDOW) -> "np.ndarray":
+    """Novelty of each gap between segments, in [0, 1]; index i is the gap before segment i.
+
+    Index 0 (before the first segment) is always 0.
+    """
+    columns: dict[str, int] = {}
+    cells = []
+    for row, segment in enumerate(segments):
+        for word in WORD.findall(segment.get("text", "").lower()):
+            column = columns.get(word)
+            if column is None:
+                column = columns[word] = zlib.crc32(word.encode()) % HASH_DIMS
+            cells.append(row * HASH_DIMS + column)
+
+    n = len(segments)
+    counts = np.bincount(cells, minlength=n * HASH_DIMS).reshape(n, HASH_DIMS)
+    counts = counts.astype(np.float32)
+    idf = np.log((1 + n) / (1 + np.count_nonzero(counts, axis=0))) + 1
+    cumulative = np.zeros((n + 1, HASH_DIMS), dtype=np.float32)
+    np.cumsum(counts * idf.astype(np.float32), axis=0, out=cumulative[1:])
+
+    gaps = np.arange(n)
+    left = cumulative[gaps] - cumulative[np.maximum(gaps - window, 0)]
+    right = cumulative[np.minimum(gaps + window, n)] - cumulative[gaps]
+    norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+    dots = np.einsum("ij,ij->i", left, right)
+    similarity = np.divide(dots, norms, out=np.ones(n, dtype=np.float32), where=norms > 0)
+    return 1 - similarity
+
+
+def choose_boundaries(novelty: "np.ndarray", times: "np.ndarray", count: int) -> list[int] | None:
+    """Cut points 0 = b0 < b1 < ... < b_count = n splitting n segments into count slides.
+
+    Maximizes the novelty at the cuts minus LENGTH_WEIGHT times each slide's
+    squared relative deviation from the mean length. times[b] is when the
+    slide starting at boundary b starts (times[n] is the end). Returns None
+    when no split satisfies the minimum slide length.
+    """
+    n = len(times) - 1
+    ideal = (times[-1] - times[0]) / count
+    if ideal <= 0:
+        return None
+    lengths = times[None, :] - times[:, None]  # lengths[i, j]: slide from boundary i to j
+    penalty = LENGTH_WEIGHT * ((lengths - ideal) / ideal) ** 2
+    allowed = np.triu(np.ones((n + 1, n + 1), dtype=bool), k=1) & (
+        lengths >= MIN_SLIDE_FRACTION * ideal
+    )
+    transition = np.where(allowed, -penalty, -np.inf)
+    gain = np.append(novelty, 0.0)  # novelty of cutting at boundary j; none at the end
+
+    score = np.full(n + 1, -np.inf)
+    score[0] = 0.0
+    back = np.zeros((count, n + 1), dtype=np.intp)
+    for k in range(count):
+        candidates = score[:, None] + transition
+        back[k] = np.argmax(candidates, axis=0)
+        score = candidates[back[k], np.arange(n + 1)] + gain
+    if not np.isfinite(score[n]):
+        return None
+
+    bounds = [n]
+    for k in range(count - 1, -1, -1):
+        bounds.append(int(back[k][bounds[-1]]))
+    return bounds[::-1]
+
+
+def _topic(slide: int, segments: list, start_idx: int, end_idx: int) -> dict:
+    start_time = segments[start_idx]["start"]
+    end_time = segments[end_idx - 1]["end"] if end_idx > 0 else start_time
+
+    # Sample text from chunk start
+    sample_text = " ".join(seg["text"] for seg in segments[start_idx : start_idx + 3])
+
+    return {
+        "slide": slide,
+        "start": format_timestamp(start_time),
+        "end": format_timestamp(end_time),
+        "sample": sample_text[:100],
     }
 
-    # Filter: remove single letters, common words, and terms with fewer than 2 chars
-    terms = [m for m in matches if len(m) >= 2 and m not in common]
 
-    # Count occurrences and sort by frequency
-    term_counts = {}
-    for term in terms:
-        term_counts[term] = term_counts.get(term, 0) + 1
-
-    # Filter terms that appear less than 2 times
-    filtered_counts = {term: count for term, count in term_counts.items() if count >= 2}
-
-    # Return top 20 by frequency
-    sorted_terms = sorted(filtered_counts.items(), key=lambda x: x[1], reverse=True)
-    return [term for term, _ in sorted_terms[:20]]
+def suggest_topics(segments: list, count: int = 10) -> list[dict]:
+    """Suggest topic boundaries where the discussion changes."""
+    if np is not None and len(segments) >= 2 * count:
+        times = np.array(
+            [seg["start"] for seg in segments] + [segments[-1]["end"]], dtype=np.float64
+        )
+        bounds = choose_boundaries(novelty_curve(segments).astype(np.float64), times, count)
+        if bounds is not None:
+            return [
+                _topic(i + 1, segments, start, end)
+                for i, (start, end) in enumerate(pairwise(bounds))
+            ]
+    return split_topics(segments, count)
 
 
-def suggest_topics(segments: list, count: int = 10) -> list[dict]:
-    """Suggest topic boundaries."""
+def split_topics(segments: list, count: int = 10) -> list[dict]:
+    """Suggest topic boundaries by splitting into equal chunks of segments."""
     total_segments = len(segments)
     chunk_size = total_segments // count
 
@@ -215,21 +284,7 @@ def suggest_topics(segments: list, count: int = 10) -> list[dict]:
     for i in range(count):
         start_idx = i * chunk_size
         end_idx = min((i + 1) * chunk_size, total_segments)
-
-        start_time = segments[start_idx]["start"]
-        end_time = segments[end_idx - 1]["end"] if end_idx > 0 else start_time
-
-        # Sample text from chunk start
-        sample_text = " ".join(seg["text"] for seg in segments[start_idx : start_idx + 3])
-
-        topics.append(
-            {
-                "slide": i + 1,
-                "start": format_timestamp(start_time),
-                "end": format_timestamp(end_time),
-                "sample": sample_text[:100],
-            }
-        )
+        topics.append(_topic(i + 1, segments, start_idx, end_idx))
 
     return topics
 
@@ -275,12 +330,116 @@ def print_analysis(
     print()
 
 
+def print_term_table(rows: list[dict], transcripts: int) -> None:
+    """Print the cross-episode term table."""
+    print(f"\n🔧 Technical Terms across {transcripts} transcripts:")
+    print("━" * 70)
+    print(f"   {'term':<32} {'count':>6} {'episodes':>8}  top episode")
+    for row in rows:
+        print(f"   {row['term']:<32} {row['count']:>6} {row['episodes']:>8}  {row['top']}")
+    print()
+
+
+def terms_main(argv: list[str]) -> int:
+    """Cross-episode term frequency table over every current and archived transcript."""
+    parser = argparse.ArgumentParser(
+        prog="analyze_transcript.py terms",
+        description="Count technical terms across all transcripts",
+    )
+    parser.add_argument(
+        "--top", type=int, default=TABLE_TERMS, help=f"Terms to list (default: {TABLE_TERMS})"
+    )
+    parser.add_argument("--json", type=Path, help="Write the table as JSON")
+    args = parser.parse_args(argv)
+
+    paths = transcript_files()
+    if not paths:
+        print("❌ No transcripts found (youtube/pl/transcripts, archive/pl/transcripts)")
+        return 1
+
+    rows = term_table(paths, args.top)
+    print_term_table(rows, len(paths))
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2, ensure_ascii=False) + "\n")
+        print(f"✅ Written to: {args.json}")
+    return 0
+
+
+def print_unreadable(unreadable: list[tuple[Path, str]]) -> None:
+    """Warn about transcripts left out of the search index."""
+    for path, error in unreadable:
+        print(f"⚠️  Not indexed, unreadable: {path.name} ({error})")
+
+
+def index_main(argv: list[str]) -> int:
+    """Bring the search index up to date with the current and archived transcripts."""
+    parser = argparse.ArgumentParser(
+        prog="analyze_transcript.py index",
+        description="Index transcripts for search (only new or changed ones are read)",
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Re-read every transcript")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        INDEX_FILE.unlink(missing_ok=True)
+    start = time.perf_counter()
+    with TranscriptIndex.open(INDEX_FILE) as index:
+        indexed, dropped = index.refresh(transcript_files())
+        transcripts, segments, words = index.stats()
+    elapsed = time.perf_counter() - start
+
+    print(f"🗂️  Indexed {indexed} transcripts, dropped {dropped} ({elapsed:.1f}s)")
+    print(f"   {transcripts} transcripts, {segments} segments, {words} words in {INDEX_FILE}")
+    print_unreadable(index.unreadable)
+    return 1 if index.unreadable else 0
+
+
+def search_main(argv: list[str]) -> int:
+    """Ranked, timestamped segments matching a query across all transcripts."""
+    parser = argparse.ArgumentParser(
+        prog="analyze_transcript.py search",
+        description="Search all transcripts (the index is updated first)",
+    )
+    parser.add_argument("query", nargs="+", help="Words to look for")
+    parser.add_argument(
+        "--limit", type=int, default=SEARCH_LIMIT, help=f"Hits to show (default: {SEARCH_LIMIT})"
+    )
+    args = parser.parse_args(argv)
+    query = " ".join(args.query)
+
+    with TranscriptIndex.open(INDEX_FILE) as index:
+        indexed, _ = index.refresh(transcript_files())
+        if indexed:
+            print(f"🗂️  Indexed {indexed} new or changed transcripts")
+        print_unreadable(index.unreadable)
+        start = time.perf_counter()
+        hits = index.search(query, args.limit)
+        elapsed = time.perf_counter() - start
+
+    if not hits:
+        print(f"❌ No matches for: {query}")
+        return 1
+    print(f"\n🔍 {query}")
+    print("━" * 70)
+    for hit in hits:
+        print(f"   {hit.episode:<28} {format_timestamp(hit.start):>6}  {hit.text[:80]}")
+    episodes = len({hit.episode for hit in hits})
+    print(f"\n   {len(hits)} hits in {episodes} episodes ({elapsed * 1000:.1f} ms)")
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
     if len(sys.argv) < 2:
         print("Usage: python analyze_transcript.py <episode_number>")
+        print("       python analyze_transcript.py terms [--top N] [--json PATH]")
+        print("       python analyze_transcript.py index [--rebuild]")
+        print("       python analyze_transcript.py search <words> [--limit N]")
         print("Example: python analyze_transcript.py 73")
         return 1
+    commands = {"terms": terms_main, "index": index_main, "search": search_main}
+    if sys.argv[1] in commands:
+        return commands[sys.argv[1]](sys.argv[2:])
 
     ep_num = sys.argv[1]
     transcript_path = find_transcript(ep_num)
@@ -299,10 +458,8 @@ def main() -> int:
         print("❌ No segments found in transcript")
         return 1
 
-    full_text = " ".join(seg["text"] for seg in segments)
-
     question = extract_final_question(segments)
-    terms = find_technical_terms(full_text)
+    terms = top_terms(count_terms(seg["text"] for seg in segments))
     topics = suggest_topics(segments, count=10)
 
     print_analysis(ep_name, data, question, terms, topics)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Benchmark video encoding profiles on a synthetic slide deck."""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from generate_video import ENCODING_PROFILES, FPS, generate_video, run_cmd
+
+DEFAULT_VARIANTS = ["default:30", "still:30", "still:10"]
+
+
+@dataclass
+class BenchResult:
+    """Timing and size of one encode."""
+
+    profile: str
+    fps: int
+    wall: float
+    size: int
+    returncode: int
+
+
+def parse_variant(value: str) -> tuple[str, int]:
+    """Parse 'profile[:fps]' into (profile, fps)."""
+    profile, _, fps = value.partition(":")
+    if profile not in ENCODING_PROFILES:
+        raise ValueError(f"Unknown profile: {profile}")
+    return profile, int(fps) if fps else FPS
+
+
+def make_slides(out_dir: Path, count: int) -> list[Path]:
+    """Render `count` distinct 1920x1080 test slides."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    run_cmd(
+        [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc2=size=1920x1080:rate=1",
+            "-frames:v",
+            str(count),
+            str(out_dir / "slide-%02d.png"),
+        ]
+    )
+    return sorted(out_dir.glob("slide-*.png"))
+
+
+def make_audio(path: Path, seconds: float) -> Path:
+    """Create a silent AAC track of the given length."""
+    run_cmd(
+        [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "anullsrc=r=44100:cl=stereo",
+            "-t",
+            str(seconds),
+            "-c:a",
+            "aac",
+            "-b:a",
+            "128k",
+            str(path),
+        ]
+    )
+    return path
+
+
+def write_concat(path: Path, slides: list[Path], audio_seconds: float) -> Path:
+    """Write concat.txt spreading audio length + 5s outro evenly over slides."""
+    total = audio_seconds + 5.0
+    per_slide = round(total / len(slides), 3)
+    lines = []
+    for slide in slides[:-1]:
+        lines += [f"file '{slide}'", f"duration {per_slide}"]
+    last = round(total - per_slide * (len(slides) - 1), 3)
+    lines += [f"file '{slides[-1]}'", f"duration {last}", f"file '{slides[-1]}'"]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def make_fixture(work_dir: Path, slides: int, minutes: float) -> tuple[Path, Path]:
+    """Build synthetic slides, audio and concat.txt. Returns (concat, audio)."""
+    seconds = minutes * 60
+    images = make_slides(work_dir / "slides", slides)
+    audio = make_audio(work_dir / "audio.m4a", seconds)
+    concat = write_concat(work_dir / "concat.txt", images, seconds)
+    return concat, audio
+
+
+def run_benchmark(
+    concat: Path, audio: Path, work_dir: Path, variants: list[tuple[str, int]]
+) -> list[BenchResult]:
+    """Encode the fixture once per variant and record wall time and size."""
+    results = []
+    for profile, fps in variants:
+        output = work_dir / f"{profile}-{fps}.mp4"
+        print(f"🔄 Encoding profile={profile} fps={fps}...")
+        start = time.perf_counter()
+        proc = generate_video(concat, audio, output, profile=profile, fps=fps)
+        wall = time.perf_counter() - start
+        size = output.stat().st_size if output.exists() else 0
+        results.append(BenchResult(profile, fps, wall, size, proc.returncode))
+    return results
+
+
+def print_results(results: list[BenchResult]) -> None:
+    """Print results relative to the first variant."""
+    base = results[0]
+    print()
+    print(f"{'profile':<10} {'fps':>4} {'wall':>9} {'size':>10} {'speedup':>8} {'size %':>7}")
+    print("━" * 53)
+    for r in results:
+        status = "" if r.returncode == 0 else "  ❌ ffmpeg failed"
+        speedup = base.wall / r.wall if r.wall else 0.0
+        size_pct = 100 * r.size / base.size if base.size else 0.0
+        print(
+            f"{r.profile:<10} {r.fps:>4} {r.wall:>8.1f}s {r.size / 1e6:>8.1f}MB "
+            f"{speedup:>7.2f}x {size_pct:>6.0f}%{status}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare encoding profiles on a synthetic slide deck",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --minutes 5 --variants default:30 still:30
+  %(prog)s --json bench.json
+        """,
+    )
+    parser.add_argument("--slides", type=int, default=30, help="Number of slides (default: 30)")
+    parser.add_argument(
+        "--minutes", type=float, default=30, help="Audio length in minutes (default: 30)"
+    )
+    parser.add_argument(
+        "--variants",
+        nargs="+",
+        default=DEFAULT_VARIANTS,
+        help="profile[:fps] entries, first one is the baseline",
+    )
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    parser.add_argument("--keep", type=Path, help="Build fixture and outputs in this directory")
+    args = parser.parse_args()
+
+    try:
+        variants = [parse_variant(v) for v in args.variants]
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    work_dir = args.keep or Path(tempfile.mkdtemp(prefix="bench-encoding-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        print(f"🧪 Fixture: {args.slides} slides, {args.minutes:g} min audio")
+        concat, audio = make_fixture(work_dir, args.slides, args.minutes)
+        results = run_benchmark(concat, audio, work_dir, variants)
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_results(results)
+    if args.json:
+        args.json.write_text(json.dumps([asdict(r) for r in results], indent=2) + "\n")
+        print(f"\n📄 Results written to {args.json}")
+
+    return 0 if all(r.returncode == 0 for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Benchmark transcription backends on a local audio sample.
+
+Each backend runs in a fresh process so model load time and peak memory
+are its own. The real-time factor (RTF) is transcription time divided by
+audio length: below 1.0 is faster than real time.
+"""
+
+import argparse
+import difflib
+import json
+import multiprocessing
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from importlib.util import find_spec
+from pathlib import Path
+
+from generate_video import get_duration, run_cmd
+from transcribe import BACKENDS, LANGUAGE, MODEL, find_audio_files
+
+
+@dataclass
+class BenchResult:
+    """Speed and output of one backend on the sample."""
+
+    backend: str
+    model: str
+    load: float = 0.0
+    wall: float = 0.0
+    audio: float = 0.0
+    rtf: float = 0.0
+    segments: int = 0
+    peak_rss: int = 0
+    agreement: float = 1.0
+    text: str = ""
+    error: str = ""
+
+
+def make_sample(source: Path, output: Path, seconds: float) -> Path:
+    """Cut the first `seconds` of source to 16 kHz mono WAV, what Whisper decodes to."""
+    cmd = ["ffmpeg", "-y", "-v", "error", "-i", str(source)]
+    if seconds:
+        cmd += ["-t", str(seconds)]
+    run_cmd([*cmd, "-ar", "16000", "-ac", "1", str(output)])
+    return output
+
+
+def _bench_backend(backend: str, model: str, language: str, sample: Path) -> dict:
+    """Load and run one backend; executed in its own process."""
+    start = time.perf_counter()
+    engine = BACKENDS[backend](model, language)
+    load = time.perf_counter() - start
+    start = time.perf_counter()
+    result = engine.transcribe(sample)
+    wall = time.perf_counter() - start
+    return {
+        "load": load,
+        "wall": wall,
+        "segments": len(result.get("segments", [])),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "text": result.get("text", ""),
+    }
+
+
+def agreement(a: str, b: str) -> float:
+    """Word-level similarity of two transcripts (1.0 = identical)."""
+    return difflib.SequenceMatcher(None, a.lower().split(), b.lower().split()).ratio()
+
+
+def run_benchmark(
+    sample: Path, backends: list[str], model: str, language: str = LANGUAGE
+) -> list[BenchResult]:
+    """Transcribe the sample with each backend and compare against the first."""
+    audio = get_duration(sample)
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for backend in backends:
+        result = BenchResult(backend, model, audio=audio)
+        if find_spec(BACKENDS[backend].module) is None:
+            result.error = f"{BACKENDS[backend].package} not installed"
+            results.append(result)
+            continue
+        print(f"🔄 Transcribing with {backend} ({model})...")
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            try:
+                stats = executor.submit(_bench_backend, backend, model, language, sample).result()
+            except Exception as e:
+                result.error = str(e)[:100]
+            else:
+                for key, value in stats.items():
+                    setattr(result, key, value)
+                result.rtf = result.wall / audio if audio else 0.0
+        results.append(result)
+
+    baseline = next((r for r in results if not r.error), None)
+    for r in results:
+        if baseline and not r.error:
+            r.agreement = agreement(baseline.text, r.text)
+    return results
+
+
+def print_results(results: list[BenchResult]) -> None:
+    """Print one row per backend with speed relative to the first that ran."""
+    ran = [r for r in results if not r.error]
+    base = ran[0] if ran else None
+    print()
+    print(
+        f"{'backend':<16} {'load':>7} {'wall':>8} {'RTF':>6} {'speedup':>8} "
+        f"{'peak RSS':>9} {'segments':>8} {'agree':>6}"
+    )
+    print("━" * 75)
+    for r in results:
+        if r.error:
+            print(f"{r.backend:<16} ❌ {r.error}")
+            continue
+        speedup = base.wall / r.wall if r.wall else 0.0
+        print(
+            f"{r.backend:<16} {r.load:>6.1f}s {r.wall:>7.1f}s {r.rtf:>6.3f} {speedup:>7.2f}x "
+            f"{r.peak_rss / 1e6:>7.0f}MB {r.segments:>8} {r.agreement:>5.0%}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare transcription backends by real-time factor",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                   # first episode, first 2 minutes
+  %(prog)s --sample youtube/pl/audio/01-attention.m4a --seconds 600
+  %(prog)s --backends faster-whisper --model medium --json bench.json
+        """,
+    )
+    parser.add_argument("--sample", type=Path, help="Audio file (default: first episode audio)")
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=120,
+        help="Transcribe only the first N seconds, 0 for all (default: 120)",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=list(BACKENDS),
+        default=list(BACKENDS),
+        help="Backends to run, first one is the baseline",
+    )
+    parser.add_argument("--model", default=MODEL, help=f"Whisper model size (default: {MODEL})")
+    parser.add_argument("--json", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    source = args.sample or next(iter(find_audio_files()), None)
+    if source is None or not source.exists():
+        print("❌ No audio sample found (pass --sample)")
+        return 1
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-transcribe-"))
+    try:
+        length = f"first {args.seconds:g}s of " if args.seconds else ""
+        print(f"🧪 Sample: {length}{source.name}")
+        sample = make_sample(source, work_dir / "sample.wav", args.seconds)
+        results = run_benchmark(sample, args.backends, args.model)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_results(results)
+    if args.json:
+        rows = [{k: v for k, v in asdict(r).items() if k != "text"} for r in results]
+        args.json.write_text(json.dumps(rows, indent=2) + "\n")
+        print(f"\n📄 Results written to {args.json}")
+
+    return 0 if all(not r.error for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
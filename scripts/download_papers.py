@@ -1,134 +1,288 @@
 #!/usr/bin/env python3
-"""Download whitepapers from input file with automatic indexing and verification."""
+"""Download whitepapers from input file with automatic indexing and verification.
+
+Papers already present are skipped before downloading, matched by name,
+normalized source (arxiv/openreview ID) or, after downloading, by content
+hash (see paper_index).
+"""
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import http.client
 import json
+import random
 import re
-import subprocess
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
+from urllib.parse import urljoin, urlsplit
 
-try:
-    import PyPDF2
-except ImportError:
-    PyPDF2 = None
-
-from status_utils import load_status, save_status, update_summary
+from paper_index import PaperIndex, parse_arxiv_url, parse_openreview_url, source_key
+from pdf_check import validate_pdf
+from status_utils import load_status, status_transaction
 
 SCRIPT_DIR = Path(__file__).parent.parent
 WHITEPAPERS_DIR = SCRIPT_DIR / "whitepapers"
+PARTIAL_DIR = WHITEPAPERS_DIR / ".partial"
+
+DOWNLOAD_JOBS = 8
+# Concurrent requests per host; anything else gets DEFAULT_HOST_LIMIT
+HOST_LIMITS = {"arxiv.org": 2, "export.arxiv.org": 2, "openreview.net": 2}
+DEFAULT_HOST_LIMIT = 4
+MAX_ATTEMPTS = 4
+BACKOFF_SECONDS = 1.0
+TIMEOUT_SECONDS = 60
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 64 * 1024
+USER_AGENT = "youtube-whitepapers/0.1 (paper downloader)"
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+
+
+def candidate_urls(url: str) -> list[tuple[str, str]]:
+    """(source description, PDF URL) pairs to try in order."""
+    candidates = []
+    if arxiv_id := parse_arxiv_url(url):
+        candidates += [
+            (f"arxiv ({arxiv_id})", f"https://arxiv.org/pdf/{arxiv_id}.pdf"),
+            (f"arxiv ({arxiv_id})", f"https://export.arxiv.org/pdf/{arxiv_id}.pdf"),
+        ]
+    if paper_id := parse_openreview_url(url):
+        candidates.append((f"openreview ({paper_id})", f"https://openreview.net/pdf?id={paper_id}"))
+    candidates.append(("direct URL", url))
+    return candidates
+
+
+class DownloadError(Exception):
+    """A download attempt failed. Retryable errors may succeed on a later attempt."""
+
+    def __init__(self, message: str, retryable: bool = True, retry_after: float | None = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def check_pdf_file(path: Path) -> None:
+    """Raise DownloadError unless path is a complete PDF (see pdf_check)."""
+    check = validate_pdf(path)
+    if not check.ok:
+        raise DownloadError(check.reason, retryable=False)
+
+
+class Downloader:
+    """Thread-safe PDF downloader.
+
+    Keep-alive connections are pooled per host and concurrent requests per
+    host are capped (HOST_LIMITS). Failed attempts are retried with
+    exponential backoff; bytes already received are kept in PARTIAL_DIR and
+    resumed with a Range request. The body is checked for a %PDF- header
+    while streaming (an HTML error page is abandoned after the first chunk)
+    and validated with pdf_check at the end.
+    """
 
-
-def parse_arxiv_url(url: str) -> str | None:
-    """Extract arxiv ID from various URL formats."""
-    patterns = [
-        r"arxiv\.org/abs/(\d+\.\d+)",
-        r"arxiv\.org/pdf/(\d+\.\d+)",
-        r"ar5iv\.org/abs/(\d+\.\d+)",
-    ]
-    for pattern in patterns:
-        if match := re.search(pattern, url):
-            return match.group(1)
-    return None
-
-
-def parse_openreview_url(url: str) -> str | None:
-    """Extract OpenReview ID from URL."""
-    if match := re.search(r"openreview\.net/forum\?id=([A-Za-z0-9_-]+)", url):
-        return match.group(1)
-    return None
-
-
-def download_from_arxiv(arxiv_id: str, output_path: Path) -> bool:
-    """Download paper from arxiv using arxiv ID."""
-    urls = [
-        f"https://arxiv.org/pdf/{arxiv_id}.pdf",
-        f"https://export.arxiv.org/pdf/{arxiv_id}.pdf",
-    ]
-
-    for url in urls:
-        try:
-            result = subprocess.run(
-                ["curl", "-L", "-f", "-o", str(output_path), url],
-                capture_output=True,
-                timeout=60,
-                check=False,
-            )
-            if result.returncode == 0 and verify_pdf(output_path):
-                return True
-            output_path.unlink(missing_ok=True)
-        except (subprocess.TimeoutExpired, Exception):
-            output_path.unlink(missing_ok=True)
-            continue
-
-    return False
-
-
-def download_from_openreview(paper_id: str, output_path: Path) -> bool:
-    """Download paper from OpenReview using paper ID."""
-    url = f"https://openreview.net/pdf?id={paper_id}"
-
-    try:
-        result = subprocess.run(
-            ["curl", "-L", "-f", "-o", str(output_path), url],
-            capture_output=True,
-            timeout=60,
-            check=False,
-        )
-        if result.returncode == 0 and verify_pdf(output_path):
-            return True
-        output_path.unlink(missing_ok=True)
-    except (subprocess.TimeoutExpired, Exception):
-        output_path.unlink(missing_ok=True)
-
-    return False
-
-
-def download_direct(url: str, output_path: Path) -> bool:
-    """Download paper directly from URL."""
-    try:
-        result = subprocess.run(
-            ["curl", "-L", "-f", "-o", str(output_path), url],
-            capture_output=True,
-            timeout=60,
-            check=False,
-        )
-        if result.returncode == 0 and verify_pdf(output_path):
-            return True
-        output_path.unlink(missing_ok=True)
-    except (subprocess.TimeoutExpired, Exception):
-        output_path.unlink(missing_ok=True)
-
-    return False
-
-
-def verify_pdf(path: Path) -> bool:
-    """Verify file is a valid PDF."""
-    if not path.exists() or path.stat().st_size < 1000:
-        return False
-
-    # Check magic number
-    try:
-        with path.open("rb") as f:
-            header = f.read(4)
-            if header != b"%PDF":
-                return False
-    except Exception:
-        return False
-
-    # If PyPDF2 available, do deeper validation
-    if PyPDF2:
+    def __init__(
+        self,
+        partial_dir: Path | None = None,
+        attempts: int = MAX_ATTEMPTS,
+        backoff: float = BACKOFF_SECONDS,
+        timeout: float = TIMEOUT_SECONDS,
+        host_limits: dict[str, int] | None = None,
+    ):
+        self.partial_dir = partial_dir or PARTIAL_DIR
+        self.attempts = attempts
+        self.backoff = backoff
+        self.timeout = timeout
+        self.host_limits = HOST_LIMITS if host_limits is None else host_limits
+        self._idle: dict[tuple[str, str, int | None], list[http.client.HTTPConnection]] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._slots:
+                limit = self.host_limits.get(host, DEFAULT_HOST_LIMIT)
+                self._slots[host] = threading.BoundedSemaphore(limit)
+            return self._slots[host]
+
+    def _connect(self, key: tuple[str, str, int | None]) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _request(
+        self, key: tuple[str, str, int | None], target: str, headers: dict[str, str]
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a GET on a pooled connection, reconnecting once if it went stale."""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            try:
+                conn.request("GET", target, headers=headers)
+                return conn, conn.getresponse()
+            except (OSError, http.client.HTTPException):
+                conn.close()  # server closed the idle connection; retry on a new one
+
+        conn = self._connect(key)
         try:
-            with path.open("rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                _ = len(reader.pages)
-            return True
-        except Exception:
-            return False
-
-    return True
+            conn.request("GET", target, headers=headers)
+            return conn, conn.getresponse()
+        except BaseException:
+            conn.close()
+            raise
+
+    def _release(
+        self,
+        key: tuple[str, str, int | None],
+        conn: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ) -> None:
+        """Return a connection to the pool once its response was fully read."""
+        if response.will_close or not response.isclosed():
+            conn.close()
+            return
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+    def partial_path(self, url: str, output_path: Path) -> Path:
+        """Where bytes of url are kept until they are moved to output_path.
+
+        Keyed on both, so concurrent downloads of one URL never share a file.
+        """
+        key = f"{url}\0{output_path.resolve()}".encode()
+        return self.partial_dir / f"{hashlib.sha256(key).hexdigest()[:16]}.part"
+
+    def download(self, url: str, output_path: Path) -> None:
+        """Download url to output_path, raising DownloadError if all attempts fail."""
+        part = self.partial_path(url, output_path)
+        part.parent.mkdir(parents=True, exist_ok=True)
+        for attempt in range(self.attempts):
+            try:
+                self._fetch(url, part)
+                check_pdf_file(part)
+            except DownloadError as e:
+                if not e.retryable:
+                    part.unlink(missing_ok=True)
+                    raise
+                if attempt == self.attempts - 1:
+                    raise  # keep the partial file to resume next time
+                delay = e.retry_after if e.retry_after is not None else self.backoff * 2**attempt
+                time.sleep(delay * (1 + random.random() / 2))
+            else:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                part.replace(output_path)
+                return
+
+    def _fetch(self, url: str, part: Path) -> None:
+        """One attempt: request url (following redirects) and stream it into part."""
+        offset = part.stat().st_size if part.exists() else 0
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise DownloadError(f"Unsupported URL: {url}", retryable=False)
+            key = (parts.scheme, parts.hostname, parts.port)
+            target = parts.path or "/"
+            if parts.query:
+                target += f"?{parts.query}"
+            headers = {"User-Agent": USER_AGENT}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+
+            with self._host_slot(parts.hostname):
+                try:
+                    conn, response = self._request(key, target, headers)
+                except (OSError, http.client.HTTPException) as e:
+                    raise DownloadError(f"{type(e).__name__}: {e}") from e
+                try:
+                    status = response.status
+                    if status in REDIRECT_CODES and response.getheader("Location"):
+                        response.read()
+                        self._release(key, conn, response)
+                        url = urljoin(url, response.getheader("Location"))
+                        continue
+                    if status == 416 and offset:
+                        # Range starts at the end: the previous attempt got everything
+                        response.read()
+                        self._release(key, conn, response)
+                        return
+                    if status == 429 or status >= 500:
+                        response.read()
+                        self._release(key, conn, response)
+                        raise DownloadError(f"HTTP {status}", retry_after=_retry_after(response))
+                    if status not in (200, 206):
+                        response.read()
+                        self._release(key, conn, response)
+                        raise DownloadError(f"HTTP {status}", retryable=False)
+
+                    if status == 206 and _range_start(response) != offset:
+                        conn.close()
+                        part.unlink(missing_ok=True)
+                        raise DownloadError("Server returned an unexpected byte range")
+                    try:
+                        self._stream(response, part, resume=status == 206)
+                    except DownloadError:
+                        conn.close()
+                        raise
+                    self._release(key, conn, response)
+                    return
+                except DownloadError:
+                    raise
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    raise DownloadError(f"{type(e).__name__}: {e}") from e
+        raise DownloadError("Too many redirects", retryable=False)
+
+    def _stream(self, response: http.client.HTTPResponse, part: Path, resume: bool) -> None:
+        """Write the response body to part, appending when resuming."""
+        expected = response.getheader("Content-Length")
+        received = 0
+        first = b""
+        if not resume:
+            # Reject non-PDF bodies before writing anything
+            while len(first) < 5:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                first += chunk
+            if not first.startswith(b"%PDF-"):
+                response.close()
+                content_type = response.getheader("Content-Type", "unknown type")
+                raise DownloadError(f"Not a PDF ({content_type})", retryable=False)
+
+        with part.open("ab" if resume else "wb") as f:
+            if first:
+                f.write(first)
+                received = len(first)
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                received += len(chunk)
+
+        if expected is not None and received != int(expected):
+            raise DownloadError(f"Connection closed after {received} of {expected} bytes")
+
+
+def _retry_after(response: http.client.HTTPResponse) -> float | None:
+    value = response.getheader("Retry-After")
+    return float(value) if value and value.isdigit() else None
+
+
+def _range_start(response: http.client.HTTPResponse) -> int | None:
+    """First byte offset from a Content-Range header."""
+    match = re.match(r"bytes (\d+)-", response.getheader("Content-Range", ""))
+    return int(match.group(1)) if match else None
 
 
 def find_available_episodes(status: dict[str, Any], count: int) -> list[str]:
@@ -149,8 +303,15 @@ def find_available_episodes(status: dict[str, Any], count: int) -> list[str]:
     return available
 
 
-def check_duplicate(status: dict[str, Any], name: str, url: str) -> str | None:
-    """Check if paper already exists by name or URL. Returns episode if found."""
+def check_duplicate(
+    status: dict[str, Any], name: str, url: str, index: PaperIndex | None = None
+) -> str | None:
+    """Check if paper already exists by name or source. Returns episode if found.
+
+    URLs are compared by source_key, so abs, pdf and mirror links to the same
+    arxiv or OpenReview paper match. index adds papers on disk that are
+    missing from status.json.
+    """
     papers = status.get("papers", [])
 
     # Check by name
@@ -158,11 +319,14 @@ def check_duplicate(status: dict[str, Any], name: str, url: str) -> str | None:
         if paper.get("name") == name:
             return paper.get("episode")
 
-    # Check by URL (if source_url field exists)
+    # Check by source (if source_url field exists)
+    key = source_key(url)
     for paper in papers:
-        if "source_url" in paper and paper["source_url"] == url:
+        if "source_url" in paper and source_key(paper["source_url"]) == key:
             return paper.get("episode")
 
+    if index is not None:
+        return index.find(name, url)
     return None
 
 
@@ -260,7 +424,7 @@ def parse_input_file(input_path: Path) -> list[dict[str, str]]:
 
         # Try to generate name from URL
         if arxiv_id := parse_arxiv_url(url):
-            name = f"arxiv-{arxiv_id.replace('.', '-')}"
+            name = f"arxiv-{arxiv_id.replace('.', '-').replace('/', '-')}"
         elif paper_id := parse_openreview_url(url):
             name = f"openreview-{paper_id}"
         else:
@@ -271,30 +435,27 @@ def parse_input_file(input_path: Path) -> list[dict[str, str]]:
     return papers
 
 
-def download_paper(paper: dict[str, str], episode: str, category: str) -> tuple[bool, str]:
-    """Download paper and return (success, message)."""
-    url = paper["url"]
-    name = paper["name"]
-
-    # Ensure category directory exists
-    category_dir = WHITEPAPERS_DIR / category
-    category_dir.mkdir(parents=True, exist_ok=True)
-
-    output_path = category_dir / f"{episode}-{name}.pdf"
+def paper_path(paper: dict[str, str], episode: str, category: str) -> Path:
+    """Where a downloaded paper is stored."""
+    return WHITEPAPERS_DIR / category / f"{episode}-{paper['name']}.pdf"
 
-    # Try arxiv
-    if (arxiv_id := parse_arxiv_url(url)) and download_from_arxiv(arxiv_id, output_path):
-        return True, f"Downloaded from arxiv ({arxiv_id})"
 
-    # Try openreview
-    if (paper_id := parse_openreview_url(url)) and download_from_openreview(paper_id, output_path):
-        return True, f"Downloaded from openreview ({paper_id})"
+def download_paper(
+    paper: dict[str, str], episode: str, category: str, downloader: Downloader
+) -> tuple[bool, str]:
+    """Download paper and return (success, message)."""
+    output_path = paper_path(paper, episode, category)
 
-    # Try direct download
-    if download_direct(url, output_path):
-        return True, "Downloaded from direct URL"
+    errors = []
+    for source, url in candidate_urls(paper["url"]):
+        try:
+            downloader.download(url, output_path)
+        except DownloadError as e:
+            errors.append(f"{source}: {e}")
+        else:
+            return True, f"Downloaded from {source}"
 
-    return False, "All download methods failed"
+    return False, "All download methods failed (" + "; ".join(errors) + ")"
 
 
 def main() -> None:
@@ -306,6 +467,13 @@ def main() -> None:
     parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be done without downloading"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DOWNLOAD_JOBS,
+        help=f"Parallel downloads (default: {DOWNLOAD_JOBS}, per-host limits still apply)",
+    )
     args = parser.parse_args()
 
     if not args.input_file.exists():
@@ -322,19 +490,29 @@ def main() -> None:
 
     print(f"📋 Found {len(papers_to_download)} papers in input file\n")
 
-    # Check for duplicates
+    # Hash papers added or changed since the last run
+    index = PaperIndex.load(WHITEPAPERS_DIR)
+    index.refresh(status.get("papers", []))
+    index.save()
+
+    # Check for duplicates, including repeats within the input file
     duplicates = []
     new_papers = []
+    planned = {}
     for paper in papers_to_download:
-        if dup_ep := check_duplicate(status, paper["name"], paper["url"]):
-            duplicates.append((paper["name"], dup_ep))
+        key = source_key(paper["url"])
+        if dup_ep := check_duplicate(status, paper["name"], paper["url"], index):
+            duplicates.append((paper["name"], f"episode {dup_ep}"))
+        elif key in planned:
+            duplicates.append((paper["name"], f"{planned[key]} (same source)"))
         else:
+            planned[key] = paper["name"]
             new_papers.append(paper)
 
     if duplicates:
         print("⚠️  Duplicates found (skipping):")
-        for name, ep in duplicates:
-            print(f"   • {name} → episode {ep}")
+        for name, existing in duplicates:
+            print(f"   • {name} → {existing}")
         print()
 
     if not new_papers:
@@ -365,52 +543,66 @@ def main() -> None:
         return
 
     # Download papers
-    print("🚀 Starting downloads...\n")
+    print(f"🚀 Starting downloads ({args.jobs} parallel)...\n")
+    start = time.perf_counter()
     success_count = 0
     failed = []
+    new_entries = []
+
+    downloader = Downloader()
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {}
+        for ep, paper in zip(episodes, new_papers, strict=True):
+            category = paper.get("category", "llm")
+            future = pool.submit(download_paper, paper, ep, category, downloader)
+            futures[future] = (ep, paper)
+
+        for done, future in enumerate(as_completed(futures), 1):
+            ep, paper = futures[future]
+            category = paper.get("category", "llm")
+            name = paper["name"]
+            success, message = future.result()
+
+            print(f"📄 [{done}/{len(new_papers)}] Episode {ep}: {name}")
+            if success:
+                path = paper_path(paper, ep, category)
+                sha, dup_ep = index.find_file(path)
+                if dup_ep:
+                    path.unlink()
+                    print(f"   ⚠️  Same PDF as episode {dup_ep}, removed\n")
+                    continue
+                index.add(path, paper["url"], sha)
+                print(f"   ✅ {message}")
+
+                new_entry = {
+                    "episode": ep,
+                    "name": name,
+                    "category": category,
+                    "source_url": paper["url"],
+                }
+                if "title" in paper:
+                    new_entry["title"] = paper["title"]
+                new_entries.append(new_entry)
+
+                success_count += 1
+            else:
+                print(f"   ❌ {message}")
+                failed.append(paper)
 
-    for i, paper in enumerate(new_papers):
-        ep = episodes[i]
-        category = paper.get("category", "llm")
-        name = paper["name"]
-
-        print(f"📄 [{i + 1}/{len(new_papers)}] Episode {ep}: {name}")
-
-        success, message = download_paper(paper, ep, category)
-
-        if success:
-            print(f"   ✅ {message}")
-
-            # Update status.json
-            papers_list = status.get("papers", [])
-            new_entry = {
-                "episode": ep,
-                "name": name,
-                "category": category,
-                "source_url": paper["url"],
-            }
-            if "title" in paper:
-                new_entry["title"] = paper["title"]
-
-            papers_list.append(new_entry)
-            papers_list.sort(key=lambda p: int(p.get("episode", "0")))
-            status["papers"] = papers_list
-
-            success_count += 1
-        else:
-            print(f"   ❌ {message}")
-            failed.append(paper)
-
-        print()
+            print()
+    downloader.close()
+    index.save()
 
     # Save status
-    if success_count > 0:
-        update_summary(status)
-        save_status(status)
+    if new_entries:
+        with status_transaction() as transaction:
+            for entry in new_entries:
+                transaction.add_paper(entry)
         print(f"✅ Updated status.json with {success_count} new papers\n")
 
     # Summary
-    print(f"🎉 Download complete: {success_count}/{len(new_papers)} successful\n")
+    elapsed = time.perf_counter() - start
+    print(f"🎉 Download complete: {success_count}/{len(new_papers)} successful in {elapsed:.1f}s\n")
 
     if failed:
         print("❌ Failed downloads - manual intervention required:\n")
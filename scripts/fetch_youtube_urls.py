@@ -11,7 +11,7 @@ import re
 import sys
 from pathlib import Path
 
-from status_utils import load_status, save_status
+from status_utils import status_transaction
 from upload_youtube import get_authenticated_service, get_playlist_id
 
 SCRIPT_DIR = Path(__file__).parent.parent
@@ -115,10 +115,6 @@ def main() -> int:
     print("📺 Fetching YouTube URLs from playlists")
     print("━" * 50)
 
-    # Load current status
-    status = load_status()
-    papers = status.get("papers", [])
-
     # Load episode titles from metadata files
     print("   📄 Loading episode titles from metadata...")
     episode_titles = load_episode_titles()
@@ -155,31 +151,31 @@ def main() -> int:
 
     # Update status.json for episodes 66+
     updated = 0
-    for paper in papers:
-        ep_num = paper.get("episode")
-        if not ep_num:
-            continue
-
-        ep_int = int(ep_num)
-        if ep_int < 66:
-            continue
-
-        # Skip if already has non-placeholder URL
-        existing_url = paper.get("youtube_url", "")
-        if existing_url and "PLACEHOLDER" not in existing_url:
-            print(f"   ⏭️  Episode {ep_num}: already has URL")
-            continue
-
-        # Update with real URL
-        if ep_num in all_videos:
-            paper["youtube_url"] = all_videos[ep_num]
-            updated += 1
-            print(f"   ✅ Episode {ep_num}: {all_videos[ep_num]}")
-        else:
-            print(f"   ❌ Episode {ep_num}: not found in playlists")
+    with status_transaction() as transaction:
+        for paper in transaction.papers:
+            ep_num = paper.get("episode")
+            if not ep_num:
+                continue
+
+            ep_int = int(ep_num)
+            if ep_int < 66:
+                continue
+
+            # Skip if already has non-placeholder URL
+            existing_url = paper.get("youtube_url", "")
+            if existing_url and "PLACEHOLDER" not in existing_url:
+                print(f"   ⏭️  Episode {ep_num}: already has URL")
+                continue
+
+            # Update with real URL
+            if ep_num in all_videos:
+                transaction.set(ep_num, "youtube_url", all_videos[ep_num])
+                updated += 1
+                print(f"   ✅ Episode {ep_num}: {all_videos[ep_num]}")
+            else:
+                print(f"   ❌ Episode {ep_num}: not found in playlists")
 
     if updated > 0:
-        save_status(status)
         print()
         print("━" * 50)
         print(f"✅ Updated {updated} YouTube URLs in status.json")
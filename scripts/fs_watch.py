@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Recursive directory watchers reporting which paths appeared or disappeared.
+
+InotifyWatcher talks to the Linux inotify API through libc; PollingWatcher
+compares directory mtimes and works everywhere. make_watcher() picks the
+first that is available. Both skip dot-directories (.git, .segments, ...).
+"""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+# inotify(7) event bits
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR
+EVENT_HEADER = struct.Struct("iIII")
+
+POLL_INTERVAL = 2.0
+
+
+def _subdirs(directory: Path) -> list[Path]:
+    """Non-hidden subdirectories of directory (empty if it vanished)."""
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                Path(e.path)
+                for e in entries
+                if not e.name.startswith(".") and e.is_dir(follow_symlinks=False)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    """libc with the inotify functions, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+class InotifyWatcher:
+    """Watch directory trees with inotify, adding watches for new subdirectories."""
+
+    def __init__(self, roots: list[Path]):
+        self.libc = _load_libc()
+        if self.libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = roots
+        self.paths: dict[int, Path] = {}
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, directory: Path) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+        self.paths[wd] = directory
+        for subdir in _subdirs(directory):
+            self._add_tree(subdir)
+
+    def _read_events(self) -> list[Path]:
+        changed = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped; report the roots so callers rescan
+                    changed.extend(self.roots)
+                    continue
+                if mask & IN_IGNORED:
+                    self.paths.pop(wd, None)
+                    continue
+                directory = self.paths.get(wd)
+                if directory is None or mask & IN_DELETE_SELF:
+                    continue
+                path = directory / name
+                if name.startswith("."):
+                    continue
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                changed.append(path)
+
+    def wait(self, timeout: float | None = None) -> list[Path]:
+        """Block until something changes (or timeout); return changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if ready:
+                changed = self._read_events()
+                if changed:
+                    return changed
+            elif deadline is not None:
+                return []
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Watch directory trees by re-listing directories whose mtime changed."""
+
+    def __init__(self, roots: list[Path], interval: float = POLL_INTERVAL):
+        self.roots = roots
+        self.interval = interval
+        self.dirs: dict[Path, tuple[int, frozenset[str]]] = {}
+        for root in roots:
+            self._add_tree(root)
+
+    def _listing(self, directory: Path) -> tuple[int, frozenset[str]] | None:
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+            with os.scandir(directory) as entries:
+                names = frozenset(e.name for e in entries if not e.name.startswith("."))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return mtime_ns, names
+
+    def _add_tree(self, directory: Path) -> None:
+        listing = self._listing(directory)
+        if listing is None:
+            return
+        self.dirs[directory] = listing
+        for subdir in _subdirs(directory):
+            self._add_tree(subdir)
+
+    def poll(self) -> list[Path]:
+        """Check every known directory once; return changed paths."""
+        changed = []
+        for directory, (mtime_ns, names) in list(self.dirs.items()):
+            if directory not in self.dirs:
+                continue
+            try:
+                if directory.stat().st_mtime_ns == mtime_ns:
+                    continue
+            except FileNotFoundError:
+                pass
+            listing = self._listing(directory)
+            if listing is None:
+                # Removed; its parent reports the name, drop the subtree
+                for known in list(self.dirs):
+                    if known == directory or directory in known.parents:
+                        del self.dirs[known]
+                continue
+            self.dirs[directory] = listing
+            for name in sorted(listing[1] ^ names):
+                path = directory / name
+                changed.append(path)
+                if name in listing[1] and path.is_dir():
+                    self._add_tree(path)
+        return changed
+
+    def wait(self, timeout: float | None = None) -> list[Path]:
+        """Block until something changes (or timeout); return changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self.poll()
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self.dirs.clear()
+
+
+def make_watcher(
+    roots: list[Path], poll: bool = False, interval: float = POLL_INTERVAL
+) -> InotifyWatcher | PollingWatcher:
+    """inotify watcher if available (and not poll), else a polling one."""
+    roots = [root for root in roots if root.is_dir()]
+    if not poll:
+        try:
+            return InotifyWatcher(roots)
+        except OSError:
+            pass
+    return PollingWatcher(roots, interval)
@@ -5,6 +5,8 @@ Usage:
     python scripts/generate_concat.py 55 --durations slide-01:180,slide-02:150,slide-03:120
     python scripts/generate_concat.py 55 --json timings.json
 
+timings.json can be written from the transcript by align_slides.py.
+
 Automatically adds:
 - 5s thumbnail intro (with duplicate to avoid ffmpeg drop)
 - 5s silent last-slide outro
@@ -16,6 +18,9 @@ from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.parent
 SLIDES_BASE = SCRIPT_DIR / "youtube" / "pl" / "slides"
+# Thumbnail shown over the first seconds of audio, and the silent outro after it
+INTRO_SECONDS = 5
+OUTRO_SECONDS = 5
 
 
 def generate_concat(episode: str, slide_durations: list[tuple[str, float]]) -> str:
@@ -35,7 +40,7 @@ def generate_concat(episode: str, slide_durations: list[tuple[str, float]]) -> s
     # Template: 5s thumbnail intro (duplicate first entry to avoid ffmpeg drop)
     thumbnail_path = slides_dir / "thumbnail.png"
     lines.append(f"file '{thumbnail_path}'")
-    lines.append("duration 5")
+    lines.append(f"duration {INTRO_SECONDS}")
     lines.append(f"file '{thumbnail_path}'")
     lines.append("duration 0")
 
@@ -48,7 +53,7 @@ def generate_concat(episode: str, slide_durations: list[tuple[str, float]]) -> s
     # Template: 5s silent outro
     last_slide_path = slides_dir / "last-slide.png"
     lines.append(f"file '{last_slide_path}'")
-    lines.append("duration 5")
+    lines.append(f"duration {OUTRO_SECONDS}")
     lines.append(f"file '{last_slide_path}'")
 
     return "\n".join(lines) + "\n"
@@ -1,18 +1,35 @@
 #!/usr/bin/env python3
-"""Generate whitepapers/status.json by scanning all directories."""
+"""Generate whitepapers/status.json by scanning all directories.
+
+Each asset directory is listed once with os.scandir. Listings are cached in
+youtube/.status-scan.json and reused while a directory's mtime is unchanged.
+
+With --watch it keeps running and refreshes the flags of episodes whose
+files appear, move or disappear (see fs_watch for inotify/polling).
+"""
 
 from __future__ import annotations
 
+import argparse
+import json
+import os
 import re
 import sys
+import time
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+from fs_watch import InotifyWatcher, PollingWatcher, make_watcher
 from status_utils import (
     PRESERVED_FIELDS,
     SCRIPT_DIR,
     WHITEPAPERS_DIR,
+    export_status_json,
+    get_episode_from_name,
     load_status,
-    save_status,
+    matches_flags,
+    sqlite_enabled,
+    status_transaction,
     update_summary,
 )
 
@@ -27,29 +44,132 @@ THUMBNAILS_DIRS = [YOUTUBE_DIR / "thumbnails", ARCHIVE_DIR / "thumbnails"]
 VIDEO_DIRS = [YOUTUBE_DIR / "output", ARCHIVE_DIR / "video"]
 SLIDES_PROMPTS_DIR = YOUTUBE_DIR / "prompts" / "slides"
 THUMBNAILS_PROMPTS_DIR = YOUTUBE_DIR / "prompts" / "thumbnails"
+SCAN_CACHE_FILE = YOUTUBE_DIR / ".status-scan.json"
+SCAN_CACHE_VERSION = 1
 
+# Listings of directories modified this recently are not cached, since a
+# change within the same mtime tick would go unnoticed
+RACY_SECONDS = 2
 
-PAPER_EXTENSIONS = (".pdf", ".txt")
+# --watch: write once no event arrived for WATCH_DEBOUNCE seconds, but at
+# most WATCH_MAX_DELAY after the first pending change
+WATCH_DEBOUNCE = 1.0
+WATCH_MAX_DELAY = 10.0
+RESCAN = "rescan"
 
-
-def scan_whitepapers() -> list[dict]:
+PAPER_EXTENSIONS = (".pdf", ".txt")
+GLOB_CHARS = re.compile(r"[*?[]")
+
+
+class AssetIndex:
+    """Names in each scanned directory, listed once with os.scandir.
+
+    cache maps directory path to {"mtime_ns", "files", "dirs"} from a previous
+    run; a directory whose mtime still matches is not listed again. Directory
+    mtimes change when entries are added, removed or renamed, which is all the
+    status checks look at.
+    """
+
+    def __init__(self, cache: dict[str, dict] | None = None):
+        self.cache = cache if cache is not None else {}
+        self.listings: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        self.scanned = 0
+        self.reused = 0
+
+    def _listing(self, directory: Path) -> tuple[frozenset[str], frozenset[str]]:
+        """(files, subdirectories) of directory; empty if it does not exist."""
+        key = str(directory)
+        listing = self.listings.get(key)
+        if listing is not None:
+            return listing
+
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self.cache.pop(key, None)
+            listing = (frozenset(), frozenset())
+        else:
+            cached = self.cache.get(key)
+            if cached and cached.get("mtime_ns") == mtime_ns:
+                listing = (frozenset(cached["files"]), frozenset(cached["dirs"]))
+                self.reused += 1
+            else:
+                listing = self._scan(directory, key, mtime_ns)
+        self.listings[key] = listing
+        return listing
+
+    def _scan(
+        self, directory: Path, key: str, mtime_ns: int
+    ) -> tuple[frozenset[str], frozenset[str]]:
+        files, dirs = [], []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+        self.scanned += 1
+
+        if time.time_ns() - mtime_ns > RACY_SECONDS * 1_000_000_000:
+            self.cache[key] = {"mtime_ns": mtime_ns, "files": sorted(files), "dirs": sorted(dirs)}
+        else:
+            self.cache.pop(key, None)
+        return frozenset(files), frozenset(dirs)
+
+    def files(self, directory: Path) -> frozenset[str]:
+        return self._listing(directory)[0]
+
+    def dirs(self, directory: Path) -> frozenset[str]:
+        return self._listing(directory)[1]
+
+    def exists(self, directory: Path, pattern: str) -> bool:
+        """Whether a file or directory in directory matches a glob pattern."""
+        files, dirs = self._listing(directory)
+        if not GLOB_CHARS.search(pattern):
+            return pattern in files or pattern in dirs
+        return any(fnmatchcase(name, pattern) for name in files | dirs)
+
+    def cache_entries(self) -> dict[str, dict]:
+        """Cache entries for the directories visited in this run."""
+        return {key: self.cache[key] for key in self.listings if key in self.cache}
+
+
+def load_scan_cache(path: Path | None = None) -> dict[str, dict]:
+    """Read cached directory listings; empty if missing or unreadable."""
+    path = path or SCAN_CACHE_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SCAN_CACHE_VERSION:
+        return {}
+    return data.get("dirs", {})
+
+
+def save_scan_cache(index: AssetIndex, path: Path | None = None) -> None:
+    """Write the listings of directories visited by index."""
+    path = path or SCAN_CACHE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    data = {"version": SCAN_CACHE_VERSION, "dirs": index.cache_entries()}
+    tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+def scan_whitepapers(index: AssetIndex | None = None) -> list[dict]:
     """Scan whitepapers directory for all papers (.pdf and .txt)."""
+    index = index or AssetIndex()
     papers = []
 
-    for category_dir in sorted(WHITEPAPERS_DIR.iterdir()):
-        if not category_dir.is_dir() or category_dir.name.startswith("."):
+    for category in sorted(index.dirs(WHITEPAPERS_DIR)):
+        if category.startswith("."):
             continue
-        if category_dir.name == "status.json":
-            continue
-
-        category = category_dir.name
 
-        for paper_file in sorted(category_dir.iterdir()):
-            if not paper_file.is_file():
-                continue
+        for file_name in sorted(index.files(WHITEPAPERS_DIR / category)):
+            paper_file = Path(file_name)
             if paper_file.suffix.lower() not in PAPER_EXTENSIONS:
                 continue
-            if "-slides" in paper_file.name:
+            if "-slides" in file_name:
                 continue
 
             name = paper_file.stem
@@ -71,91 +191,97 @@ def scan_whitepapers() -> list[dict]:
     return papers
 
 
-def check_exists(dirs: list[Path], pattern: str) -> bool:
+def check_exists(dirs: list[Path], pattern: str, index: AssetIndex | None = None) -> bool:
     """Check if file matching pattern exists in any of the directories."""
-    for d in dirs:
-        if not d.exists():
-            continue
-        if list(d.glob(pattern)):
-            return True
-    return False
+    index = index or AssetIndex()
+    return any(index.exists(d, pattern) for d in dirs)
 
 
-def check_slides_exist(dirs: list[Path], ep_name: str) -> bool:
+def check_slides_exist(dirs: list[Path], ep_name: str, index: AssetIndex | None = None) -> bool:
     """Check if slides exist for episode (PDF or extracted PNGs)."""
+    index = index or AssetIndex()
     for d in dirs:
-        if not d.exists():
-            continue
         # Check for PDF file directly in slides dir
-        if (d / f"{ep_name}.pdf").exists():
+        if f"{ep_name}.pdf" in index.files(d):
             return True
         # Check for extracted PNGs in episode subdirectory
-        slides_dir = d / ep_name
-        if slides_dir.is_dir() and list(slides_dir.glob("*.png")):
+        if ep_name in index.dirs(d) and index.exists(d / ep_name, "*.png"):
             return True
     return False
 
 
-def check_archived(ep_name: str) -> bool:
+def check_archived(ep_name: str, index: AssetIndex | None = None) -> bool:
     """Check if episode is archived (has files in archive directory)."""
-    archive_audio = ARCHIVE_DIR / "audio" / f"{ep_name}.m4a"
-    archive_video = ARCHIVE_DIR / "video" / f"{ep_name}.mp4"
-    return archive_audio.exists() or archive_video.exists()
+    index = index or AssetIndex()
+    return f"{ep_name}.m4a" in index.files(ARCHIVE_DIR / "audio") or (
+        f"{ep_name}.mp4" in index.files(ARCHIVE_DIR / "video")
+    )
 
 
-def check_slides_prompt(ep_name: str) -> bool:
+def check_slides_prompt(ep_name: str, index: AssetIndex | None = None) -> bool:
     """Check if slides prompt exists for episode."""
-    return (SLIDES_PROMPTS_DIR / f"{ep_name}.md").exists()
+    index = index or AssetIndex()
+    return f"{ep_name}.md" in index.files(SLIDES_PROMPTS_DIR)
 
 
-def check_thumbnail_prompt(ep_name: str) -> bool:
+def check_thumbnail_prompt(ep_name: str, index: AssetIndex | None = None) -> bool:
     """Check if thumbnail prompt exists for episode."""
-    return (THUMBNAILS_PROMPTS_DIR / f"{ep_name}-thumbnail.md").exists()
+    index = index or AssetIndex()
+    return f"{ep_name}-thumbnail.md" in index.files(THUMBNAILS_PROMPTS_DIR)
+
 
+def refresh_paper(paper: dict, old_paper: dict, index: AssetIndex) -> None:
+    """Fill in paper's asset flags, carrying over manually tracked fields."""
+    ep_name = f"{paper['episode']}-{paper['name']}"
 
-def generate_status() -> dict:
-    """Generate complete status by scanning directories."""
-    existing = load_status()
+    # Skip status updates for archived episodes - preserve all existing fields
+    if old_paper.get("archived"):
+        paper.update(
+            {k: v for k, v in old_paper.items() if k not in ("episode", "name", "category")}
+        )
+        return
+
+    for field in PRESERVED_FIELDS:
+        if field in old_paper:
+            paper[field] = old_paper[field]
+
+    if old_paper.get("uploaded"):
+        paper["uploaded"] = True
+    if old_paper.get("youtube_url"):
+        paper["youtube_url"] = old_paper["youtube_url"]
+    if old_paper.get("published"):
+        paper["published"] = True
+
+    paper["audio"] = check_exists(AUDIO_DIRS, f"{ep_name}.m4a", index)
+    paper["slides_prompt"] = check_slides_prompt(ep_name, index)
+    paper["slides"] = check_slides_exist(SLIDES_DIRS, ep_name, index)
+    paper["transcript"] = check_exists(TRANSCRIPTS_DIRS, f"{ep_name}.json", index)
+    paper["thumbnail_prompt"] = check_thumbnail_prompt(ep_name, index)
+    paper["thumbnail"] = check_exists(THUMBNAILS_DIRS, f"{ep_name}.png", index) or check_exists(
+        THUMBNAILS_DIRS, f"{ep_name}-optimized.png", index
+    )
+    paper["video"] = check_exists(VIDEO_DIRS, f"{ep_name}.mp4", index)
+
+    if check_archived(ep_name, index):
+        paper["archived"] = True
+
+
+def generate_status(existing: dict | None = None, index: AssetIndex | None = None) -> dict:
+    """Generate complete status by scanning directories.
+
+    existing is the current status.json content (loaded if not given); its
+    manually tracked fields are carried over. index holds the directory
+    listings (a fresh, uncached one if not given).
+    """
+    if existing is None:
+        existing = load_status()
     existing_papers = {p.get("episode"): p for p in existing.get("papers", [])}
+    index = index or AssetIndex()
 
-    papers = scan_whitepapers()
+    papers = scan_whitepapers(index)
 
     for paper in papers:
-        ep_num = paper["episode"]
-        ep_name = f"{ep_num}-{paper['name']}"
-
-        old_paper = existing_papers.get(ep_num, {})
-
-        # Skip status updates for archived episodes - preserve all existing fields
-        if old_paper.get("archived"):
-            paper.update(
-                {k: v for k, v in old_paper.items() if k not in ("episode", "name", "category")}
-            )
-            continue
-
-        for field in PRESERVED_FIELDS:
-            if field in old_paper:
-                paper[field] = old_paper[field]
-
-        if old_paper.get("uploaded"):
-            paper["uploaded"] = True
-        if old_paper.get("youtube_url"):
-            paper["youtube_url"] = old_paper["youtube_url"]
-        if old_paper.get("published"):
-            paper["published"] = True
-
-        paper["audio"] = check_exists(AUDIO_DIRS, f"{ep_name}.m4a")
-        paper["slides_prompt"] = check_slides_prompt(ep_name)
-        paper["slides"] = check_slides_exist(SLIDES_DIRS, ep_name)
-        paper["transcript"] = check_exists(TRANSCRIPTS_DIRS, f"{ep_name}.json")
-        paper["thumbnail_prompt"] = check_thumbnail_prompt(ep_name)
-        paper["thumbnail"] = check_exists(THUMBNAILS_DIRS, f"{ep_name}.png") or check_exists(
-            THUMBNAILS_DIRS, f"{ep_name}-optimized.png"
-        )
-        paper["video"] = check_exists(VIDEO_DIRS, f"{ep_name}.mp4")
-
-        if check_archived(ep_name):
-            paper["archived"] = True
+        refresh_paper(paper, existing_papers.get(paper["episode"], {}), index)
 
     papers.sort(key=lambda p: int(p.get("episode", "0")))
     status = {"papers": papers, "summary": {}, "updated": ""}
@@ -163,64 +289,200 @@ def generate_status() -> dict:
     return status
 
 
+# Flag conditions for each pipeline queue (see status_utils.select_papers)
+READY_FOR_VIDEO = {
+    "archived": False,
+    "audio": True,
+    "slides": True,
+    "transcript": True,
+    "thumbnail": True,
+    "video": False,
+}
+READY_FOR_SLIDES = {
+    "archived": False,
+    "audio": True,
+    "transcript": True,
+    "slides_prompt": False,
+    "slides_scheduled": False,
+    "slides": False,
+}
+READY_FOR_UPLOAD = {"archived": False, "video": True, "uploaded": False}
+READY_FOR_ARCHIVE = {"uploaded": True, "archived": False}
+READY_FOR_PUBLISH = {"uploaded": True, "published": False}
+NEED_THUMBNAIL_PROMPTS = {"archived": False, "thumbnail": False, "thumbnail_prompt": False}
+
+
 def get_ready_for_video(papers: list[dict]) -> list[dict]:
     """Get episodes ready for video generation (have all assets except video)."""
-    return [
-        p
-        for p in papers
-        if not p.get("archived")
-        and p.get("audio")
-        and p.get("slides")
-        and p.get("transcript")
-        and p.get("thumbnail")
-        and not p.get("video")
-    ]
+    return [p for p in papers if matches_flags(p, READY_FOR_VIDEO)]
 
 
 def get_ready_for_slides(papers: list[dict]) -> list[dict]:
     """Get episodes ready for slide prompt generation (have audio+transcript, no slides)."""
-    return [
-        p
-        for p in papers
-        if not p.get("archived")
-        and p.get("audio")
-        and p.get("transcript")
-        and not p.get("slides_prompt")
-        and not p.get("slides_scheduled")
-        and not p.get("slides")
-    ]
+    return [p for p in papers if matches_flags(p, READY_FOR_SLIDES)]
 
 
 def get_ready_for_upload(papers: list[dict]) -> list[dict]:
     """Get episodes ready for upload (have video, not uploaded)."""
-    return [p for p in papers if not p.get("archived") and p.get("video") and not p.get("uploaded")]
+    return [p for p in papers if matches_flags(p, READY_FOR_UPLOAD)]
 
 
 def get_ready_for_archive(papers: list[dict]) -> list[dict]:
     """Get episodes ready for archive (uploaded, not archived)."""
-    return [p for p in papers if p.get("uploaded") and not p.get("archived")]
+    return [p for p in papers if matches_flags(p, READY_FOR_ARCHIVE)]
 
 
 def get_ready_for_publish(papers: list[dict]) -> list[dict]:
     """Get episodes ready to publish (uploaded but not published, including archived)."""
-    return [p for p in papers if p.get("uploaded") and not p.get("published")]
+    return [p for p in papers if matches_flags(p, READY_FOR_PUBLISH)]
 
 
 def get_need_thumbnail_prompts(papers: list[dict]) -> list[dict]:
     """Get episodes that need thumbnail prompts (no prompt, no thumbnail yet)."""
-    return [
-        p
-        for p in papers
-        if not p.get("archived") and not p.get("thumbnail") and not p.get("thumbnail_prompt")
+    return [p for p in papers if matches_flags(p, NEED_THUMBNAIL_PROMPTS)]
+
+
+def watch_roots() -> list[Path]:
+    """Directory trees whose changes affect status."""
+    return [YOUTUBE_DIR, WHITEPAPERS_DIR, ARCHIVE_DIR.parent]
+
+
+def classify_change(path: Path) -> str | None:
+    """Episode number whose flags a change at path affects.
+
+    Returns RESCAN for changes to the paper list in whitepapers/ (or a watch
+    root itself, reported after dropped events) and None for unrelated files.
+    """
+    roots = watch_roots()
+    if path in roots:
+        return RESCAN
+    if path.is_relative_to(WHITEPAPERS_DIR):
+        parts = path.relative_to(WHITEPAPERS_DIR).parts
+        if len(parts) == 1 and not path.suffix:
+            return RESCAN  # category directory
+        if len(parts) == 2 and path.suffix.lower() in PAPER_EXTENSIONS:
+            return RESCAN
+        return None
+
+    for root in roots:
+        if path.is_relative_to(root):
+            for part in path.relative_to(root).parts:
+                episode = get_episode_from_name(part)
+                if episode:
+                    return episode
+    return None
+
+
+def _changed_fields(old: dict, new: dict) -> list[str]:
+    return [f for f, v in new.items() if f not in old or old[f] != v] + [
+        f for f in old if f not in new
     ]
 
 
+def apply_changes(episodes: set[str], rescan: bool = False) -> list[str]:
+    """Refresh flags of the given episodes (or all papers) in one status transaction.
+
+    Returns "NN-name: field, ..." for every episode whose entry changed.
+    """
+    index = AssetIndex()
+    changes = []
+    with status_transaction() as transaction:
+        if rescan:
+            before = {p.get("episode"): p for p in transaction.papers}
+            status = generate_status(transaction.status, index)
+            for paper in status["papers"]:
+                old = before.pop(paper["episode"], None)
+                fields = _changed_fields(old, paper) if old is not None else ["added"]
+                if fields:
+                    changes.append(f"{paper['episode']}-{paper['name']}: {', '.join(fields)}")
+            changes += [f"{ep}-{old.get('name', '')}: removed" for ep, old in before.items()]
+            if changes:
+                transaction.replace(status)
+            return changes
+
+        for ep in sorted(episodes, key=int):
+            old = transaction.paper(ep)
+            if old is None:
+                continue  # no whitepaper for it, nothing to track
+            paper = {k: old.get(k, "") for k in ("episode", "name", "category")}
+            refresh_paper(paper, old, index)
+            fields = [f for f, v in paper.items() if f not in old or old[f] != v]
+            for field in fields:
+                transaction.set(ep, field, paper[field])
+            if fields:
+                changes.append(f"{ep}-{paper['name']}: {', '.join(fields)}")
+    return changes
+
+
+def watch_status(
+    watcher: InotifyWatcher | PollingWatcher,
+    debounce: float = WATCH_DEBOUNCE,
+    max_delay: float = WATCH_MAX_DELAY,
+) -> None:
+    """Apply filesystem changes to status until interrupted.
+
+    Affected episodes are collected until no new event arrives for debounce
+    seconds (or max_delay passed since the first one), then written in one
+    transaction.
+    """
+    episodes: set[str] = set()
+    rescan = False
+    first_change = None
+    while True:
+        paths = watcher.wait(debounce if first_change is not None else None)
+        for path in paths:
+            affected = classify_change(path)
+            if affected == RESCAN:
+                rescan = True
+            elif affected:
+                episodes.add(affected)
+        if first_change is None:
+            if not (episodes or rescan):
+                continue
+            first_change = time.monotonic()
+        if paths and time.monotonic() - first_change < max_delay:
+            continue
+
+        changes = apply_changes(episodes, rescan)
+        for line in changes:
+            print(f"   🔄 {line}")
+        if changes and sqlite_enabled():
+            export_status_json()
+        episodes = set()
+        rescan = False
+        first_change = None
+
+
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate whitepapers/status.json")
+    parser.add_argument("--rescan", action="store_true", help="Ignore cached directory listings")
+    parser.add_argument(
+        "--watch", action="store_true", help="Keep running and update status as files change"
+    )
+    parser.add_argument(
+        "--poll", action="store_true", help="With --watch: poll directories instead of inotify"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=WATCH_DEBOUNCE,
+        help=f"With --watch: seconds of quiet before writing (default: {WATCH_DEBOUNCE:g})",
+    )
+    args = parser.parse_args()
+
     print("📊 Generating status.json")
     print("━" * 40)
 
-    status = generate_status()
+    start = time.perf_counter()
+    index = AssetIndex({} if args.rescan else load_scan_cache())
+    with status_transaction() as transaction:
+        status = generate_status(transaction.status, index)
+        transaction.replace(status)
+    save_scan_cache(index)
+    elapsed = time.perf_counter() - start
     papers = status["papers"]
+
+    print(f"   🗂️  Scanned {index.scanned} dirs, {index.reused} unchanged ({elapsed * 1000:.0f}ms)")
     summary = status["summary"]
 
     print(f"   Total papers: {summary['total']}")
@@ -235,11 +497,10 @@ def main() -> int:
     print(f"   🌐 Published: {summary.get('published', 0)}")
     print(f"   📦 Archived: {summary.get('archived', 0)}")
 
-    save_status(status)
-
     print()
     print("━" * 40)
-    print(f"✅ Saved to whitepapers/status.json ({len(papers)} papers)")
+    target = "status.db" if sqlite_enabled() else "status.json"
+    print(f"✅ Saved to whitepapers/{target} ({len(papers)} papers)")
 
     # Ready for video generation
     ready_video = get_ready_for_video(papers)
@@ -289,6 +550,18 @@ def main() -> int:
         for p in need_thumbnail_prompts:
             print(f"   {p['episode']}-{p['name']}")
 
+    if args.watch:
+        watcher = make_watcher(watch_roots(), poll=args.poll)
+        method = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+        print()
+        print(f"👀 Watching youtube/, whitepapers/ and archive/ ({method}), Ctrl+C to stop")
+        try:
+            watch_status(watcher, args.debounce)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped")
+        finally:
+            watcher.close()
+
     return 0
 
 
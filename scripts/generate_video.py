@@ -2,17 +2,68 @@
 """Generate video from concat.txt and audio file using ffmpeg."""
 
 import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
-from status_utils import update_episode_status
+from generate_status import READY_FOR_VIDEO
+from status_utils import select_papers, update_episode_status
+from verify_concat import parse_concat
 
 SCRIPT_DIR = Path(__file__).parent.parent
 YOUTUBE_DIR = SCRIPT_DIR / "youtube"
 ASSETS_DIR = YOUTUBE_DIR / "pl"
 OUTPUT_DIR = YOUTUBE_DIR / "output"
+SEGMENTS_DIR = YOUTUBE_DIR / ".segments"
+LOGS_DIR = OUTPUT_DIR / "logs"
+DEFAULT_FFMPEG_THREADS = 4
+BLACK_THRESHOLD = 0.05
+CHECK_WINDOW = 3.0
+FPS = 30
+OUTRO_SECONDS = 5
+REENCODE_AUDIO_ARGS = ["-af", f"apad=pad_dur={OUTRO_SECONDS}", "-c:a", "aac", "-b:a", "192k"]
+PASSTHROUGH_SAMPLE_RATES = {44100, 48000}
+SCALE_PAD_FILTER = (
+    "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2"
+)
+# Every segment must share these settings so they can be joined with -c copy
+SEGMENT_ENCODER_ARGS = [
+    "-pix_fmt",
+    "yuv420p",
+    "-video_track_timescale",
+    "15360",
+]
+
+
+@dataclass(frozen=True)
+class EncodingProfile:
+    """libx264 settings for the slide video.
+
+    With gop_seconds set, the GOP is stretched to that length and keyframes
+    are forced at slide boundaries instead of every few seconds.
+    """
+
+    x264_args: tuple[str, ...] = ()
+    gop_seconds: float | None = None
+
+
+ENCODING_PROFILES = {
+    "default": EncodingProfile(),
+    "still": EncodingProfile(
+        x264_args=("-preset", "veryfast", "-tune", "stillimage", "-crf", "20"),
+        gop_seconds=60,
+    ),
+}
 
 
 def safe_relative(path: Path, base: Path) -> Path:
@@ -45,56 +96,261 @@ def get_duration(file_path: Path) -> float:
     return float(result.stdout.strip())
 
 
-def extract_frame(video: Path, output: Path, timestamp: float) -> None:
-    """Extract single frame from video at timestamp."""
-    subprocess.run(
+@dataclass
+class AudioInfo:
+    """Codec parameters of the first audio stream."""
+
+    codec: str
+    profile: str
+    sample_rate: int
+    channels: int
+    bit_rate: int | None = None
+
+    @property
+    def passthrough_ok(self) -> bool:
+        """True if the stream can be copied into the MP4 unchanged."""
+        return (
+            self.codec == "aac"
+            and self.profile == "LC"
+            and self.channels in (1, 2)
+            and self.sample_rate in PASSTHROUGH_SAMPLE_RATES
+        )
+
+
+def probe_audio(file_path: Path) -> AudioInfo | None:
+    """Probe audio codec parameters with ffprobe. Returns None if unknown."""
+    try:
+        result = run_cmd(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_entries",
+                "stream=codec_name,profile,sample_rate,channels,bit_rate",
+                "-of",
+                "json",
+                str(file_path),
+            ],
+            check=False,
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        stream = json.loads(result.stdout)["streams"][0]
+        bit_rate = stream.get("bit_rate")
+        return AudioInfo(
+            codec=stream["codec_name"],
+            profile=stream.get("profile", ""),
+            sample_rate=int(stream["sample_rate"]),
+            channels=int(stream["channels"]),
+            bit_rate=int(bit_rate) if bit_rate else None,
+        )
+    except (json.JSONDecodeError, KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+def cache_tmp(path: Path) -> Path:
+    """A new empty temp file next to path, with path's extension for ffmpeg.
+
+    Each writer gets its own name, so parallel renders producing the same
+    cache entry never write or rename each other's file.
+    """
+    fd, name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=f".tmp{path.suffix}"
+    )
+    os.close(fd)
+    return Path(name)
+
+
+def silent_tail(info: AudioInfo, cache_dir: Path) -> Path | None:
+    """Return a cached silent AAC outro matching the source stream."""
+    bit_rate = info.bit_rate or 192000
+    path = cache_dir / f"silence-{info.sample_rate}-{info.channels}ch-{bit_rate}.m4a"
+    if path.exists():
+        return path
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cache_tmp(path)
+    layout = "mono" if info.channels == 1 else "stereo"
+    result = run_cmd(
         [
             "ffmpeg",
             "-y",
             "-v",
             "error",
-            "-ss",
-            str(timestamp),
+            "-f",
+            "lavfi",
             "-i",
-            str(video),
-            "-vframes",
-            "1",
-            str(output),
+            f"anullsrc=r={info.sample_rate}:cl={layout}",
+            "-t",
+            str(OUTRO_SECONDS),
+            "-c:a",
+            "aac",
+            "-b:a",
+            str(bit_rate),
+            str(tmp),
         ],
-        check=True,
+        check=False,
     )
-
-
-def get_brightness(image: Path) -> float:
-    """Get average brightness of image (0-1 scale)."""
-    result = run_cmd(
-        ["magick", str(image), "-colorspace", "Gray", "-format", "%[fx:mean]", "info:"]
+    if result.returncode != 0:
+        tmp.unlink(missing_ok=True)
+        return None
+    tmp.replace(path)
+    return path
+
+
+def audio_inputs(
+    audio_file: Path, work_dir: Path, copy_audio: bool = True
+) -> tuple[list[str], list[str]]:
+    """Return (ffmpeg input args, audio codec args) for the final mux.
+
+    AAC-LC sources are stream-copied with a silent AAC tail appended through
+    the concat demuxer. Anything else is re-encoded through apad.
+    """
+    if copy_audio:
+        info = probe_audio(audio_file)
+        tail = silent_tail(info, SEGMENTS_DIR) if info and info.passthrough_ok else None
+        if tail:
+            list_file = work_dir / "audio.txt"
+            list_file.write_text(f"file '{audio_file.resolve()}'\nfile '{tail.resolve()}'\n")
+            return ["-f", "concat", "-safe", "0", "-i", str(list_file)], ["-c:a", "copy"]
+    return ["-i", str(audio_file)], REENCODE_AUDIO_ARGS
+
+
+@dataclass
+class VideoCheck:
+    """Result of single-pass video verification."""
+
+    duration: float
+    start_brightness: float
+    end_brightness: float
+    black_intervals: list[tuple[float, float]] = field(default_factory=list)
+
+    @property
+    def start_ok(self) -> bool:
+        return self.start_brightness >= BLACK_THRESHOLD
+
+    @property
+    def end_ok(self) -> bool:
+        return self.end_brightness >= BLACK_THRESHOLD
+
+
+def parse_ffmpeg_duration(stderr: str) -> float:
+    """Parse input duration from ffmpeg stderr header."""
+    match = re.search(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)", stderr)
+    if not match:
+        raise ValueError("Cannot find duration in ffmpeg output")
+    hours, mins, secs = match.groups()
+    return int(hours) * 3600 + int(mins) * 60 + float(secs)
+
+
+def luma_to_brightness(yavg: float) -> float:
+    """Convert limited-range (16-235) average luma to 0-1 brightness."""
+    return min(1.0, max(0.0, (yavg - 16.0) / 219.0))
+
+
+def find_black_intervals(frames: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """Group consecutive black frames into (start, end) intervals.
+
+    Frames are (timestamp, brightness) pairs; an interval ends at the next
+    non-black frame, or at the last black frame's timestamp.
+    """
+    intervals = []
+    black_start = None
+    last_time = 0.0
+    for timestamp, brightness in frames:
+        if brightness < BLACK_THRESHOLD:
+            if black_start is None:
+                black_start = timestamp
+        elif black_start is not None:
+            intervals.append((black_start, timestamp))
+            black_start = None
+        last_time = timestamp
+    if black_start is not None:
+        intervals.append((black_start, last_time))
+    return intervals
+
+
+def parse_video_check(stderr: str, window: float = CHECK_WINDOW) -> VideoCheck:
+    """Parse per-frame luma printed by analyze_video's filter graph.
+
+    Each window's metadata filter logs a "frame:N pts:X pts_time:T" line
+    followed by "lavfi.signalstats.YAVG=V". End window timestamps restart at
+    zero after -sseof, so they are shifted to absolute video time.
+    """
+    duration = parse_ffmpeg_duration(stderr)
+    offsets = {"start": 0.0, "end": max(0.0, duration - window)}
+    frames: dict[str, list[tuple[float, float]]] = {"start": [], "end": []}
+    current_time: dict[str, float] = {"start": 0.0, "end": 0.0}
+
+    pattern = re.compile(
+        r"\[metadata@(start|end) @ [^\]]+\] "
+        r"(?:frame:\d+\s+pts:\S+\s+pts_time:(\S+)|lavfi\.signalstats\.YAVG=(\S+))"
+    )
+    for match in pattern.finditer(stderr):
+        name, pts_time, yavg = match.groups()
+        if pts_time is not None:
+            current_time[name] = offsets[name] + float(pts_time)
+        else:
+            frames[name].append((current_time[name], luma_to_brightness(float(yavg))))
+
+    return VideoCheck(
+        duration=duration,
+        start_brightness=min((b for _, b in frames["start"]), default=0.0),
+        end_brightness=min((b for _, b in frames["end"]), default=0.0),
+        black_intervals=find_black_intervals(frames["start"]) + find_black_intervals(frames["end"]),
     )
-    return float(result.stdout.strip())
 
 
-def check_black_frames(video: Path, duration: float) -> tuple[bool, bool]:
-    """Check for black frames at start and end. Returns (start_ok, end_ok)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
+def analyze_video(video: Path, window: float = CHECK_WINDOW) -> VideoCheck:
+    """Verify video in one ffmpeg pass decoding only the first and last seconds.
 
-        start_ok = True
-        for i in range(3):
-            frame = tmppath / f"start_{i}.png"
-            extract_frame(video, frame, float(i))
-            if get_brightness(frame) < 0.05:
-                start_ok = False
-                break
+    The same file is opened twice (-t for the head, -sseof for the tail) and
+    both inputs run through signalstats; duration comes from the input header.
+    Replaces separate ffprobe + per-frame ffmpeg/magick calls.
+    """
+    graph = (
+        "[0:v]signalstats,metadata@start=mode=print:key=lavfi.signalstats.YAVG[start];"
+        "[1:v]signalstats,metadata@end=mode=print:key=lavfi.signalstats.YAVG[end]"
+    )
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-t",
+        str(window),
+        "-i",
+        str(video),
+        "-sseof",
+        f"-{window}",
+        "-i",
+        str(video),
+        "-filter_complex",
+        graph,
+        "-map",
+        "[start]",
+        "-f",
+        "null",
+        "-",
+        "-map",
+        "[end]",
+        "-f",
+        "null",
+        "-",
+    ]
+    result = run_cmd(cmd, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg verification failed: {result.stderr.strip()[-500:]}")
+    return parse_video_check(result.stderr, window)
 
-        end_ok = True
-        for i in range(3):
-            frame = tmppath / f"end_{i}.png"
-            extract_frame(video, frame, duration - 3 + i)
-            if get_brightness(frame) < 0.05:
-                end_ok = False
-                break
 
-    return start_ok, end_ok
+def format_black_intervals(intervals: list[tuple[float, float]]) -> str:
+    """Format black intervals as comma-separated start-end ranges."""
+    return ", ".join(f"{start:.2f}s-{end:.2f}s" for start, end in intervals)
 
 
 def find_episode_files(ep_num: str) -> tuple[Path | None, Path | None]:
@@ -111,59 +367,264 @@ def find_episode_files(ep_num: str) -> tuple[Path | None, Path | None]:
     return slides, audio
 
 
+def slide_start_times(concat_file: Path) -> list[float]:
+    """Return start time of every timed slide in concat.txt."""
+    times = []
+    elapsed = 0.0
+    for entry in parse_concat(concat_file):
+        if entry.duration > 0:
+            times.append(elapsed)
+            elapsed += entry.duration
+    return times
+
+
+def video_encoder_args(
+    profile: str, fps: int = FPS, keyframes: list[float] | None = None
+) -> list[str]:
+    """Build libx264 arguments for an encoding profile."""
+    settings = ENCODING_PROFILES[profile]
+    args = ["-c:v", "libx264", *settings.x264_args]
+    if settings.gop_seconds is not None:
+        args += ["-g", str(round(settings.gop_seconds * fps))]
+        if keyframes:
+            args += ["-force_key_frames", ",".join(f"{t:.3f}" for t in keyframes)]
+    return args
+
+
 def generate_video(
-    concat_file: Path, audio_file: Path, output_file: Path
+    concat_file: Path,
+    audio_file: Path,
+    output_file: Path,
+    profile: str = "default",
+    fps: int = FPS,
+    copy_audio: bool = True,
+    threads: int | None = None,
 ) -> subprocess.CompletedProcess:
     """Run ffmpeg to generate video from concat.txt and audio."""
+    keyframes = slide_start_times(concat_file) if ENCODING_PROFILES[profile].gop_seconds else None
+    thread_args = ["-threads", str(threads)] if threads else []
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_in, audio_args = audio_inputs(audio_file, Path(tmp), copy_audio)
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(concat_file),
+            *audio_in,
+            "-map",
+            "0:v",
+            "-map",
+            "1:a",
+            *video_encoder_args(profile, fps, keyframes),
+            "-vf",
+            f"{SCALE_PAD_FILTER},fps={fps}",
+            "-pix_fmt",
+            "yuv420p",
+            "-vsync",
+            "cfr",
+            *thread_args,
+            *audio_args,
+            str(output_file),
+        ]
+        return run_cmd(cmd, check=False)
+
+
+@dataclass
+class Segment:
+    """Still image shown for a fixed number of frames."""
+
+    image: Path
+    frames: int
+
+
+def plan_segments(concat_file: Path, fps: int = FPS) -> list[Segment]:
+    """Turn concat.txt entries into per-slide segments.
+
+    Frame counts come from rounding cumulative timestamps, so per-slide
+    rounding never accumulates into audio drift. Entries without a duration
+    (the repeated last slide) are skipped.
+    """
+    segments = []
+    elapsed = 0.0
+    frame_pos = 0
+    for entry in parse_concat(concat_file):
+        if entry.duration <= 0:
+            continue
+        elapsed += entry.duration
+        end_frame = round(elapsed * fps)
+        if end_frame > frame_pos:
+            image = entry.file_path
+            if not image.is_absolute():
+                image = concat_file.parent / image
+            segments.append(Segment(image, end_frame - frame_pos))
+            frame_pos = end_frame
+    return segments
+
+
+def segment_key(image_hash: str, frames: int, profile: str = "default", fps: int = FPS) -> str:
+    """Cache key for an encoded segment."""
+    encoder = " ".join(video_encoder_args(profile, fps) + SEGMENT_ENCODER_ARGS)
+    params = f"{image_hash}:{frames}:{fps}:{SCALE_PAD_FILTER}:{encoder}"
+    return hashlib.sha256(params.encode()).hexdigest()
+
+
+def encode_segment(
+    image: Path,
+    frames: int,
+    output: Path,
+    profile: str = "default",
+    fps: int = FPS,
+    threads: int | None = None,
+) -> subprocess.CompletedProcess:
+    """Encode one still image into an H.264 segment of exactly `frames` frames."""
+    tmp = cache_tmp(output)
     cmd = [
         "ffmpeg",
         "-y",
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        str(concat_file),
+        "-v",
+        "error",
+        "-loop",
+        "1",
+        "-framerate",
+        str(fps),
         "-i",
-        str(audio_file),
-        "-af",
-        "apad=pad_dur=5",
-        "-c:v",
-        "libx264",
+        str(image),
+        "-frames:v",
+        str(frames),
         "-vf",
-        "scale=1920:1080:force_original_aspect_ratio=decrease,"
-        "pad=1920:1080:(ow-iw)/2:(oh-ih)/2,fps=30",
-        "-pix_fmt",
-        "yuv420p",
-        "-vsync",
-        "cfr",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "192k",
-        str(output_file),
+        SCALE_PAD_FILTER,
+        *video_encoder_args(profile, fps),
+        *SEGMENT_ENCODER_ARGS,
+        *(["-threads", str(threads)] if threads else []),
+        str(tmp),
     ]
-    return run_cmd(cmd, check=False)
-
+    result = run_cmd(cmd, check=False)
+    if result.returncode == 0:
+        tmp.replace(output)
+    else:
+        tmp.unlink(missing_ok=True)
+    return result
+
+
+def render_segments(
+    segments: list[Segment],
+    cache_dir: Path,
+    jobs: int | None = None,
+    profile: str = "default",
+    fps: int = FPS,
+) -> tuple[list[Path], int, subprocess.CompletedProcess | None]:
+    """Encode segments missing from the cache.
+
+    jobs is the CPU budget: it is split between parallel segment encodes and
+    ffmpeg threads per encode. Returns (segment files in playback order,
+    number encoded, first failure).
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    hashes: dict[Path, str] = {}
+    paths = []
+    todo: dict[Path, Segment] = {}
+    for seg in segments:
+        if seg.image not in hashes:
+            with seg.image.open("rb") as f:
+                hashes[seg.image] = hashlib.file_digest(f, "sha256").hexdigest()
+        path = cache_dir / f"{segment_key(hashes[seg.image], seg.frames, profile, fps)}.mp4"
+        paths.append(path)
+        if not path.exists():
+            todo[path] = seg
+
+    failure = None
+    if todo:
+        budget = jobs or os.cpu_count() or 1
+        workers = min(budget, len(todo))
+        threads = max(1, budget // workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                lambda item: encode_segment(
+                    item[1].image, item[1].frames, item[0], profile, fps, threads
+                ),
+                todo.items(),
+            )
+            for result in results:
+                if result.returncode != 0 and failure is None:
+                    failure = result
+    return paths, len(todo), failure
+
+
+def assemble_segments(
+    segment_files: list[Path], audio_file: Path, output_file: Path, copy_audio: bool = True
+) -> subprocess.CompletedProcess:
+    """Join encoded segments with -c copy and mux in the audio track."""
+    with tempfile.TemporaryDirectory() as tmp:
+        list_file = Path(tmp) / "segments.txt"
+        list_file.write_text("".join(f"file '{p.resolve()}'\n" for p in segment_files))
+        audio_in, audio_args = audio_inputs(audio_file, Path(tmp), copy_audio)
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_file),
+            *audio_in,
+            "-map",
+            "0:v",
+            "-map",
+            "1:a",
+            "-c:v",
+            "copy",
+            *audio_args,
+            "-movflags",
+            "+faststart",
+            str(output_file),
+        ]
+        return run_cmd(cmd, check=False)
+
+
+def generate_video_incremental(
+    concat_file: Path,
+    audio_file: Path,
+    output_file: Path,
+    cache_dir: Path = SEGMENTS_DIR,
+    profile: str = "default",
+    fps: int = FPS,
+    copy_audio: bool = True,
+    jobs: int | None = None,
+) -> subprocess.CompletedProcess:
+    """Generate video from cached per-slide segments, encoding only changed ones."""
+    segments = plan_segments(concat_file, fps)
+    if not segments:
+        return subprocess.CompletedProcess([], 1, "", f"No timed entries in {concat_file}")
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Generate video from concat.txt and audio",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s 28
-  %(prog)s 28 --concat path/to/concat.txt
-  %(prog)s 28 --skip-verify
-        """,
+    segment_files, encoded, failure = render_segments(
+        segments, cache_dir, jobs=jobs, profile=profile, fps=fps
     )
-    parser.add_argument("episode", help="Episode number (e.g., 28)")
-    parser.add_argument("--concat", type=Path, help="Custom concat.txt path")
-    parser.add_argument("--skip-verify", action="store_true", help="Skip verification step")
-    args = parser.parse_args()
+    print(f"   ♻️  Segments: {len(segments) - encoded} cached, {encoded} encoded")
+    if failure is not None:
+        return failure
+    return assemble_segments(segment_files, audio_file, output_file, copy_audio)
+
+
+@dataclass
+class RenderOptions:
+    """Encoding options shared by single-episode and batch runs."""
 
-    ep_num = args.episode
+    concat: Path | None = None
+    skip_verify: bool = False
+    incremental: bool = False
+    profile: str = "default"
+    fps: int = FPS
+    copy_audio: bool = True
+    threads: int | None = None
 
+
+def render_episode(ep_num: str, options: RenderOptions, update_status: bool = True) -> int:
+    """Generate and verify the video for one episode. Returns exit code."""
     # Find episode files
     slides_dir, audio_file = find_episode_files(ep_num)
 
@@ -178,7 +639,7 @@ Examples:
         return 1
 
     # Determine concat file path
-    concat_file = args.concat if args.concat else slides_dir / "concat.txt"
+    concat_file = options.concat if options.concat else slides_dir / "concat.txt"
 
     if not concat_file.exists():
         print(f"❌ concat.txt not found: {concat_file}")
@@ -205,8 +666,28 @@ Examples:
     OUTPUT_DIR.mkdir(exist_ok=True)
 
     # Generate video
-    print("🔄 Running ffmpeg...")
-    result = generate_video(concat_file, audio_file, output_file)
+    if options.incremental:
+        print("🔄 Running ffmpeg (incremental segments)...")
+        result = generate_video_incremental(
+            concat_file,
+            audio_file,
+            output_file,
+            profile=options.profile,
+            fps=options.fps,
+            copy_audio=options.copy_audio,
+            jobs=options.threads,
+        )
+    else:
+        print("🔄 Running ffmpeg...")
+        result = generate_video(
+            concat_file,
+            audio_file,
+            output_file,
+            profile=options.profile,
+            fps=options.fps,
+            copy_audio=options.copy_audio,
+            threads=options.threads,
+        )
 
     if result.returncode != 0:
         print("❌ ffmpeg failed:")
@@ -220,18 +701,25 @@ Examples:
         return 1
 
     # Verification
-    if args.skip_verify:
+    if options.skip_verify:
         print("⏭️  Skipping verification")
         print()
         print("━" * 50)
         print(f"✅ Video created: {safe_relative(output_file, SCRIPT_DIR)}")
-        update_episode_status(ep_num, "video", True)
+        if update_status:
+            update_episode_status(ep_num, "video", True)
         return 0
 
     print()
     print("🔍 Verifying output...")
 
-    video_duration = get_duration(output_file)
+    try:
+        check = analyze_video(output_file)
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    video_duration = check.duration
     duration_diff = video_duration - expected_duration
     duration_ok = abs(duration_diff) <= 0.5
 
@@ -242,7 +730,7 @@ Examples:
         print(f"   ❌ Duration mismatch: {duration_diff:+.2f}s")
 
     print("   Checking for black frames...")
-    start_ok, end_ok = check_black_frames(output_file, video_duration)
+    start_ok, end_ok = check.start_ok, check.end_ok
 
     if start_ok:
         print("   ✅ Start frames OK")
@@ -254,13 +742,17 @@ Examples:
     else:
         print("   ❌ Black frames detected at end")
 
+    if check.black_intervals:
+        print(f"   Black intervals: {format_black_intervals(check.black_intervals)}")
+
     all_ok = duration_ok and start_ok and end_ok
 
     print()
     print("━" * 50)
     if all_ok:
         print(f"✅ Video created and verified: {safe_relative(output_file, SCRIPT_DIR)}")
-        update_episode_status(ep_num, "video", True)
+        if update_status:
+            update_episode_status(ep_num, "video", True)
         return 0
     else:
         print(f"⚠️  Video created but verification failed: {safe_relative(output_file, SCRIPT_DIR)}")
@@ -273,5 +765,170 @@ Examples:
         return 1
 
 
+@dataclass
+class EpisodeResult:
+    """Outcome of rendering a single episode in batch mode."""
+
+    episode: str
+    name: str
+    returncode: int
+    elapsed: float
+    log_file: Path
+
+
+def render_episode_worker(episode: str, name: str, options: RenderOptions) -> EpisodeResult:
+    """Render one episode with output captured to its log file (runs in worker process)."""
+    buffer = io.StringIO()
+    start = time.monotonic()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            returncode = render_episode(episode, options, update_status=False)
+        except Exception as e:
+            print(f"❌ {type(e).__name__}: {e}")
+            returncode = 1
+
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    log_file = LOGS_DIR / f"{name}.log"
+    log_file.write_text(buffer.getvalue())
+    return EpisodeResult(episode, name, returncode, time.monotonic() - start, log_file)
+
+
+def plan_concurrency(
+    episodes: int, jobs: int | None = None, threads: int | None = None
+) -> tuple[int, int]:
+    """Pick (parallel encodes, ffmpeg threads each) so jobs x threads fits the cores."""
+    cpus = os.cpu_count() or 1
+    if threads is None:
+        threads = max(1, cpus // jobs) if jobs else min(cpus, DEFAULT_FFMPEG_THREADS)
+    max_jobs = max(1, cpus // threads)
+    jobs = min(jobs or max_jobs, max_jobs, max(1, episodes))
+    return jobs, threads
+
+
+def find_ready_episodes() -> tuple[list[tuple[str, str]], list[str]]:
+    """Return ([(episode, name)] ready to render, [names missing concat.txt])."""
+    ready = []
+    missing_concat = []
+    for paper in select_papers(**READY_FOR_VIDEO):
+        episode = paper["episode"]
+        name = f"{episode}-{paper['name']}"
+        slides_dir, _ = find_episode_files(episode)
+        if slides_dir and (slides_dir / "concat.txt").exists():
+            ready.append((episode, name))
+        else:
+            missing_concat.append(name)
+    return ready, missing_concat
+
+
+def run_ready(options: RenderOptions, jobs: int | None = None, threads: int | None = None) -> int:
+    """Render every episode that is ready for video and print summary."""
+    ready, missing_concat = find_ready_episodes()
+    for name in missing_concat:
+        print(f"⏭️  {name}: no concat.txt yet")
+    if not ready:
+        print("✅ No episodes ready for video generation")
+        return 0
+
+    jobs, threads = plan_concurrency(len(ready), jobs, threads)
+    options = replace(options, threads=threads)
+
+    print(f"🎬 Rendering {len(ready)} episodes")
+    print(f"   ⚙️  {jobs} parallel encodes, {threads} ffmpeg threads each")
+    print(f"   📄 Logs: {safe_relative(LOGS_DIR, SCRIPT_DIR)}")
+    print("━" * 50)
+
+    start = time.monotonic()
+    results: list[EpisodeResult] = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(render_episode_worker, episode, name, options)
+            for episode, name in ready
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result.returncode == 0:
+                update_episode_status(result.episode, "video", True)
+                print(f"✅ {result.name} ({result.elapsed:.1f}s)")
+            else:
+                print(f"❌ {result.name} ({result.elapsed:.1f}s)")
+
+    failed = [r for r in results if r.returncode != 0]
+    elapsed = time.monotonic() - start
+
+    print()
+    print("━" * 50)
+    print("📊 Summary:")
+    print(f"   Episodes: {len(results) - len(failed)}/{len(results)} rendered")
+    print(f"   Time:     {elapsed:.1f}s")
+
+    if failed:
+        print()
+        print("❌ Failed episodes:")
+        for result in sorted(failed, key=lambda r: r.episode):
+            print(f"   • {result.name} → {safe_relative(result.log_file, SCRIPT_DIR)}")
+        return 1
+
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate video from concat.txt and audio",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s 28
+  %(prog)s 28 --concat path/to/concat.txt
+  %(prog)s 28 --skip-verify
+  %(prog)s 28 --incremental
+  %(prog)s 28 --profile still --fps 10
+  %(prog)s --ready --jobs 2 --threads 4
+        """,
+    )
+    parser.add_argument("episode", nargs="?", help="Episode number (e.g., 28)")
+    parser.add_argument("--ready", action="store_true", help="Render every episode ready for video")
+    parser.add_argument("--jobs", type=int, help="Max parallel encodes with --ready")
+    parser.add_argument("--threads", type=int, help="ffmpeg threads per encode")
+    parser.add_argument("--concat", type=Path, help="Custom concat.txt path")
+    parser.add_argument("--skip-verify", action="store_true", help="Skip verification step")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached per-slide segments and join them without re-encoding",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(ENCODING_PROFILES),
+        default="default",
+        help="Encoding profile (still: stillimage tuning, long GOP keyed to slides)",
+    )
+    parser.add_argument(
+        "--reencode-audio",
+        action="store_true",
+        help="Always re-encode audio instead of copying AAC sources",
+    )
+    parser.add_argument("--fps", type=int, default=FPS, help=f"Output frame rate (default: {FPS})")
+    args = parser.parse_args()
+
+    if args.ready == bool(args.episode):
+        parser.error("give an episode number or --ready")
+    if args.ready and args.concat:
+        parser.error("--concat applies to a single episode")
+
+    options = RenderOptions(
+        concat=args.concat,
+        skip_verify=args.skip_verify,
+        incremental=args.incremental,
+        profile=args.profile,
+        fps=args.fps,
+        copy_audio=not args.reencode_audio,
+        threads=args.threads,
+    )
+    if args.ready:
+        return run_ready(options, args.jobs, args.threads)
+    return render_episode(args.episode, options)
+
+
 if __name__ == "__main__":
     sys.exit(main())
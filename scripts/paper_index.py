@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Content-addressed index of downloaded papers, used to catch duplicates.
+
+A paper is known by the SHA-256 of its file, by a normalized source key
+(arxiv:1706.03762, openreview:<id>, or the URL without scheme and www.) and
+by its name. Hashes are cached in whitepapers/.paper-index.json together
+with each file's size and mtime, so only new or changed files are read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from status_utils import WHITEPAPERS_DIR
+
+INDEX_NAME = ".paper-index.json"
+INDEX_VERSION = 1
+
+PAPER_EXTENSIONS = (".pdf", ".txt")
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# New-style (1706.03762) and old-style (cs/0112017, math.GT/0309136) arxiv IDs
+ARXIV_ID = r"(\d{4}\.\d{4,5}|[a-z-]+(?:\.[A-Z]{2})?/\d{7})"
+ARXIV_URL = re.compile(
+    r"(?:arxiv\.org|ar5iv(?:\.labs\.arxiv)?\.org|alphaxiv\.org)/(?:abs|pdf|html)/"
+    + ARXIV_ID
+    + r"(?:v\d+)?"
+)
+OPENREVIEW_URL = re.compile(r"openreview\.net/(?:forum|pdf)\?(?:[^#]*&)?id=([A-Za-z0-9_-]+)")
+
+
+def parse_arxiv_url(url: str) -> str | None:
+    """Extract the arxiv ID (without version) from abs, pdf, html or mirror URLs."""
+    if match := ARXIV_URL.search(url):
+        return match.group(1)
+    return None
+
+
+def parse_openreview_url(url: str) -> str | None:
+    """Extract OpenReview ID from a forum or pdf URL."""
+    if match := OPENREVIEW_URL.search(url):
+        return match.group(1)
+    return None
+
+
+def source_key(url: str) -> str:
+    """Key identifying the paper behind url, the same for all its mirrors."""
+    if arxiv_id := parse_arxiv_url(url):
+        return f"arxiv:{arxiv_id}"
+    if paper_id := parse_openreview_url(url):
+        return f"openreview:{paper_id}"
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").removeprefix("www.")
+    path = parts.path.rstrip("/")
+    query = f"?{parts.query}" if parts.query else ""
+    return f"url:{host}{path}{query}"
+
+
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _episode_and_name(relpath: str) -> tuple[str, str] | None:
+    match = re.match(r"^(\d+)-(.+)$", Path(relpath).stem)
+    return (match.group(1), match.group(2)) if match else None
+
+
+class PaperIndex:
+    """Papers in whitepapers/ by content hash, source key and name.
+
+    files maps a path relative to the whitepapers directory to
+    {"size", "mtime_ns", "sha256", "sources"}; everything else is derived
+    from it and from the source_url fields in status.json.
+    """
+
+    def __init__(self, files: dict[str, dict] | None = None, root: Path | None = None):
+        self.root = root or WHITEPAPERS_DIR
+        self.files = files if files is not None else {}
+        self.by_hash: dict[str, str] = {}
+        self.by_source: dict[str, str] = {}
+        self.by_name: dict[str, str] = {}
+        self.status_sources: dict[str, str] = {}
+        self.hashed = 0
+        self._rebuild()
+
+    @property
+    def path(self) -> Path:
+        return self.root / INDEX_NAME
+
+    @classmethod
+    def load(cls, root: Path | None = None) -> PaperIndex:
+        """Read the cached index of root; empty if missing, unreadable or outdated."""
+        path = (root or WHITEPAPERS_DIR) / INDEX_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            data = {}
+        return cls(data.get("files", {}), root)
+
+    def save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(INDEX_NAME + ".tmp")
+        data = {"version": INDEX_VERSION, "files": dict(sorted(self.files.items()))}
+        tmp.write_text(json.dumps(data, indent=1) + "\n", encoding="utf-8")
+        tmp.replace(self.path)
+
+    def _rebuild(self) -> None:
+        self.by_hash.clear()
+        self.by_source.clear()
+        self.by_name.clear()
+        for relpath, entry in self.files.items():
+            parsed = _episode_and_name(relpath)
+            if parsed is None:
+                continue
+            episode, name = parsed
+            self.by_hash.setdefault(entry["sha256"], episode)
+            self.by_name.setdefault(name, episode)
+            for key in entry.get("sources", []):
+                self.by_source.setdefault(key, episode)
+        for key, episode in self.status_sources.items():
+            self.by_source.setdefault(key, episode)
+
+    def _entry(self, path: Path, old: dict | None, stat: os.stat_result) -> dict:
+        if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+            return old
+        self.hashed += 1
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_sha256(path),
+            "sources": old.get("sources", []) if old else [],
+        }
+
+    def refresh(self, papers: list[dict[str, Any]] | None = None) -> None:
+        """Sync with the files on disk, hashing only new or modified ones.
+
+        papers (status.json entries) contribute the source keys of their
+        source_url.
+        """
+        files = {}
+        try:
+            with os.scandir(self.root) as categories:
+                category_dirs = [
+                    Path(e.path)
+                    for e in categories
+                    if not e.name.startswith(".") and e.is_dir(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            category_dirs = []
+        for category in category_dirs:
+            with os.scandir(category) as entries:
+                for e in entries:
+                    if not e.name.lower().endswith(PAPER_EXTENSIONS) or "-slides" in e.name:
+                        continue
+                    if not e.is_file():
+                        continue
+                    relpath = f"{category.name}/{e.name}"
+                    files[relpath] = self._entry(Path(e.path), self.files.get(relpath), e.stat())
+        self.files = files
+        self.status_sources = {
+            source_key(paper["source_url"]): paper["episode"]
+            for paper in papers or []
+            if paper.get("source_url") and "episode" in paper
+        }
+        self._rebuild()
+
+    def find(self, name: str, url: str) -> str | None:
+        """Episode of an indexed paper with this name or source, if any."""
+        return self.by_name.get(name) or self.by_source.get(source_key(url))
+
+    def find_file(self, path: Path) -> tuple[str, str | None]:
+        """(sha256, episode of an indexed paper with the same bytes)."""
+        sha = file_sha256(path)
+        return sha, self.by_hash.get(sha)
+
+    def add(self, path: Path, url: str, sha: str | None = None) -> None:
+        """Record a new file under whitepapers/ and the source it came from."""
+        stat = path.stat()
+        relpath = path.relative_to(self.root).as_posix()
+        self.files[relpath] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha or file_sha256(path),
+            "sources": [source_key(url)],
+        }
+        self._rebuild()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Validate PDFs without parsing them, falling back to a full parse only if needed.
+
+Checks run cheapest first on a memory-mapped file, so only the header, the
+trailer and the object headers named by the xref table are touched:
+
+1. header: %PDF- within the first 1KB
+2. trailer: %%EOF with a startxref offset before it
+3. xref: startxref points at an xref table whose in-use entries point at
+   "N G obj", or at an xref stream object
+
+Broken xref offsets are common and readers repair them, so a file failing
+tier 3 is opened with PyMuPDF (tier 4) before it is rejected.
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+SCRIPT_DIR = Path(__file__).parent.parent
+WHITEPAPERS_DIR = SCRIPT_DIR / "whitepapers"
+
+MIN_PDF_SIZE = 1000
+HEADER_WINDOW = 1024
+TRAILER_WINDOW = 2048
+
+STARTXREF = re.compile(rb"startxref\s+(\d+)")
+SUBSECTION = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*\r?\n?")
+XREF_ENTRY = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+OBJ_HEADER = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj\b")
+XREF_ENTRY_SIZE = 20
+
+
+@dataclass
+class PdfCheck:
+    """Result of validate_pdf. tier names the last check that ran."""
+
+    ok: bool
+    tier: str
+    reason: str = ""
+
+
+def _check_xref(data: mmap.mmap, offset: int, base: int) -> str | None:
+    """Why the xref at startxref offset does not line up, or None if it does."""
+    pos = base + offset
+    if pos >= len(data):
+        return f"startxref {offset} is past the end of the file"
+
+    if OBJ_HEADER.match(data, pos):
+        # Cross-reference stream (PDF 1.5+); entries are compressed
+        return None
+    if data[pos : pos + 4] != b"xref":
+        return f"startxref {offset} does not point at a cross-reference table"
+
+    pos += 4
+    while match := SUBSECTION.match(data, pos):
+        first, count = int(match.group(1)), int(match.group(2))
+        pos = match.end()
+        for number in range(first, first + count):
+            entry = XREF_ENTRY.match(data, pos)
+            if not entry:
+                return f"malformed xref entry for object {number}"
+            pos += XREF_ENTRY_SIZE
+            obj_offset = int(entry.group(1))
+            # Producers write "0000000000 ... n" for unused objects; readers treat it as free
+            if entry.group(3) == b"f" or number == 0 or obj_offset == 0:
+                continue
+            header = OBJ_HEADER.match(data, base + obj_offset)
+            if not header or int(header.group(1)) != number:
+                return f"xref offset of object {number} does not point at it"
+    if data[pos : pos + 64].lstrip()[:7] != b"trailer":
+        return "xref table is not followed by a trailer"
+    return None
+
+
+def _full_parse(path: Path, problem: str) -> PdfCheck:
+    """Tier 4: let PyMuPDF open the file (repairing the xref if it can)."""
+    if pymupdf is None:
+        return PdfCheck(True, "xref", f"{problem} (install pymupdf for a full check)")
+    try:
+        with pymupdf.open(path) as doc:
+            pages = doc.page_count
+    except Exception as e:
+        return PdfCheck(False, "parse", f"Unreadable PDF: {e}")
+    if pages == 0:
+        return PdfCheck(False, "parse", "PDF has no pages")
+    return PdfCheck(True, "parse", problem)
+
+
+def validate_pdf(path: Path) -> PdfCheck:
+    """Check that path is a complete PDF, parsing it only if the cheap checks disagree."""
+    size = path.stat().st_size
+    if size < MIN_PDF_SIZE:
+        return PdfCheck(False, "header", f"File too small for a PDF ({size} bytes)")
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        # Offsets are from the start of the file, but readers also accept
+        # them relative to a header preceded by junk
+        base = data.find(b"%PDF-", 0, HEADER_WINDOW)
+        if base < 0:
+            return PdfCheck(False, "header", "Not a PDF (bad header)")
+
+        tail = max(0, size - TRAILER_WINDOW)
+        eof = data.rfind(b"%%EOF", tail)
+        if eof < 0:
+            return PdfCheck(False, "trailer", "Incomplete PDF (no %%EOF trailer)")
+        start = data.rfind(b"startxref", tail, eof)
+        match = STARTXREF.match(data, start) if start >= 0 else None
+        if not match:
+            return PdfCheck(False, "trailer", "Incomplete PDF (no startxref before %%EOF)")
+
+        offset = int(match.group(1))
+        problem = _check_xref(data, offset, 0)
+        if problem and base:
+            problem = _check_xref(data, offset, base) and problem
+
+    if problem is None:
+        return PdfCheck(True, "xref")
+    return _full_parse(path, problem)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate downloaded papers without parsing every PDF",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                  # every PDF in whitepapers/
+  %(prog)s whitepapers/llm/01-attention-is-all-you-need.pdf
+        """,
+    )
+    parser.add_argument("files", nargs="*", type=Path, help="PDFs to check")
+    args = parser.parse_args()
+
+    files = args.files or sorted(WHITEPAPERS_DIR.glob("*/*.pdf"))
+    invalid = 0
+    parsed = 0
+    for path in files:
+        check = validate_pdf(path)
+        if check.tier == "parse":
+            parsed += 1
+        if not check.ok:
+            invalid += 1
+            print(f"❌ {path}: {check.reason}")
+        elif check.reason:
+            print(f"⚠️  {path}: {check.reason}")
+
+    print(f"\n📄 {len(files)} PDFs checked, {invalid} invalid, {parsed} needed a full parse")
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,40 @@
 Extracts slides from PDF and scales all images to full HD (1920x1080).
 This prevents ffmpeg concat demuxer from dropping frames due to resolution changes.
 Also compresses images exceeding 1.9MB threshold.
+
+Rendering backends:
+- native: PyMuPDF + Pillow, renders each page in-process directly at 1920x1080
+- imagemagick: pdftoppm + ImageMagick (fallback when native deps are missing)
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from status_utils import get_episode_number, load_status
 
 SCRIPT_DIR = Path(__file__).parent.parent
 COMPRESS_THRESHOLD = 1.9 * 1024 * 1024  # 1.9MB in bytes
@@ -18,6 +47,12 @@ YOUTUBE_DIR = SCRIPT_DIR / "youtube"
 ASSETS_DIR = YOUTUBE_DIR / "pl"
 THUMBNAILS_DIR = YOUTUBE_DIR / "thumbnails"
 LAST_SLIDE = ASSETS_DIR / "slides" / "last-slide.png"
+HAS_NATIVE_RENDERER = pymupdf is not None and Image is not None
+MANIFEST_NAME = ".prepare-manifest.json"
+MANIFEST_VERSION = 1
+# Indirect references in PDF object source, and page tree back-links not to follow
+REFERENCE = re.compile(r"\b(\d+) \d+ R\b")
+BACK_LINK = re.compile(r"/(?:Parent|P)\s+\d+ \d+ R\b")
 
 
 def run_cmd(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
@@ -67,7 +102,29 @@ def compress_image(src: Path, quality: int = 80, colors: int = 256) -> tuple[int
     return old_size, new_size
 
 
-def compress_large_images(images: list[Path]) -> None:
+def compress_image_native(src: Path, colors: int = 256) -> tuple[int, int]:
+    """Compress PNG image in-place using Pillow quantization. Returns (old_size, new_size)."""
+    old_size = src.stat().st_size
+    tmp_path = src.with_suffix(".tmp.png")
+
+    with Image.open(src) as image:
+        image.convert("RGB").quantize(colors=colors).save(tmp_path, format="PNG", optimize=True)
+
+    new_size = tmp_path.stat().st_size
+
+    # Only replace if smaller
+    if new_size < old_size:
+        tmp_path.replace(src)
+    else:
+        tmp_path.unlink()
+        new_size = old_size
+
+    return old_size, new_size
+
+
+def compress_large_images(
+    images: list[Path], compress: Callable[[Path], tuple[int, int]] = compress_image
+) -> None:
     """Compress images exceeding threshold."""
     large = [(img, img.stat().st_size) for img in images if img.stat().st_size > COMPRESS_THRESHOLD]
 
@@ -79,7 +136,7 @@ def compress_large_images(images: list[Path]) -> None:
 
     for img, _ in large:
         try:
-            old_size, new_size = compress_image(img)
+            old_size, new_size = compress(img)
             if new_size < old_size:
                 savings = (1 - new_size / old_size) * 100
                 print(
@@ -87,7 +144,7 @@ def compress_large_images(images: list[Path]) -> None:
                 )
             else:
                 print(f"      {img.name}: {format_size(old_size)} (already optimal)")
-        except RuntimeError as e:
+        except (RuntimeError, OSError) as e:
             print(f"      ❌ {img.name}: {e}")
 
 
@@ -123,6 +180,246 @@ def ensure_rgb(image_path: Path) -> None:
     run_cmd(["mogrify", "-colorspace", "sRGB", str(image_path)])
 
 
+def read_png_dimensions(image_path: Path) -> tuple[int, int]:
+    """Read width and height from PNG IHDR header without decoding pixels."""
+    with image_path.open("rb") as f:
+        header = f.read(24)
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        raise ValueError(f"Not a PNG file: {image_path}")
+    return int.from_bytes(header[16:20], "big"), int.from_bytes(header[20:24], "big")
+
+
+def to_rgb(image: "Image.Image", width: int, height: int) -> "Image.Image":
+    """Convert Pillow image to RGB at exact dimensions (force resize, no padding)."""
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if image.size != (width, height):
+        image = image.resize((width, height), Image.Resampling.LANCZOS)
+    return image
+
+
+def slide_filename(index: int, page_count: int) -> str:
+    """Slide filename matching pdftoppm (page number zero-padded to page count width)."""
+    return f"slide-{index + 1:0{len(str(page_count))}d}.png"
+
+
+def _resolve_references(
+    doc: "pymupdf.Document", source: str, memo: dict[int, str], path: set[int]
+) -> str:
+    """PDF object source with each indirect reference replaced by its target's digest."""
+    return REFERENCE.sub(lambda m: _object_digest(doc, int(m[1]), memo, path), source)
+
+
+def _object_digest(doc: "pymupdf.Document", xref: int, memo: dict[int, str], path: set[int]) -> str:
+    """Hash a PDF object with its stream and everything it references.
+
+    Digests do not depend on object numbering. /Parent and /P back-links are
+    not followed (they lead to the page tree, i.e. to every other page).
+    """
+    if xref in memo:
+        return memo[xref]
+    if xref in path:
+        return "cycle"
+    path.add(xref)
+    source = BACK_LINK.sub("", doc.xref_object(xref, compressed=True))
+    digest = hashlib.sha256(_resolve_references(doc, source, memo, path).encode())
+    if doc.xref_is_stream(xref):
+        digest.update(doc.xref_stream_raw(xref) or b"")
+    path.discard(xref)
+    memo[xref] = digest.hexdigest()
+    return memo[xref]
+
+
+def fingerprint_pages(pdf_file: Path) -> list[str]:
+    """Hash each PDF page's geometry and everything it draws from.
+
+    Covers content streams and the full closure of resources and annotations
+    (form XObjects, fonts, images, graphics states, appearance streams).
+    Cheap alternative to rendering for detecting which pages changed between
+    two versions of a deck (no decoding or rasterization involved).
+    """
+    fingerprints = []
+    memo: dict[int, str] = {}
+    with pymupdf.open(pdf_file) as doc:
+        for page in doc:
+            digest = hashlib.sha256()
+            digest.update(f"{tuple(page.rect)}:{page.rotation}".encode())
+            digest.update(_object_digest(doc, page.xref, memo, set()).encode())
+            # Resources may be inherited from an ancestor in the page tree
+            node = page.xref
+            kind, resources = doc.xref_get_key(node, "Resources")
+            while kind == "null":
+                kind, parent = doc.xref_get_key(node, "Parent")
+                if kind != "xref":
+                    break
+                node = int(parent.split()[0])
+                kind, resources = doc.xref_get_key(node, "Resources")
+            if node != page.xref and kind in ("xref", "dict"):
+                digest.update(_resolve_references(doc, resources, memo, set()).encode())
+            fingerprints.append(digest.hexdigest())
+    return fingerprints
+
+
+def render_pdf_native(
+    pdf_file: Path,
+    output_dir: Path,
+    width: int,
+    height: int,
+    workers: int = 1,
+    pages: set[int] | None = None,
+) -> list[Path]:
+    """Render PDF pages in-process directly at target dimensions.
+
+    Pages are rasterized sequentially (PyMuPDF is not thread-safe) while PNG
+    encoding runs on a thread pool. When pages is given, only those page
+    indices are rendered; paths for all pages are returned.
+    """
+    slides = []
+    with ThreadPoolExecutor(max_workers=workers) as pool, pymupdf.open(pdf_file) as doc:
+        futures = []
+        for page in doc:
+            slide = output_dir / slide_filename(page.number, doc.page_count)
+            slides.append(slide)
+            if pages is not None and page.number not in pages:
+                continue
+
+            rect = page.rect
+            matrix = pymupdf.Matrix(width / rect.width, height / rect.height)
+            pix = page.get_pixmap(matrix=matrix, colorspace=pymupdf.csRGB, alpha=False)
+            image = to_rgb(
+                Image.frombytes("RGB", (pix.width, pix.height), pix.samples), width, height
+            )
+            futures.append(pool.submit(image.save, slide, format="PNG"))
+
+        for future in futures:
+            future.result()
+    return slides
+
+
+def scale_image_native(src: Path, dst: Path, width: int, height: int) -> None:
+    """Scale image to exact dimensions in-process using Pillow."""
+    with Image.open(src) as image:
+        to_rgb(image, width, height).save(dst, format="PNG")
+
+
+def get_image_dimensions_native(image_path: Path) -> tuple[int, int]:
+    """Get image width and height using Pillow (reads header only)."""
+    with Image.open(image_path) as image:
+        return image.size
+
+
+def extract_slides(
+    pdf_file: Path,
+    output_dir: Path,
+    width: int,
+    height: int,
+    native: bool,
+    workers: int = 1,
+    pages: set[int] | None = None,
+) -> list[Path] | None:
+    """Extract slides from PDF at target dimensions. Returns None on failure.
+
+    Page selection only applies to the native renderer; pdftoppm always
+    extracts the whole document.
+    """
+    if native:
+        try:
+            return render_pdf_native(pdf_file, output_dir, width, height, workers, pages)
+        except (RuntimeError, ValueError) as e:
+            print(f"❌ PDF rendering failed: {e}")
+            return None
+
+    for stale in output_dir.glob("slide-*.png"):
+        stale.unlink()
+
+    result = run_cmd(
+        ["pdftoppm", "-png", "-r", "150", str(pdf_file), str(output_dir / "slide")], check=False
+    )
+    if result.returncode != 0:
+        print(f"❌ pdftoppm failed: {result.stderr}")
+        return None
+    return sorted(output_dir.glob("slide-*.png"))
+
+
+def scale_slide(slide: Path, width: int, height: int) -> tuple[int, int]:
+    """Scale extracted slide in-place to target dimensions. Returns original dimensions."""
+    dims = get_image_dimensions(slide)
+    scale_image(slide, slide, width, height)
+    return dims
+
+
+def prepare_static_image(
+    src: Path, dst: Path, width: int, height: int, label: str, native: bool
+) -> None:
+    """Copy image to output dir, scaling to target dimensions if needed."""
+    get_dims = get_image_dimensions_native if native else get_image_dimensions
+    scale = scale_image_native if native else scale_image
+
+    src_w, src_h = get_dims(src)
+    if (src_w, src_h) == (width, height):
+        shutil.copyfile(src, dst)
+        print(f"   ✅ {label} copied (dimensions already match)")
+    else:
+        print(f"   📐 Scaling from {src_w}x{src_h} to {width}x{height}")
+        scale(src, dst, width, height)
+        print(f"   ✅ {label} scaled and copied")
+
+
+def file_sha256(path: Path) -> str:
+    """Return SHA-256 hex digest of file contents."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def load_manifest(output_dir: Path, params: dict[str, Any]) -> dict[str, Any]:
+    """Load prepare manifest, or empty one if missing or made with other params."""
+    empty: dict[str, Any] = {"entries": {}}
+    manifest_path = output_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return empty
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return empty
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("params") != params:
+        return empty
+    return manifest
+
+
+def save_manifest(output_dir: Path, manifest: dict[str, Any]) -> None:
+    """Write prepare manifest atomically."""
+    manifest_path = output_dir / MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    tmp_path.replace(manifest_path)
+
+
+def is_cached(manifest: dict[str, Any], output: Path, source_hash: str | None = None) -> bool:
+    """Check output exists unmodified and (optionally) was built from source_hash."""
+    entry = manifest["entries"].get(output.name)
+    if entry is None or not output.exists():
+        return False
+    if source_hash is not None and entry.get("source") != source_hash:
+        return False
+    return file_sha256(output) == entry.get("output")
+
+
+def record_output(manifest: dict[str, Any], output: Path, source_hash: str) -> None:
+    """Record output hash and the source hash it was built from."""
+    manifest["entries"][output.name] = {"source": source_hash, "output": file_sha256(output)}
+
+
+def cached_slides(manifest: dict[str, Any], output_dir: Path, pdf_hash: str) -> list[Path] | None:
+    """Return cached slide paths if PDF and all slide outputs are unchanged."""
+    if manifest.get("pdf") != pdf_hash:
+        return None
+    names = sorted(name for name in manifest["entries"] if name.startswith("slide-"))
+    slides = [output_dir / name for name in names]
+    if not slides or not all(is_cached(manifest, slide) for slide in slides):
+        return None
+    return slides
+
+
 def find_episode(ep_num: str) -> Path | None:
     """Find PDF file matching episode number."""
     slides_dir = ASSETS_DIR / "slides"
@@ -130,30 +427,161 @@ def find_episode(ep_num: str) -> Path | None:
     return matches[0] if matches else None
 
 
-def main() -> int:
-    if len(sys.argv) < 2:
-        print("Usage: ./prepare-slides.py <episode_number>")
-        print("Example: ./prepare-slides.py 26")
-        print()
-        print("This script:")
-        print("  1. Extracts slides from PDF using pdftoppm")
-        print("  2. Scales thumbnail to match slide dimensions")
-        print("  3. Copies last-slide.png to output folder")
+def parse_episode_ranges(spec: str) -> list[str]:
+    """Parse episode spec like '12,15-20' into zero-padded episode numbers."""
+    episodes = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            if int(start) > int(end):
+                raise ValueError(f"Invalid episode range: {part}")
+            episodes.extend(str(n).zfill(2) for n in range(int(start), int(end) + 1))
+        else:
+            episodes.append(str(int(part)).zfill(2))
+    return list(dict.fromkeys(episodes))
+
+
+def has_extracted_slides(pdf_file: Path) -> bool:
+    """Check if PDF already has an extracted PNG directory next to it."""
+    output_dir = pdf_file.parent / pdf_file.stem
+    return output_dir.is_dir() and any(output_dir.glob("slide-*.png"))
+
+
+def find_pending_episodes(episodes: list[str] | None = None) -> list[Path]:
+    """Find slide PDFs to prepare using status.json.
+
+    With explicit episodes, returns every listed episode that has a PDF.
+    Otherwise returns non-archived episodes with a PDF but no extracted PNGs.
+    """
+    papers = load_status().get("papers", [])
+    slides_dir = ASSETS_DIR / "slides"
+    wanted = set(episodes) if episodes is not None else None
+
+    pdf_files = []
+    for paper in papers:
+        ep_num = paper.get("episode", "")
+        if wanted is not None and ep_num not in wanted:
+            continue
+        if wanted is None and (paper.get("archived") or not paper.get("slides")):
+            continue
+
+        pdf_file = slides_dir / f"{ep_num}-{paper.get('name', '')}.pdf"
+        if not pdf_file.exists():
+            continue
+        if wanted is None and has_extracted_slides(pdf_file):
+            continue
+        pdf_files.append(pdf_file)
+
+    return pdf_files
+
+
+@dataclass
+class EpisodeResult:
+    """Outcome of preparing a single episode in batch mode."""
+
+    name: str
+    returncode: int
+    slides: int
+    elapsed: float
+    log: str
+
+
+def prepare_episode_worker(pdf_file: Path, slide_workers: int, force: bool) -> EpisodeResult:
+    """Prepare one episode with captured output (runs in worker process)."""
+    buffer = io.StringIO()
+    start = time.monotonic()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            returncode = prepare_episode(pdf_file, slide_workers, force)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            print(f"❌ {type(e).__name__}: {e}")
+            returncode = 1
+
+    output_dir = pdf_file.parent / pdf_file.stem
+    slides = len(list(output_dir.glob("slide-*.png"))) if output_dir.is_dir() else 0
+    return EpisodeResult(
+        name=pdf_file.stem,
+        returncode=returncode,
+        slides=slides,
+        elapsed=time.monotonic() - start,
+        log=buffer.getvalue(),
+    )
+
+
+def run_batch(pdf_files: list[Path], jobs: int | None = None, force: bool = False) -> int:
+    """Prepare multiple episodes across a process pool and print summary."""
+    cpus = os.cpu_count() or 1
+    jobs = max(1, min(jobs or cpus, len(pdf_files)))
+    slide_workers = max(1, cpus // jobs)
+
+    print(f"📋 Preparing slides for {len(pdf_files)} episodes")
+    print(f"   ⚙️  {jobs} parallel episodes, {slide_workers} slide workers each")
+    print("━" * 50)
+
+    start = time.monotonic()
+    results: list[EpisodeResult] = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(prepare_episode_worker, pdf_file, slide_workers, force): pdf_file
+            for pdf_file in pdf_files
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            icon = "✅" if result.returncode == 0 else "❌"
+            print(f"{icon} {result.name}: {result.slides} slides ({result.elapsed:.1f}s)")
+
+    failed = [r for r in results if r.returncode != 0]
+    elapsed = time.monotonic() - start
+
+    print()
+    print("━" * 50)
+    print("📊 Summary:")
+    print(f"   Episodes: {len(results) - len(failed)}/{len(results)} prepared")
+    print(f"   Slides:   {sum(r.slides for r in results if r.returncode == 0)}")
+    print(f"   Time:     {elapsed:.1f}s")
+
+    if failed:
         print()
-        print("Available episodes:")
-        slides_dir = ASSETS_DIR / "slides"
-        if slides_dir.exists():
-            for f in sorted(slides_dir.glob("*.pdf")):
-                print(f"  {f.stem}")
+        print("❌ Failed episodes:")
+        for result in sorted(failed, key=lambda r: get_episode_number(r.name)):
+            print(f"   • {result.name}")
+            for line in result.log.strip().splitlines()[-5:]:
+                print(f"     {line}")
         return 1
 
-    ep_num = sys.argv[1]
-    pdf_file = find_episode(ep_num)
+    return 0
 
-    if not pdf_file:
-        print(f"❌ No PDF file found for episode {ep_num}")
-        return 1
 
+def print_usage() -> None:
+    """Print usage help with available episodes."""
+    print("Usage: ./prepare-slides.py <episode_number>")
+    print("       ./prepare-slides.py --all | --episodes 12,15-20 [--jobs N]")
+    print("Example: ./prepare-slides.py 26")
+    print()
+    print("This script:")
+    print("  1. Extracts slides from PDF (PyMuPDF, or pdftoppm fallback)")
+    print("  2. Scales thumbnail to match slide dimensions")
+    print("  3. Copies last-slide.png to output folder")
+    print()
+    print("Available episodes:")
+    slides_dir = ASSETS_DIR / "slides"
+    if slides_dir.exists():
+        for f in sorted(slides_dir.glob("*.pdf")):
+            print(f"  {f.stem}")
+
+
+def prepare_episode(pdf_file: Path, slide_workers: int = 1, force: bool = False) -> int:
+    """Prepare slides, thumbnail and last-slide for a single episode PDF.
+
+    Outputs are tracked in .prepare-manifest.json (input hashes, output hashes
+    and render params) so re-runs only rebuild what changed. force ignores it.
+    """
     ep_name = pdf_file.stem
     output_dir = pdf_file.parent / ep_name
     thumbnail_src = THUMBNAILS_DIR / f"{ep_name}.png"
@@ -178,82 +606,127 @@ def main() -> int:
     output_dir.mkdir(exist_ok=True)
     print(f"✅ Output directory: {output_dir.relative_to(SCRIPT_DIR)}")
 
-    # Extract slides from PDF
-    print("🔄 Extracting slides from PDF...")
-    result = run_cmd(
-        ["pdftoppm", "-png", "-r", "150", str(pdf_file), str(output_dir / "slide")], check=False
-    )
-
-    if result.returncode != 0:
-        print(f"❌ pdftoppm failed: {result.stderr}")
-        return 1
-
-    slides = sorted(output_dir.glob("slide-*.png"))
-    print(f"   ✅ Extracted {len(slides)} slides")
+    width, height = TARGET_WIDTH, TARGET_HEIGHT
+    native = HAS_NATIVE_RENDERER
+    params = {
+        "backend": "native" if native else "imagemagick",
+        "width": width,
+        "height": height,
+        "compress_threshold": int(COMPRESS_THRESHOLD),
+    }
+    pdf_hash = file_sha256(pdf_file)
+    previous = {"entries": {}} if force else load_manifest(output_dir, params)
+    manifest = {"version": MANIFEST_VERSION, "params": params, "pdf": pdf_hash, "entries": {}}
+    regenerated: list[Path] = []
 
-    if not slides:
-        print("❌ No slides extracted")
-        return 1
+    # Extract slides from PDF
+    slides = cached_slides(previous, output_dir, pdf_hash)
 
-    # Target dimensions: full HD
-    width, height = TARGET_WIDTH, TARGET_HEIGHT
-    print(f"   📐 Target dimensions: {width}x{height} (Full HD)")
-
-    # Scale all slides to full HD
-    print("🔄 Scaling slides to Full HD...")
-    for slide in slides:
-        slide_w, slide_h = get_image_dimensions(slide)
-        if (slide_w, slide_h) != (width, height):
-            print(f"   📐 {slide.name}: {slide_w}x{slide_h} → {width}x{height}")
-        scale_image(slide, slide, width, height)
-
-    print(f"   ✅ Scaled {len(slides)} slides to Full HD")
-
-    # Scale and copy thumbnail
-    print("🔄 Preparing thumbnail...")
-    thumb_dst = output_dir / "thumbnail.png"
-    thumb_w, thumb_h = get_image_dimensions(thumbnail_src)
-
-    if (thumb_w, thumb_h) == (width, height):
-        # Just copy if dimensions match
-        thumb_dst.write_bytes(thumbnail_src.read_bytes())
-        print("   ✅ Thumbnail copied (dimensions already match)")
+    if slides is not None:
+        print(f"♻️  Slides unchanged, skipping extraction ({len(slides)} cached)")
+        for slide in slides:
+            manifest["entries"][slide.name] = previous["entries"][slide.name]
     else:
-        print(f"   📐 Scaling from {thumb_w}x{thumb_h} to {width}x{height}")
-        scale_image(thumbnail_src, thumb_dst, width, height)
-        print("   ✅ Thumbnail scaled and copied")
-
-    # Scale and copy last-slide
-    print("🔄 Preparing last-slide...")
-    last_dst = output_dir / "last-slide.png"
-    last_w, last_h = get_image_dimensions(LAST_SLIDE)
-
-    if (last_w, last_h) == (width, height):
-        last_dst.write_bytes(LAST_SLIDE.read_bytes())
-        print("   ✅ Last slide copied (dimensions already match)")
-    else:
-        print(f"   📐 Scaling from {last_w}x{last_h} to {width}x{height}")
-        scale_image(LAST_SLIDE, last_dst, width, height)
-        print("   ✅ Last slide scaled and copied")
+        pages = None
+        fingerprints: list[str] = []
+        if native:
+            print("🔄 Extracting slides from PDF (in-process renderer)...")
+            fingerprints = fingerprint_pages(pdf_file)
+            pages = {
+                i
+                for i, fingerprint in enumerate(fingerprints)
+                if not is_cached(
+                    previous, output_dir / slide_filename(i, len(fingerprints)), fingerprint
+                )
+            }
+            if len(pages) < len(fingerprints):
+                print(f"   ♻️  {len(fingerprints) - len(pages)} pages unchanged")
+        else:
+            print("🔄 Extracting slides from PDF...")
+
+        slides = extract_slides(pdf_file, output_dir, width, height, native, slide_workers, pages)
+        if slides is None:
+            return 1
+
+        print(f"   ✅ Extracted {len(slides)} slides")
+
+        if not slides:
+            print("❌ No slides extracted")
+            return 1
+
+        # Target dimensions: full HD
+        print(f"   📐 Target dimensions: {width}x{height} (Full HD)")
+
+        # Scale all slides to full HD (native renderer already outputs target size)
+        if native:
+            rendered = [s for i, s in enumerate(slides) if i in pages]
+            print(f"   ✅ Rendered {len(rendered)} slides at Full HD")
+        else:
+            rendered = slides
+            print("🔄 Scaling slides to Full HD...")
+            with ThreadPoolExecutor(max_workers=slide_workers) as pool:
+                original_dims = pool.map(lambda slide: scale_slide(slide, width, height), slides)
+                for slide, (slide_w, slide_h) in zip(slides, original_dims, strict=True):
+                    if (slide_w, slide_h) != (width, height):
+                        print(f"   📐 {slide.name}: {slide_w}x{slide_h} → {width}x{height}")
+
+            print(f"   ✅ Scaled {len(slides)} slides to Full HD")
+
+        # Remove slides left over from a previous, longer deck
+        for stale in set(output_dir.glob("slide-*.png")) - set(slides):
+            stale.unlink()
+
+        regenerated.extend(rendered)
+        for i, slide in enumerate(slides):
+            source = fingerprints[i] if native else pdf_hash
+            if slide in rendered:
+                manifest["entries"][slide.name] = {"source": source, "output": ""}
+            else:
+                manifest["entries"][slide.name] = previous["entries"][slide.name]
 
-    # Verify all images have same dimensions
+    # Scale and copy thumbnail and last-slide
+    static_images = [
+        (thumbnail_src, output_dir / "thumbnail.png", "Thumbnail", "thumbnail"),
+        (LAST_SLIDE, output_dir / "last-slide.png", "Last slide", "last-slide"),
+    ]
+    for src, dst, label, step in static_images:
+        print(f"🔄 Preparing {step}...")
+        src_hash = file_sha256(src)
+        if is_cached(previous, dst, src_hash):
+            print(f"   ♻️  {label} unchanged (cached)")
+            manifest["entries"][dst.name] = previous["entries"][dst.name]
+            continue
+        prepare_static_image(src, dst, width, height, label, native)
+        manifest["entries"][dst.name] = {"source": src_hash, "output": ""}
+        regenerated.append(dst)
+
+    # Verify regenerated images have target dimensions (cached ones were verified when built)
     print("🔍 Verifying image consistency...")
-    all_images = [thumb_dst, *slides, last_dst]
-    dimensions_ok = True
+    all_images = [output_dir / "thumbnail.png", *slides, output_dir / "last-slide.png"]
+    get_dims = read_png_dimensions if native else get_image_dimensions
+    mismatched = set()
 
-    for img in all_images:
-        w, h = get_image_dimensions(img)
+    for img in regenerated:
+        w, h = get_dims(img)
         status = "✅" if (w, h) == (width, height) else "❌"
         if (w, h) != (width, height):
-            dimensions_ok = False
+            mismatched.add(img)
             print(f"   {status} {img.name}: {w}x{h} (expected {width}x{height})")
 
-    if dimensions_ok:
+    if not mismatched:
         print(f"   ✅ All {len(all_images)} images have consistent dimensions")
 
     # Compress large images
     print("🔄 Checking file sizes...")
-    compress_large_images(all_images)
+    compress_large_images(regenerated, compress_image_native if native else compress_image)
+
+    # Record output hashes after compression; dimension mismatches stay uncached
+    for img in regenerated:
+        if img in mismatched:
+            del manifest["entries"][img.name]
+        else:
+            manifest["entries"][img.name]["output"] = file_sha256(img)
+    save_manifest(output_dir, manifest)
 
     # Summary
     print()
@@ -272,5 +745,45 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Prepare slides for video generation")
+    parser.add_argument("episode", nargs="?", help="Episode number (e.g., 26)")
+    parser.add_argument(
+        "--all", action="store_true", help="Prepare all episodes with PDFs but no extracted PNGs"
+    )
+    parser.add_argument("--episodes", help="Episode list/ranges to prepare (e.g., 12,15-20)")
+    parser.add_argument("--jobs", type=int, help="Parallel episodes (default: CPU count)")
+    parser.add_argument(
+        "--force", action="store_true", help="Ignore .prepare-manifest.json and rebuild everything"
+    )
+    args = parser.parse_args()
+
+    if args.all or args.episodes:
+        try:
+            episodes = parse_episode_ranges(args.episodes) if args.episodes else None
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+
+        pdf_files = find_pending_episodes(episodes)
+        if not pdf_files:
+            print("✅ No episodes to prepare")
+            return 0
+        return run_batch(pdf_files, args.jobs, args.force)
+
+    if not args.episode:
+        print_usage()
+        return 1
+
+    ep_num = args.episode
+    pdf_file = find_episode(ep_num)
+
+    if not pdf_file:
+        print(f"❌ No PDF file found for episode {ep_num}")
+        return 1
+
+    return prepare_episode(pdf_file, os.cpu_count() or 1, args.force)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -5,7 +5,7 @@ import re
 import sys
 from pathlib import Path
 
-from status_utils import sort_by_episode, update_episode_status
+from status_utils import sort_by_episode, status_transaction, update_episode_status
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -43,7 +43,8 @@ def rename_audio_files() -> int:
         print("❌ No whitepapers found")
         return 1
 
-    renamed = 0
+    renamed: list[int] = []
+    failed = 0
     for audio_file in sort_by_episode(list(AUDIO_DIR.glob("*.m4a"))):
         match = re.match(r"^(\d+)", audio_file.name)
         if not match:
@@ -59,15 +60,27 @@ def rename_audio_files() -> int:
             continue
 
         new_path = audio_file.parent / new_name
-        audio_file.rename(new_path)
+        try:
+            audio_file.rename(new_path)
+        except OSError as e:
+            print(f"❌ {audio_file.name}: {e}")
+            failed += 1
+            continue
         print(f"✅ {audio_file.name} -> {new_name}")
-        update_episode_status(ep_num, "audio", True)
-        renamed += 1
+        renamed.append(ep_num)
+
+    # Only the status write holds the lock; every rename that happened is recorded
+    with status_transaction():
+        for ep_num in renamed:
+            update_episode_status(ep_num, "audio", True)
 
-    if renamed == 0:
+    if renamed:
+        print(f"\n🎉 Renamed {len(renamed)} files")
+    if failed:
+        print(f"❌ {failed} files could not be renamed")
+        return 1
+    if not renamed:
         print("✅ All audio files already match whitepaper names")
-    else:
-        print(f"\n🎉 Renamed {renamed} files")
 
     return 0
 
@@ -5,7 +5,7 @@ import re
 import sys
 from pathlib import Path
 
-from status_utils import sort_by_episode, update_episode_status
+from status_utils import sort_by_episode, status_transaction, update_episode_status
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -43,7 +43,8 @@ def rename_slides() -> int:
         print("❌ No whitepapers found")
         return 1
 
-    renamed = 0
+    renamed: list[int] = []
+    failed = 0
 
     # Rename directories
     for item in sort_by_episode(list(SLIDES_DIR.iterdir())):
@@ -64,10 +65,14 @@ def rename_slides() -> int:
             continue
 
         new_path = item.parent / new_name
-        item.rename(new_path)
+        try:
+            item.rename(new_path)
+        except OSError as e:
+            print(f"❌ {item.name}/: {e}")
+            failed += 1
+            continue
         print(f"✅ {item.name}/ -> {new_name}/")
-        update_episode_status(ep_num, "slides", True)
-        renamed += 1
+        renamed.append(ep_num)
 
     # Rename PDFs
     for pdf in sort_by_episode(list(SLIDES_DIR.glob("*.pdf"))):
@@ -85,15 +90,27 @@ def rename_slides() -> int:
             continue
 
         new_path = pdf.parent / new_name
-        pdf.rename(new_path)
+        try:
+            pdf.rename(new_path)
+        except OSError as e:
+            print(f"❌ {pdf.name}: {e}")
+            failed += 1
+            continue
         print(f"✅ {pdf.name} -> {new_name}")
-        update_episode_status(ep_num, "slides", True)
-        renamed += 1
+        renamed.append(ep_num)
 
-    if renamed == 0:
+    # Only the status write holds the lock; every rename that happened is recorded
+    with status_transaction():
+        for ep_num in renamed:
+            update_episode_status(ep_num, "slides", True)
+
+    if renamed:
+        print(f"\n🎉 Renamed {len(renamed)} items")
+    if failed:
+        print(f"❌ {failed} items could not be renamed")
+        return 1
+    if not renamed:
         print("✅ All slides already match whitepaper names")
-    else:
-        print(f"\n🎉 Renamed {renamed} items")
 
     return 0
 
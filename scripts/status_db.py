@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Sync whitepapers/status.db (SQLite backend) with the git-tracked status.json.
+
+With STATUS_BACKEND=sqlite the scripts read and write status.db; status.json
+is only rewritten when exported here.
+"""
+
+import argparse
+import sys
+
+from status_utils import export_status_json, import_status_json, status_db_path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Export status.db to status.json or import status.json into status.db",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s export    # regenerate status.json before committing
+  %(prog)s import    # reload status.db after pulling a new status.json
+        """,
+    )
+    parser.add_argument("command", choices=["export", "import"])
+    args = parser.parse_args()
+
+    if args.command == "export":
+        count = export_status_json()
+        print(f"✅ Exported {count} papers to whitepapers/status.json")
+    else:
+        count = import_status_json()
+        print(f"✅ Imported {count} papers into {status_db_path().name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
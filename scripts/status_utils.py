@@ -1,14 +1,30 @@
 #!/usr/bin/env python3
-"""Utilities for managing whitepapers/status.json."""
+"""Utilities for managing whitepapers/status.json.
+
+Set STATUS_BACKEND=sqlite to keep episode state in whitepapers/status.db
+instead. Readiness queries then use indexed columns and single-field updates
+touch one row; status.json becomes an export (see status_db.py).
+"""
 
 from __future__ import annotations
 
 import json
+import os
 import re
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: only in-process locking
+
 SCRIPT_DIR = Path(__file__).parent.parent
 STATUS_FILE = SCRIPT_DIR / "whitepapers" / "status.json"
 WHITEPAPERS_DIR = SCRIPT_DIR / "whitepapers"
@@ -24,9 +40,42 @@ PRESERVED_FIELDS = [
     "published",
 ]
 
+# Boolean fields with an indexed column in status.db
+FLAG_FIELDS = [
+    "archived",
+    "notebook_created",
+    "audio_scheduled",
+    "audio",
+    "slides_scheduled",
+    "slides_prompt",
+    "slides",
+    "transcript",
+    "thumbnail_prompt",
+    "thumbnail",
+    "video",
+    "uploaded",
+    "published",
+]
+
+_thread_lock = threading.Lock()
+_local = threading.local()
+
+
+def sqlite_enabled() -> bool:
+    """Whether STATUS_BACKEND selects the SQLite database."""
+    return os.environ.get("STATUS_BACKEND", "json").lower() == "sqlite"
+
+
+def status_db_path() -> Path:
+    """SQLite database kept next to status.json."""
+    return STATUS_FILE.with_suffix(".db")
+
 
 def load_status() -> dict[str, Any]:
     """Load existing status.json or return empty structure."""
+    if sqlite_enabled():
+        with closing(connect_status_db()) as conn:
+            return read_status_db(conn)
     if STATUS_FILE.exists():
         return json.loads(STATUS_FILE.read_text(encoding="utf-8"))
     return {"papers": [], "summary": {}, "updated": ""}
@@ -35,11 +84,338 @@ def load_status() -> dict[str, Any]:
 def save_status(status: dict[str, Any]) -> None:
     """Save status.json with updated timestamp."""
     status["updated"] = datetime.now(UTC).isoformat(timespec="seconds")
+    write_status_file(status)
+
+
+def write_status_file(status: dict[str, Any]) -> None:
+    """Write status.json as-is.
+
+    Written to a temp file and renamed over the original, so readers never
+    see a partially written file.
+    """
     STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATUS_FILE.write_text(
-        json.dumps(status, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
+    mode = STATUS_FILE.stat().st_mode & 0o777 if STATUS_FILE.exists() else 0o644
+    fd, tmp_name = tempfile.mkstemp(
+        dir=STATUS_FILE.parent, prefix=f".{STATUS_FILE.name}.", suffix=".tmp"
     )
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(status, indent=2, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.chmod(mode)
+        tmp.replace(STATUS_FILE)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class StatusTransaction:
+    """status.json contents held under lock by status_transaction()."""
+
+    def __init__(self, status: dict[str, Any]):
+        self.status = status
+        self.changed = False
+        self._index = {p.get("episode"): p for p in self.papers}
+
+    @property
+    def papers(self) -> list[dict]:
+        return self.status.setdefault("papers", [])
+
+    def paper(self, ep_num: str | int) -> dict | None:
+        """Find paper entry by episode number."""
+        return self._index.get(str(ep_num).zfill(2))
+
+    def add_paper(self, paper: dict) -> dict:
+        """Insert a new paper entry, keeping papers sorted by episode."""
+        self.papers.append(paper)
+        self.papers.sort(key=lambda p: int(p.get("episode", "0")))
+        self._index[paper.get("episode")] = paper
+        self.changed = True
+        return paper
+
+    def set(self, ep_num: str | int, field: str, value: Any) -> None:
+        """Set a field on an episode, creating the entry if needed."""
+        ep_str = str(ep_num).zfill(2)
+        paper = self.paper(ep_str)
+        if paper:
+            paper[field] = value
+            self.changed = True
+        else:
+            self.add_paper({"episode": ep_str, "name": "", "category": "", field: value})
+
+    def archive(self, ep_num: str | int) -> None:
+        """Mark episode as archived, keeping only episode/name/category/archived."""
+        ep_str = str(ep_num).zfill(2)
+        paper = self.paper(ep_str)
+        if not paper:
+            self.add_paper(archived_entry(ep_str, None))
+            return
+
+        archived_paper = archived_entry(ep_str, paper)
+        self.papers[self.papers.index(paper)] = archived_paper
+        self._index[archived_paper["episode"]] = archived_paper
+        self.changed = True
+
+    def replace(self, status: dict[str, Any]) -> None:
+        """Replace the whole document (e.g. after a full rescan)."""
+        self.status = status
+        self._index = {p.get("episode"): p for p in self.papers}
+        self.changed = True
+
+
+class SqliteStatusTransaction:
+    """status.db rows held in one write transaction by status_transaction().
+
+    Same interface as StatusTransaction, but set() and archive() rewrite a
+    single row. paper() and papers return copies; change them through set().
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.changed = False
+
+    @property
+    def status(self) -> dict[str, Any]:
+        return read_status_db(self.conn)
+
+    @property
+    def papers(self) -> list[dict]:
+        return self.status["papers"]
+
+    def paper(self, ep_num: str | int) -> dict | None:
+        """Find paper entry by episode number."""
+        row = self.conn.execute(
+            "SELECT data FROM papers WHERE episode = ?", (str(ep_num).zfill(2),)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def add_paper(self, paper: dict) -> dict:
+        """Insert (or overwrite) a paper entry."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO papers (episode, data) VALUES (?, ?)",
+            (paper.get("episode"), json.dumps(paper, ensure_ascii=False)),
+        )
+        self.changed = True
+        return paper
+
+    def set(self, ep_num: str | int, field: str, value: Any) -> None:
+        """Set a field on an episode, creating the entry if needed."""
+        ep_str = str(ep_num).zfill(2)
+        cursor = self.conn.execute(
+            "UPDATE papers SET data = json_set(data, ?, json(?)) WHERE episode = ?",
+            (f'$."{field}"', json.dumps(value, ensure_ascii=False), ep_str),
+        )
+        if cursor.rowcount:
+            self.changed = True
+        else:
+            self.add_paper({"episode": ep_str, "name": "", "category": "", field: value})
+
+    def archive(self, ep_num: str | int) -> None:
+        """Mark episode as archived, keeping only episode/name/category/archived."""
+        ep_str = str(ep_num).zfill(2)
+        self.add_paper(archived_entry(ep_str, self.paper(ep_str)))
+
+    def replace(self, status: dict[str, Any]) -> None:
+        """Replace the whole document (e.g. after a full rescan)."""
+        _import_rows(self.conn, status)
+        self.changed = True
+
+
+def archived_entry(ep_str: str, paper: dict | None) -> dict:
+    """Archived form of a paper: core fields plus PRESERVED_FIELDS."""
+    paper = paper or {}
+    archived_paper = {
+        "episode": paper.get("episode", ep_str),
+        "name": paper.get("name", ""),
+        "category": paper.get("category", ""),
+        "archived": True,
+    }
+    for field in PRESERVED_FIELDS:
+        if field in paper:
+            archived_paper[field] = paper[field]
+    return archived_paper
+
+
+def _schema() -> str:
+    """DDL for status.db. Category and flags are generated from the JSON data."""
+    flag_columns = "".join(
+        f",\n    {field} INTEGER GENERATED ALWAYS AS (json_extract(data, '$.{field}') IS 1)"
+        for field in FLAG_FIELDS
+    )
+    indexes = "".join(
+        f"CREATE INDEX IF NOT EXISTS idx_papers_{column} ON papers ({column});\n"
+        for column in ["number", "category", *FLAG_FIELDS]
+    )
+    return f"""
+CREATE TABLE IF NOT EXISTS papers (
+    episode TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    number INTEGER GENERATED ALWAYS AS (CAST(episode AS INTEGER)),
+    category TEXT GENERATED ALWAYS AS (json_extract(data, '$.category')){flag_columns}
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+{indexes}"""
+
+
+def connect_status_db() -> sqlite3.Connection:
+    """Open status.db, creating it from status.json on first use."""
+    path = status_db_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_schema())
+        conn.execute("BEGIN IMMEDIATE")
+        initialized = conn.execute("SELECT 1 FROM meta WHERE key = 'updated'").fetchone()
+        if not initialized:
+            status = (
+                json.loads(STATUS_FILE.read_text(encoding="utf-8"))
+                if STATUS_FILE.exists()
+                else {"papers": [], "updated": ""}
+            )
+            _import_rows(conn, status)
+            _set_updated(conn, status.get("updated", ""))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _import_rows(conn: sqlite3.Connection, status: dict[str, Any]) -> None:
+    """Replace all rows in papers with the entries of a status document."""
+    conn.execute("DELETE FROM papers")
+    conn.executemany(
+        "INSERT INTO papers (episode, data) VALUES (?, ?)",
+        [(p.get("episode"), json.dumps(p, ensure_ascii=False)) for p in status.get("papers", [])],
+    )
+
+
+def _set_updated(conn: sqlite3.Connection, updated: str) -> None:
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('updated', ?)", (updated,))
+
+
+def read_status_db(conn: sqlite3.Connection) -> dict[str, Any]:
+    """Build the status.json document from status.db."""
+    papers = [
+        json.loads(data) for (data,) in conn.execute("SELECT data FROM papers ORDER BY number")
+    ]
+    row = conn.execute("SELECT value FROM meta WHERE key = 'updated'").fetchone()
+    status = {"papers": papers, "summary": {}, "updated": row[0] if row else ""}
+    update_summary(status)
+    return status
+
+
+def export_status_json() -> int:
+    """Regenerate status.json from status.db. Returns number of papers."""
+    with closing(connect_status_db()) as conn:
+        conn.execute("BEGIN")
+        status = read_status_db(conn)
+        conn.execute("COMMIT")
+    write_status_file(status)
+    return len(status["papers"])
+
+
+def import_status_json() -> int:
+    """Load status.json into status.db, replacing its rows. Returns number of papers."""
+    status = json.loads(STATUS_FILE.read_text(encoding="utf-8"))
+    with closing(connect_status_db()) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _import_rows(conn, status)
+        _set_updated(conn, status.get("updated", ""))
+        conn.execute("COMMIT")
+    return len(status.get("papers", []))
+
+
+def matches_flags(paper: dict, flags: dict[str, bool]) -> bool:
+    """Whether each flag field of paper is truthy/falsy as requested."""
+    return all(bool(paper.get(field)) == wanted for field, wanted in flags.items())
+
+
+def select_papers(**flags: bool) -> list[dict]:
+    """Papers matching flag conditions, e.g. select_papers(video=False, audio=True).
+
+    With the SQLite backend this is an indexed query instead of a scan.
+    """
+    unknown = set(flags) - set(FLAG_FIELDS)
+    if unknown:
+        raise ValueError(f"Not a flag field: {', '.join(sorted(unknown))}")
+    if not sqlite_enabled():
+        return [p for p in load_status().get("papers", []) if matches_flags(p, flags)]
+
+    where = " AND ".join(f"{field} = ?" for field in flags) or "1"
+    with closing(connect_status_db()) as conn:
+        rows = conn.execute(
+            f"SELECT data FROM papers WHERE {where} ORDER BY number",
+            [int(wanted) for wanted in flags.values()],
+        ).fetchall()
+    return [json.loads(data) for (data,) in rows]
+
+
+@contextmanager
+def _status_lock() -> Iterator[None]:
+    """Hold an exclusive lock on status.json across threads and processes."""
+    lock_file = STATUS_FILE.with_name(STATUS_FILE.name + ".lock")
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with _thread_lock, lock_file.open("a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@contextmanager
+def status_transaction() -> Iterator[StatusTransaction]:
+    """Lock status.json for one read-modify-write cycle.
+
+    The file is read once on entry and written once on exit if anything
+    changed; an exception discards the changes. Nested calls in the same
+    thread join the outer transaction, so helpers like update_episode_status
+    can be batched by wrapping a loop. With the SQLite backend this is a
+    database transaction instead.
+    """
+    active = getattr(_local, "transaction", None)
+    if active is not None:
+        yield active
+        return
+
+    backend = _sqlite_transaction if sqlite_enabled() else _json_transaction
+    with backend() as transaction:
+        _local.transaction = transaction
+        try:
+            yield transaction
+        finally:
+            _local.transaction = None
+
+
+@contextmanager
+def _json_transaction() -> Iterator[StatusTransaction]:
+    with _status_lock():
+        transaction = StatusTransaction(load_status())
+        yield transaction
+        if transaction.changed:
+            update_summary(transaction.status)
+            save_status(transaction.status)
+
+
+@contextmanager
+def _sqlite_transaction() -> Iterator[SqliteStatusTransaction]:
+    with closing(connect_status_db()) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        transaction = SqliteStatusTransaction(conn)
+        try:
+            yield transaction
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if transaction.changed:
+            _set_updated(conn, datetime.now(UTC).isoformat(timespec="seconds"))
+        conn.execute("COMMIT")
 
 
 def find_paper_by_episode(papers: list[dict], ep_num: str | int) -> dict | None:
@@ -83,73 +459,20 @@ def detect_category(ep_name: str) -> str | None:
 
 def update_episode_status(ep_num: str | int, field: str, value: bool) -> None:
     """Update single field for an episode in status.json."""
-    status = load_status()
-    papers = status.get("papers", [])
-
-    ep_str = str(ep_num).zfill(2)
-    paper = find_paper_by_episode(papers, ep_str)
-
-    if paper:
-        paper[field] = value
-    else:
-        paper = {"episode": ep_str, "name": "", "category": "", field: value}
-        papers.append(paper)
-        papers.sort(key=lambda p: int(p.get("episode", "0")))
-        status["papers"] = papers
-
-    update_summary(status)
-    save_status(status)
+    with status_transaction() as transaction:
+        transaction.set(ep_num, field, value)
 
 
 def update_episode_field(ep_num: str | int, field: str, value: Any) -> None:
     """Update single field with any value type for an episode in status.json."""
-    status = load_status()
-    papers = status.get("papers", [])
-
-    ep_str = str(ep_num).zfill(2)
-    paper = find_paper_by_episode(papers, ep_str)
-
-    if paper:
-        paper[field] = value
-    else:
-        paper = {"episode": ep_str, "name": "", "category": "", field: value}
-        papers.append(paper)
-        papers.sort(key=lambda p: int(p.get("episode", "0")))
-        status["papers"] = papers
-
-    update_summary(status)
-    save_status(status)
+    with status_transaction() as transaction:
+        transaction.set(ep_num, field, value)
 
 
 def archive_episode_status(ep_num: str | int) -> None:
     """Mark episode as archived, keeping only episode/name/category/archived."""
-    status = load_status()
-    papers = status.get("papers", [])
-
-    ep_str = str(ep_num).zfill(2)
-    paper = find_paper_by_episode(papers, ep_str)
-
-    if paper:
-        # Keep only core fields + preserved fields
-        archived_paper = {
-            "episode": paper.get("episode", ep_str),
-            "name": paper.get("name", ""),
-            "category": paper.get("category", ""),
-            "archived": True,
-        }
-        for field in PRESERVED_FIELDS:
-            if field in paper:
-                archived_paper[field] = paper[field]
-        idx = papers.index(paper)
-        papers[idx] = archived_paper
-    else:
-        paper = {"episode": ep_str, "name": "", "category": "", "archived": True}
-        papers.append(paper)
-        papers.sort(key=lambda p: int(p.get("episode", "0")))
-        status["papers"] = papers
-
-    update_summary(status)
-    save_status(status)
+    with status_transaction() as transaction:
+        transaction.archive(ep_num)
 
 
 def update_summary(status: dict[str, Any]) -> None:
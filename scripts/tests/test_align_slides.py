@@ -0,0 +1,211 @@
+"""Tests for align_slides.py script."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+SLIDE_TEXTS = [
+    "Raft\nWybory lidera: kadencja, głosowanie",
+    "Raft\nReplikacja dziennika: wpisy, zatwierdzenie",
+    "Raft\nMigawki i kompakcja stanu",
+]
+TOPIC_SPEECH = [
+    "lider wygrywa wybory w nowej kadencji po głosowaniu",
+    "dziennik jest replikowany a wpisy czekają na zatwierdzenie",
+    "stan maszyny trafia do migawki a kompakcja skraca dziennik",
+]
+
+
+def speech_segments(lengths, chatter=False):
+    """5s segments: lengths[k] segments about slide k; with chatter, every other one is filler."""
+    segments = []
+    for topic, length in enumerate(lengths):
+        for i in range(length):
+            text = "no więc właśnie tak" if chatter and i % 2 else TOPIC_SPEECH[topic]
+            start = len(segments) * 5.0
+            segments.append({"start": start, "end": start + 4.5, "text": text})
+    return segments
+
+
+class TestStems:
+    """Tests for stems function."""
+
+    def test_cuts_words_to_common_prefix(self):
+        """Inflected forms should share a stem; short words and digits are dropped."""
+        from scripts.align_slides import stems
+
+        assert stems("Replikacja replikacji, w 2024 r.") == ["replik", "replik"]
+
+
+class TestAlign:
+    """Tests for similarity_matrix and align functions."""
+
+    def test_follows_slide_text(self):
+        """Slides should start where the speech turns to their words."""
+        from scripts.align_slides import align, similarity_matrix
+
+        segments = speech_segments([6, 20, 10])
+        similarity = similarity_matrix(SLIDE_TEXTS, segments)
+
+        assert align(similarity, segments) == [0, 6, 26]
+
+    def test_filler_segments_stay_near_the_change(self):
+        """Filler between topics may go either way, but only by a segment."""
+        from scripts.align_slides import align, similarity_matrix
+
+        segments = speech_segments([6, 20, 10], chatter=True)
+        firsts = align(similarity_matrix(SLIDE_TEXTS, segments), segments)
+
+        assert firsts[1] in (5, 6)
+        assert firsts[2] in (25, 26)
+
+    def test_words_on_every_slide_do_not_count(self):
+        """The deck title appears on every slide and should not match anything."""
+        from scripts.align_slides import similarity_matrix
+
+        similarity = similarity_matrix(SLIDE_TEXTS, [{"start": 0, "end": 1, "text": "Raft"}])
+
+        assert similarity == [[0.0], [0.0], [0.0]]
+
+    def test_spreads_evenly_without_evidence(self):
+        """With no slide text at all, slides should split the segments evenly."""
+        from scripts.align_slides import align, similarity_matrix
+
+        segments = speech_segments([30])
+        similarity = similarity_matrix(["", "", ""], segments)
+
+        assert align(similarity, segments) == [0, 10, 20]
+
+    def test_needs_a_segment_per_slide(self):
+        """Should refuse to align more slides than segments."""
+        from scripts.align_slides import align
+
+        with pytest.raises(ValueError, match="cannot cover"):
+            align([[0.0], [0.0]], [{"start": 0, "end": 1, "text": ""}])
+
+
+class TestSlideTimings:
+    """Tests for slide_timings function."""
+
+    def test_durations_cover_audio_after_intro(self):
+        """Durations should change slides in gaps and add up to audio minus the intro."""
+        from scripts.align_slides import slide_timings
+
+        segments = speech_segments([6, 20, 10])
+        similarity = [[1.0] * 36] * 3
+
+        timings = slide_timings(["s1", "s2", "s3"], [0, 6, 26], segments, similarity, 183.4567)
+
+        assert [t.start for t in timings] == [5.0, 29.75, 129.75]
+        assert round(sum(t.duration for t in timings), 3) == 178.457
+        assert timings[0].similarity == 1.0
+
+    def test_keeps_slides_apart(self):
+        """A slide whose text matches inside the intro should still get screen time."""
+        from scripts.align_slides import MIN_SLIDE_SECONDS, slide_timings
+
+        segments = [{"start": t, "end": t + 1.0, "text": ""} for t in range(60)]
+        timings = slide_timings(["s1", "s2"], [0, 1], segments, [[0.0] * 60] * 2, 60.0)
+
+        assert timings[0].duration == MIN_SLIDE_SECONDS
+        assert timings[1].start == 5.0 + MIN_SLIDE_SECONDS
+
+    def test_shares_short_audio_evenly(self):
+        """Without room for MIN_SLIDE_SECONDS each, slides should split the audio evenly."""
+        from scripts.align_slides import slide_timings
+
+        segments = [{"start": t, "end": t + 1.0, "text": ""} for t in range(5, 20)]
+        names = [f"s{k}" for k in range(10)]
+        timings = slide_timings(names, list(range(10)), segments, [[0.0] * 15] * 10, 20.0)
+
+        assert [t.duration for t in timings] == [1.5] * 10
+        assert [t.start for t in timings] == [5.0 + 1.5 * k for k in range(10)]
+
+    def test_requires_audio_after_intro(self):
+        """Should refuse audio that ends within the intro."""
+        from scripts.align_slides import slide_timings
+
+        segments = [{"start": 0.0, "end": 4.0, "text": ""}]
+        with pytest.raises(ValueError, match="intro"):
+            slide_timings(["s1"], [0], segments, [[0.0]], 4.0)
+
+
+class TestSlideTexts:
+    """Tests for slide_texts function."""
+
+    def test_ocrs_pages_without_text(self, tmp_path):
+        """Pages with no text layer should fall back to OCR of the slide PNG."""
+        from scripts.align_slides import slide_texts
+
+        slides = [tmp_path / "slide-1.png", tmp_path / "slide-2.png"]
+        pdf = tmp_path / "ep.pdf"
+        pdf.write_bytes(b"%PDF")
+        with (
+            patch("scripts.align_slides.pdf_page_texts", return_value=[SLIDE_TEXTS[0], " "]),
+            patch("scripts.align_slides.ocr_text", return_value="tekst z obrazka") as ocr,
+        ):
+            texts = slide_texts(pdf, slides)
+
+        assert texts == [SLIDE_TEXTS[0], "tekst z obrazka"]
+        ocr.assert_called_once_with(slides[1])
+
+    def test_pdftotext_pages(self, tmp_path):
+        """Without PyMuPDF, pages should come from pdftotext's form feeds."""
+        from scripts.align_slides import pdf_page_texts
+
+        proc = subprocess.CompletedProcess([], 0, "one\fbi\ntwo\f", "")
+        with (
+            patch("scripts.align_slides.pymupdf", None),
+            patch("scripts.align_slides.subprocess.run", return_value=proc),
+        ):
+            assert pdf_page_texts(tmp_path / "ep.pdf") == ["one", "bi\ntwo"]
+
+
+class TestMain:
+    """Tests for main function."""
+
+    def test_writes_timings_json(self, temp_project, capsys):
+        """Should write timings that generate_concat can read."""
+        from scripts.align_slides import main
+        from scripts.generate_concat import parse_durations_json
+
+        assets = temp_project / "youtube" / "pl"
+        (assets / "audio" / "73-raft.m4a").write_bytes(b"audio")
+        segments = speech_segments([6, 20, 10])
+        (assets / "transcripts" / "73-raft.json").write_text(json.dumps({"segments": segments}))
+        slides_dir = assets / "slides" / "73-raft"
+        slides_dir.mkdir(parents=True)
+        for i in range(1, 4):
+            (slides_dir / f"slide-{i}.png").write_bytes(b"png")
+        (assets / "slides" / "73-raft.pdf").write_bytes(b"%PDF")
+
+        with (
+            patch("scripts.align_slides.ASSETS_DIR", assets),
+            patch("scripts.align_slides.pdf_page_texts", return_value=SLIDE_TEXTS),
+            patch("scripts.align_slides.get_duration", return_value=185.0),
+            patch("sys.argv", ["align_slides.py", "73"]),
+        ):
+            assert main() == 0
+
+        timings = parse_durations_json(slides_dir / "timings.json")
+        assert [name for name, _ in timings] == ["slide-1", "slide-2", "slide-3"]
+        assert round(sum(d for _, d in timings), 3) == 180.0
+        assert "generate-concat -- 73 --json" in capsys.readouterr().out
+
+    def test_requires_slides(self, temp_project, capsys):
+        """Should point at prepare when slides are not extracted yet."""
+        from scripts.align_slides import main
+
+        assets = temp_project / "youtube" / "pl"
+        (assets / "audio" / "73-raft.m4a").write_bytes(b"audio")
+        (assets / "transcripts" / "73-raft.json").write_text('{"segments": []}')
+
+        with (
+            patch("scripts.align_slides.ASSETS_DIR", assets),
+            patch("sys.argv", ["align_slides.py", "73"]),
+        ):
+            assert main() == 1
+
+        assert "mise run prepare -- 73" in capsys.readouterr().out
@@ -1,16 +1,51 @@
 """Tests for analyze_transcript.py."""
 
+import json
 from unittest.mock import patch
 
+import pytest
+
 from scripts.analyze_transcript import (
+    count_terms,
     extract_final_question,
     find_technical_terms,
     find_transcript,
     format_timestamp,
+    load_stopwords,
     load_transcript,
+    novelty_curve,
     suggest_topics,
+    term_phrases,
+    top_terms,
 )
 
+try:
+    import numpy  # noqa: F401
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+requires_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+
+TOPIC_WORDS = [
+    "konsensus lider wybory głosowanie kadencja serwer",
+    "dziennik replikacja wpis zatwierdzenie indeks follower",
+    "migawka kompakcja stan maszyna pamięć dysk",
+]
+
+
+def topic_segments(lengths):
+    """Segments of 5s each, len(lengths) topics with distinct vocabulary."""
+    segments = []
+    for topic, length in enumerate(lengths):
+        words = TOPIC_WORDS[topic].split()
+        for i in range(length):
+            text = " ".join(words[(i + j) % len(words)] for j in range(4)) + " więc także"
+            start = len(segments) * 5.0
+            segments.append({"start": start, "end": start + 5.0, "text": text})
+    return segments
+
 
 def test_find_transcript(tmp_path):
     """Should find transcript by episode number."""
@@ -123,6 +158,40 @@ def test_find_technical_terms_frequency():
     assert "Byzantine" in result
 
 
+def test_load_stopwords_from_data_files():
+    """Should read lowercase stopwords per language from the data files."""
+    assert {"jest", "właśnie", "the", "which"} <= load_stopwords()
+    assert "jest" not in load_stopwords(("en",))
+
+
+def test_term_phrases_break_at_punctuation_and_stopwords():
+    """Should yield each capitalized run with its sub-phrases, split by stopwords and punctuation."""
+    phrases = list(term_phrases("Raft i Paxos. Leader Election, GPT-4 też", load_stopwords()))
+
+    assert phrases == ["Raft", "Paxos", "Leader", "Election", "Leader Election", "GPT-4"]
+
+
+def test_count_terms_over_segments():
+    """Should count terms across segment texts without joining them."""
+    texts = iter(["Multi-Paxos działa.", "Potem Multi-Paxos", "Wtedy Raft"])
+
+    counts = count_terms(texts)
+
+    assert counts["Multi-Paxos"] == 2
+    assert counts["Raft"] == 1
+    assert "Potem" not in counts
+    assert "Wtedy" not in counts
+
+
+def test_top_terms_prefers_phrases_over_their_words():
+    """Should drop a word seen only inside a longer phrase, but keep it when used alone too."""
+    counts = count_terms(["Strong Leader Election", "Strong Leader Election", "Leader"])
+
+    result = top_terms(counts)
+
+    assert result == ["Leader", "Strong Leader Election"]
+
+
 def test_suggest_topics():
     """Should divide transcript into chunks."""
     segments = []
@@ -151,6 +220,38 @@ def test_suggest_topics_small_transcript():
     assert len(result) == 10
 
 
+@requires_numpy
+def test_novelty_peaks_at_topic_change():
+    """Novelty should be highest at the gap where the vocabulary changes."""
+    novelty = novelty_curve(topic_segments([30, 30]))
+
+    assert novelty.argmax() == 30
+    assert novelty[0] == 0
+    assert novelty[10] < 0.1
+
+
+@requires_numpy
+def test_suggest_topics_follows_topic_changes():
+    """Slides should start where the discussion changes, not at equal chunks."""
+    segments = topic_segments([20, 50, 30])
+
+    result = suggest_topics(segments, count=3)
+
+    assert [t["start"] for t in result] == ["0:00", "1:40", "5:50"]
+    assert result[-1]["end"] == "8:20"
+    assert result[1]["sample"].startswith("dziennik")
+
+
+def test_suggest_topics_without_numpy():
+    """Should fall back to equal chunks when NumPy is missing."""
+    segments = topic_segments([20, 50, 30])
+
+    with patch("scripts.analyze_transcript.np", None):
+        result = suggest_topics(segments, count=4)
+
+    assert [t["start"] for t in result] == ["0:00", "2:05", "4:10", "6:15"]
+
+
 def test_format_timestamp():
     """Should format seconds as MM:SS."""
     assert format_timestamp(0.0) == "0:00"
@@ -255,3 +356,68 @@ def test_main_empty_segments(capsys, tmp_path):
     assert result == 1
     assert "❌" in captured.out
     assert "No segments" in captured.out
+
+
+def test_main_terms_table(capsys, tmp_path):
+    """Should tabulate terms across all transcripts and write them as JSON."""
+    from scripts.analyze_transcript import main
+
+    current = tmp_path / "73-raft.json"
+    current.write_text(
+        '{"segments": [{"text": "Raft i Paxos."}, {"text": "Raft wybiera lidera."}]}'
+    )
+    archived = tmp_path / "74-paxos.json"
+    archived.write_text('{"segments": [{"text": "Paxos to Paxos."}, {"text": "Multi-Paxos."}]}')
+    output = tmp_path / "terms.json"
+
+    with (
+        patch("sys.argv", ["analyze_transcript.py", "terms", "--json", str(output)]),
+        patch("scripts.analyze_transcript.transcript_files", return_value=[current, archived]),
+    ):
+        result = main()
+
+    assert result == 0
+    assert "2 transcripts" in capsys.readouterr().out
+    assert json.loads(output.read_text()) == [
+        {"term": "Paxos", "count": 3, "episodes": 2, "top": "74-paxos"},
+        {"term": "Raft", "count": 2, "episodes": 1, "top": "73-raft"},
+    ]
+
+
+def test_main_index_and_search(capsys, tmp_path):
+    """Should index new transcripts and list timestamped hits for a query."""
+    from scripts.analyze_transcript import main
+
+    transcript = tmp_path / "73-raft.json"
+    transcript.write_text(
+        '{"segments": [{"start": 0.0, "text": "Wstęp."}, {"start": 75.0, "text": "Raft i Paxos."}]}'
+    )
+
+    with (
+        patch("scripts.analyze_transcript.INDEX_FILE", tmp_path / "index.db"),
+        patch("scripts.analyze_transcript.transcript_files", return_value=[transcript]),
+    ):
+        with patch("sys.argv", ["analyze_transcript.py", "index"]):
+            assert main() == 0
+        assert "Indexed 1 transcripts" in capsys.readouterr().out
+
+        with patch("sys.argv", ["analyze_transcript.py", "search", "paxos"]):
+            assert main() == 0
+        out = capsys.readouterr().out
+        assert "Indexed" not in out
+        assert "73-raft" in out
+        assert "1:15" in out
+        assert "1 hits in 1 episodes" in out
+
+        with patch("sys.argv", ["analyze_transcript.py", "search", "kafka"]):
+            assert main() == 1
+        assert "No matches" in capsys.readouterr().out
+
+        broken = tmp_path / "74-broken.json"
+        broken.write_text("{")
+        with (
+            patch("sys.argv", ["analyze_transcript.py", "index"]),
+            patch("scripts.analyze_transcript.transcript_files", return_value=[transcript, broken]),
+        ):
+            assert main() == 1
+        assert "Not indexed, unreadable: 74-broken.json" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+"""Tests for benchmark_encoding.py script."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+
+class TestParseVariant:
+    """Tests for parse_variant function."""
+
+    def test_profile_with_fps(self):
+        """Should split profile and frame rate."""
+        from scripts.benchmark_encoding import parse_variant
+
+        assert parse_variant("still:10") == ("still", 10)
+
+    def test_defaults_to_standard_fps(self):
+        """Should use the default frame rate when omitted."""
+        from scripts.benchmark_encoding import parse_variant
+
+        assert parse_variant("default") == ("default", 30)
+
+    def test_rejects_unknown_profile(self):
+        """Should raise for profiles generate_video does not know."""
+        from scripts.benchmark_encoding import parse_variant
+
+        with pytest.raises(ValueError, match="Unknown profile"):
+            parse_variant("ultra")
+
+
+class TestWriteConcat:
+    """Tests for write_concat function."""
+
+    def test_durations_cover_audio_and_outro(self, tmp_path):
+        """Slide durations should sum to audio length plus 5s."""
+        from scripts.benchmark_encoding import write_concat
+        from scripts.verify_concat import parse_concat
+
+        slides = [tmp_path / f"slide-{i:02d}.png" for i in range(1, 31)]
+        concat = write_concat(tmp_path / "concat.txt", slides, 1800)
+
+        entries = parse_concat(concat)
+        assert len(entries) == 31
+        assert sum(e.duration for e in entries) == pytest.approx(1805)
+        assert entries[-1].duration == 0.0
+
+
+class TestRunBenchmark:
+    """Tests for run_benchmark function."""
+
+    def test_records_each_variant(self, tmp_path):
+        """Should time every variant and record output size."""
+        from scripts.benchmark_encoding import run_benchmark
+
+        def fake_generate(_concat, _audio, output, profile, fps):
+            output.write_bytes(b"x" * fps)
+            return subprocess.CompletedProcess([], 0, "", "")
+
+        with patch("scripts.benchmark_encoding.generate_video", side_effect=fake_generate):
+            results = run_benchmark(
+                tmp_path / "c.txt",
+                tmp_path / "a.m4a",
+                tmp_path,
+                [("default", 30), ("still", 10)],
+            )
+
+        assert [(r.profile, r.fps, r.size) for r in results] == [
+            ("default", 30, 30),
+            ("still", 10, 10),
+        ]
+        assert all(r.returncode == 0 for r in results)
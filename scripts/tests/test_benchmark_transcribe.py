@@ -0,0 +1,85 @@
+"""Tests for benchmark_transcribe.py script."""
+
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+
+def done(value):
+    """A finished future holding value."""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class TestAgreement:
+    """Tests for agreement function."""
+
+    def test_compares_words_ignoring_case(self):
+        """Identical words should agree fully, disjoint ones not at all."""
+        from scripts.benchmark_transcribe import agreement
+
+        assert agreement(" Cześć, witam.", "cześć, Witam.") == 1.0
+        assert agreement("a b", "c d") == 0.0
+        assert agreement("a b c d", "a b c e") == pytest.approx(0.75)
+
+
+class TestRunBenchmark:
+    """Tests for run_benchmark function."""
+
+    def test_reports_rtf_and_agreement_per_backend(self, tmp_path):
+        """Should compute RTF from audio length and compare text with the baseline."""
+        from scripts.benchmark_transcribe import run_benchmark
+
+        texts = {"whisper": "jeden dwa trzy cztery", "faster-whisper": "jeden dwa trzy pięć"}
+
+        def fake_bench(backend, model, language, sample):
+            wall = {"whisper": 60.0, "faster-whisper": 15.0}[backend]
+            return {"load": 1.0, "wall": wall, "segments": 4, "peak_rss": 1, "text": texts[backend]}
+
+        with (
+            patch("scripts.benchmark_transcribe.get_duration", return_value=120.0),
+            patch("scripts.benchmark_transcribe.find_spec", return_value=object()),
+            patch("scripts.benchmark_transcribe.ProcessPoolExecutor") as executor_class,
+        ):
+            executor = executor_class.return_value.__enter__.return_value
+            executor.submit.side_effect = lambda _fn, *args: done(fake_bench(*args))
+            results = run_benchmark(tmp_path / "s.wav", ["whisper", "faster-whisper"], "small")
+
+        assert [(r.backend, r.rtf) for r in results] == [
+            ("whisper", 0.5),
+            ("faster-whisper", 0.125),
+        ]
+        assert results[0].agreement == 1.0
+        assert results[1].agreement == pytest.approx(0.75)
+
+    def test_missing_backend_is_reported_not_run(self, tmp_path):
+        """Should record an error for backends that are not installed."""
+        from scripts.benchmark_transcribe import run_benchmark
+
+        with (
+            patch("scripts.benchmark_transcribe.get_duration", return_value=120.0),
+            patch("scripts.benchmark_transcribe.find_spec", return_value=None),
+            patch("scripts.benchmark_transcribe.ProcessPoolExecutor") as executor_class,
+        ):
+            results = run_benchmark(tmp_path / "s.wav", ["faster-whisper"], "small")
+
+        assert results[0].error == "faster-whisper not installed"
+        executor_class.assert_not_called()
+
+
+class TestMain:
+    """Tests for main function."""
+
+    def test_requires_a_sample(self, tmp_path, capsys):
+        """Should fail clearly when there is no audio to benchmark."""
+        from scripts.benchmark_transcribe import main
+
+        with (
+            patch("scripts.benchmark_transcribe.find_audio_files", return_value=[]),
+            patch("sys.argv", ["benchmark_transcribe.py"]),
+        ):
+            assert main() == 1
+
+        assert "No audio sample found" in capsys.readouterr().out
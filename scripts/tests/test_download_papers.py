@@ -0,0 +1,371 @@
+"""Tests for download_papers.py script."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from scripts.tests.test_pdf_check import make_pdf
+
+PDF = make_pdf()
+
+
+def paper_bytes(path):
+    """PDF served for path; ?id=N query strings get distinct contents."""
+    if "id=" not in path:
+        return PDF
+    return make_pdf(comment=path.encode())
+
+
+class PaperServer(ThreadingHTTPServer):
+    """Local stand-in for arxiv/openreview with scripted failures."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), PaperHandler)
+        self.requests = []
+        self.connections = set()
+        self.failures = {}
+        self.inflight = 0
+        self.max_inflight = 0
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class PaperHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("Range")))
+            server.connections.add(self.client_address)
+            server.inflight += 1
+            server.max_inflight = max(server.max_inflight, server.inflight)
+            scripted = server.failures.get(self.path)
+            failure = scripted.pop(0) if scripted else None
+        try:
+            self.respond(failure)
+        finally:
+            with server.lock:
+                server.inflight -= 1
+
+    def respond(self, failure):
+        if failure == "503":
+            self.send_error(503)
+            return
+        if failure == "slow":
+            time.sleep(0.05)
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/paper.pdf")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/login":
+            body = b"<html>" + b"x" * 2000 + b"</html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path == "/missing.pdf":
+            self.send_error(404)
+            return
+
+        body = PDF[:-10] if self.path == "/no-trailer.pdf" else paper_bytes(self.path)
+        start = 0
+        if range_header := self.headers.get("Range"):
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            if start >= len(body):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        if failure == "cut":
+            # Promise the full body, send half and drop the connection
+            self.wfile.write(body[start : len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def server():
+    server = PaperServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    from scripts.download_papers import Downloader
+
+    downloader = Downloader(partial_dir=tmp_path / ".partial", backoff=0, timeout=5)
+    yield downloader
+    downloader.close()
+
+
+class TestCandidateUrls:
+    """Tests for candidate_urls function."""
+
+    def test_arxiv_mirrors_then_direct(self):
+        """Should try both arxiv hosts before the original URL."""
+        from scripts.download_papers import candidate_urls
+
+        url = "https://arxiv.org/abs/1706.03762"
+
+        assert candidate_urls(url) == [
+            ("arxiv (1706.03762)", "https://arxiv.org/pdf/1706.03762.pdf"),
+            ("arxiv (1706.03762)", "https://export.arxiv.org/pdf/1706.03762.pdf"),
+            ("direct URL", url),
+        ]
+
+    def test_openreview(self):
+        """Should build the OpenReview PDF URL."""
+        from scripts.download_papers import candidate_urls
+
+        candidates = candidate_urls("https://openreview.net/forum?id=abc_1")
+
+        assert candidates[0] == ("openreview (abc_1)", "https://openreview.net/pdf?id=abc_1")
+
+
+class TestDownloader:
+    """Tests for Downloader against a local HTTP server."""
+
+    def test_downloads_and_reuses_connection(self, server, downloader, tmp_path):
+        """Sequential downloads from one host should share a keep-alive connection."""
+        for i in range(3):
+            downloader.download(server.url(f"/paper.pdf?n={i}"), tmp_path / f"{i}.pdf")
+
+        assert all((tmp_path / f"{i}.pdf").read_bytes() == PDF for i in range(3))
+        assert len(server.connections) == 1
+        assert not list((tmp_path / ".partial").iterdir())
+
+    def test_reconnects_when_idle_connection_was_dropped(self, server, tmp_path):
+        """A pooled connection closed by the server should not cost a retry."""
+        from scripts.download_papers import Downloader
+
+        downloader = Downloader(partial_dir=tmp_path / ".partial", attempts=1, timeout=5)
+        try:
+            downloader.download(server.url("/paper.pdf"), tmp_path / "a.pdf")
+            for conns in downloader._idle.values():
+                for conn in conns:
+                    conn.sock.shutdown(2)
+            downloader.download(server.url("/paper.pdf"), tmp_path / "b.pdf")
+        finally:
+            downloader.close()
+
+        assert (tmp_path / "b.pdf").read_bytes() == PDF
+        assert len(server.connections) == 2
+
+    def test_follows_redirects(self, server, downloader, tmp_path):
+        """Should follow a redirect to the PDF."""
+        downloader.download(server.url("/redirect"), tmp_path / "out.pdf")
+
+        assert (tmp_path / "out.pdf").read_bytes() == PDF
+        assert [path for path, _ in server.requests] == ["/redirect", "/paper.pdf"]
+
+    def test_retries_server_errors(self, server, downloader, tmp_path):
+        """Should retry 5xx responses with backoff."""
+        server.failures["/paper.pdf"] = ["503", "503"]
+
+        downloader.download(server.url("/paper.pdf"), tmp_path / "out.pdf")
+
+        assert (tmp_path / "out.pdf").read_bytes() == PDF
+        assert len(server.requests) == 3
+
+    def test_resumes_truncated_download(self, server, downloader, tmp_path):
+        """A dropped connection should resume with a Range request."""
+        server.failures["/paper.pdf"] = ["cut"]
+
+        downloader.download(server.url("/paper.pdf"), tmp_path / "out.pdf")
+
+        assert (tmp_path / "out.pdf").read_bytes() == PDF
+        assert server.requests == [("/paper.pdf", None), ("/paper.pdf", f"bytes={len(PDF) // 2}-")]
+
+    def test_keeps_partial_file_for_next_run(self, server, tmp_path):
+        """After the last attempt the partial bytes should stay to be resumed later."""
+        from scripts.download_papers import Downloader, DownloadError
+
+        url = server.url("/paper.pdf")
+        server.failures["/paper.pdf"] = ["cut"]
+        first = Downloader(partial_dir=tmp_path / ".partial", attempts=1, backoff=0)
+        with pytest.raises(DownloadError):
+            first.download(url, tmp_path / "out.pdf")
+        assert first.partial_path(url, tmp_path / "out.pdf").stat().st_size == len(PDF) // 2
+
+        Downloader(partial_dir=tmp_path / ".partial", backoff=0).download(url, tmp_path / "out.pdf")
+
+        assert (tmp_path / "out.pdf").read_bytes() == PDF
+        assert server.requests[-1] == ("/paper.pdf", f"bytes={len(PDF) // 2}-")
+
+    @pytest.mark.parametrize(
+        ("path", "message"),
+        [
+            ("/login", "Not a PDF (text/html)"),
+            ("/no-trailer.pdf", "no %%EOF trailer"),
+            ("/missing.pdf", "HTTP 404"),
+        ],
+    )
+    def test_rejects_invalid_responses_without_retry(
+        self, server, downloader, tmp_path, path, message
+    ):
+        """Non-PDF bodies, truncated PDFs and 4xx should fail immediately."""
+        from scripts.download_papers import DownloadError
+
+        with pytest.raises(DownloadError, match=message.replace("(", r"\(").replace(")", r"\)")):
+            downloader.download(server.url(path), tmp_path / "out.pdf")
+
+        assert len(server.requests) == 1
+        assert not (tmp_path / "out.pdf").exists()
+        assert not list((tmp_path / ".partial").iterdir())
+
+    def test_limits_concurrency_per_host(self, server, tmp_path):
+        """Parallel downloads should respect the per-host limit."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from scripts.download_papers import Downloader
+
+        server.failures["/paper.pdf"] = ["slow"] * 8
+        downloader = Downloader(
+            partial_dir=tmp_path / ".partial", backoff=0, host_limits={"127.0.0.1": 2}
+        )
+        url = server.url("/paper.pdf")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: downloader.download(url, tmp_path / f"{i}.pdf"), range(8)))
+        downloader.close()
+
+        assert server.max_inflight == 2
+        assert len(list(tmp_path.glob("*.pdf"))) == 8
+
+
+class TestMain:
+    """Tests for main function."""
+
+    def test_downloads_in_parallel_and_updates_status(self, server, tmp_path, capsys):
+        """Should download every new paper and add them to status in one go."""
+        from scripts.download_papers import main
+
+        whitepapers = tmp_path / "whitepapers"
+        status_file = whitepapers / "status.json"
+        status_file.parent.mkdir()
+        status_file.write_text(json.dumps({"papers": [{"episode": "01", "name": "old"}]}))
+        input_file = tmp_path / "papers.json"
+        papers = [
+            {"name": f"paper-{i}", "category": "llm", "url": server.url(f"/paper.pdf?id={i}")}
+            for i in range(5)
+        ]
+        papers.append({"name": "broken", "category": "llm", "url": server.url("/missing.pdf")})
+        input_file.write_text(json.dumps(papers))
+
+        with (
+            patch("scripts.download_papers.WHITEPAPERS_DIR", whitepapers),
+            patch("scripts.download_papers.PARTIAL_DIR", whitepapers / ".partial"),
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            patch("status_utils.STATUS_FILE", status_file),
+            patch("sys.argv", ["download_papers.py", str(input_file), "--jobs", "4"]),
+        ):
+            main()
+
+        saved = json.loads(status_file.read_text())
+        assert [p["episode"] for p in saved["papers"]] == ["01", "02", "03", "04", "05", "06"]
+        assert (whitepapers / "llm" / "02-paper-0.pdf").read_bytes() == paper_bytes(
+            "/paper.pdf?id=0"
+        )
+        assert not (whitepapers / "llm" / "07-broken.pdf").exists()
+        out = capsys.readouterr().out
+        assert "5/6 successful" in out
+        assert "HTTP 404" in out
+
+    def test_skips_known_papers_without_downloading(self, server, tmp_path, capsys):
+        """Mirrors of a known paper, repeats in the input and re-runs should be no-ops."""
+        from scripts.download_papers import main
+
+        whitepapers = tmp_path / "whitepapers"
+        status_file = whitepapers / "status.json"
+        status_file.parent.mkdir()
+        status_file.write_text(
+            json.dumps(
+                {
+                    "papers": [
+                        {
+                            "episode": "01",
+                            "name": "attention",
+                            "source_url": "https://arxiv.org/abs/1706.03762",
+                        }
+                    ]
+                }
+            )
+        )
+        input_file = tmp_path / "papers.json"
+        papers = [
+            {"name": "transformer", "url": "https://arxiv.org/pdf/1706.03762v7.pdf"},
+            {"name": "new", "url": server.url("/paper.pdf?id=1")},
+            {"name": "new-again", "url": server.url("/paper.pdf?id=1")},
+        ]
+        input_file.write_text(json.dumps(papers))
+
+        with (
+            patch("scripts.download_papers.WHITEPAPERS_DIR", whitepapers),
+            patch("scripts.download_papers.PARTIAL_DIR", whitepapers / ".partial"),
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            patch("status_utils.STATUS_FILE", status_file),
+            patch("sys.argv", ["download_papers.py", str(input_file)]),
+        ):
+            main()
+            first = capsys.readouterr().out
+            main()
+            second = capsys.readouterr().out
+
+        assert "transformer → episode 01" in first
+        assert "new-again → new (same source)" in first
+        assert len(server.requests) == 1
+        assert "No new papers to download" in second
+        assert "new → episode 02" in second
+        assert (whitepapers / ".paper-index.json").exists()
+
+    def test_removes_download_with_known_contents(self, server, tmp_path, capsys):
+        """A download identical to a paper on disk should be dropped after the fact."""
+        from scripts.download_papers import main
+
+        whitepapers = tmp_path / "whitepapers"
+        (whitepapers / "llm").mkdir(parents=True)
+        (whitepapers / "llm" / "01-original.pdf").write_bytes(PDF)
+        status_file = whitepapers / "status.json"
+        status_file.write_text(json.dumps({"papers": [{"episode": "01", "name": "original"}]}))
+        input_file = tmp_path / "papers.json"
+        input_file.write_text(json.dumps([{"name": "copy", "url": server.url("/paper.pdf")}]))
+
+        with (
+            patch("scripts.download_papers.WHITEPAPERS_DIR", whitepapers),
+            patch("scripts.download_papers.PARTIAL_DIR", whitepapers / ".partial"),
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            patch("status_utils.STATUS_FILE", status_file),
+            patch("sys.argv", ["download_papers.py", str(input_file)]),
+        ):
+            main()
+
+        assert "Same PDF as episode 01" in capsys.readouterr().out
+        assert not (whitepapers / "llm" / "02-copy.pdf").exists()
+        saved = json.loads(status_file.read_text())
+        assert [p["name"] for p in saved["papers"]] == ["original"]
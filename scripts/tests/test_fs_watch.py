@@ -0,0 +1,115 @@
+"""Tests for fs_watch.py module."""
+
+import pytest
+
+
+def _inotify_available():
+    from scripts.fs_watch import _load_libc
+
+    return _load_libc() is not None
+
+
+requires_inotify = pytest.mark.skipif(not _inotify_available(), reason="inotify not available")
+
+
+class TestPollingWatcher:
+    """Tests for PollingWatcher."""
+
+    def test_reports_added_and_removed_names(self, tmp_path):
+        """Should report paths that appeared or disappeared since the last poll."""
+        from scripts.fs_watch import PollingWatcher
+
+        (tmp_path / "old.m4a").write_bytes(b"")
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+
+        assert watcher.poll() == []
+        (tmp_path / "old.m4a").unlink()
+        (tmp_path / "new.m4a").write_bytes(b"")
+
+        assert sorted(watcher.wait(timeout=1)) == [tmp_path / "new.m4a", tmp_path / "old.m4a"]
+
+    def test_follows_new_subdirectories(self, tmp_path):
+        """Files created inside a new subdirectory should be seen on later polls."""
+        from scripts.fs_watch import PollingWatcher
+
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+        (tmp_path / "01-a").mkdir()
+        assert watcher.poll() == [tmp_path / "01-a"]
+
+        (tmp_path / "01-a" / "slide-01.png").write_bytes(b"")
+        assert watcher.wait(timeout=1) == [tmp_path / "01-a" / "slide-01.png"]
+
+    def test_ignores_hidden_entries(self, tmp_path):
+        """Temp files and dot-directories should not be reported."""
+        from scripts.fs_watch import PollingWatcher
+
+        (tmp_path / ".segments").mkdir()
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+        (tmp_path / ".status.json.tmp").write_text("{}")
+        (tmp_path / ".segments" / "x.mp4").write_bytes(b"")
+
+        assert watcher.dirs.keys() == {tmp_path}
+        assert watcher.wait(timeout=0.05) == []
+
+    def test_removed_subdirectory_is_dropped(self, tmp_path):
+        """Should stop tracking a directory once it is deleted."""
+        from scripts.fs_watch import PollingWatcher
+
+        (tmp_path / "sub").mkdir()
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+        (tmp_path / "sub").rmdir()
+
+        assert watcher.poll() == [tmp_path / "sub"]
+        assert watcher.dirs.keys() == {tmp_path}
+
+
+@requires_inotify
+class TestInotifyWatcher:
+    """Tests for InotifyWatcher."""
+
+    def test_reports_create_move_and_delete(self, tmp_path):
+        """Should report each changed path, including inside new subdirectories."""
+        from scripts.fs_watch import InotifyWatcher
+
+        watcher = InotifyWatcher([tmp_path])
+        try:
+            (tmp_path / "01-a.m4a").write_bytes(b"")
+            assert watcher.wait(timeout=1) == [tmp_path / "01-a.m4a"]
+
+            (tmp_path / "01-a").mkdir()
+            assert watcher.wait(timeout=1) == [tmp_path / "01-a"]
+            (tmp_path / "01-a" / "slide-01.png").write_bytes(b"")
+            assert watcher.wait(timeout=1) == [tmp_path / "01-a" / "slide-01.png"]
+
+            (tmp_path / "01-a.m4a").rename(tmp_path / "01-b.m4a")
+            (tmp_path / "01-b.m4a").unlink()
+            (tmp_path / ".hidden.tmp").write_text("")
+            changed = watcher.wait(timeout=1)
+            assert changed == [tmp_path / "01-a.m4a", tmp_path / "01-b.m4a", tmp_path / "01-b.m4a"]
+            assert watcher.wait(timeout=0.05) == []
+        finally:
+            watcher.close()
+
+
+class TestMakeWatcher:
+    """Tests for make_watcher function."""
+
+    def test_poll_forces_polling(self, tmp_path):
+        """Should return a polling watcher when asked, skipping missing roots."""
+        from scripts.fs_watch import PollingWatcher, make_watcher
+
+        watcher = make_watcher([tmp_path, tmp_path / "missing"], poll=True)
+
+        assert isinstance(watcher, PollingWatcher)
+        assert watcher.roots == [tmp_path]
+
+    def test_falls_back_without_inotify(self, tmp_path):
+        """Should poll when inotify cannot be used."""
+        from unittest.mock import patch
+
+        from scripts.fs_watch import PollingWatcher, make_watcher
+
+        with patch("scripts.fs_watch._load_libc", return_value=None):
+            watcher = make_watcher([tmp_path])
+
+        assert isinstance(watcher, PollingWatcher)
@@ -80,6 +80,96 @@ class TestScanWhitepapers:
         assert paper["name"] == "attention-is-all-you-need"
 
 
+class TestAssetIndex:
+    """Tests for AssetIndex directory listings."""
+
+    def test_lists_each_directory_once(self, tmp_path):
+        """Repeated lookups should reuse the first listing."""
+        import os
+
+        from scripts.generate_status import AssetIndex
+
+        (tmp_path / "01-a.m4a").write_bytes(b"")
+        (tmp_path / "01-a").mkdir()
+        index = AssetIndex()
+
+        with patch("scripts.generate_status.os.scandir", wraps=os.scandir) as scan:
+            assert index.exists(tmp_path, "01-a.m4a")
+            assert index.exists(tmp_path, "01-*")
+            assert not index.exists(tmp_path, "02-a.m4a")
+            assert index.dirs(tmp_path) == {"01-a"}
+
+        assert scan.call_count == 1
+        assert index.scanned == 1
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """Should treat a missing directory as having no entries."""
+        from scripts.generate_status import AssetIndex
+
+        index = AssetIndex()
+
+        assert index.files(tmp_path / "missing") == frozenset()
+        assert index.scanned == 0
+
+    def test_reuses_cache_while_mtime_unchanged(self, tmp_path):
+        """Should skip listing a directory whose mtime matches the cache."""
+        import os
+
+        from scripts.generate_status import AssetIndex
+
+        (tmp_path / "01-a.m4a").write_bytes(b"")
+        old = 1_000_000_000_000_000_000
+        os.utime(tmp_path, ns=(old, old))
+
+        first = AssetIndex()
+        assert first.files(tmp_path) == {"01-a.m4a"}
+        cache = first.cache_entries()
+        assert cache[str(tmp_path)]["mtime_ns"] == old
+
+        # Stale listing is served as long as the mtime matches
+        (tmp_path / "02-b.m4a").write_bytes(b"")
+        os.utime(tmp_path, ns=(old, old))
+        second = AssetIndex(cache)
+        assert second.files(tmp_path) == {"01-a.m4a"}
+        assert (second.scanned, second.reused) == (0, 1)
+
+        os.utime(tmp_path, ns=(old + 1, old + 1))
+        third = AssetIndex(cache)
+        assert third.files(tmp_path) == {"01-a.m4a", "02-b.m4a"}
+        assert third.scanned == 1
+
+    def test_does_not_cache_recently_modified_dirs(self, tmp_path):
+        """A directory changed within the racy window should be rescanned next time."""
+        from scripts.generate_status import AssetIndex
+
+        (tmp_path / "01-a.m4a").write_bytes(b"")
+        index = AssetIndex()
+        index.files(tmp_path)
+
+        assert index.cache_entries() == {}
+
+    def test_cache_file_round_trip(self, tmp_path):
+        """Should save visited listings and ignore unreadable cache files."""
+        import os
+
+        from scripts.generate_status import AssetIndex, load_scan_cache, save_scan_cache
+
+        assets = tmp_path / "assets"
+        assets.mkdir()
+        (assets / "01-a.json").write_text("{}")
+        os.utime(assets, ns=(10**18, 10**18))
+        cache_file = tmp_path / ".status-scan.json"
+
+        index = AssetIndex()
+        index.files(assets)
+        save_scan_cache(index, cache_file)
+
+        assert load_scan_cache(cache_file)[str(assets)]["files"] == ["01-a.json"]
+        cache_file.write_text("not json")
+        assert load_scan_cache(cache_file) == {}
+        assert load_scan_cache(tmp_path / "missing.json") == {}
+
+
 class TestCheckExists:
     """Tests for check_exists function."""
 
@@ -493,6 +583,11 @@ class TestMain:
             patch("status_utils.STATUS_FILE", status_file),
             patch("scripts.status_utils.WHITEPAPERS_DIR", project_with_whitepapers / "whitepapers"),
             patch("status_utils.WHITEPAPERS_DIR", project_with_whitepapers / "whitepapers"),
+            patch(
+                "scripts.generate_status.SCAN_CACHE_FILE",
+                project_with_whitepapers / "youtube" / ".status-scan.json",
+            ),
+            patch("sys.argv", ["generate_status.py"]),
         ):
             result = main()
 
@@ -501,3 +596,144 @@ class TestMain:
         assert "Generating status.json" in captured.out
         assert "Total papers:" in captured.out
         assert "Saved to" in captured.out
+        assert "Scanned" in captured.out
+        assert (project_with_whitepapers / "youtube" / ".status-scan.json").exists()
+
+
+@pytest.fixture
+def watched_project(project_with_whitepapers, monkeypatch):
+    """Point generate_status and status_utils at the temp project."""
+    root = project_with_whitepapers
+    youtube = root / "youtube"
+    archive = root / "archive" / "pl"
+    whitepapers = root / "whitepapers"
+    settings = {
+        "WHITEPAPERS_DIR": whitepapers,
+        "YOUTUBE_DIR": youtube,
+        "ARCHIVE_DIR": archive,
+        "AUDIO_DIRS": [youtube / "pl" / "audio", archive / "audio"],
+        "SLIDES_DIRS": [youtube / "pl" / "slides", archive / "slides"],
+        "TRANSCRIPTS_DIRS": [youtube / "pl" / "transcripts", archive / "transcripts"],
+        "THUMBNAILS_DIRS": [youtube / "thumbnails", archive / "thumbnails"],
+        "VIDEO_DIRS": [youtube / "output", archive / "video"],
+        "SLIDES_PROMPTS_DIR": youtube / "prompts" / "slides",
+        "THUMBNAILS_PROMPTS_DIR": youtube / "prompts" / "thumbnails",
+    }
+    for name, value in settings.items():
+        monkeypatch.setattr(f"scripts.generate_status.{name}", value)
+    for module in ("scripts.status_utils", "status_utils"):
+        monkeypatch.setattr(f"{module}.STATUS_FILE", whitepapers / "status.json")
+        monkeypatch.setattr(f"{module}.WHITEPAPERS_DIR", whitepapers)
+    return root
+
+
+def _papers(root):
+    status = json.loads((root / "whitepapers" / "status.json").read_text())
+    return {p["episode"]: p for p in status["papers"]}
+
+
+class TestClassifyChange:
+    """Tests for classify_change function."""
+
+    def test_maps_asset_paths_to_episodes(self, watched_project):
+        """Should find the episode in the first numbered path component."""
+        from scripts.generate_status import classify_change
+
+        youtube = watched_project / "youtube"
+        assert classify_change(youtube / "pl" / "audio" / "07-x.m4a") == "07"
+        assert classify_change(youtube / "pl" / "slides" / "64-y" / "slide-01.png") == "64"
+        assert classify_change(watched_project / "archive" / "pl" / "video" / "2-z.mp4") == "02"
+        assert classify_change(youtube / "config.json") is None
+
+    def test_whitepaper_changes_need_rescan(self, watched_project):
+        """Papers and categories change the paper list; status files are ignored."""
+        from scripts.generate_status import RESCAN, classify_change
+
+        whitepapers = watched_project / "whitepapers"
+        assert classify_change(whitepapers / "llm" / "03-bert.pdf") == RESCAN
+        assert classify_change(whitepapers / "robotics") == RESCAN
+        assert classify_change(whitepapers) == RESCAN
+        assert classify_change(whitepapers / "status.json") is None
+        assert classify_change(whitepapers / "status.db-wal") is None
+        assert classify_change(whitepapers / "llm" / "notes.md") is None
+
+
+class TestApplyChanges:
+    """Tests for apply_changes function."""
+
+    def test_updates_only_affected_episode(self, watched_project):
+        """Should refresh the given episode and leave others untouched."""
+        from scripts.generate_status import apply_changes
+
+        assert apply_changes(set(), rescan=True) == [
+            "01-attention-is-all-you-need: added",
+            "02-gpt: added",
+            "64-lamport-clocks: added",
+        ]
+        audio = watched_project / "youtube" / "pl" / "audio"
+        (audio / "01-attention-is-all-you-need.m4a").write_bytes(b"audio")
+        (audio / "02-gpt.m4a").write_bytes(b"audio")
+
+        assert apply_changes({"01", "99"}) == ["01-attention-is-all-you-need: audio"]
+
+        papers = _papers(watched_project)
+        assert papers["01"]["audio"] is True
+        assert papers["02"]["audio"] is False
+
+    def test_no_write_without_changes(self, watched_project):
+        """Should leave status.json alone when flags already match."""
+        from scripts.generate_status import apply_changes
+
+        apply_changes(set(), rescan=True)
+        status_file = watched_project / "whitepapers" / "status.json"
+        before = status_file.read_text()
+
+        assert apply_changes({"01", "02"}) == []
+        assert apply_changes(set(), rescan=True) == []
+        assert status_file.read_text() == before
+
+    def test_rescan_reports_removed_papers(self, watched_project):
+        """Should drop papers whose whitepaper was deleted."""
+        from scripts.generate_status import apply_changes
+
+        apply_changes(set(), rescan=True)
+        (watched_project / "whitepapers" / "llm" / "02-gpt.pdf").unlink()
+
+        assert apply_changes(set(), rescan=True) == ["02-gpt: removed"]
+        assert "02" not in _papers(watched_project)
+
+
+class TestWatchStatus:
+    """Tests for watch_status function."""
+
+    def test_batches_events_until_quiet(self, watched_project, capsys):
+        """Events before a quiet period should be written in one transaction."""
+        from unittest.mock import MagicMock, patch
+
+        from scripts.generate_status import apply_changes, watch_status
+
+        apply_changes(set(), rescan=True)
+        audio = watched_project / "youtube" / "pl" / "audio"
+        transcripts = watched_project / "youtube" / "pl" / "transcripts"
+        (audio / "01-attention-is-all-you-need.m4a").write_bytes(b"audio")
+        (transcripts / "64-lamport-clocks.json").write_text("{}")
+
+        watcher = MagicMock()
+        watcher.wait.side_effect = [
+            [audio / "01-attention-is-all-you-need.m4a"],
+            [transcripts / "64-lamport-clocks.json", audio / "notes.txt"],
+            [],
+            KeyboardInterrupt,
+        ]
+
+        with (
+            patch("scripts.generate_status.apply_changes", wraps=apply_changes) as mock_apply,
+            pytest.raises(KeyboardInterrupt),
+        ):
+            watch_status(watcher, debounce=0.01)
+
+        mock_apply.assert_called_once_with({"01", "64"}, False)
+        papers = _papers(watched_project)
+        assert papers["01"]["audio"] is True
+        assert papers["64"]["transcript"] is True
+        assert "64-lamport-clocks: transcript" in capsys.readouterr().out
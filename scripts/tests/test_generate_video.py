@@ -1,6 +1,9 @@
 """Tests for generate_video.py script."""
 
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -65,101 +68,114 @@ class TestGetDuration:
         assert "format=duration" in args
 
 
-class TestExtractFrame:
-    """Tests for extract_frame function."""
+SAMPLE_STDERR = """Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'video.mp4':
+  Duration: 00:02:05.50, start: 0.000000, bitrate: 8 kb/s
+Input #1, mov,mp4,m4a,3gp,3g2,mj2, from 'video.mp4':
+  Duration: 00:02:05.50, start: 0.000000, bitrate: 8 kb/s
+[metadata@start @ 0x7fa700004140] frame:0    pts:0       pts_time:0
+[metadata@start @ 0x7fa700004140] lavfi.signalstats.YAVG=16
+[metadata@end @ 0x7fa700004ec0] frame:0    pts:0       pts_time:0
+[metadata@end @ 0x7fa700004ec0] lavfi.signalstats.YAVG=180
+[metadata@start @ 0x7fa700004140] frame:1    pts:512     pts_time:1
+[metadata@start @ 0x7fa700004140] lavfi.signalstats.YAVG=200
+[metadata@end @ 0x7fa700004ec0] frame:1    pts:512     pts_time:1
+[metadata@end @ 0x7fa700004ec0] lavfi.signalstats.YAVG=235
+"""
 
-    def test_calls_ffmpeg_with_correct_args(self, tmp_path):
-        """Should call ffmpeg to extract single frame."""
-        from scripts.generate_video import extract_frame
 
-        video = tmp_path / "test.mp4"
-        output = tmp_path / "frame.png"
+class TestParseVideoCheck:
+    """Tests for parse_video_check function."""
 
-        with patch("subprocess.run") as mock_run:
-            extract_frame(video, output, 5.0)
+    def test_parses_duration(self):
+        """Should read duration from input header."""
+        from scripts.generate_video import parse_video_check
 
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[0] == "ffmpeg"
-        assert "-ss" in args
-        assert "5.0" in args
-        assert "-vframes" in args
-        assert "1" in args
+        check = parse_video_check(SAMPLE_STDERR)
 
+        assert check.duration == 125.5
 
-class TestGetBrightness:
-    """Tests for get_brightness function."""
+    def test_min_brightness_per_window(self):
+        """Should report darkest frame of each window, normalized to 0-1."""
+        from scripts.generate_video import parse_video_check
 
-    def test_parses_brightness_value(self):
-        """Should parse brightness from magick output."""
-        from scripts.generate_video import get_brightness
+        check = parse_video_check(SAMPLE_STDERR)
 
-        mock_result = MagicMock()
-        mock_result.stdout = "0.75"
+        assert check.start_brightness == 0.0
+        assert check.end_brightness == pytest.approx((180 - 16) / 219)
+        assert check.start_ok is False
+        assert check.end_ok is True
 
-        with patch("scripts.generate_video.run_cmd", return_value=mock_result):
-            brightness = get_brightness(Path("/fake/image.png"))
+    def test_black_intervals_in_absolute_time(self):
+        """Should report black runs, shifting end window to video time."""
+        from scripts.generate_video import parse_video_check
+
+        stderr = SAMPLE_STDERR.replace("YAVG=235", "YAVG=16")
+        check = parse_video_check(stderr)
 
-        assert brightness == 0.75
+        assert check.black_intervals == [(0.0, 1.0), (123.5, 123.5)]
 
-    def test_calls_magick_with_correct_args(self):
-        """Should call magick with grayscale mean calculation."""
-        from scripts.generate_video import get_brightness
+    def test_raises_without_duration(self):
+        """Should raise ValueError when duration missing."""
+        from scripts.generate_video import parse_video_check
+
+        with pytest.raises(ValueError, match="duration"):
+            parse_video_check("no header here")
+
+
+class TestAnalyzeVideo:
+    """Tests for analyze_video function."""
+
+    def test_runs_single_ffmpeg_process(self):
+        """Should decode head and tail in one ffmpeg call."""
+        from scripts.generate_video import analyze_video
 
         mock_result = MagicMock()
-        mock_result.stdout = "0.5"
+        mock_result.returncode = 0
+        mock_result.stderr = SAMPLE_STDERR
 
         with patch("scripts.generate_video.run_cmd", return_value=mock_result) as mock_run:
-            get_brightness(Path("/test/image.png"))
+            check = analyze_video(Path("/fake/video.mp4"))
 
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
-        assert args[0] == "magick"
-        assert "-colorspace" in args
-        assert "Gray" in args
-
+        assert args[0] == "ffmpeg"
+        assert "-sseof" in args
+        assert "-t" in args
+        assert args.count("/fake/video.mp4") == 2
+        assert "signalstats" in args[args.index("-filter_complex") + 1]
+        assert check.duration == 125.5
 
-class TestCheckBlackFrames:
-    """Tests for check_black_frames function."""
+    def test_raises_on_ffmpeg_failure(self):
+        """Should raise RuntimeError when ffmpeg fails."""
+        from scripts.generate_video import analyze_video
 
-    def test_returns_tuple_of_bools(self):
-        """Should return (start_ok, end_ok) tuple."""
-        from scripts.generate_video import check_black_frames
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stderr = "No such file"
 
         with (
-            patch("scripts.generate_video.extract_frame"),
-            patch("scripts.generate_video.get_brightness", return_value=0.5),
+            patch("scripts.generate_video.run_cmd", return_value=mock_result),
+            pytest.raises(RuntimeError, match="ffmpeg verification failed"),
         ):
-            result = check_black_frames(Path("/fake/video.mp4"), 100.0)
+            analyze_video(Path("/fake/video.mp4"))
 
-        assert isinstance(result, tuple)
-        assert len(result) == 2
-        assert all(isinstance(v, bool) for v in result)
 
-    def test_detects_black_start_frames(self):
-        """Should detect black frames at start."""
-        from scripts.generate_video import check_black_frames
+class TestFindBlackIntervals:
+    """Tests for find_black_intervals function."""
 
-        with (
-            patch("scripts.generate_video.extract_frame"),
-            patch("scripts.generate_video.get_brightness", return_value=0.01),
-        ):
-            start_ok, _end_ok = check_black_frames(Path("/fake/video.mp4"), 100.0)
+    def test_groups_consecutive_black_frames(self):
+        """Should merge consecutive black frames into one interval."""
+        from scripts.generate_video import find_black_intervals
 
-        assert start_ok is False
+        frames = [(0.0, 0.0), (0.5, 0.01), (1.0, 0.5), (1.5, 0.0), (2.0, 0.6)]
 
-    def test_passes_non_black_frames(self):
-        """Should pass when frames are not black."""
-        from scripts.generate_video import check_black_frames
+        assert find_black_intervals(frames) == [(0.0, 1.0), (1.5, 2.0)]
 
-        with (
-            patch("scripts.generate_video.extract_frame"),
-            patch("scripts.generate_video.get_brightness", return_value=0.5),
-        ):
-            start_ok, end_ok = check_black_frames(Path("/fake/video.mp4"), 100.0)
+    def test_no_black_frames(self):
+        """Should return empty list when nothing is black."""
+        from scripts.generate_video import find_black_intervals
 
-        assert start_ok is True
-        assert end_ok is True
+        assert find_black_intervals([(0.0, 0.5), (1.0, 0.7)]) == []
 
 
 class TestFindEpisodeFiles:
@@ -213,7 +229,10 @@ class TestGenerateVideo:
         mock_result = MagicMock()
         mock_result.returncode = 0
 
-        with patch("scripts.generate_video.run_cmd", return_value=mock_result) as mock_run:
+        with (
+            patch("scripts.generate_video.run_cmd", return_value=mock_result) as mock_run,
+            patch("scripts.generate_video.probe_audio", return_value=None),
+        ):
             generate_video(concat, audio, output)
 
         mock_run.assert_called_once()
@@ -238,7 +257,10 @@ class TestGenerateVideo:
         mock_result = MagicMock()
         mock_result.returncode = 0
 
-        with patch("scripts.generate_video.run_cmd", return_value=mock_result) as mock_run:
+        with (
+            patch("scripts.generate_video.run_cmd", return_value=mock_result) as mock_run,
+            patch("scripts.generate_video.probe_audio", return_value=None),
+        ):
             generate_video(concat, audio, output)
 
         args = mock_run.call_args[0][0]
@@ -249,6 +271,348 @@ class TestGenerateVideo:
         assert "fps=30" in vf_value
 
 
+class TestEncodingProfiles:
+    """Tests for encoding profile selection."""
+
+    def test_default_profile_keeps_plain_libx264(self):
+        """Default profile should not add tuning options."""
+        from scripts.generate_video import video_encoder_args
+
+        assert video_encoder_args("default") == ["-c:v", "libx264"]
+
+    def test_still_profile_uses_long_gop_and_slide_keyframes(self):
+        """Still profile should tune for still images and key on slide starts."""
+        from scripts.generate_video import video_encoder_args
+
+        args = video_encoder_args("still", fps=10, keyframes=[0.0, 12.5])
+
+        assert args[args.index("-tune") + 1] == "stillimage"
+        assert args[args.index("-g") + 1] == "600"
+        assert args[args.index("-force_key_frames") + 1] == "0.000,12.500"
+
+    def test_slide_start_times(self, tmp_path):
+        """Should return cumulative start times of timed slides."""
+        from scripts.generate_video import slide_start_times
+
+        concat = tmp_path / "concat.txt"
+        concat.write_text("file 'a.png'\nduration 5\nfile 'b.png'\nduration 7.5\nfile 'b.png'\n")
+
+        assert slide_start_times(concat) == [0.0, 5.0]
+
+    def test_generate_video_applies_profile_and_fps(self, tmp_path):
+        """Should pass profile options and output rate to ffmpeg."""
+        from scripts.generate_video import generate_video
+
+        concat = tmp_path / "concat.txt"
+        concat.write_text("file 'a.png'\nduration 5\nfile 'b.png'\nduration 5\n")
+
+        with patch("scripts.generate_video.run_cmd") as mock_run:
+            generate_video(concat, tmp_path / "a.m4a", tmp_path / "o.mp4", "still", 10)
+
+        args = mock_run.call_args[0][0]
+        assert "stillimage" in args
+        assert args[args.index("-force_key_frames") + 1] == "0.000,5.000"
+        assert args[args.index("-vf") + 1].endswith("fps=10")
+
+    def test_segment_key_depends_on_profile(self):
+        """Cached segments should not be shared between profiles."""
+        from scripts.generate_video import segment_key
+
+        assert segment_key("abc", 30, "default") != segment_key("abc", 30, "still")
+        assert segment_key("abc", 30, "still", 30) != segment_key("abc", 30, "still", 10)
+
+
+class TestAudioPassthrough:
+    """Tests for AAC probing and stream-copy audio."""
+
+    def test_probe_audio_parses_stream(self, tmp_path):
+        """Should read codec parameters from ffprobe JSON."""
+        from scripts.generate_video import AudioInfo, probe_audio
+
+        stdout = (
+            '{"streams": [{"codec_name": "aac", "profile": "LC", '
+            '"sample_rate": "44100", "channels": 2, "bit_rate": "127999"}]}'
+        )
+        ok = subprocess.CompletedProcess([], 0, stdout, "")
+        with patch("scripts.generate_video.run_cmd", return_value=ok):
+            info = probe_audio(tmp_path / "a.m4a")
+
+        assert info == AudioInfo("aac", "LC", 44100, 2, 127999)
+        assert info.passthrough_ok
+
+    def test_probe_audio_returns_none_on_failure(self, tmp_path):
+        """Should return None when ffprobe fails."""
+        from scripts.generate_video import probe_audio
+
+        failed = subprocess.CompletedProcess([], 1, "", "error")
+        with patch("scripts.generate_video.run_cmd", return_value=failed):
+            assert probe_audio(tmp_path / "a.m4a") is None
+
+    def test_probe_audio_without_ffprobe(self, tmp_path):
+        """Should return None when ffprobe is not installed."""
+        from scripts.generate_video import probe_audio
+
+        with patch("scripts.generate_video.run_cmd", side_effect=FileNotFoundError):
+            assert probe_audio(tmp_path / "a.m4a") is None
+
+    def test_non_lc_aac_is_not_copied(self):
+        """HE-AAC and non-AAC sources should be re-encoded."""
+        from scripts.generate_video import AudioInfo
+
+        assert not AudioInfo("aac", "HE-AAC", 44100, 2).passthrough_ok
+        assert not AudioInfo("mp3", "", 44100, 2).passthrough_ok
+        assert not AudioInfo("aac", "LC", 22050, 2).passthrough_ok
+
+    def test_copies_aac_with_silent_tail(self, tmp_path):
+        """Should concat source and silence and stream-copy the result."""
+        from scripts.generate_video import AudioInfo, audio_inputs
+
+        audio = tmp_path / "a.m4a"
+        tail = tmp_path / "silence.m4a"
+        with (
+            patch(
+                "scripts.generate_video.probe_audio",
+                return_value=AudioInfo("aac", "LC", 48000, 2, 192000),
+            ),
+            patch("scripts.generate_video.silent_tail", return_value=tail),
+        ):
+            inputs, codec = audio_inputs(audio, tmp_path)
+
+        assert codec == ["-c:a", "copy"]
+        assert inputs[:2] == ["-f", "concat"]
+        listing = Path(inputs[-1]).read_text()
+        assert listing.index(str(audio)) < listing.index(str(tail))
+
+    def test_reencodes_incompatible_audio(self, tmp_path):
+        """Should fall back to apad + AAC encode."""
+        from scripts.generate_video import REENCODE_AUDIO_ARGS, AudioInfo, audio_inputs
+
+        audio = tmp_path / "a.mp3"
+        with patch(
+            "scripts.generate_video.probe_audio", return_value=AudioInfo("mp3", "", 44100, 2)
+        ):
+            inputs, codec = audio_inputs(audio, tmp_path)
+
+        assert inputs == ["-i", str(audio)]
+        assert codec == REENCODE_AUDIO_ARGS
+
+    def test_reencode_flag_skips_probe(self, tmp_path):
+        """Should not probe when copy is disabled."""
+        from scripts.generate_video import REENCODE_AUDIO_ARGS, audio_inputs
+
+        with patch("scripts.generate_video.probe_audio") as probe:
+            _, codec = audio_inputs(tmp_path / "a.m4a", tmp_path, copy_audio=False)
+
+        probe.assert_not_called()
+        assert codec == REENCODE_AUDIO_ARGS
+
+    def test_silent_tail_is_cached(self, tmp_path):
+        """Should reuse a previously generated silence segment."""
+        from scripts.generate_video import AudioInfo, silent_tail
+
+        info = AudioInfo("aac", "LC", 44100, 1, 96000)
+        cached = tmp_path / "silence-44100-1ch-96000.m4a"
+        cached.write_bytes(b"aac")
+
+        with patch("scripts.generate_video.run_cmd") as mock_run:
+            assert silent_tail(info, tmp_path) == cached
+
+        mock_run.assert_not_called()
+
+
+class TestConcurrentCacheWrites:
+    """Parallel renders writing the same cache entry."""
+
+    @staticmethod
+    def slow_ffmpeg(barrier, outputs):
+        """run_cmd stand-in writing its output in pieces once both callers are running."""
+
+        def run(cmd, **_kwargs):
+            output = Path(cmd[-1])
+            outputs.append(output)
+            barrier.wait(timeout=5)
+            with output.open("wb") as f:
+                for _ in range(5):
+                    f.write(b"x" * 1000)
+                    f.flush()
+                    time.sleep(0.01)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        return run
+
+    def test_silent_tail_and_segments_use_own_temp_files(self, tmp_path):
+        """Two workers should write separate temp files and leave a complete cache entry."""
+        from scripts.generate_video import AudioInfo, encode_segment, silent_tail
+
+        info = AudioInfo("aac", "LC", 44100, 2, 128000)
+        image = tmp_path / "slide.png"
+        image.write_bytes(b"png")
+        segment = tmp_path / "cache" / "abc.mp4"
+        segment.parent.mkdir()
+
+        for call in (
+            lambda: silent_tail(info, tmp_path / "cache"),
+            lambda: encode_segment(image, 30, segment),
+        ):
+            outputs = []
+            with (
+                patch(
+                    "scripts.generate_video.run_cmd",
+                    side_effect=self.slow_ffmpeg(threading.Barrier(2), outputs),
+                ),
+                ThreadPoolExecutor(2) as pool,
+            ):
+                results = [f.result() for f in [pool.submit(call), pool.submit(call)]]
+
+            assert len(set(outputs)) == 2
+            assert all(not output.exists() for output in outputs)
+            assert results[0] is not None
+
+        tail = tmp_path / "cache" / "silence-44100-2ch-128000.m4a"
+        assert tail.read_bytes() == b"x" * 5000
+        assert segment.read_bytes() == b"x" * 5000
+        assert sorted(p.name for p in segment.parent.iterdir()) == [segment.name, tail.name]
+
+
+class TestPlanSegments:
+    """Tests for plan_segments function."""
+
+    def test_converts_durations_to_frames(self, tmp_path):
+        """Should map each timed entry to a frame count."""
+        from scripts.generate_video import plan_segments
+
+        concat = tmp_path / "concat.txt"
+        concat.write_text(
+            "file '/a.png'\nduration 10\nfile '/b.png'\nduration 2.5\nfile '/b.png'\n"
+        )
+
+        segments = plan_segments(concat)
+
+        assert [(s.image, s.frames) for s in segments] == [
+            (Path("/a.png"), 300),
+            (Path("/b.png"), 75),
+        ]
+
+    def test_rounding_does_not_drift(self, tmp_path):
+        """Should keep total frames equal to total duration."""
+        from scripts.generate_video import plan_segments
+
+        concat = tmp_path / "concat.txt"
+        concat.write_text("".join(f"file '/s{i}.png'\nduration 1.01\n" for i in range(100)))
+
+        segments = plan_segments(concat)
+
+        assert sum(s.frames for s in segments) == 3030
+
+    def test_resolves_relative_paths(self, tmp_path):
+        """Should resolve relative image paths against concat.txt location."""
+        from scripts.generate_video import plan_segments
+
+        concat = tmp_path / "concat.txt"
+        concat.write_text("file 'slide-01.png'\nduration 1\n")
+
+        assert plan_segments(concat)[0].image == tmp_path / "slide-01.png"
+
+
+class TestRenderSegments:
+    """Tests for render_segments function."""
+
+    def test_encodes_only_missing_segments(self, tmp_path):
+        """Should reuse cached segments and encode the rest."""
+        from scripts.generate_video import Segment, render_segments
+
+        image = tmp_path / "slide.png"
+        image.write_bytes(b"png")
+        cache = tmp_path / "cache"
+        segments = [Segment(image, 30), Segment(image, 60)]
+
+        def fake_encode(_image, _frames, output, *_args):
+            output.write_bytes(b"mp4")
+            return subprocess.CompletedProcess([], 0, "", "")
+
+        with patch("scripts.generate_video.encode_segment", side_effect=fake_encode) as enc:
+            paths, encoded, failure = render_segments(segments, cache)
+            assert encoded == 2
+            assert failure is None
+            assert enc.call_count == 2
+
+            segments.append(Segment(image, 90))
+            paths, encoded, _ = render_segments(segments, cache)
+
+        assert encoded == 1
+        assert enc.call_count == 3
+        assert len(paths) == 3
+        assert all(p.exists() for p in paths)
+
+    def test_key_changes_with_image_content(self, tmp_path):
+        """Should encode again when the image changes."""
+        from scripts.generate_video import Segment, render_segments
+
+        image = tmp_path / "slide.png"
+        image.write_bytes(b"v1")
+        with patch(
+            "scripts.generate_video.encode_segment",
+            return_value=subprocess.CompletedProcess([], 0, "", ""),
+        ):
+            first, _, _ = render_segments([Segment(image, 30)], tmp_path)
+            image.write_bytes(b"v2")
+            second, _, _ = render_segments([Segment(image, 30)], tmp_path)
+
+        assert first != second
+
+    def test_reports_failure(self, tmp_path):
+        """Should return the failed ffmpeg result."""
+        from scripts.generate_video import Segment, render_segments
+
+        image = tmp_path / "slide.png"
+        image.write_bytes(b"png")
+        failed = subprocess.CompletedProcess([], 1, "", "boom")
+
+        with patch("scripts.generate_video.encode_segment", return_value=failed):
+            _, _, failure = render_segments([Segment(image, 30)], tmp_path / "cache")
+
+        assert failure is failed
+
+
+class TestGenerateVideoIncremental:
+    """Tests for generate_video_incremental function."""
+
+    def test_assembles_with_stream_copy(self, tmp_path):
+        """Should join segments with -c:v copy and mux audio."""
+        from scripts.generate_video import generate_video_incremental
+
+        image = tmp_path / "slide.png"
+        image.write_bytes(b"png")
+        concat = tmp_path / "concat.txt"
+        concat.write_text(f"file '{image}'\nduration 10\nfile '{image}'\n")
+        audio = tmp_path / "audio.m4a"
+        output = tmp_path / "output.mp4"
+
+        ok = subprocess.CompletedProcess([], 0, "", "")
+        with (
+            patch("scripts.generate_video.encode_segment", return_value=ok),
+            patch("scripts.generate_video.run_cmd", return_value=ok) as mock_run,
+        ):
+            result = generate_video_incremental(concat, audio, output, tmp_path / "cache")
+
+        assert result.returncode == 0
+        args = mock_run.call_args[0][0]
+        assert args[args.index("-c:v") + 1] == "copy"
+        assert str(audio) in args
+        assert str(output) in args
+
+    def test_fails_without_timed_entries(self, tmp_path):
+        """Should fail when concat.txt has no durations."""
+        from scripts.generate_video import generate_video_incremental
+
+        concat = tmp_path / "concat.txt"
+        concat.write_text("file 'slide.png'\n")
+
+        result = generate_video_incremental(concat, tmp_path / "a.m4a", tmp_path / "o.mp4")
+
+        assert result.returncode == 1
+
+
 class TestMain:
     """Tests for main function."""
 
@@ -311,7 +675,7 @@ class TestMain:
 
     def test_uses_custom_concat_path(self, tmp_path, capsys):
         """Should use custom concat path when provided."""
-        from scripts.generate_video import main
+        from scripts.generate_video import VideoCheck, main
 
         slides_dir = tmp_path / "28-test"
         slides_dir.mkdir()
@@ -325,16 +689,16 @@ class TestMain:
         mock_result.returncode = 0
         mock_result.stdout = "100.0"
 
-        # get_duration called 3 times: audio, video, video (in verification)
         # audio=100, expected video=105 (audio+5), actual video=105
-        duration_values = [100.0, 105.0]
+        check = VideoCheck(duration=105.0, start_brightness=0.5, end_brightness=0.5)
 
         with (
             patch("sys.argv", ["generate_video.py", "28", "--concat", str(custom_concat)]),
             patch("scripts.generate_video.find_episode_files", return_value=(slides_dir, audio)),
             patch("scripts.generate_video.run_cmd", return_value=mock_result),
-            patch("scripts.generate_video.get_duration", side_effect=duration_values),
-            patch("scripts.generate_video.check_black_frames", return_value=(True, True)),
+            patch("scripts.generate_video.get_duration", return_value=100.0),
+            patch("scripts.generate_video.analyze_video", return_value=check),
+            patch("scripts.generate_video.update_episode_status"),
             patch("scripts.generate_video.OUTPUT_DIR", tmp_path),
         ):
             (tmp_path / "28-test.mp4").write_bytes(b"video")
@@ -362,6 +726,7 @@ class TestMain:
             patch("scripts.generate_video.find_episode_files", return_value=(slides_dir, audio)),
             patch("scripts.generate_video.run_cmd", return_value=mock_result),
             patch("scripts.generate_video.get_duration", return_value=100.0),
+            patch("scripts.generate_video.update_episode_status"),
             patch("scripts.generate_video.OUTPUT_DIR", tmp_path),
         ):
             (tmp_path / "28-test.mp4").write_bytes(b"video")
@@ -371,6 +736,34 @@ class TestMain:
         captured = capsys.readouterr()
         assert "Skipping verification" in captured.out
 
+    def test_incremental_flag(self, tmp_path, capsys):
+        """Should build from cached segments when --incremental is used."""
+        from scripts.generate_video import main
+
+        slides_dir = tmp_path / "28-test"
+        slides_dir.mkdir()
+        (slides_dir / "concat.txt").write_text("file slide.png\nduration 10\n")
+        audio = tmp_path / "28-test.m4a"
+        audio.write_bytes(b"audio")
+        ok = subprocess.CompletedProcess([], 0, "", "")
+
+        with (
+            patch("sys.argv", ["generate_video.py", "28", "--incremental", "--skip-verify"]),
+            patch("scripts.generate_video.find_episode_files", return_value=(slides_dir, audio)),
+            patch("scripts.generate_video.generate_video_incremental", return_value=ok) as inc,
+            patch("scripts.generate_video.generate_video") as full,
+            patch("scripts.generate_video.get_duration", return_value=100.0),
+            patch("scripts.generate_video.update_episode_status"),
+            patch("scripts.generate_video.OUTPUT_DIR", tmp_path),
+        ):
+            (tmp_path / "28-test.mp4").write_bytes(b"video")
+            result = main()
+
+        assert result == 0
+        inc.assert_called_once()
+        full.assert_not_called()
+        assert "incremental" in capsys.readouterr().out
+
     def test_returns_1_when_ffmpeg_fails(self, tmp_path, capsys):
         """Should return 1 when ffmpeg fails."""
         from scripts.generate_video import main
@@ -408,7 +801,7 @@ class TestMain:
 
     def test_returns_1_when_verification_fails(self, tmp_path, capsys):
         """Should return 1 when verification fails."""
-        from scripts.generate_video import main
+        from scripts.generate_video import VideoCheck, main
 
         slides_dir = tmp_path / "28-test"
         slides_dir.mkdir()
@@ -425,10 +818,13 @@ class TestMain:
             patch("sys.argv", ["generate_video.py", "28"]),
             patch("scripts.generate_video.find_episode_files", return_value=(slides_dir, audio)),
             patch("scripts.generate_video.run_cmd", return_value=mock_result),
+            patch("scripts.generate_video.get_duration", return_value=100.0),
             patch(
-                "scripts.generate_video.get_duration", side_effect=[100.0, 90.0]
-            ),  # Wrong duration
-            patch("scripts.generate_video.check_black_frames", return_value=(True, True)),
+                "scripts.generate_video.analyze_video",
+                return_value=VideoCheck(
+                    duration=90.0, start_brightness=0.5, end_brightness=0.5
+                ),  # Wrong duration
+            ),
             patch("scripts.generate_video.OUTPUT_DIR", tmp_path),
         ):
             (tmp_path / "28-test.mp4").write_bytes(b"video")
@@ -437,3 +833,179 @@ class TestMain:
         assert result == 1
         captured = capsys.readouterr()
         assert "verification failed" in captured.out
+
+
+class TestPlanConcurrency:
+    """Tests for plan_concurrency function."""
+
+    def test_default_splits_cores_by_thread_count(self):
+        """Should run cores / threads encodes in parallel."""
+        from scripts.generate_video import plan_concurrency
+
+        with patch("scripts.generate_video.os.cpu_count", return_value=16):
+            assert plan_concurrency(10) == (4, 4)
+
+    def test_jobs_only_divides_cores(self):
+        """Should give each job an equal share of cores."""
+        from scripts.generate_video import plan_concurrency
+
+        with patch("scripts.generate_video.os.cpu_count", return_value=16):
+            assert plan_concurrency(10, jobs=2) == (2, 8)
+
+    def test_caps_jobs_by_cores(self):
+        """Should not oversubscribe cores with too many jobs."""
+        from scripts.generate_video import plan_concurrency
+
+        with patch("scripts.generate_video.os.cpu_count", return_value=8):
+            assert plan_concurrency(10, jobs=8, threads=4) == (2, 4)
+
+    def test_caps_jobs_by_episode_count(self):
+        """Should not start more workers than episodes."""
+        from scripts.generate_video import plan_concurrency
+
+        with patch("scripts.generate_video.os.cpu_count", return_value=32):
+            assert plan_concurrency(1) == (1, 4)
+
+
+class TestFindReadyEpisodes:
+    """Tests for find_ready_episodes function."""
+
+    def test_splits_by_concat_presence(self, tmp_path):
+        """Should queue ready episodes with concat.txt and report the rest."""
+        from scripts.generate_video import find_ready_episodes
+        from scripts.status_utils import matches_flags
+
+        ready_paper = {
+            "audio": True,
+            "slides": True,
+            "transcript": True,
+            "thumbnail": True,
+        }
+        status = {
+            "papers": [
+                {"episode": "10", "name": "a", **ready_paper},
+                {"episode": "11", "name": "b", **ready_paper},
+                {"episode": "12", "name": "c", **ready_paper, "video": True},
+            ]
+        }
+        slides = tmp_path / "slides"
+        (slides / "10-a").mkdir(parents=True)
+        (slides / "10-a" / "concat.txt").write_text("file 'x.png'\n")
+        (slides / "11-b").mkdir()
+
+        with (
+            patch(
+                "scripts.generate_video.select_papers",
+                side_effect=lambda **flags: [
+                    p for p in status["papers"] if matches_flags(p, flags)
+                ],
+            ),
+            patch("scripts.generate_video.ASSETS_DIR", tmp_path),
+        ):
+            ready, missing = find_ready_episodes()
+
+        assert ready == [("10", "10-a")]
+        assert missing == ["11-b"]
+
+
+class TestRenderEpisodeWorker:
+    """Tests for render_episode_worker function."""
+
+    def test_writes_log_and_skips_status_update(self, tmp_path):
+        """Should capture output to a per-episode log without touching status."""
+        from scripts.generate_video import RenderOptions, render_episode_worker
+
+        def fake_render(ep_num, _options, update_status):
+            assert update_status is False
+            print(f"rendering {ep_num}")
+            return 0
+
+        with (
+            patch("scripts.generate_video.render_episode", side_effect=fake_render),
+            patch("scripts.generate_video.LOGS_DIR", tmp_path / "logs"),
+        ):
+            result = render_episode_worker("28", "28-test", RenderOptions())
+
+        assert result.returncode == 0
+        assert result.log_file == tmp_path / "logs" / "28-test.log"
+        assert "rendering 28" in result.log_file.read_text()
+
+    def test_catches_exceptions(self, tmp_path):
+        """Should turn crashes into a failed result."""
+        from scripts.generate_video import RenderOptions, render_episode_worker
+
+        with (
+            patch("scripts.generate_video.render_episode", side_effect=OSError("disk full")),
+            patch("scripts.generate_video.LOGS_DIR", tmp_path),
+        ):
+            result = render_episode_worker("28", "28-test", RenderOptions())
+
+        assert result.returncode == 1
+        assert "disk full" in result.log_file.read_text()
+
+
+class TestRunReady:
+    """Tests for run_ready function."""
+
+    def test_updates_status_for_successful_episodes(self, tmp_path, capsys):
+        """Should mark only successful episodes as having video."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from scripts.generate_video import EpisodeResult, RenderOptions, run_ready
+
+        def fake_worker(episode, name, options):
+            assert options.threads == 2
+            return EpisodeResult(episode, name, 0 if episode == "10" else 1, 1.0, tmp_path)
+
+        with (
+            patch(
+                "scripts.generate_video.find_ready_episodes",
+                return_value=([("10", "10-a"), ("11", "11-b")], ["12-c"]),
+            ),
+            patch("scripts.generate_video.render_episode_worker", side_effect=fake_worker),
+            patch("scripts.generate_video.ProcessPoolExecutor", ThreadPoolExecutor),
+            patch("scripts.generate_video.update_episode_status") as mock_update,
+            patch("scripts.generate_video.os.cpu_count", return_value=4),
+        ):
+            result = run_ready(RenderOptions(), threads=2)
+
+        assert result == 1
+        mock_update.assert_called_once_with("10", "video", True)
+        out = capsys.readouterr().out
+        assert "12-c: no concat.txt yet" in out
+        assert "1/2 rendered" in out
+        assert "11-b" in out
+
+    def test_nothing_ready(self, capsys):
+        """Should succeed when the queue is empty."""
+        from scripts.generate_video import RenderOptions, run_ready
+
+        with patch("scripts.generate_video.find_ready_episodes", return_value=([], [])):
+            assert run_ready(RenderOptions()) == 0
+
+        assert "No episodes ready" in capsys.readouterr().out
+
+
+class TestMainReady:
+    """Tests for --ready command line handling."""
+
+    def test_ready_runs_queue(self):
+        """Should pass jobs and threads to run_ready."""
+        from scripts.generate_video import main
+
+        with (
+            patch("sys.argv", ["generate_video.py", "--ready", "--jobs", "2", "--threads", "3"]),
+            patch("scripts.generate_video.run_ready", return_value=0) as mock_run,
+        ):
+            assert main() == 0
+
+        options, jobs, threads = mock_run.call_args[0]
+        assert (jobs, threads) == (2, 3)
+        assert options.threads == 3
+
+    def test_episode_and_ready_conflict(self):
+        """Should reject an episode number together with --ready."""
+        from scripts.generate_video import main
+
+        with patch("sys.argv", ["generate_video.py", "28", "--ready"]), pytest.raises(SystemExit):
+            main()
@@ -0,0 +1,124 @@
+"""Tests for paper_index.py module."""
+
+import json
+
+import pytest
+
+
+class TestSourceKey:
+    """Tests for source_key function."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://arxiv.org/abs/1706.03762",
+            "https://arxiv.org/abs/1706.03762v5",
+            "http://arxiv.org/pdf/1706.03762v7.pdf",
+            "https://export.arxiv.org/pdf/1706.03762",
+            "https://ar5iv.labs.arxiv.org/html/1706.03762",
+            "https://ar5iv.org/abs/1706.03762",
+        ],
+    )
+    def test_arxiv_mirrors_share_a_key(self, url):
+        """Abs, pdf, versioned and mirror URLs should map to the same key."""
+        from scripts.paper_index import source_key
+
+        assert source_key(url) == "arxiv:1706.03762"
+
+    def test_old_style_arxiv_id(self):
+        """Should keep the archive prefix of pre-2007 IDs."""
+        from scripts.paper_index import source_key
+
+        assert source_key("https://arxiv.org/abs/cs/0112017v1") == "arxiv:cs/0112017"
+
+    def test_openreview(self):
+        """Forum and pdf links should map to the same key."""
+        from scripts.paper_index import source_key
+
+        assert source_key("https://openreview.net/forum?id=abc_1") == "openreview:abc_1"
+        assert source_key("https://openreview.net/pdf?id=abc_1") == "openreview:abc_1"
+
+    def test_other_urls_ignore_scheme_and_www(self):
+        """Other URLs should compare without scheme, www. and trailing slash."""
+        from scripts.paper_index import source_key
+
+        assert source_key("https://www.usenix.org/paper.pdf") == source_key(
+            "http://usenix.org/paper.pdf/"
+        )
+
+
+@pytest.fixture
+def whitepapers(tmp_path):
+    root = tmp_path / "whitepapers"
+    (root / "llm").mkdir(parents=True)
+    (root / "llm" / "01-attention.pdf").write_bytes(b"%PDF-1.4 attention")
+    (root / "llm" / "02-gpt.pdf").write_bytes(b"%PDF-1.4 gpt")
+    (root / "llm" / "02-gpt-slides.pdf").write_bytes(b"%PDF-1.4 slides")
+    (root / ".partial").mkdir()
+    (root / ".partial" / "abc.part").write_bytes(b"%PDF")
+    return root
+
+
+class TestPaperIndex:
+    """Tests for PaperIndex class."""
+
+    def test_refresh_indexes_papers_on_disk(self, whitepapers):
+        """Should index paper files by hash, name and status source_url."""
+        from scripts.paper_index import PaperIndex, file_sha256
+
+        index = PaperIndex(root=whitepapers)
+        index.refresh([{"episode": "01", "source_url": "https://arxiv.org/abs/1706.03762"}])
+
+        assert sorted(index.files) == ["llm/01-attention.pdf", "llm/02-gpt.pdf"]
+        assert index.find("gpt", "https://example.com/x.pdf") == "02"
+        assert index.find("other", "https://arxiv.org/pdf/1706.03762v2") == "01"
+        assert index.find("other", "https://example.com/x.pdf") is None
+        sha = file_sha256(whitepapers / "llm" / "02-gpt.pdf")
+        assert index.by_hash[sha] == "02"
+
+    def test_hashes_only_new_or_changed_files(self, whitepapers):
+        """A reloaded index should reuse hashes of files whose size and mtime match."""
+        from scripts.paper_index import PaperIndex
+
+        index = PaperIndex.load(whitepapers)
+        index.refresh()
+        index.save()
+        assert index.hashed == 2
+
+        (whitepapers / "llm" / "02-gpt.pdf").write_bytes(b"%PDF-1.4 gpt, revised")
+        (whitepapers / "llm" / "01-attention.pdf").unlink()
+        index = PaperIndex.load(whitepapers)
+        index.refresh()
+
+        assert index.hashed == 1
+        assert sorted(index.files) == ["llm/02-gpt.pdf"]
+        assert index.find("attention", "") is None
+
+    def test_find_file_and_add(self, whitepapers):
+        """Should match downloads by content and remember their source."""
+        from scripts.paper_index import PaperIndex
+
+        index = PaperIndex(root=whitepapers)
+        index.refresh()
+        copy = whitepapers / "llm" / "03-copy.pdf"
+        copy.write_bytes(b"%PDF-1.4 gpt")
+        new = whitepapers / "llm" / "03-new.pdf"
+        new.write_bytes(b"%PDF-1.4 new")
+
+        assert index.find_file(copy)[1] == "02"
+        sha, episode = index.find_file(new)
+        assert episode is None
+
+        index.add(new, "https://openreview.net/pdf?id=xyz", sha)
+        index.save()
+        reloaded = PaperIndex.load(whitepapers)
+        assert reloaded.find("other", "https://openreview.net/forum?id=xyz") == "03"
+        assert reloaded.by_hash[sha] == "03"
+
+    def test_load_ignores_other_versions(self, whitepapers):
+        """Should start empty when the cache has an unknown version."""
+        from scripts.paper_index import INDEX_NAME, PaperIndex
+
+        (whitepapers / INDEX_NAME).write_text(json.dumps({"version": 0, "files": {"x": {}}}))
+
+        assert PaperIndex.load(whitepapers).files == {}
@@ -0,0 +1,157 @@
+"""Tests for pdf_check.py script."""
+
+from unittest.mock import patch
+
+import pytest
+
+try:
+    import pymupdf  # noqa: F401
+
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
+
+
+def make_pdf(comment=b"", prefix=b"", shift=0, xref_stream=False):
+    """Build a one-page PDF with a correct xref table.
+
+    shift moves every xref offset; prefix is junk written before the header.
+    """
+    content = b"BT /F1 12 Tf 72 720 Td (" + b"x" * 1000 + b") Tj ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    out = b"%PDF-1.4\n"
+    if comment:
+        out += b"% " + comment + b"\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    if xref_stream:
+        out += b"5 0 obj\n<< /Type /XRef /Size 6 /Root 1 0 R >>\nstream\n\nendstream\nendobj\n"
+    else:
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        for offset in offsets:
+            out += b"%010d 00000 n \n" % (offset + shift)
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref
+    return prefix + out
+
+
+class TestValidatePdf:
+    """Tests for validate_pdf function."""
+
+    def test_valid_pdf_passes_without_parsing(self, tmp_path):
+        """A PDF whose xref lines up should be accepted by the cheap checks."""
+        from scripts.pdf_check import validate_pdf
+
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(make_pdf())
+
+        with patch("scripts.pdf_check._full_parse") as full_parse:
+            check = validate_pdf(path)
+
+        assert check.ok
+        assert check.tier == "xref"
+        full_parse.assert_not_called()
+
+    def test_xref_stream_and_junk_before_header(self, tmp_path):
+        """Should accept xref streams and offsets relative to a late header."""
+        from scripts.pdf_check import validate_pdf
+
+        stream = tmp_path / "stream.pdf"
+        stream.write_bytes(make_pdf(xref_stream=True))
+        junk = tmp_path / "junk.pdf"
+        junk.write_bytes(make_pdf(prefix=b"\r\n\r\n"))
+
+        assert validate_pdf(stream).tier == "xref"
+        assert validate_pdf(junk).tier == "xref"
+
+    @pytest.mark.parametrize(
+        ("data", "tier", "reason"),
+        [
+            (b"%PDF-1.4\n%%EOF\n", "header", "too small"),
+            (b"<html>" + b"x" * 2000 + b"</html>", "header", "bad header"),
+            (make_pdf()[:-200], "trailer", "no %%EOF"),
+            (make_pdf().replace(b"startxref", b"startfoo"), "trailer", "no startxref"),
+        ],
+    )
+    def test_rejects_broken_files(self, tmp_path, data, tier, reason):
+        """Files failing the header or trailer check should be rejected outright."""
+        from scripts.pdf_check import validate_pdf
+
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(data)
+
+        check = validate_pdf(path)
+
+        assert not check.ok
+        assert check.tier == tier
+        assert reason in check.reason
+
+    def test_bad_xref_falls_back_to_full_parse(self, tmp_path):
+        """Mismatched xref offsets should be settled by the full parse."""
+        from scripts.pdf_check import PdfCheck, validate_pdf
+
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(make_pdf(shift=3))
+
+        with patch("scripts.pdf_check._full_parse", return_value=PdfCheck(True, "parse")) as full:
+            assert validate_pdf(path).tier == "parse"
+
+        assert "object 1 does not point at it" in full.call_args.args[1]
+
+    def test_without_pymupdf_inconclusive_files_pass_with_reason(self, tmp_path):
+        """Without a parser, xref problems should be reported but not fatal."""
+        from scripts.pdf_check import validate_pdf
+
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(make_pdf(shift=3))
+
+        with patch("scripts.pdf_check.pymupdf", None):
+            check = validate_pdf(path)
+
+        assert check.ok
+        assert "install pymupdf" in check.reason
+
+    @pytest.mark.skipif(not HAS_PYMUPDF, reason="pymupdf not installed")
+    def test_full_parse_repairs_or_rejects(self, tmp_path):
+        """PyMuPDF should accept a repairable xref and reject a file with no pages."""
+        from scripts.pdf_check import validate_pdf
+
+        shifted = tmp_path / "shifted.pdf"
+        shifted.write_bytes(make_pdf(shift=3))
+        empty = tmp_path / "empty.pdf"
+        empty.write_bytes(
+            make_pdf(shift=3).replace(b"/Count 1", b"/Count 0").replace(b"[3 0 R]", b"[]     ")
+        )
+
+        assert validate_pdf(shifted).tier == "parse"
+        assert validate_pdf(shifted).ok
+        assert not validate_pdf(empty).ok
+
+
+class TestMain:
+    """Tests for main function."""
+
+    def test_reports_invalid_files(self, tmp_path, capsys):
+        """Should list invalid PDFs and exit non-zero."""
+        from scripts.pdf_check import main
+
+        (tmp_path / "good.pdf").write_bytes(make_pdf())
+        (tmp_path / "bad.pdf").write_bytes(make_pdf()[:-200])
+
+        with patch(
+            "sys.argv", ["pdf_check.py", str(tmp_path / "good.pdf"), str(tmp_path / "bad.pdf")]
+        ):
+            assert main() == 1
+
+        out = capsys.readouterr().out
+        assert "bad.pdf" in out
+        assert "good.pdf" not in out
+        assert "2 PDFs checked, 1 invalid" in out
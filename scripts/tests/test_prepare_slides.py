@@ -6,6 +6,25 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+try:
+    import pymupdf  # noqa: F401
+    from PIL import Image
+
+    HAS_NATIVE_DEPS = True
+except ImportError:
+    HAS_NATIVE_DEPS = False
+
+requires_native_deps = pytest.mark.skipif(
+    not HAS_NATIVE_DEPS, reason="PyMuPDF and Pillow not installed"
+)
+
+
+@pytest.fixture(autouse=True)
+def imagemagick_backend():
+    """Default to ImageMagick backend so subprocess mocks apply regardless of installed deps."""
+    with patch("scripts.prepare_slides.HAS_NATIVE_RENDERER", False):
+        yield
+
 
 class TestRunCmd:
     """Tests for run_cmd function."""
@@ -138,6 +157,95 @@ class TestEnsureRgb:
         assert "sRGB" in cmd
 
 
+class TestReadPngDimensions:
+    """Tests for read_png_dimensions function."""
+
+    def test_reads_dimensions_from_header(self, sample_thumbnail):
+        """Should read width and height from IHDR chunk."""
+        from scripts.prepare_slides import read_png_dimensions
+
+        assert read_png_dimensions(sample_thumbnail) == (1, 1)
+
+    def test_raises_for_non_png(self, tmp_path):
+        """Should raise ValueError for non-PNG file."""
+        from scripts.prepare_slides import read_png_dimensions
+
+        fake = tmp_path / "fake.png"
+        fake.write_bytes(b"fake png")
+
+        with pytest.raises(ValueError, match="Not a PNG file"):
+            read_png_dimensions(fake)
+
+
+@requires_native_deps
+class TestNativeRenderer:
+    """Tests for in-process PyMuPDF/Pillow rendering."""
+
+    def test_renders_pages_at_target_size(self, tmp_path):
+        """Should render every PDF page directly to target dimensions."""
+        import pymupdf
+
+        from scripts.prepare_slides import read_png_dimensions, render_pdf_native
+
+        pdf_path = tmp_path / "deck.pdf"
+        with pymupdf.open() as doc:
+            for _ in range(3):
+                doc.new_page(width=1440, height=810)
+            doc.save(pdf_path)
+
+        slides = render_pdf_native(pdf_path, tmp_path, 1920, 1080)
+
+        assert [s.name for s in slides] == ["slide-1.png", "slide-2.png", "slide-3.png"]
+        for slide in slides:
+            assert read_png_dimensions(slide) == (1920, 1080)
+
+    def test_scale_image_native_converts_to_rgb(self, tmp_path):
+        """Should force-resize and convert to RGB."""
+        from scripts.prepare_slides import scale_image_native
+
+        src = tmp_path / "src.png"
+        dst = tmp_path / "dst.png"
+        Image.new("RGBA", (800, 600), (255, 0, 0, 128)).save(src)
+
+        scale_image_native(src, dst, 1920, 1080)
+
+        with Image.open(dst) as image:
+            assert image.size == (1920, 1080)
+            assert image.mode == "RGB"
+
+    def test_main_uses_native_backend(
+        self, temp_project, sample_thumbnail, sample_last_slide, capsys
+    ):
+        """Should prepare slides without spawning external processes."""
+        import pymupdf
+
+        from scripts.prepare_slides import main
+
+        pdf_path = temp_project / "youtube" / "pl" / "slides" / "01-attention-is-all-you-need.pdf"
+        with pymupdf.open() as doc:
+            doc.new_page(width=1440, height=810)
+            doc.save(pdf_path)
+        Image.new("RGB", (1280, 720), "navy").save(sample_thumbnail)
+        Image.new("RGB", (1920, 1080), "white").save(sample_last_slide)
+
+        with (
+            patch("scripts.prepare_slides.HAS_NATIVE_RENDERER", True),
+            patch("scripts.prepare_slides.SCRIPT_DIR", temp_project),
+            patch("scripts.prepare_slides.ASSETS_DIR", temp_project / "youtube" / "pl"),
+            patch("scripts.prepare_slides.THUMBNAILS_DIR", temp_project / "youtube" / "thumbnails"),
+            patch("scripts.prepare_slides.LAST_SLIDE", sample_last_slide),
+            patch("scripts.prepare_slides.run_cmd") as mock_run,
+            patch("sys.argv", ["prepare_slides.py", "01"]),
+        ):
+            result = main()
+
+        assert result == 0
+        mock_run.assert_not_called()
+        captured = capsys.readouterr()
+        assert "in-process renderer" in captured.out
+        assert "All 3 images have consistent dimensions" in captured.out
+
+
 class TestFindEpisode:
     """Tests for find_episode function."""
 
@@ -452,3 +560,313 @@ class TestFullWorkflow:
 
         captured = capsys.readouterr()
         assert "Scaling from" in captured.out
+
+
+class TestParseEpisodeRanges:
+    """Tests for parse_episode_ranges function."""
+
+    def test_parses_single_and_ranges(self):
+        """Should expand ranges and zero-pad episode numbers."""
+        from scripts.prepare_slides import parse_episode_ranges
+
+        assert parse_episode_ranges("5,12,15-17") == ["05", "12", "15", "16", "17"]
+
+    def test_deduplicates_preserving_order(self):
+        """Should drop duplicate episodes."""
+        from scripts.prepare_slides import parse_episode_ranges
+
+        assert parse_episode_ranges("12,10-12") == ["12", "10", "11"]
+
+    def test_raises_on_reversed_range(self):
+        """Should raise ValueError for descending range."""
+        from scripts.prepare_slides import parse_episode_ranges
+
+        with pytest.raises(ValueError, match="Invalid episode range"):
+            parse_episode_ranges("20-15")
+
+
+class TestFindPendingEpisodes:
+    """Tests for find_pending_episodes function."""
+
+    @pytest.fixture
+    def status(self):
+        return {
+            "papers": [
+                {"episode": "01", "name": "attention-is-all-you-need", "slides": True},
+                {"episode": "02", "name": "gpt", "slides": True},
+                {"episode": "03", "name": "bert", "slides": True, "archived": True},
+            ]
+        }
+
+    def test_finds_pdfs_without_extracted_slides(self, temp_project, sample_pdf_files, status):
+        """Should skip episodes that already have extracted PNGs."""
+        from scripts.prepare_slides import find_pending_episodes
+
+        slides_dir = temp_project / "youtube" / "pl" / "slides"
+        (slides_dir / "02-gpt").mkdir()
+        (slides_dir / "02-gpt" / "slide-01.png").write_bytes(b"png")
+
+        with (
+            patch("scripts.prepare_slides.ASSETS_DIR", temp_project / "youtube" / "pl"),
+            patch("scripts.prepare_slides.load_status", return_value=status),
+        ):
+            result = find_pending_episodes()
+
+        assert [p.stem for p in result] == ["01-attention-is-all-you-need"]
+
+    def test_explicit_episodes_include_extracted(self, temp_project, sample_pdf_files, status):
+        """Should return explicitly requested episodes even if already extracted."""
+        from scripts.prepare_slides import find_pending_episodes
+
+        slides_dir = temp_project / "youtube" / "pl" / "slides"
+        (slides_dir / "02-gpt").mkdir()
+        (slides_dir / "02-gpt" / "slide-01.png").write_bytes(b"png")
+
+        with (
+            patch("scripts.prepare_slides.ASSETS_DIR", temp_project / "youtube" / "pl"),
+            patch("scripts.prepare_slides.load_status", return_value=status),
+        ):
+            result = find_pending_episodes(["02", "03"])
+
+        assert [p.stem for p in result] == ["02-gpt"]
+
+
+class TestRunBatch:
+    """Tests for run_batch function."""
+
+    def test_prints_consolidated_summary(self, sample_pdf_files, capsys):
+        """Should prepare every episode and report totals."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from scripts.prepare_slides import run_batch
+
+        def fake_prepare(pdf_file, _slide_workers, _force):
+            output_dir = pdf_file.parent / pdf_file.stem
+            output_dir.mkdir(exist_ok=True)
+            (output_dir / "slide-01.png").write_bytes(b"png")
+            (output_dir / "slide-02.png").write_bytes(b"png")
+            return 0
+
+        with (
+            patch("scripts.prepare_slides.ProcessPoolExecutor", ThreadPoolExecutor),
+            patch("scripts.prepare_slides.prepare_episode", side_effect=fake_prepare),
+        ):
+            result = run_batch(sample_pdf_files, jobs=1)
+
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Episodes: 2/2 prepared" in captured.out
+        assert "Slides:   4" in captured.out
+
+    def test_reports_failed_episode_log(self, sample_pdf_files, capsys):
+        """Should return 1 and show tail of failed episode output."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from scripts.prepare_slides import run_batch
+
+        def fake_prepare(pdf_file, _slide_workers, _force):
+            print("❌ Thumbnail not found")
+            return 1
+
+        with (
+            patch("scripts.prepare_slides.ProcessPoolExecutor", ThreadPoolExecutor),
+            patch("scripts.prepare_slides.prepare_episode", side_effect=fake_prepare),
+        ):
+            result = run_batch(sample_pdf_files[:1], jobs=1)
+
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "Failed episodes" in captured.out
+        assert "Thumbnail not found" in captured.out
+
+    def test_main_all_with_nothing_pending(self, temp_project, capsys):
+        """Should exit cleanly when no episodes need preparing."""
+        from scripts.prepare_slides import main
+
+        with (
+            patch("scripts.prepare_slides.load_status", return_value={"papers": []}),
+            patch("sys.argv", ["prepare_slides.py", "--all"]),
+        ):
+            result = main()
+
+        assert result == 0
+        assert "No episodes to prepare" in capsys.readouterr().out
+
+
+class TestManifestCache:
+    """Tests for .prepare-manifest.json incremental cache."""
+
+    @pytest.fixture
+    def run_main(self, temp_project, sample_pdf_files, sample_thumbnail, sample_last_slide):
+        """Run main() for episode 01 with ImageMagick mocks; returns list of commands run."""
+        from scripts.prepare_slides import main
+
+        output_dir = temp_project / "youtube" / "pl" / "slides" / "01-attention-is-all-you-need"
+
+        def run(*extra_args):
+            commands = []
+
+            def mock_run_cmd(cmd, **_kwargs):
+                commands.append(cmd[0])
+                result = MagicMock()
+                result.returncode = 0
+                result.stdout = "1920x1080"
+                result.stderr = ""
+                if cmd[0] == "pdftoppm":
+                    output_dir.mkdir(exist_ok=True)
+                    for i in range(1, 3):
+                        (output_dir / f"slide-{i:02d}.png").write_bytes(b"fake png")
+                elif cmd[0] == "convert":
+                    Path(cmd[-1]).write_bytes(b"fake scaled png")
+                return result
+
+            with (
+                patch("scripts.prepare_slides.SCRIPT_DIR", temp_project),
+                patch("scripts.prepare_slides.ASSETS_DIR", temp_project / "youtube" / "pl"),
+                patch(
+                    "scripts.prepare_slides.THUMBNAILS_DIR", temp_project / "youtube" / "thumbnails"
+                ),
+                patch("scripts.prepare_slides.LAST_SLIDE", sample_last_slide),
+                patch("scripts.prepare_slides.run_cmd", side_effect=mock_run_cmd),
+                patch("sys.argv", ["prepare_slides.py", "01", *extra_args]),
+            ):
+                assert main() == 0
+            return commands
+
+        return run
+
+    def test_writes_manifest(self, temp_project, run_main):
+        """Should record input hashes, output hashes and params."""
+        import json
+
+        run_main()
+
+        manifest_path = (
+            temp_project
+            / "youtube"
+            / "pl"
+            / "slides"
+            / "01-attention-is-all-you-need"
+            / ".prepare-manifest.json"
+        )
+        manifest = json.loads(manifest_path.read_text())
+        assert manifest["params"]["width"] == 1920
+        assert manifest["pdf"]
+        assert set(manifest["entries"]) == {
+            "slide-01.png",
+            "slide-02.png",
+            "thumbnail.png",
+            "last-slide.png",
+        }
+
+    def test_rerun_skips_unchanged(self, run_main, capsys):
+        """Should not spawn any process when nothing changed."""
+        run_main()
+        commands = run_main()
+
+        assert commands == []
+        assert "Slides unchanged" in capsys.readouterr().out
+
+    def test_thumbnail_swap_only_rebuilds_thumbnail(self, run_main, sample_thumbnail, capsys):
+        """Should re-prepare only the thumbnail when it changes."""
+        run_main()
+        sample_thumbnail.write_bytes(sample_thumbnail.read_bytes() + b"changed")
+        commands = run_main()
+
+        assert "pdftoppm" not in commands
+        assert commands == ["identify", "identify"]
+        captured = capsys.readouterr()
+        assert "Last slide unchanged (cached)" in captured.out
+
+    def test_modified_output_is_rebuilt(self, temp_project, run_main):
+        """Should rebuild when a cached output was modified on disk."""
+        run_main()
+        slide = (
+            temp_project
+            / "youtube"
+            / "pl"
+            / "slides"
+            / "01-attention-is-all-you-need"
+            / "slide-01.png"
+        )
+        slide.write_bytes(b"edited")
+        commands = run_main()
+
+        assert "pdftoppm" in commands
+
+    def test_force_ignores_manifest(self, run_main):
+        """Should rebuild everything with --force."""
+        run_main()
+        commands = run_main("--force")
+
+        assert "pdftoppm" in commands
+
+
+@requires_native_deps
+class TestNativeIncremental:
+    """Tests for page-level incremental rendering."""
+
+    def test_fingerprints_detect_changed_page(self, tmp_path):
+        """Should only change fingerprint of the edited page."""
+        import pymupdf
+
+        from scripts.prepare_slides import fingerprint_pages
+
+        def make_pdf(path, texts):
+            with pymupdf.open() as doc:
+                for text in texts:
+                    page = doc.new_page(width=1440, height=810)
+                    page.insert_text((100, 100), text)
+                doc.save(path)
+
+        make_pdf(tmp_path / "a.pdf", ["one", "two", "three"])
+        make_pdf(tmp_path / "b.pdf", ["one", "TWO", "three"])
+
+        a = fingerprint_pages(tmp_path / "a.pdf")
+        b = fingerprint_pages(tmp_path / "b.pdf")
+
+        assert [x == y for x, y in zip(a, b, strict=True)] == [True, False, True]
+
+    def test_fingerprints_follow_form_xobjects_and_annotations(self, tmp_path):
+        """Should change when a placed page's inner content or an annotation changes."""
+        import pymupdf
+
+        from scripts.prepare_slides import fingerprint_pages
+
+        def make_pdf(path, text, note=None, padding=0):
+            with pymupdf.open() as source, pymupdf.open() as doc:
+                source.new_page(width=1440, height=810).insert_text((100, 100), text)
+                # Unused objects shift object numbers without changing the page
+                for _ in range(padding):
+                    doc.get_new_xref()
+                page = doc.new_page(width=1440, height=810)
+                page.show_pdf_page(page.rect, source, 0)
+                if note:
+                    page.add_freetext_annot(pymupdf.Rect(100, 200, 400, 300), note)
+                doc.save(path)
+            return fingerprint_pages(path)
+
+        base = make_pdf(tmp_path / "a.pdf", "Hello A")
+
+        assert make_pdf(tmp_path / "b.pdf", "Totally different") != base
+        assert make_pdf(tmp_path / "c.pdf", "Hello A", note="x") != make_pdf(
+            tmp_path / "d.pdf", "Hello A", note="y"
+        )
+        assert make_pdf(tmp_path / "e.pdf", "Hello A", padding=3) == base
+
+    def test_renders_only_selected_pages(self, tmp_path):
+        """Should skip pages not in selection but return all paths."""
+        import pymupdf
+
+        from scripts.prepare_slides import render_pdf_native
+
+        pdf_path = tmp_path / "deck.pdf"
+        with pymupdf.open() as doc:
+            for _ in range(3):
+                doc.new_page(width=1440, height=810)
+            doc.save(pdf_path)
+
+        slides = render_pdf_native(pdf_path, tmp_path, 1920, 1080, pages={1})
+
+        assert len(slides) == 3
+        assert [s.exists() for s in slides] == [False, True, False]
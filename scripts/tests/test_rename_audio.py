@@ -0,0 +1,69 @@
+"""Tests for rename_audio.py script."""
+
+from contextlib import nullcontext
+from pathlib import Path
+from unittest.mock import patch
+
+
+def make_tree(tmp_path):
+    """Whitepapers for episodes 1 and 2, and audio files with short names."""
+    papers = tmp_path / "whitepapers" / "llm"
+    papers.mkdir(parents=True)
+    (papers / "01-attention.pdf").write_bytes(b"pdf")
+    (papers / "02-gpt.pdf").write_bytes(b"pdf")
+    audio = tmp_path / "audio"
+    audio.mkdir()
+    (audio / "01.m4a").write_bytes(b"a")
+    (audio / "02.m4a").write_bytes(b"b")
+    return audio
+
+
+def test_failed_rename_keeps_status_of_earlier_ones(tmp_path, capsys):
+    """A rename failing partway should still record the renames already done."""
+    from scripts.rename_audio import rename_audio_files
+
+    audio = make_tree(tmp_path)
+    real_rename = Path.rename
+
+    def rename(self, target):
+        if self.name == "02.m4a":
+            raise PermissionError("read-only")
+        return real_rename(self, target)
+
+    with (
+        patch("scripts.rename_audio.AUDIO_DIR", audio),
+        patch("scripts.rename_audio.WHITEPAPERS_DIR", tmp_path / "whitepapers"),
+        patch("scripts.rename_audio.update_episode_status") as update,
+        patch("scripts.rename_audio.status_transaction"),
+        patch.object(Path, "rename", rename),
+    ):
+        assert rename_audio_files() == 1
+
+    assert (audio / "01-attention.m4a").exists()
+    assert (audio / "02.m4a").exists()
+    update.assert_called_once_with(1, "audio", True)
+    out = capsys.readouterr().out
+    assert "02.m4a: read-only" in out
+    assert "1 files could not be renamed" in out
+
+
+def test_status_lock_is_not_held_while_renaming(tmp_path):
+    """Files should be renamed before the status transaction starts."""
+    from scripts.rename_audio import rename_audio_files
+
+    audio = make_tree(tmp_path)
+    events = []
+
+    def transaction():
+        events.append(sorted(p.name for p in audio.iterdir()))
+        return nullcontext()
+
+    with (
+        patch("scripts.rename_audio.AUDIO_DIR", audio),
+        patch("scripts.rename_audio.WHITEPAPERS_DIR", tmp_path / "whitepapers"),
+        patch("scripts.rename_audio.update_episode_status"),
+        patch("scripts.rename_audio.status_transaction", side_effect=transaction),
+    ):
+        assert rename_audio_files() == 0
+
+    assert events == [["01-attention.m4a", "02-gpt.m4a"]]
@@ -0,0 +1,36 @@
+"""Tests for status_db.py module."""
+
+import json
+import sys
+from unittest.mock import patch
+
+
+class TestMain:
+    """Tests for main function."""
+
+    def test_export_then_import(self, tmp_path, monkeypatch, capsys):
+        """Should export the database to status.json and load it back."""
+        from scripts.status_db import main
+        from scripts.status_utils import load_status, update_episode_status
+
+        monkeypatch.setenv("STATUS_BACKEND", "sqlite")
+        status_file = tmp_path / "status.json"
+        status_file.write_text(json.dumps({"papers": [{"episode": "01", "name": "a"}]}))
+
+        with (
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            patch("status_utils.STATUS_FILE", status_file),
+        ):
+            update_episode_status("01", "audio", True)
+            with patch.object(sys, "argv", ["status_db.py", "export"]):
+                assert main() == 0
+            assert json.loads(status_file.read_text())["papers"][0]["audio"] is True
+
+            status_file.write_text(json.dumps({"papers": [{"episode": "02", "name": "b"}]}))
+            with patch.object(sys, "argv", ["status_db.py", "import"]):
+                assert main() == 0
+            assert [p["episode"] for p in load_status()["papers"]] == ["02"]
+
+        out = capsys.readouterr().out
+        assert "Exported 1 papers" in out
+        assert "Imported 1 papers into status.db" in out
@@ -186,6 +186,290 @@ class TestUpdateEpisodeStatus:
         assert saved["summary"]["transcript"] == 2
 
 
+class TestStatusTransaction:
+    """Tests for status_transaction context manager."""
+
+    def test_batches_updates_into_one_write(self, status_file, sample_status):
+        """Many updates inside a transaction should read and write once."""
+        from scripts import status_utils
+
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text(json.dumps(sample_status))
+
+        with (
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            patch("scripts.status_utils.load_status", wraps=status_utils.load_status) as mock_load,
+            patch("scripts.status_utils.save_status", wraps=status_utils.save_status) as mock_save,
+            status_utils.status_transaction() as transaction,
+        ):
+            transaction.set("01", "video", True)
+            status_utils.update_episode_status("02", "transcript", True)
+            status_utils.update_episode_field("03", "youtube_url", "https://y.t/3")
+
+        assert mock_load.call_count == 1
+        assert mock_save.call_count == 1
+        saved = json.loads(status_file.read_text())
+        assert [p["episode"] for p in saved["papers"]] == ["01", "02", "03"]
+        assert saved["summary"]["transcript"] == 2
+
+    def test_exception_discards_changes(self, status_file, sample_status):
+        """Should leave the file untouched when the block raises."""
+        from scripts.status_utils import status_transaction
+
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text(json.dumps(sample_status))
+
+        with (
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            pytest.raises(RuntimeError),
+            status_transaction() as transaction,
+        ):
+            transaction.set("01", "video", True)
+            raise RuntimeError("boom")
+
+        assert json.loads(status_file.read_text()) == sample_status
+
+    def test_read_only_transaction_does_not_write(self, status_file, sample_status):
+        """Should not rewrite the file when nothing changed."""
+        from scripts.status_utils import status_transaction
+
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text(json.dumps(sample_status))
+
+        with (
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            status_transaction() as transaction,
+        ):
+            assert transaction.paper(1)["name"] == "attention-is-all-you-need"
+
+        assert json.loads(status_file.read_text())["updated"] == sample_status["updated"]
+
+    def test_concurrent_updates_are_not_lost(self, status_file):
+        """Parallel writers should all land in the file."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from scripts.status_utils import update_episode_status
+
+        with patch("scripts.status_utils.STATUS_FILE", status_file):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda ep: update_episode_status(ep, "audio", True), range(1, 41)))
+
+            saved = json.loads(status_file.read_text())
+
+        assert len(saved["papers"]) == 40
+        assert saved["summary"]["audio"] == 40
+
+    def test_replace_swaps_document(self, status_file, sample_status):
+        """Should write a replaced document in full."""
+        from scripts.status_utils import status_transaction
+
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text(json.dumps(sample_status))
+
+        with (
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            status_transaction() as transaction,
+        ):
+            transaction.replace({"papers": [{"episode": "07", "name": "x"}]})
+
+        saved = json.loads(status_file.read_text())
+        assert [p["episode"] for p in saved["papers"]] == ["07"]
+        assert saved["summary"]["total"] == 1
+
+
+class TestAtomicSave:
+    """Tests for atomic status.json writes."""
+
+    def test_no_temp_files_left(self, status_file, sample_status):
+        """Should rename the temp file over status.json."""
+        from scripts.status_utils import save_status
+
+        with patch("scripts.status_utils.STATUS_FILE", status_file):
+            save_status(sample_status)
+
+        assert [p.name for p in status_file.parent.iterdir()] == ["status.json"]
+
+    def test_failed_write_keeps_original(self, status_file, sample_status):
+        """Should keep the old file if serialization fails."""
+        from scripts.status_utils import save_status
+
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text(json.dumps(sample_status))
+
+        with (
+            patch("scripts.status_utils.STATUS_FILE", status_file),
+            pytest.raises(TypeError),
+        ):
+            save_status({"papers": [object()]})
+
+        assert json.loads(status_file.read_text()) == sample_status
+        assert [p.name for p in status_file.parent.iterdir()] == ["status.json"]
+
+    def test_preserves_file_mode(self, status_file, sample_status):
+        """Should keep permissions of the existing file."""
+        from scripts.status_utils import save_status
+
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text("{}")
+        status_file.chmod(0o664)
+
+        with patch("scripts.status_utils.STATUS_FILE", status_file):
+            save_status(sample_status)
+
+        assert status_file.stat().st_mode & 0o777 == 0o664
+
+
+class TestSqliteBackend:
+    """Tests for the STATUS_BACKEND=sqlite status.db backend."""
+
+    @pytest.fixture(autouse=True)
+    def sqlite_backend(self, monkeypatch, status_file, sample_status):
+        from scripts.status_utils import update_summary
+
+        monkeypatch.setenv("STATUS_BACKEND", "sqlite")
+        update_summary(sample_status)
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text(json.dumps(sample_status, indent=2) + "\n")
+        with patch("scripts.status_utils.STATUS_FILE", status_file):
+            yield
+
+    def test_imports_status_json_on_first_use(self, status_file, sample_status):
+        """Should create status.db from status.json and read it back."""
+        from scripts.status_utils import load_status, status_db_path
+
+        status = load_status()
+
+        assert status_db_path() == status_file.with_suffix(".db")
+        assert status_db_path().exists()
+        assert status["papers"] == sample_status["papers"]
+        assert status["updated"] == sample_status["updated"]
+
+    def test_updates_do_not_touch_status_json(self, status_file):
+        """Should write to the database only until exported."""
+        from scripts.status_utils import load_status, update_episode_status
+
+        before = status_file.read_text()
+        update_episode_status("02", "transcript", True)
+        update_episode_status("05", "audio", True)
+
+        assert status_file.read_text() == before
+        papers = load_status()["papers"]
+        assert papers[1]["transcript"] is True
+        assert papers[2] == {"episode": "05", "name": "", "category": "", "audio": True}
+
+    def test_export_round_trips_byte_for_byte(self, status_file):
+        """Unchanged data should export to an identical status.json."""
+        from scripts.status_utils import export_status_json, load_status
+
+        before = status_file.read_text()
+        load_status()
+        status_file.unlink()
+
+        assert export_status_json() == 2
+        assert status_file.read_text() == before
+
+    def test_export_keeps_field_order(self, status_file):
+        """Updated fields keep their position; new ones go last, as with JSON."""
+        from scripts.status_utils import export_status_json, update_episode_field
+
+        update_episode_field("01", "audio", False)
+        update_episode_field("01", "youtube_url", "https://youtu.be/ż")
+        export_status_json()
+
+        paper = json.loads(status_file.read_text())["papers"][0]
+        assert list(paper)[-2:] == ["transcript", "youtube_url"]
+        assert paper["audio"] is False
+        assert paper["youtube_url"] == "https://youtu.be/ż"
+
+    def test_select_papers_uses_index(self):
+        """Flag queries should filter in SQL with an index."""
+        from contextlib import closing
+
+        from scripts.status_utils import connect_status_db, select_papers
+
+        assert [p["episode"] for p in select_papers(audio=True, transcript=False)] == ["02"]
+        assert [p["episode"] for p in select_papers(archived=False)] == ["01", "02"]
+
+        with closing(connect_status_db()) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT data FROM papers WHERE transcript = 0"
+            ).fetchall()
+        assert "idx_papers_transcript" in str(plan)
+
+    def test_select_papers_rejects_unknown_field(self):
+        """Should refuse fields without an indexed column."""
+        from scripts.status_utils import select_papers
+
+        with pytest.raises(ValueError, match="notebook_url"):
+            select_papers(notebook_url=True)
+
+    def test_archive_rewrites_row(self):
+        """Should keep only core and preserved fields."""
+        from scripts.status_utils import archive_episode_status, load_status
+
+        archive_episode_status("01")
+
+        assert load_status()["papers"][0] == {
+            "episode": "01",
+            "name": "attention-is-all-you-need",
+            "category": "llm",
+            "archived": True,
+            "notebook_created": True,
+            "notebook_url": "https://notebooklm.google.com/notebook/abc123",
+        }
+
+    def test_exception_rolls_back(self):
+        """Should discard all changes made in a failed transaction."""
+        from scripts.status_utils import load_status, status_transaction
+
+        with pytest.raises(RuntimeError), status_transaction() as transaction:
+            transaction.set("01", "video", True)
+            transaction.add_paper({"episode": "09", "name": "x"})
+            raise RuntimeError("boom")
+
+        status = load_status()
+        assert [p["episode"] for p in status["papers"]] == ["01", "02"]
+        assert "video" not in status["papers"][0]
+
+    def test_replace_and_import(self, status_file, sample_status):
+        """replace() should swap all rows; import reloads status.json."""
+        from scripts.status_utils import import_status_json, load_status, status_transaction
+
+        with status_transaction() as transaction:
+            transaction.replace({"papers": [{"episode": "100", "name": "z"}, {"episode": "9"}]})
+        assert [p["episode"] for p in load_status()["papers"]] == ["9", "100"]
+
+        assert import_status_json() == 2
+        assert load_status()["papers"] == sample_status["papers"]
+
+    def test_concurrent_updates_are_not_lost(self):
+        """Parallel writers should all land in the database."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from scripts.status_utils import load_status, update_episode_status
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda ep: update_episode_status(ep, "video", True), range(1, 41)))
+
+        assert load_status()["summary"]["video"] == 40
+
+
+class TestSelectPapers:
+    """Tests for select_papers with the default JSON backend."""
+
+    def test_filters_by_flags(self, status_file, sample_status, monkeypatch):
+        """Missing flags count as False."""
+        from scripts.status_utils import select_papers
+
+        monkeypatch.delenv("STATUS_BACKEND", raising=False)
+        status_file.parent.mkdir(parents=True)
+        status_file.write_text(json.dumps(sample_status))
+
+        with patch("scripts.status_utils.STATUS_FILE", status_file):
+            assert [p["episode"] for p in select_papers(transcript=False)] == ["02"]
+            assert len(select_papers()) == 2
+
+
 class TestArchiveEpisodeStatus:
     """Tests for archive_episode_status function."""
 
@@ -1,76 +1,455 @@
 """Tests for transcribe.py script."""
 
+import json
+import os
 import subprocess
+import sys
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+# Stands in for openai-whisper in the worker processes; logs every call
+FAKE_WHISPER = """
+import os
+from pathlib import Path
+
+LOG = Path(__file__).parent / "calls.log"
+
+
+def load_model(name, device=None):
+    with LOG.open("a") as f:
+        f.write(f"load {os.getpid()} {name}\\n")
+    return Model()
+
+
+class Model:
+    def transcribe(self, audio, language=None, **kwargs):
+        if "broken" in audio:
+            raise RuntimeError("cannot decode audio")
+        with LOG.open("a") as f:
+            f.write(f"transcribe {os.getpid()} {Path(audio).name}\\n")
+        if Path(audio).name == "chunk.wav":
+            # Written by FAKE_FFMPEG: one segment per second of the chunk
+            start, length = map(float, Path(audio).read_text().split())
+            segments = [
+                {"seek": 0, "start": t, "end": t + 1.0, "text": f" s{int(start + t)}."}
+                for t in range(int(length))
+            ]
+        else:
+            segments = [{"start": 0.0, "end": 90.0, "text": " Cześć."}]
+        text = "".join(s["text"] for s in segments)
+        return {"text": text, "segments": segments, "language": language}
+"""
+
+# Stands in for ffmpeg cutting chunks: writes "start length" to the output file
+FAKE_FFMPEG = """#!/usr/bin/env python3
+import sys
+
+args = sys.argv[1:]
+start = args[args.index("-ss") + 1]
+length = args[args.index("-t") + 1]
+with open(args[-1], "w") as f:
+    f.write(f"{start} {length}")
+"""
+
+
+@pytest.fixture
+def fake_whisper(tmp_path, monkeypatch):
+    """Put fake whisper and torch modules on sys.path (inherited by spawned workers)."""
+    module_dir = tmp_path / "fake-whisper"
+    module_dir.mkdir()
+    (module_dir / "whisper.py").write_text(FAKE_WHISPER)
+    (module_dir / "torch.py").write_text("def set_num_threads(n):\n    pass\n")
+    monkeypatch.syspath_prepend(str(module_dir))
+    return module_dir / "calls.log"
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """Put a fake ffmpeg first on PATH."""
+    bin_dir = tmp_path / "fake-bin"
+    bin_dir.mkdir()
+    ffmpeg = bin_dir / "ffmpeg"
+    ffmpeg.write_text(FAKE_FFMPEG)
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def fake_segment(start, end, text):
+    """A faster_whisper Segment-like object."""
+    return SimpleNamespace(
+        id=1,
+        seek=0,
+        start=start,
+        end=end,
+        text=text,
+        tokens=[1, 2],
+        temperature=0.0,
+        avg_logprob=-0.2,
+        compression_ratio=1.1,
+        no_speech_prob=0.01,
+    )
+
+
+@pytest.fixture
+def fake_faster_whisper(monkeypatch):
+    """Replace faster_whisper with a module whose WhisperModel is a mock."""
+    model = MagicMock()
+    module = ModuleType("faster_whisper")
+    module.WhisperModel = MagicMock(return_value=model)
+    monkeypatch.setitem(sys.modules, "faster_whisper", module)
+    return module
+
+
+def fake_pool(results=None):
+    """TranscriptionPool replacement; results maps stem to (success, message)."""
+    results = results or {}
+    pool = MagicMock()
+    pool.__enter__.return_value.run.side_effect = lambda jobs, _chunks=None, _sources=None: (
+        (audio, *results.get(audio.stem, (True, "1.0 min audio in 1s"))) for audio, _ in jobs
+    )
+    return pool
+
+
+class TestPlanWorkers:
+    """Tests for plan_workers function."""
+
+    def test_caps_workers_by_available_memory(self):
+        """Should not start more workers than there is memory for models."""
+        from scripts.transcribe import plan_workers
+
+        with patch("scripts.transcribe.available_memory", return_value=3_200_000_000):
+            assert plan_workers(4, model="small") == 2
+            assert plan_workers(4, model="large") == 1
+            assert plan_workers(1, model="tiny") == 1
+
+    def test_int8_backend_fits_more_workers(self):
+        """faster-whisper's int8 models should need less memory per worker."""
+        from scripts.transcribe import plan_workers
+
+        with patch("scripts.transcribe.available_memory", return_value=3_200_000_000):
+            assert plan_workers(4, "whisper", "small") == 2
+            assert plan_workers(4, "faster-whisper", "small") == 4
+
+    def test_uses_request_when_memory_unknown(self):
+        """Should trust the requested count without /proc/meminfo."""
+        from scripts.transcribe import plan_workers
+
+        with patch("scripts.transcribe.available_memory", return_value=None):
+            assert plan_workers(3) == 3
+
+
+class TestFasterWhisperBackend:
+    """Tests for FasterWhisperBackend class."""
+
+    def test_loads_int8_model_on_cpu(self, fake_faster_whisper):
+        """Should load an int8 CTranslate2 model with the given thread count."""
+        from scripts.transcribe import FasterWhisperBackend
+
+        FasterWhisperBackend("small", "pl", threads=2)
+
+        fake_faster_whisper.WhisperModel.assert_called_once_with(
+            "small", device="cpu", compute_type="int8", cpu_threads=2
+        )
 
-class TestTranscribeFile:
-    """Tests for transcribe_file function."""
+    def test_returns_whisper_json_schema(self, fake_faster_whisper, tmp_path):
+        """Should skip silence with VAD and return segments as openai-whisper does."""
+        from scripts.transcribe import FasterWhisperBackend
 
-    def test_skips_existing_transcript(self, temp_project, sample_transcript):
-        """Should skip transcription when output file already exists."""
-        from scripts.transcribe import transcribe_file
+        model = fake_faster_whisper.WhisperModel.return_value
+        segments = [fake_segment(0.0, 50.0, " Cześć."), fake_segment(50.0, 100.0, " Witam.")]
+        model.transcribe.return_value = (
+            iter(segments),
+            SimpleNamespace(duration=100.0, language="pl"),
+        )
+        progress = []
 
-        audio_path = temp_project / "youtube" / "pl" / "audio" / "01-attention-is-all-you-need.m4a"
-        audio_path.write_bytes(b"fake audio")
+        result = FasterWhisperBackend("small", "pl").transcribe(
+            tmp_path / "ep.m4a", progress.append
+        )
 
-        with patch(
-            "scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"
-        ):
-            path, success, msg = transcribe_file(audio_path)
+        assert model.transcribe.call_args.kwargs == {"language": "pl", "vad_filter": True}
+        assert result["text"] == " Cześć. Witam."
+        assert result["language"] == "pl"
+        assert set(result["segments"][0]) >= {"id", "start", "end", "text", "avg_logprob"}
+        assert [s["end"] for s in result["segments"]] == [50.0, 100.0]
+        assert progress == [0.5, 1.0]
+        json.dumps(result)
 
-        assert success is True
-        assert msg == "skipped (exists)"
-        assert path == audio_path
 
-    def test_transcribes_new_file(self, temp_project, sample_audio_files):
-        """Should run whisper for new audio file."""
-        from scripts.transcribe import transcribe_file
+class TestCheckTranscript:
+    """Tests for check_transcript and write_transcript functions."""
 
-        audio_path = sample_audio_files[0]
-        output_dir = temp_project / "youtube" / "pl" / "transcripts"
+    @pytest.fixture
+    def episode(self, tmp_path):
+        audio = tmp_path / "01-ep.m4a"
+        audio.write_bytes(b"audio v1")
+        return audio, tmp_path / "01-ep.json"
+
+    def test_new_and_current(self, episode):
+        """A transcript written with its source should be current without rehashing."""
+        from scripts.transcribe import check_transcript, write_transcript
+
+        audio, output = episode
+        reason, source = check_transcript(audio, output)
+        assert reason == "new"
+        write_transcript({"text": "", "segments": []}, output, source)
+
+        with patch("scripts.transcribe.file_sha256") as sha:
+            assert check_transcript(audio, output)[0] is None
+        sha.assert_not_called()
+        assert json.loads(output.read_text())["source"]["backend"] == "whisper"
+        assert not output.with_name("01-ep.json.tmp").exists()
+
+    def test_changed_audio_or_settings(self, episode):
+        """Should redo transcripts of new audio or made with other settings."""
+        from scripts.transcribe import check_transcript, write_transcript
+
+        audio, output = episode
+        write_transcript({"segments": []}, output, check_transcript(audio, output)[1])
+
+        assert check_transcript(audio, output, model="medium")[0] == "made with whisper small pl"
+        audio.write_bytes(b"audio v2")
+        assert check_transcript(audio, output)[0] == "audio changed"
+
+    def test_touched_audio_is_restamped(self, episode):
+        """Same bytes with a new mtime should be hashed once and recorded."""
+        from scripts.transcribe import check_transcript, write_transcript
+
+        audio, output = episode
+        write_transcript({"segments": []}, output, check_transcript(audio, output)[1])
+        os.utime(audio, ns=(1, 1))
 
-        mock_run = MagicMock()
+        assert check_transcript(audio, output)[0] is None
+        assert json.loads(output.read_text())["source"]["mtime_ns"] == 1
+
+    def test_truncated_transcript_is_redone(self, episode):
+        """A partially written transcript should not count as done."""
+        from scripts.transcribe import check_transcript
+
+        audio, output = episode
+        output.write_text('{"text": " Cześć", "segm')
+
+        assert check_transcript(audio, output)[0] == "unreadable transcript"
+
+    def test_legacy_transcript_is_adopted(self, episode):
+        """Transcripts without a source are kept for the default settings and stamped."""
+        from scripts.transcribe import check_transcript
+
+        audio, output = episode
+        output.write_text(json.dumps({"text": "", "segments": []}))
+
+        assert check_transcript(audio, output, "faster-whisper")[0] is not None
+        assert check_transcript(audio, output)[0] is None
+        assert json.loads(output.read_text())["source"]["audio"] == "01-ep.m4a"
+
+
+SILENCEDETECT_OUTPUT = """
+Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'ep.m4a':
+  Duration: 00:40:00.50, start: 0.000000, bitrate: 129 kb/s
+[silencedetect @ 0x1] silence_start: -0.01
+[silencedetect @ 0x1] silence_end: 0.8 | silence_duration: 0.81
+[silencedetect @ 0x1] silence_start: 310.2
+[silencedetect @ 0x1] silence_end: 311.0 | silence_duration: 0.8
+[silencedetect @ 0x1] silence_start: 2399.9
+"""
+
+
+class TestDetectSilences:
+    """Tests for detect_silences function."""
+
+    def test_parses_duration_and_silences(self, tmp_path):
+        """Should read the duration and pair silence starts with ends."""
+        from scripts.transcribe import detect_silences
+
+        proc = subprocess.CompletedProcess([], 0, "", SILENCEDETECT_OUTPUT)
+        with patch("scripts.transcribe.subprocess.run", return_value=proc) as run:
+            duration, silences = detect_silences(tmp_path / "ep.m4a")
+
+        assert "silencedetect" in " ".join(run.call_args.args[0])
+        assert duration == 2400.5
+        assert silences == [(0.0, 0.8), (310.2, 311.0), (2399.9, 2400.5)]
+
+    def test_split_falls_back_to_whole_file(self, tmp_path):
+        """Should not split files ffmpeg cannot read, or short ones."""
+        from scripts.transcribe import split_at_silence
+
+        with patch("scripts.transcribe.subprocess.run", side_effect=FileNotFoundError):
+            assert split_at_silence(tmp_path / "ep.m4a") == []
+        with patch("scripts.transcribe.detect_silences", return_value=(400.0, [])):
+            assert split_at_silence(tmp_path / "ep.m4a", 300) == []
+
+
+class TestPlanChunks:
+    """Tests for plan_chunks function."""
+
+    def test_cuts_at_nearest_silence(self):
+        """Should cut in the middle of the silence closest to each target."""
+        from scripts.transcribe import Chunk, plan_chunks
+
+        silences = [(250.0, 251.0), (310.0, 312.0), (590.0, 592.0)]
+        chunks = plan_chunks(900.0, silences, chunk_seconds=300, overlap=2.0)
+
+        assert chunks == [
+            Chunk(0.0, 313.0, 0.0, 311.0),
+            Chunk(309.0, 593.0, 311.0, 591.0),
+            Chunk(589.0, 900.0, 591.0, 900.0),
+        ]
+
+    def test_cuts_on_target_without_silence(self):
+        """Should cut every chunk_seconds when there is no silence nearby."""
+        from scripts.transcribe import plan_chunks
+
+        chunks = plan_chunks(1000.0, [(20.0, 21.0)], chunk_seconds=300, overlap=0)
+
+        assert [(c.keep_start, c.keep_end) for c in chunks] == [
+            (0.0, 300.0),
+            (300.0, 600.0),
+            (600.0, 1000.0),
+        ]
+
+    def test_short_audio_is_one_chunk(self):
+        """Audio up to 1.5 chunk lengths should not be split."""
+        from scripts.transcribe import plan_chunks
+
+        assert len(plan_chunks(449.0, [], chunk_seconds=300)) == 1
+
+
+class TestStitchChunks:
+    """Tests for stitch_chunks function."""
+
+    def test_shifts_timestamps_and_drops_overlap(self):
+        """Segments should get file timestamps and appear once across overlaps."""
+        from scripts.transcribe import Chunk, stitch_chunks
+
+        first = Chunk(0.0, 12.0, 0.0, 10.0)
+        second = Chunk(8.0, 20.0, 10.0, 20.0)
+        parts = [
+            (
+                first,
+                {
+                    "language": "pl",
+                    "segments": [
+                        {"seek": 0, "start": 0.0, "end": 5.0, "text": " Jeden."},
+                        {"seek": 0, "start": 5.0, "end": 9.5, "text": " Dwa."},
+                        {"seek": 0, "start": 10.2, "end": 12.0, "text": " Trzy."},
+                    ],
+                },
+            ),
+            (
+                second,
+                {
+                    "segments": [
+                        {"seek": 0, "start": 0.0, "end": 1.5, "text": " Dwa."},
+                        {"seek": 0, "start": 2.2, "end": 6.0, "text": " Trzy."},
+                        {"seek": 0, "start": 6.0, "end": 12.0, "text": " Cztery."},
+                    ],
+                },
+            ),
+        ]
+
+        result = stitch_chunks(parts)
+
+        assert result["text"] == " Jeden. Dwa. Trzy. Cztery."
+        assert result["language"] == "pl"
+        assert [(s["id"], s["start"], s["end"]) for s in result["segments"]] == [
+            (0, 0.0, 5.0),
+            (1, 5.0, 9.5),
+            (2, 10.2, 14.0),
+            (3, 14.0, 20.0),
+        ]
+        assert result["segments"][3]["seek"] == 800
+
+    def test_drops_repeated_text_across_cut(self):
+        """A segment straddling the cut and heard by both chunks should be kept once."""
+        from scripts.transcribe import Chunk, stitch_chunks
+
+        parts = [
+            (
+                Chunk(0.0, 12.0, 0.0, 10.0),
+                {"segments": [{"start": 7.0, "end": 10.6, "text": " A."}]},
+            ),
+            (
+                Chunk(8.0, 20.0, 10.0, 20.0),
+                {"segments": [{"start": 1.0, "end": 3.0, "text": " A."}]},
+            ),
+        ]
+
+        assert [s["start"] for s in stitch_chunks(parts)["segments"]] == [7.0]
+
+
+class TestTranscriptionPool:
+    """Tests for TranscriptionPool class."""
+
+    def test_loads_model_once_per_worker(self, tmp_path, fake_whisper):
+        """Workers should load the model once and transcribe many files."""
+        from scripts.transcribe import TranscriptionPool
+
+        jobs = []
+        for i in range(5):
+            audio = tmp_path / f"{i:02d}-episode.m4a"
+            audio.write_bytes(b"audio")
+            jobs.append((audio, tmp_path / f"{i:02d}-episode.json"))
+        broken = tmp_path / "99-broken.m4a"
+        broken.write_bytes(b"audio")
+        jobs.append((broken, tmp_path / "99-broken.json"))
+
+        with TranscriptionPool(2, model="tiny", language="pl") as pool:
+            results = {path.stem: (success, msg) for path, success, msg in pool.run(jobs)}
+
+        assert results["99-broken"] == (False, "failed: cannot decode audio")
+        assert all(results[f"{i:02d}-episode"][0] for i in range(5))
+        transcript = json.loads((tmp_path / "00-episode.json").read_text())
+        assert transcript["segments"][0]["text"] == " Cześć."
+        assert transcript["language"] == "pl"
+
+        calls = [line.split() for line in fake_whisper.read_text().splitlines()]
+        loads = [pid for kind, pid, _ in calls if kind == "load"]
+        transcribing = {pid for kind, pid, _ in calls if kind == "transcribe"}
+        assert len(loads) <= 2
+        assert set(loads) >= transcribing
+        assert sum(kind == "transcribe" for kind, _, _ in calls) == 5
+
+    def test_transcribes_chunks_in_parallel(self, tmp_path, fake_whisper, fake_ffmpeg):
+        """Chunks should be spread over workers and stitched in order."""
+        from scripts.transcribe import TranscriptionPool, plan_chunks
+
+        audio = tmp_path / "01-episode.m4a"
+        audio.write_bytes(b"audio")
+        output = tmp_path / "01-episode.json"
+        chunks = plan_chunks(40.0, [], chunk_seconds=10, overlap=2.0)
+
+        with TranscriptionPool(2, model="tiny", language="pl") as pool:
+            results = list(pool.run([(audio, output)], {audio: chunks}))
+
+        assert results[0][1]
+        assert "4 chunks" in results[0][2]
+        transcript = json.loads(output.read_text())
+        assert [s["start"] for s in transcript["segments"]] == [float(t) for t in range(40)]
+        assert transcript["text"] == "".join(f" s{t}." for t in range(40))
+        calls = fake_whisper.read_text().splitlines()
+        assert sum(line.startswith("transcribe") for line in calls) == 4
+
+    def test_requires_whisper(self):
+        """Should fail early when openai-whisper is not installed."""
+        from scripts.transcribe import TranscriptionPool
 
         with (
-            patch("scripts.transcribe.OUTPUT_DIR", output_dir),
-            patch("subprocess.run", mock_run),
+            patch("scripts.transcribe.find_spec", return_value=None),
+            pytest.raises(ImportError, match="openai-whisper"),
         ):
-            _path, success, msg = transcribe_file(audio_path)
-
-        assert success is True
-        assert msg == "done"
-        mock_run.assert_called_once()
-
-        # Verify whisper command
-        call_args = mock_run.call_args[0][0]
-        assert call_args[0] == "whisper"
-        assert str(audio_path) in call_args
-        assert "--model" in call_args
-        assert "--language" in call_args
-        assert "--output_format" in call_args
-        assert "json" in call_args
-
-    def test_returns_failure_on_whisper_error(self, temp_project, sample_audio_files):
-        """Should return failure when whisper command fails."""
-        from scripts.transcribe import transcribe_file
-
-        audio_path = sample_audio_files[0]
-        output_dir = temp_project / "youtube" / "pl" / "transcripts"
+            TranscriptionPool(1)
 
-        mock_run = MagicMock(
-            side_effect=subprocess.CalledProcessError(1, "whisper", stderr=b"error message")
-        )
+    def test_requires_selected_backend(self):
+        """Should name the package of the backend that is missing."""
+        from scripts.transcribe import TranscriptionPool
 
         with (
-            patch("scripts.transcribe.OUTPUT_DIR", output_dir),
-            patch("subprocess.run", mock_run),
+            patch("scripts.transcribe.find_spec", return_value=None),
+            pytest.raises(ImportError, match="pip install faster-whisper"),
         ):
-            path, success, msg = transcribe_file(audio_path)
-
-        assert success is False
-        assert "failed" in msg
-        assert path == audio_path
+            TranscriptionPool(1, backend="faster-whisper")
 
 
 class TestFindAudioFiles:
@@ -193,74 +572,176 @@ class TestMain:
         """Should use default 3 parallel jobs."""
         from scripts.transcribe import main
 
+        pool = fake_pool()
         with (
             patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
             patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
-            patch("scripts.transcribe.transcribe_file") as mock_transcribe,
+            patch("scripts.transcribe.available_memory", return_value=None),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool) as pool_class,
+            patch("scripts.transcribe.update_episode_status"),
             patch("sys.argv", ["transcribe.py"]),
         ):
-            mock_transcribe.return_value = (sample_audio_files[0], True, "done")
             main()
 
         captured = capsys.readouterr()
         assert "Parallel jobs: 3" in captured.out
+        pool_class.assert_called_once_with(3, "whisper", "small")
 
     def test_accepts_custom_parallelism(self, temp_project, sample_audio_files, capsys):
-        """Should accept custom parallel job count from args."""
+        """Should accept custom parallel job count from args, capped by file count."""
         from scripts.transcribe import main
 
+        pool = fake_pool()
         with (
             patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
             patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
-            patch("scripts.transcribe.transcribe_file") as mock_transcribe,
+            patch("scripts.transcribe.available_memory", return_value=None),
+            patch("scripts.transcribe.split_at_silence", return_value=[]),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool) as pool_class,
+            patch("scripts.transcribe.update_episode_status"),
             patch("sys.argv", ["transcribe.py", "5"]),
         ):
-            mock_transcribe.return_value = (sample_audio_files[0], True, "done")
             main()
 
         captured = capsys.readouterr()
         assert "Parallel jobs: 5" in captured.out
+        pool_class.assert_called_once_with(3, "whisper", "small")
+
+    def test_passes_backend_and_model(self, temp_project, sample_audio_files, capsys):
+        """Should hand the chosen backend and model to the worker pool."""
+        from scripts.transcribe import main
+
+        pool = fake_pool()
+        with (
+            patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
+            patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
+            patch("scripts.transcribe.available_memory", return_value=None),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool) as pool_class,
+            patch("scripts.transcribe.update_episode_status"),
+            patch(
+                "sys.argv", ["transcribe.py", "2", "--backend", "faster-whisper", "--model", "tiny"]
+            ),
+        ):
+            main()
+
+        assert "Backend: faster-whisper" in capsys.readouterr().out
+        pool_class.assert_called_once_with(2, "faster-whisper", "tiny")
+
+    def test_splits_files_when_workers_are_idle(self, temp_project, sample_audio_files, capsys):
+        """With more workers than files, long files should be split into chunks."""
+        from scripts.transcribe import Chunk, main
+
+        chunks = [Chunk(0.0, 302.0, 0.0, 300.0), Chunk(298.0, 600.0, 300.0, 600.0)]
+        pool = fake_pool()
+        with (
+            patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
+            patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
+            patch("scripts.transcribe.available_memory", return_value=None),
+            patch("scripts.transcribe.split_at_silence", return_value=chunks) as split,
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool) as pool_class,
+            patch("scripts.transcribe.update_episode_status"),
+            patch("sys.argv", ["transcribe.py", "8"]),
+        ):
+            main()
+
+        assert split.call_count == 3
+        assert "2 chunks split at silences" in capsys.readouterr().out
+        pool_class.assert_called_once_with(6, "whisper", "small")
+        assert len(pool.__enter__.return_value.run.call_args.args[1]) == 3
+
+    def test_warns_when_memory_limits_workers(self, temp_project, sample_audio_files, capsys):
+        """Should say so when fewer workers than requested fit in memory."""
+        from scripts.transcribe import main
+
+        pool = fake_pool()
+        with (
+            patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
+            patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
+            patch("scripts.transcribe.available_memory", return_value=2_000_000_000),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool) as pool_class,
+            patch("scripts.transcribe.update_episode_status"),
+            patch("sys.argv", ["transcribe.py", "3"]),
+        ):
+            main()
+
+        assert "Using 1 worker(s)" in capsys.readouterr().out
+        pool_class.assert_called_once_with(1, "whisper", "small")
 
     def test_shows_skip_for_existing(
         self, temp_project, sample_audio_files, sample_transcript, capsys
     ):
-        """Should show skip message for existing transcripts."""
+        """Should skip existing transcripts without sending them to the pool."""
         from scripts.transcribe import main
 
-        # Rename sample transcript to match first audio file
-        transcript_dir = temp_project / "youtube" / "pl" / "transcripts"
-        existing = transcript_dir / "01-attention-is-all-you-need.json"
-        sample_transcript.rename(existing)
+        pool = fake_pool()
+        with (
+            patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
+            patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool),
+            patch("scripts.transcribe.update_episode_status"),
+            patch("sys.argv", ["transcribe.py", "1"]),
+        ):
+            main()
 
-        def mock_transcribe(path):
-            if path.stem == "01-attention-is-all-you-need":
-                return path, True, "skipped (exists)"
-            return path, True, "done"
+        captured = capsys.readouterr()
+        assert "Skip: 01-attention-is-all-you-need" in captured.out
+        jobs = pool.__enter__.return_value.run.call_args.args[0]
+        assert [audio.stem for audio, _ in jobs] == ["02-gpt", "15-glam"]
+
+    def test_redoes_transcripts_of_changed_audio(
+        self, temp_project, sample_audio_files, sample_transcript, capsys
+    ):
+        """Should transcribe a file again when its audio no longer matches."""
+        from scripts.transcribe import main
 
+        transcript = json.loads(sample_transcript.read_text())
+        transcript["source"] = {"sha256": "0" * 64, "backend": "whisper", "model": "small"}
+        sample_transcript.write_text(json.dumps(transcript))
+        pool = fake_pool()
         with (
             patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
-            patch("scripts.transcribe.OUTPUT_DIR", transcript_dir),
-            patch("scripts.transcribe.transcribe_file", side_effect=mock_transcribe),
+            patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool),
+            patch("scripts.transcribe.update_episode_status"),
             patch("sys.argv", ["transcribe.py", "1"]),
         ):
             main()
 
-        captured = capsys.readouterr()
-        assert "Skip:" in captured.out
+        assert "Redo: 01-attention-is-all-you-need (audio changed)" in capsys.readouterr().out
+        jobs, _, sources = pool.__enter__.return_value.run.call_args.args
+        assert len(jobs) == 3
+        assert sources[jobs[0][0]]["audio"] == "01-attention-is-all-you-need.m4a"
+
+    def test_does_not_start_pool_when_all_done(
+        self, temp_project, sample_audio_files, sample_transcript, capsys
+    ):
+        """Should not load any model when every transcript exists."""
+        from scripts.transcribe import main
+
+        transcripts = temp_project / "youtube" / "pl" / "transcripts"
+        for name in ("02-gpt", "15-glam"):
+            (transcripts / f"{name}.json").write_text('{"text": "", "segments": []}')
+
+        with (
+            patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
+            patch("scripts.transcribe.OUTPUT_DIR", transcripts),
+            patch("scripts.transcribe.TranscriptionPool") as pool_class,
+            patch("sys.argv", ["transcribe.py"]),
+        ):
+            assert main() == 0
+
+        pool_class.assert_not_called()
 
     def test_returns_1_on_failures(self, temp_project, sample_audio_files, capsys):
         """Should return 1 when any transcription fails."""
         from scripts.transcribe import main
 
-        def mock_transcribe(path):
-            if path.stem == "01-attention-is-all-you-need":
-                return path, False, "failed: error"
-            return path, True, "done"
-
+        pool = fake_pool({"01-attention-is-all-you-need": (False, "failed: error")})
         with (
             patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
             patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
-            patch("scripts.transcribe.transcribe_file", side_effect=mock_transcribe),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool),
+            patch("scripts.transcribe.update_episode_status"),
             patch("sys.argv", ["transcribe.py", "1"]),
         ):
             result = main()
@@ -270,68 +751,56 @@ class TestMain:
         assert "Failed:" in captured.out
         assert "transcription(s) failed" in captured.out
 
-    def test_returns_0_on_all_success(self, temp_project, sample_audio_files, capsys):
-        """Should return 0 when all transcriptions succeed."""
+    def test_returns_1_without_whisper(self, temp_project, sample_audio_files, capsys):
+        """Should report a missing whisper install instead of crashing."""
         from scripts.transcribe import main
 
-        def mock_transcribe(path):
-            return path, True, "done"
-
         with (
             patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
             patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
-            patch("scripts.transcribe.transcribe_file", side_effect=mock_transcribe),
+            patch("scripts.transcribe.find_spec", return_value=None),
             patch("sys.argv", ["transcribe.py", "1"]),
         ):
             result = main()
 
-        assert result == 0
-        captured = capsys.readouterr()
-        assert "All transcriptions complete!" in captured.out
-
-
-class TestParallelExecution:
-    """Tests for parallel execution behavior."""
+        assert result == 1
+        assert "openai-whisper is not installed" in capsys.readouterr().out
 
-    def test_processes_files_in_parallel(self, temp_project, sample_audio_files):
-        """Should process multiple files using ThreadPoolExecutor."""
+    def test_returns_0_on_all_success(self, temp_project, sample_audio_files, capsys):
+        """Should return 0 and mark transcripts done when all transcriptions succeed."""
         from scripts.transcribe import main
 
-        processed = []
-
-        def mock_transcribe(path):
-            processed.append(path)
-            return path, True, "done"
-
         with (
             patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
             patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
-            patch("scripts.transcribe.transcribe_file", side_effect=mock_transcribe),
-            patch("sys.argv", ["transcribe.py", "2"]),
+            patch("scripts.transcribe.TranscriptionPool", return_value=fake_pool()),
+            patch("scripts.transcribe.update_episode_status") as update,
+            patch("sys.argv", ["transcribe.py", "1"]),
         ):
-            main()
-
-        # All 3 files should be processed
-        assert len(processed) == 3
+            result = main()
 
-    def test_handles_mixed_results(self, temp_project, sample_audio_files, capsys):
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "All transcriptions complete!" in captured.out
+        assert "[3/3] Done: 15-glam" in captured.out
+        assert [c.args for c in update.call_args_list] == [
+            ("01", "transcript", True),
+            ("02", "transcript", True),
+            ("15", "transcript", True),
+        ]
+
+    def test_handles_mixed_results(
+        self, temp_project, sample_audio_files, sample_transcript, capsys
+    ):
         """Should handle mix of success, skip, and failure."""
         from scripts.transcribe import main
 
-        results = {
-            "01-attention-is-all-you-need": ("skipped (exists)", True),
-            "02-gpt": ("done", True),
-            "15-glam": ("failed: error", False),
-        }
-
-        def mock_transcribe(path):
-            msg, success = results[path.stem]
-            return path, success, msg
-
+        pool = fake_pool({"15-glam": (False, "failed: error")})
         with (
             patch("scripts.transcribe.AUDIO_DIR", temp_project / "youtube" / "pl" / "audio"),
             patch("scripts.transcribe.OUTPUT_DIR", temp_project / "youtube" / "pl" / "transcripts"),
-            patch("scripts.transcribe.transcribe_file", side_effect=mock_transcribe),
+            patch("scripts.transcribe.TranscriptionPool", return_value=pool),
+            patch("scripts.transcribe.update_episode_status"),
             patch("sys.argv", ["transcribe.py", "1"]),
         ):
             result = main()
@@ -0,0 +1,142 @@
+"""Tests for transcript_index.py module."""
+
+import json
+import os
+
+
+def write_transcript(path, texts, step=10.0):
+    """Transcript JSON with one segment per text, step seconds apart."""
+    segments = [
+        {"start": i * step, "end": (i + 1) * step, "text": f" {text}"}
+        for i, text in enumerate(texts)
+    ]
+    path.write_text(json.dumps({"text": "", "segments": segments}))
+    return path
+
+
+class TestRefresh:
+    """Tests for TranscriptIndex.refresh."""
+
+    def test_reads_only_new_or_changed_transcripts(self, tmp_path):
+        """A second refresh should skip unchanged files, re-read changed ones and drop deleted ones."""
+        from scripts.transcript_index import TranscriptIndex
+
+        raft = write_transcript(tmp_path / "73-raft.json", ["Raft wybiera lidera."])
+        paxos = write_transcript(tmp_path / "74-paxos.json", ["Paxos jest trudny."])
+
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            assert index.refresh([raft, paxos]) == (2, 0)
+            assert index.refresh([raft, paxos]) == (0, 0)
+
+            write_transcript(raft, ["Raft wybiera lidera.", "Potem replikuje dziennik."])
+            os.utime(raft, ns=(0, 1))
+            assert index.refresh([raft]) == (1, 1)
+            assert index.stats()[:2] == (1, 2)
+            assert [hit.episode for hit in index.search("dziennik")] == ["73-raft"]
+            assert index.search("Paxos") == []
+
+    def test_persists_between_opens(self, tmp_path):
+        """The index should be reused from disk, and rebuilt when its version differs."""
+        import sqlite3
+
+        from scripts.transcript_index import TranscriptIndex
+
+        raft = write_transcript(tmp_path / "73-raft.json", ["Raft wybiera lidera."])
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            index.refresh([raft])
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            assert index.refresh([raft]) == (0, 0)
+
+        with sqlite3.connect(tmp_path / "index.db") as conn:
+            conn.execute("PRAGMA user_version = 0")
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            assert index.stats() == (0, 0, 0)
+
+    def test_unreadable_transcript_is_reported_and_retried(self, tmp_path):
+        """A broken transcript should be listed, left out of the index and read again once fixed."""
+        from scripts.transcript_index import TranscriptIndex
+
+        broken = tmp_path / "75-broken.json"
+        broken.write_text("{")
+
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            assert index.refresh([broken]) == (0, 0)
+            assert [path for path, _ in index.unreadable] == [broken]
+            assert index.stats() == (0, 0, 0)
+
+            assert index.refresh([broken]) == (0, 0)
+            assert len(index.unreadable) == 1
+
+            write_transcript(broken, ["Naprawiony."])
+            assert index.refresh([broken]) == (1, 0)
+            assert index.unreadable == []
+            assert index.stats()[:2] == (1, 1)
+
+
+class TestSearch:
+    """Tests for TranscriptIndex.search."""
+
+    def test_ranked_timestamped_hits(self, tmp_path):
+        """Segments with all query words should come first, with their start times."""
+        from scripts.transcript_index import TranscriptIndex
+
+        raft = write_transcript(
+            tmp_path / "73-raft.json",
+            ["Mówimy o wyborze lidera.", "Raft i wybór lidera to podstawa.", "Raft jest prosty."],
+        )
+        paxos = write_transcript(tmp_path / "74-paxos.json", ["Paxos też ma lidera."])
+
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            index.refresh([raft, paxos])
+            hits = index.search("Raft lidera")
+
+        assert (hits[0].episode, hits[0].segment, hits[0].start) == ("73-raft", 1, 10.0)
+        assert hits[0].text == "Raft i wybór lidera to podstawa."
+        assert hits[0].matched == 2
+        assert {(hit.episode, hit.segment) for hit in hits[1:]} == {
+            ("73-raft", 0),
+            ("73-raft", 2),
+            ("74-paxos", 0),
+        }
+
+    def test_prefix_matches_inflections(self, tmp_path):
+        """Longer query words should match inflected forms; short ones only themselves."""
+        from scripts.transcript_index import TranscriptIndex
+
+        paxos = write_transcript(
+            tmp_path / "74-paxos.json", ["Autorzy Paxosa.", "Z Paxosem.", "AI i AIX."]
+        )
+
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            index.refresh([paxos])
+
+            assert [hit.segment for hit in index.search("paxos")] in ([0, 1], [1, 0])
+            assert [hit.segment for hit in index.search("ai")] == [2]
+            assert index.search("AI")[0].score < index.search("AIX AI")[0].score
+
+    def test_prefix_counts_each_query_word_once(self, tmp_path):
+        """Words sharing a prefix should count as one query word for ranking."""
+        from scripts.transcript_index import TranscriptIndex
+
+        transcript = write_transcript(
+            tmp_path / "73-raft.json",
+            ["replication replicas replicated", "replication consensus"],
+        )
+
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            index.refresh([transcript])
+            hits = index.search("replica consensus")
+
+        assert [(hit.segment, hit.matched) for hit in hits] == [(1, 2), (0, 1)]
+
+    def test_limit_and_empty_query(self, tmp_path):
+        """Should return at most limit hits, and none for a query without words."""
+        from scripts.transcript_index import TranscriptIndex
+
+        raft = write_transcript(tmp_path / "73-raft.json", ["Raft"] * 10)
+
+        with TranscriptIndex.open(tmp_path / "index.db") as index:
+            index.refresh([raft])
+
+            assert len(index.search("raft", limit=3)) == 3
+            assert index.search("?!") == []
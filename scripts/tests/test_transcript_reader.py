@@ -0,0 +1,76 @@
+"""Tests for transcript_reader.py module."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+WHISPER_OUTPUT = {
+    "text": ' Pierwsze "zdanie" z \\ ukośnikiem. Drugie.',
+    "segments": [
+        {
+            "id": 0,
+            "seek": 0,
+            "start": 0.0,
+            "end": 2.5,
+            "text": ' Pierwsze "zdanie" z \\ ukośnikiem.',
+            "tokens": [50364, 4743, 50489],
+            "avg_logprob": -0.25,
+            "no_speech_prob": 0.01,
+        },
+        {"id": 1, "start": 2.5, "end": 4, "text": " Drugie.", "tokens": [], "words": []},
+    ],
+    "language": "pl",
+    "source": {"sha256": "ab", "backend": "whisper", "model": "small", "language": "pl"},
+}
+
+EXPECTED = [(0.0, 2.5, ' Pierwsze "zdanie" z \\ ukośnikiem.'), (2.5, 4.0, " Drugie.")]
+
+
+class TestIterSegments:
+    """Tests for iter_segments function."""
+
+    def test_yields_start_end_text(self, tmp_path):
+        """Should yield only start, end and text of each segment, as tuples."""
+        from scripts.transcript_reader import Segment, iter_segments
+
+        path = tmp_path / "73-raft.json"
+        path.write_text(json.dumps(WHISPER_OUTPUT, indent=2))
+
+        segments = list(iter_segments(path))
+
+        assert segments == EXPECTED
+        assert isinstance(segments[0], Segment)
+        assert segments[1].end == 4.0
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+    def test_values_split_across_chunks(self, tmp_path, chunk_size):
+        """Strings, escapes and numbers cut by a chunk boundary should decode the same."""
+        from scripts.transcript_reader import iter_segments
+
+        path = tmp_path / "73-raft.json"
+        path.write_text(json.dumps(WHISPER_OUTPUT, ensure_ascii=False))
+
+        with patch("scripts.transcript_reader.CHUNK_SIZE", chunk_size):
+            assert list(iter_segments(path)) == EXPECTED
+
+    @pytest.mark.parametrize("data", ["{}", '{"segments": []}', '{"text": "", "segments": [] }'])
+    def test_no_segments(self, tmp_path, data):
+        """Should yield nothing for transcripts without segments."""
+        from scripts.transcript_reader import iter_segments
+
+        path = tmp_path / "73-raft.json"
+        path.write_text(data)
+
+        assert list(iter_segments(path)) == []
+
+    @pytest.mark.parametrize("data", ["", "[]", '{"text": "abc', '{"segments": [{"start": 0}'])
+    def test_malformed_json_raises_value_error(self, tmp_path, data):
+        """Should raise ValueError for files that are not a complete transcript object."""
+        from scripts.transcript_reader import iter_segments
+
+        path = tmp_path / "73-raft.json"
+        path.write_text(data)
+
+        with pytest.raises(ValueError):
+            list(iter_segments(path))
@@ -1,7 +1,7 @@
 """Tests for verify_video.py script."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 
 class TestRunCmd:
@@ -58,130 +58,16 @@ class TestGetDuration:
         assert duration == 7200.123
 
 
-class TestExtractFrames:
-    """Tests for extract_frames function."""
+def make_check(duration=125.5, start=0.5, end=0.5, intervals=None):
+    """Build VideoCheck result as returned by analyze_video."""
+    from scripts.generate_video import VideoCheck
 
-    def test_extracts_start_frames(self, tmp_path):
-        """Should extract frames from start of video."""
-        from scripts.verify_video import extract_frames
-
-        video = tmp_path / "test.mp4"
-        video.write_bytes(b"fake video")
-
-        mock_run = MagicMock()
-
-        with (
-            patch("scripts.verify_video.get_duration", return_value=100.0),
-            patch("subprocess.run", mock_run),
-        ):
-            frames = extract_frames(video, tmp_path, start=True, count=3)
-
-        assert len(frames) == 3
-        assert all("start" in f.name for f in frames)
-        assert mock_run.call_count == 3
-
-    def test_extracts_end_frames(self, tmp_path):
-        """Should extract frames from end of video."""
-        from scripts.verify_video import extract_frames
-
-        video = tmp_path / "test.mp4"
-        video.write_bytes(b"fake video")
-
-        mock_run = MagicMock()
-
-        with (
-            patch("scripts.verify_video.get_duration", return_value=100.0),
-            patch("subprocess.run", mock_run),
-        ):
-            frames = extract_frames(video, tmp_path, start=False, count=3)
-
-        assert len(frames) == 3
-        assert all("end" in f.name for f in frames)
-
-    def test_uses_correct_timestamps_for_start(self, tmp_path):
-        """Should use timestamps 0, 1, 2 for start frames."""
-        from scripts.verify_video import extract_frames
-
-        video = tmp_path / "test.mp4"
-        video.write_bytes(b"fake video")
-
-        mock_run = MagicMock()
-
-        with (
-            patch("scripts.verify_video.get_duration", return_value=100.0),
-            patch("subprocess.run", mock_run),
-        ):
-            extract_frames(video, tmp_path, start=True, count=3)
-
-        calls = mock_run.call_args_list
-        timestamps = []
-        for c in calls:
-            args = c[0][0]
-            ss_idx = args.index("-ss")
-            timestamps.append(args[ss_idx + 1])
-
-        assert timestamps == ["0", "1", "2"]
-
-    def test_uses_correct_timestamps_for_end(self, tmp_path):
-        """Should use last 3 seconds for end frames."""
-        from scripts.verify_video import extract_frames
-
-        video = tmp_path / "test.mp4"
-        video.write_bytes(b"fake video")
-
-        mock_run = MagicMock()
-
-        with (
-            patch("scripts.verify_video.get_duration", return_value=100.0),
-            patch("subprocess.run", mock_run),
-        ):
-            extract_frames(video, tmp_path, start=False, count=3)
-
-        calls = mock_run.call_args_list
-        timestamps = []
-        for c in calls:
-            args = c[0][0]
-            ss_idx = args.index("-ss")
-            timestamps.append(float(args[ss_idx + 1]))
-
-        # For 100s video with count=3: 97, 98, 99
-        assert timestamps == [97.0, 98.0, 99.0]
-
-
-class TestGetBrightness:
-    """Tests for get_brightness function."""
-
-    def test_parses_brightness_value(self):
-        """Should parse brightness from magick output."""
-        from scripts.verify_video import get_brightness
-
-        with patch("scripts.verify_video.run_cmd", return_value="0.75"):
-            brightness = get_brightness(Path("/fake/image.png"))
-
-        assert brightness == 0.75
-
-    def test_calls_magick_with_correct_args(self):
-        """Should call magick with grayscale mean calculation."""
-        from scripts.verify_video import get_brightness
-
-        with patch("scripts.verify_video.run_cmd", return_value="0.5") as mock_run:
-            get_brightness(Path("/test/image.png"))
-
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[0] == "magick"
-        assert "-colorspace" in args
-        assert "Gray" in args
-        assert "%[fx:mean]" in " ".join(args)
-
-    def test_detects_black_frame(self):
-        """Should detect very dark frames as black."""
-        from scripts.verify_video import get_brightness
-
-        with patch("scripts.verify_video.run_cmd", return_value="0.01"):
-            brightness = get_brightness(Path("/fake/image.png"))
-
-        assert brightness < 0.05  # Threshold for black
+    return VideoCheck(
+        duration=duration,
+        start_brightness=start,
+        end_brightness=end,
+        black_intervals=intervals or [],
+    )
 
 
 class TestVerifyVideo:
@@ -197,38 +83,42 @@ class TestVerifyVideo:
         audio.write_bytes(b"audio")
 
         with (
-            patch("scripts.verify_video.get_duration", side_effect=[125.5, 120.5]),  # video, audio
-            patch("scripts.verify_video.extract_frames") as mock_extract,
-            patch("scripts.verify_video.get_brightness", return_value=0.5),
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch("scripts.verify_video.analyze_video", return_value=make_check()),
         ):
-            mock_extract.return_value = [tmp_path / "frame.png"]
-            (tmp_path / "frame.png").write_bytes(b"png")
-
             result = verify_video(video, audio)
 
         assert result is True
         captured = capsys.readouterr()
         assert "Video verification passed" in captured.out
 
+    def test_uses_single_analysis_pass(self, tmp_path):
+        """Should probe audio once and analyze video once."""
+        from scripts.verify_video import verify_video
+
+        video = tmp_path / "test.mp4"
+        audio = tmp_path / "test.m4a"
+
+        with (
+            patch("scripts.verify_video.get_duration", return_value=120.5) as mock_duration,
+            patch("scripts.verify_video.analyze_video", return_value=make_check()) as mock_analyze,
+        ):
+            verify_video(video, audio)
+
+        mock_duration.assert_called_once_with(audio)
+        mock_analyze.assert_called_once_with(video)
+
     def test_fails_when_duration_wrong(self, tmp_path, capsys):
         """Should fail when video duration doesn't match expected."""
         from scripts.verify_video import verify_video
 
         video = tmp_path / "test.mp4"
         audio = tmp_path / "test.m4a"
-        video.write_bytes(b"video")
-        audio.write_bytes(b"audio")
 
         with (
-            patch(
-                "scripts.verify_video.get_duration", side_effect=[100.0, 120.5]
-            ),  # Wrong duration
-            patch("scripts.verify_video.extract_frames") as mock_extract,
-            patch("scripts.verify_video.get_brightness", return_value=0.5),
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch("scripts.verify_video.analyze_video", return_value=make_check(duration=100.0)),
         ):
-            mock_extract.return_value = [tmp_path / "frame.png"]
-            (tmp_path / "frame.png").write_bytes(b"png")
-
             result = verify_video(video, audio)
 
         assert result is False
@@ -241,27 +131,18 @@ class TestVerifyVideo:
 
         video = tmp_path / "test.mp4"
         audio = tmp_path / "test.m4a"
-        video.write_bytes(b"video")
-        audio.write_bytes(b"audio")
-
-        frame = tmp_path / "frame.png"
-        frame.write_bytes(b"png")
-
-        def mock_brightness(path):
-            if "start" in str(path):
-                return 0.01  # Black
-            return 0.5
+        check = make_check(start=0.01, intervals=[(0.0, 2.0)])
 
         with (
-            patch("scripts.verify_video.get_duration", side_effect=[125.5, 120.5]),
-            patch("scripts.verify_video.extract_frames", return_value=[frame]),
-            patch("scripts.verify_video.get_brightness", side_effect=mock_brightness),
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch("scripts.verify_video.analyze_video", return_value=check),
         ):
             result = verify_video(video, audio)
 
         assert result is False
         captured = capsys.readouterr()
         assert "BLACK" in captured.out
+        assert "0.00s-2.00s" in captured.out
 
     def test_fails_when_end_frames_black(self, tmp_path, capsys):
         """Should fail when end frames are black."""
@@ -269,34 +150,36 @@ class TestVerifyVideo:
 
         video = tmp_path / "test.mp4"
         audio = tmp_path / "test.m4a"
-        video.write_bytes(b"video")
-        audio.write_bytes(b"audio")
 
-        start_frame = tmp_path / "start_00.png"
-        end_frame = tmp_path / "end_00.png"
-        start_frame.write_bytes(b"png")
-        end_frame.write_bytes(b"png")
+        with (
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch("scripts.verify_video.analyze_video", return_value=make_check(end=0.01)),
+        ):
+            result = verify_video(video, audio)
+
+        assert result is False
+        captured = capsys.readouterr()
+        assert "BLACK" in captured.out
+        assert "last-slide.png" in captured.out
 
-        def mock_extract(_video, _output_dir, start, _count=3):
-            if start:
-                return [start_frame]
-            return [end_frame]
+    def test_fails_when_analysis_errors(self, tmp_path, capsys):
+        """Should fail when ffmpeg analysis fails."""
+        from scripts.verify_video import verify_video
 
-        def mock_brightness(path):
-            if "end" in path.name:
-                return 0.01  # Black end frame
-            return 0.5
+        video = tmp_path / "test.mp4"
+        audio = tmp_path / "test.m4a"
 
         with (
-            patch("scripts.verify_video.get_duration", side_effect=[125.5, 120.5]),
-            patch("scripts.verify_video.extract_frames", side_effect=mock_extract),
-            patch("scripts.verify_video.get_brightness", side_effect=mock_brightness),
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch(
+                "scripts.verify_video.analyze_video",
+                side_effect=RuntimeError("ffmpeg verification failed: boom"),
+            ),
         ):
             result = verify_video(video, audio)
 
         assert result is False
-        captured = capsys.readouterr()
-        assert "BLACK" in captured.out
+        assert "ffmpeg verification failed" in capsys.readouterr().out
 
     def test_provides_fix_suggestions(self, tmp_path, capsys):
         """Should provide suggestions when verification fails."""
@@ -304,16 +187,11 @@ class TestVerifyVideo:
 
         video = tmp_path / "test.mp4"
         audio = tmp_path / "test.m4a"
-        video.write_bytes(b"video")
-        audio.write_bytes(b"audio")
-
-        frame = tmp_path / "frame.png"
-        frame.write_bytes(b"png")
+        check = make_check(duration=100.0, start=0.01)
 
         with (
-            patch("scripts.verify_video.get_duration", side_effect=[100.0, 120.5]),  # Wrong
-            patch("scripts.verify_video.extract_frames", return_value=[frame]),
-            patch("scripts.verify_video.get_brightness", return_value=0.01),  # Black
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch("scripts.verify_video.analyze_video", return_value=check),
         ):
             verify_video(video, audio)
 
@@ -327,17 +205,11 @@ class TestVerifyVideo:
 
         video = tmp_path / "test.mp4"
         audio = tmp_path / "test.m4a"
-        video.write_bytes(b"video")
-        audio.write_bytes(b"audio")
-
-        frame = tmp_path / "frame.png"
-        frame.write_bytes(b"png")
 
         # Expected: 120.5 + 5 = 125.5, actual: 125.8 (within 0.5s)
         with (
-            patch("scripts.verify_video.get_duration", side_effect=[125.8, 120.5]),
-            patch("scripts.verify_video.extract_frames", return_value=[frame]),
-            patch("scripts.verify_video.get_brightness", return_value=0.5),
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch("scripts.verify_video.analyze_video", return_value=make_check(duration=125.8)),
         ):
             result = verify_video(video, audio)
 
@@ -443,17 +315,11 @@ class TestBrightnessThreshold:
 
         video = tmp_path / "test.mp4"
         audio = tmp_path / "test.m4a"
-        video.write_bytes(b"video")
-        audio.write_bytes(b"audio")
-
-        frame = tmp_path / "frame.png"
-        frame.write_bytes(b"png")
 
         # 0.049 should be black, 0.051 should not
         with (
-            patch("scripts.verify_video.get_duration", side_effect=[125.5, 120.5]),
-            patch("scripts.verify_video.extract_frames", return_value=[frame]),
-            patch("scripts.verify_video.get_brightness", return_value=0.049),
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch("scripts.verify_video.analyze_video", return_value=make_check(start=0.049)),
         ):
             result = verify_video(video, audio)
 
@@ -467,16 +333,13 @@ class TestBrightnessThreshold:
 
         video = tmp_path / "test.mp4"
         audio = tmp_path / "test.m4a"
-        video.write_bytes(b"video")
-        audio.write_bytes(b"audio")
-
-        frame = tmp_path / "frame.png"
-        frame.write_bytes(b"png")
 
         with (
-            patch("scripts.verify_video.get_duration", side_effect=[125.5, 120.5]),
-            patch("scripts.verify_video.extract_frames", return_value=[frame]),
-            patch("scripts.verify_video.get_brightness", return_value=0.051),
+            patch("scripts.verify_video.get_duration", return_value=120.5),
+            patch(
+                "scripts.verify_video.analyze_video",
+                return_value=make_check(start=0.051, end=0.051),
+            ),
         ):
             result = verify_video(video, audio)
 
@@ -1,10 +1,41 @@
 #!/usr/bin/env python3
-"""Parallel transcription script for NotebookLM podcasts using Whisper."""
+"""Parallel transcription script for NotebookLM podcasts using Whisper.
 
+Files are transcribed by long-lived worker processes that each load the
+model once, instead of one `whisper` CLI process per file reloading it
+every time. Each worker holds its own copy of the model, so the worker
+count is capped by available memory.
+
+Backends (--backend) produce the same JSON as `whisper --output_format
+json`: openai-whisper (PyTorch, fp32) or faster-whisper (CTranslate2 with
+int8 weights, skipping silence with its VAD filter).
+
+When there are fewer files than workers, long files are split at silences
+into overlapping chunks that are transcribed in parallel and stitched back
+together, so one urgent episode uses every worker instead of one.
+
+Each transcript records the SHA-256 of its audio and the backend, model and
+language that produced it under "source". A file is transcribed again
+exactly when one of those changed, or when its transcript is unreadable.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from importlib.util import find_spec
+from itertools import pairwise
 from pathlib import Path
 
 from status_utils import sort_by_episode, update_episode_status
@@ -12,42 +43,540 @@ from status_utils import sort_by_episode, update_episode_status
 SCRIPT_DIR = Path(__file__).parent.parent
 AUDIO_DIR = SCRIPT_DIR / "youtube/pl/audio"
 OUTPUT_DIR = SCRIPT_DIR / "youtube/pl/transcripts"
+BACKEND = "whisper"
 MODEL = "small"
 LANGUAGE = "pl"
 AUDIO_EXTENSIONS = {".m4a", ".mp3", ".wav"}
 
+# Approximate resident memory of one fp32 model loaded on CPU, per worker
+MODEL_MEMORY = {
+    "tiny": 500_000_000,
+    "base": 700_000_000,
+    "small": 1_500_000_000,
+    "medium": 3_500_000_000,
+    "large": 7_000_000_000,
+    "turbo": 4_000_000_000,
+}
+# Jobs handed to the pool per worker, so a worker never waits for the next file
+JOBS_PER_WORKER = 2
+EVENT_POLL_SECONDS = 0.5
+# Workers report progress of backends that stream segments in these steps
+PROGRESS_STEP = 25
+
+# Long files are cut about every CHUNK_SECONDS, at the silence nearest to
+# the target within CUT_WINDOW of it; chunks overlap by CHUNK_OVERLAP
+CHUNK_SECONDS = 300
+CUT_WINDOW = 0.25
+CHUNK_OVERLAP = 2.0
+SILENCE_NOISE = "-35dB"
+SILENCE_MIN_SECONDS = 0.4
+SILENCE_START = re.compile(r"silence_start: (-?[\d.]+)")
+SILENCE_END = re.compile(r"silence_end: ([\d.]+)")
+DURATION = re.compile(r"Duration: (\d+):(\d+):([\d.]+)")
+# Whisper's seek is in mel frames, 100 per second
+FRAMES_PER_SECOND = 100
+
+# Transcript key recording the audio and settings a transcript was made from
+SOURCE_KEY = "source"
+SOURCE_PARAMS = ("backend", "model", "language")
+
+# State of a worker process, set once by _init_worker
+_worker: dict = {}
+
+
+def available_memory() -> int | None:
+    """MemAvailable in bytes, or None where /proc/meminfo does not exist."""
+    try:
+        meminfo = Path("/proc/meminfo").read_text()
+    except OSError:
+        return None
+    if match := re.search(r"^MemAvailable:\s+(\d+) kB", meminfo, re.MULTILINE):
+        return int(match.group(1)) * 1024
+    return None
+
+
+class WhisperBackend:
+    """openai-whisper on PyTorch, fp32 on CPU."""
+
+    module = "whisper"
+    package = "openai-whisper"
+    memory_factor = 1.0
+
+    def __init__(self, model: str, language: str, threads: int | None = None):
+        import torch
+        import whisper
+
+        if threads:
+            torch.set_num_threads(threads)
+        self.model = whisper.load_model(model, device="cpu")
+        self.language = language
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        progress: Callable[[float], None] | None = None,  # noqa: ARG002
+    ) -> dict:
+        """Transcribe audio_path. progress is not called: whisper does not stream."""
+        return self.model.transcribe(
+            str(audio_path), language=self.language, fp16=False, verbose=None
+        )
+
+
+class FasterWhisperBackend:
+    """faster-whisper: CTranslate2 with int8 weights on CPU and VAD silence skipping."""
+
+    module = "faster_whisper"
+    package = "faster-whisper"
+    memory_factor = 0.4
+
+    def __init__(self, model: str, language: str, threads: int | None = None):
+        from faster_whisper import WhisperModel
+
+        self.model = WhisperModel(
+            model, device="cpu", compute_type="int8", cpu_threads=threads or 0
+        )
+        self.language = language
+
+    def transcribe(self, audio_path: Path, progress: Callable[[float], None] | None = None) -> dict:
+        """Transcribe audio_path, calling progress(fraction done) per segment."""
+        segments, info = self.model.transcribe(
+            str(audio_path), language=self.language, vad_filter=True
+        )
+        result = []
+        for segment in segments:
+            result.append(
+                {
+                    "id": segment.id,
+                    "seek": segment.seek,
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text,
+                    "tokens": segment.tokens,
+                    "temperature": segment.temperature,
+                    "avg_logprob": segment.avg_logprob,
+                    "compression_ratio": segment.compression_ratio,
+                    "no_speech_prob": segment.no_speech_prob,
+                }
+            )
+            if progress and info.duration:
+                progress(segment.end / info.duration)
+        text = "".join(segment["text"] for segment in result)
+        return {"text": text, "segments": result, "language": info.language}
+
+
+BACKENDS = {"whisper": WhisperBackend, "faster-whisper": FasterWhisperBackend}
+
+
+def model_memory(backend: str, model: str) -> int:
+    """Estimated memory one worker needs for model on backend."""
+    fp32 = MODEL_MEMORY.get(model, MODEL_MEMORY["large"])
+    return int(fp32 * BACKENDS[backend].memory_factor)
 
-def transcribe_file(audio_path: Path) -> tuple[Path, bool, str]:
-    """Transcribe single audio file with whisper.
 
-    Returns tuple of (path, success, message).
+def plan_workers(requested: int, backend: str = BACKEND, model: str = MODEL) -> int:
+    """Number of workers whose models fit in available memory (at least one)."""
+    available = available_memory()
+    if available is None:
+        return requested
+    return max(1, min(requested, available // model_memory(backend, model)))
+
+
+def write_transcript(result: dict, output_file: Path, source: dict | None = None) -> None:
+    """Write a transcription result as `whisper --output_format json` does.
+
+    The file is replaced atomically, so an interrupted run never leaves a
+    truncated transcript behind.
     """
-    output_file = OUTPUT_DIR / f"{audio_path.stem}.json"
+    if source is not None:
+        result = {**result, SOURCE_KEY: source}
+    tmp = output_file.with_name(output_file.name + ".tmp")
+    tmp.write_text(json.dumps(result), encoding="utf-8")
+    tmp.replace(output_file)
+
+
+def file_sha256(path: Path) -> str:
+    """Return SHA-256 hex digest of file contents."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
-    if output_file.exists():
-        return audio_path, True, "skipped (exists)"
+def audio_source(
+    audio_path: Path,
+    backend: str = BACKEND,
+    model: str = MODEL,
+    language: str = LANGUAGE,
+    sha256: str | None = None,
+) -> dict:
+    """What a transcript of audio_path made with these settings depends on."""
+    stat = audio_path.stat()
+    return {
+        "audio": audio_path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256 or file_sha256(audio_path),
+        "backend": backend,
+        "model": model,
+        "language": language,
+    }
 
-    print(f"🔄 Transcribing: {audio_path.stem}")
+
+def check_transcript(
+    audio_path: Path,
+    output_file: Path,
+    backend: str = BACKEND,
+    model: str = MODEL,
+    language: str = LANGUAGE,
+) -> tuple[str | None, dict]:
+    """(Why output_file must be written, or None if it is current; source of audio_path).
+
+    The audio is hashed only when its size or mtime differ from the recorded
+    ones. Transcripts from before sources were recorded are taken to be made
+    from the current audio with the defaults of the time, and are stamped.
+    """
     try:
-        subprocess.run(
-            [
-                "whisper",
-                str(audio_path),
-                "--model",
-                MODEL,
-                "--language",
-                LANGUAGE,
-                "--output_format",
-                "json",
-                "--output_dir",
-                str(OUTPUT_DIR),
-            ],
-            check=True,
-            capture_output=True,
+        transcript = json.loads(output_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return "new", audio_source(audio_path, backend, model, language)
+    except (OSError, ValueError):
+        transcript = None
+    if not isinstance(transcript, dict) or not isinstance(transcript.get("segments"), list):
+        return "unreadable transcript", audio_source(audio_path, backend, model, language)
+
+    recorded = transcript.get(SOURCE_KEY) or {
+        "backend": BACKEND,
+        "model": MODEL,
+        "language": LANGUAGE,
+    }
+    stat = audio_path.stat()
+    unchanged = (recorded.get("size"), recorded.get("mtime_ns")) == (
+        stat.st_size,
+        stat.st_mtime_ns,
+    )
+    sha = recorded.get("sha256") if unchanged else None
+    source = audio_source(audio_path, backend, model, language, sha)
+    if recorded.get("sha256", source["sha256"]) != source["sha256"]:
+        return "audio changed", source
+    if any(recorded.get(param) != source[param] for param in SOURCE_PARAMS):
+        made_with = " ".join(str(recorded.get(param)) for param in SOURCE_PARAMS)
+        return f"made with {made_with}", source
+    if recorded != source:
+        # Legacy transcript, or audio touched without changing: record it
+        write_transcript(transcript, output_file, source)
+    return None, source
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """Part of a file to transcribe: [start, end] cut out, [keep_start, keep_end] kept.
+
+    The cut range is the kept range widened by the overlap, so words at a
+    boundary are heard in full by both neighbouring chunks.
+    """
+
+    start: float
+    end: float
+    keep_start: float
+    keep_end: float
+
+
+def detect_silences(audio_path: Path) -> tuple[float, list[tuple[float, float]]]:
+    """(duration, [(silence start, silence end)]) from ffmpeg's silencedetect filter."""
+    result = subprocess.run(
+        [
+            "ffmpeg",
+            "-hide_banner",
+            "-nostats",
+            "-i",
+            str(audio_path),
+            "-af",
+            f"silencedetect=noise={SILENCE_NOISE}:d={SILENCE_MIN_SECONDS}",
+            "-f",
+            "null",
+            "-",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    match = DURATION.search(result.stderr)
+    if not match:
+        raise ValueError(f"No duration reported for {audio_path.name}")
+    hours, minutes, seconds = match.groups()
+    duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    starts = [max(0.0, float(t)) for t in SILENCE_START.findall(result.stderr)]
+    ends = [float(t) for t in SILENCE_END.findall(result.stderr)]
+    # A file ending in silence has a start without an end
+    ends += [duration] * (len(starts) - len(ends))
+    return duration, list(zip(starts, ends, strict=True))
+
+
+def plan_chunks(
+    duration: float,
+    silences: list[tuple[float, float]],
+    chunk_seconds: float = CHUNK_SECONDS,
+    overlap: float = CHUNK_OVERLAP,
+) -> list[Chunk]:
+    """Split [0, duration] about every chunk_seconds, cutting in the middle of silences.
+
+    Where no silence is near a target cut, the cut falls on the target. The
+    last chunk is between 0.5 and 1.5 chunk_seconds long.
+    """
+    middles = [(start + end) / 2 for start, end in silences]
+    window = chunk_seconds * CUT_WINDOW
+    cuts = [0.0]
+    while duration - cuts[-1] > chunk_seconds * 1.5:
+        target = cuts[-1] + chunk_seconds
+        near = [m for m in middles if abs(m - target) <= window]
+        cuts.append(min(near, key=lambda m: abs(m - target)) if near else target)
+    cuts.append(duration)
+    return [
+        Chunk(max(0.0, start - overlap), min(duration, end + overlap), start, end)
+        for start, end in pairwise(cuts)
+    ]
+
+
+def split_at_silence(audio_path: Path, chunk_seconds: float = CHUNK_SECONDS) -> list[Chunk]:
+    """Chunks of a file long enough to split, or [] to transcribe it whole."""
+    try:
+        duration, silences = detect_silences(audio_path)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return []
+    chunks = plan_chunks(duration, silences, chunk_seconds)
+    return chunks if len(chunks) > 1 else []
+
+
+def extract_chunk(audio_path: Path, chunk: Chunk, output: Path) -> Path:
+    """Cut a chunk out of audio_path as 16 kHz mono WAV, what Whisper decodes to."""
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-ss",
+            f"{chunk.start:.3f}",
+            "-i",
+            str(audio_path),
+            "-t",
+            f"{chunk.end - chunk.start:.3f}",
+            "-ar",
+            "16000",
+            "-ac",
+            "1",
+            str(output),
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return output
+
+
+def stitch_chunks(parts: list[tuple[Chunk, dict]]) -> dict:
+    """Join chunk results into one transcript with timestamps of the whole file.
+
+    A segment belongs to the chunk whose kept range holds its midpoint, so a
+    segment heard twice in an overlap is kept once; a segment repeating the
+    text of the one before it across a cut is dropped as well.
+    """
+    segments: list[dict] = []
+    last = len(parts) - 1
+    for index, (chunk, result) in enumerate(parts):
+        offset = chunk.start
+        for segment in result.get("segments", []):
+            start, end = segment["start"] + offset, segment["end"] + offset
+            middle = (start + end) / 2
+            if middle < chunk.keep_start or (middle >= chunk.keep_end and index < last):
+                continue
+            if (
+                segments
+                and start < segments[-1]["end"]
+                and segment["text"].strip() == segments[-1]["text"].strip()
+            ):
+                continue
+            shifted = {
+                **segment,
+                "id": len(segments),
+                "seek": segment.get("seek", 0) + round(offset * FRAMES_PER_SECOND),
+                "start": start,
+                "end": end,
+            }
+            if "words" in segment:
+                shifted["words"] = [
+                    {**word, "start": word["start"] + offset, "end": word["end"] + offset}
+                    for word in segment["words"]
+                ]
+            segments.append(shifted)
+    return {
+        "text": "".join(segment["text"] for segment in segments),
+        "segments": segments,
+        "language": parts[0][1].get("language") if parts else None,
+    }
+
+
+def _init_worker(
+    backend: str, model: str, language: str, threads: int, events: multiprocessing.Queue
+) -> None:
+    """Load the model once when a worker process starts."""
+    start = time.perf_counter()
+    _worker["backend"] = BACKENDS[backend](model, language, threads)
+    _worker["events"] = events
+    events.put((os.getpid(), f"loaded {backend} {model} in {time.perf_counter() - start:.1f}s"))
+
+
+def _transcribe_job(audio_path: Path, chunk: Chunk | None, label: str) -> dict:
+    """Transcribe a file, or one chunk of it, in a worker.
+
+    Chunk timestamps are relative to the chunk; stitch_chunks shifts them.
+    """
+    events = _worker["events"]
+    events.put((os.getpid(), f"transcribing {label}"))
+    reported = [0]
+
+    def progress(fraction: float) -> None:
+        percent = int(fraction * 100) // PROGRESS_STEP * PROGRESS_STEP
+        if PROGRESS_STEP <= percent < 100 and percent > reported[0]:
+            reported[0] = percent
+            events.put((os.getpid(), f"{label} {percent}%"))
+
+    if chunk is None:
+        return _worker["backend"].transcribe(audio_path, progress)
+    with tempfile.TemporaryDirectory(prefix="transcribe-chunk-") as tmp:
+        clip = extract_chunk(audio_path, chunk, Path(tmp) / "chunk.wav")
+        return _worker["backend"].transcribe(clip, progress)
+
+
+class TranscriptionPool:
+    """Worker processes that each keep a loaded model for their whole lifetime.
+
+    Workers are started with the spawn method (forking a process that may
+    already hold model threads is unsafe) and report progress through a
+    queue that run() prints while waiting for results.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        backend: str = BACKEND,
+        model: str = MODEL,
+        language: str = LANGUAGE,
+    ):
+        backend_class = BACKENDS[backend]
+        if find_spec(backend_class.module) is None:
+            package = backend_class.package
+            raise ImportError(f"{package} is not installed (pip install {package})")
+        context = multiprocessing.get_context("spawn")
+        # Split the cores between workers instead of each using all of them
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        self.workers = workers
+        self.events = context.Queue()
+        self.executor = ProcessPoolExecutor(
+            workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(backend, model, language, threads, self.events),
         )
-        return audio_path, True, "done"
-    except subprocess.CalledProcessError as e:
-        return audio_path, False, f"failed: {e.stderr.decode()[:100]}"
+
+    def __enter__(self) -> "TranscriptionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        self._print_events()
+
+    def _print_events(self) -> None:
+        while True:
+            try:
+                pid, message = self.events.get_nowait()
+            except queue.Empty:
+                return
+            print(f"   🧠 [worker {pid}] {message}")
+
+    def run(
+        self,
+        jobs: list[tuple[Path, Path]],
+        chunks: dict[Path, list[Chunk]] | None = None,
+        sources: dict[Path, dict] | None = None,
+    ) -> Iterator[tuple[Path, bool, str]]:
+        """Transcribe (audio, output) jobs, yielding (audio, success, message) as each ends.
+
+        Files with an entry in chunks are transcribed chunk by chunk, spread
+        over the workers, and written once the last chunk is done. Entries
+        in sources are recorded in the transcripts (see audio_source).
+        """
+        chunks = chunks or {}
+        sources = sources or {}
+        pending = iter(jobs)
+        queued: deque[tuple[Path, int]] = deque()
+        files: dict[Path, dict] = {}
+        running: dict[Future, tuple[Path, int]] = {}
+
+        def submit_more() -> None:
+            while len(running) < self.workers * JOBS_PER_WORKER:
+                if not queued:
+                    job = next(pending, None)
+                    if job is None:
+                        return
+                    audio_path, output_file = job
+                    parts = chunks.get(audio_path) or [None]
+                    files[audio_path] = {
+                        "output": output_file,
+                        "parts": parts,
+                        "results": {},
+                        "start": time.perf_counter(),
+                    }
+                    queued.extend((audio_path, i) for i in range(len(parts)))
+                audio_path, i = queued.popleft()
+                if audio_path not in files:
+                    continue  # another chunk of this file failed
+                parts = files[audio_path]["parts"]
+                label = audio_path.stem
+                if len(parts) > 1:
+                    label += f" [{i + 1}/{len(parts)}]"
+                future = self.executor.submit(_transcribe_job, audio_path, parts[i], label)
+                running[future] = (audio_path, i)
+
+        submit_more()
+        while running:
+            done, _ = wait(running, timeout=EVENT_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            self._print_events()
+            for future in done:
+                audio_path, i = running.pop(future)
+                state = files.get(audio_path)
+                if state is None:
+                    continue
+                try:
+                    state["results"][i] = future.result()
+                except Exception as e:
+                    del files[audio_path]
+                    yield audio_path, False, f"failed: {str(e)[:100]}"
+                    continue
+                parts = state["parts"]
+                if len(state["results"]) < len(parts):
+                    continue
+                del files[audio_path]
+                if len(parts) == 1:
+                    result = state["results"][0]
+                else:
+                    result = stitch_chunks(
+                        [(chunk, state["results"][n]) for n, chunk in enumerate(parts)]
+                    )
+                write_transcript(result, state["output"], sources.get(audio_path))
+                segments = result.get("segments", [])
+                duration = segments[-1]["end"] if segments else 0.0
+                elapsed = time.perf_counter() - state["start"]
+                message = f"{duration / 60:.1f} min audio in {elapsed:.0f}s"
+                if len(parts) > 1:
+                    message += f", {len(parts)} chunks"
+                yield audio_path, True, message
+            submit_more()
+
+
+def transcript_path(audio_path: Path) -> Path:
+    """Transcript JSON written for an audio file."""
+    return OUTPUT_DIR / f"{audio_path.stem}.json"
 
 
 def find_audio_files() -> list[Path]:
@@ -60,7 +589,35 @@ def find_audio_files() -> list[Path]:
 
 def main() -> int:
     """Run parallel transcription."""
-    parallel_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    parser = argparse.ArgumentParser(
+        description="Transcribe NotebookLM podcasts with Whisper",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                   # 3 workers, openai-whisper small
+  %(prog)s 4 --backend faster-whisper        # int8 CTranslate2 with VAD
+  %(prog)s --backend faster-whisper --model medium
+        """,
+    )
+    parser.add_argument(
+        "jobs", nargs="?", type=int, default=3, help="Parallel workers (default: 3)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default=BACKEND,
+        help=f"Transcription backend (default: {BACKEND})",
+    )
+    parser.add_argument("--model", default=MODEL, help=f"Whisper model size (default: {MODEL})")
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=CHUNK_SECONDS,
+        help="Split long files into chunks of about this length when there are "
+        f"fewer files than workers, 0 to never split (default: {CHUNK_SECONDS})",
+    )
+    args = parser.parse_args()
+    parallel_jobs = args.jobs
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -68,7 +625,8 @@ def main() -> int:
     print("=" * 24)
     print(f"Audio dir: {AUDIO_DIR}")
     print(f"Output dir: {OUTPUT_DIR}")
-    print(f"Model: {MODEL}")
+    print(f"Backend: {args.backend}")
+    print(f"Model: {args.model}")
     print(f"Language: {LANGUAGE}")
     print(f"Parallel jobs: {parallel_jobs}")
     print()
@@ -81,25 +639,56 @@ def main() -> int:
         print("No audio files to process")
         return 0
 
-    failed = []
+    jobs = []
+    sources = {}
+    for audio_path in audio_files:
+        output_file = transcript_path(audio_path)
+        reason, source = check_transcript(
+            audio_path, output_file, args.backend, args.model, LANGUAGE
+        )
+        if reason is None:
+            print(f"⏭️  Skip: {audio_path.stem}")
+            continue
+        if reason != "new":
+            print(f"🔁 Redo: {audio_path.stem} ({reason})")
+        jobs.append((audio_path, output_file))
+        sources[audio_path] = source
+
+    if not jobs:
+        print()
+        print("🎉 All transcriptions complete!")
+        return 0
 
-    with ThreadPoolExecutor(max_workers=parallel_jobs) as executor:
-        futures = {executor.submit(transcribe_file, f): f for f in audio_files}
-
-        for future in as_completed(futures):
-            path, success, msg = future.result()
-            name = path.stem
-
-            if msg == "skipped (exists)":
-                print(f"⏭️  Skip: {name}")
-            elif success:
-                print(f"✅ Done: {name}")
-                match = re.match(r"^(\d+)-", name)
-                if match:
-                    update_episode_status(match.group(1), "transcript", True)
-            else:
-                print(f"❌ Failed: {name} - {msg}")
-                failed.append(path)
+    # With workers to spare, split long files so they are transcribed in parallel
+    chunks = {}
+    if args.chunk_seconds and len(jobs) < parallel_jobs:
+        for audio_path, _ in jobs:
+            if planned := split_at_silence(audio_path, args.chunk_seconds):
+                chunks[audio_path] = planned
+                print(f"✂️  {audio_path.stem}: {len(planned)} chunks split at silences")
+    tasks = len(jobs) + sum(len(planned) - 1 for planned in chunks.values())
+
+    workers = min(plan_workers(parallel_jobs, args.backend, args.model), tasks)
+    if workers < min(parallel_jobs, tasks):
+        print(f"⚠️  Using {workers} worker(s): not enough free memory for more {args.model} models")
+    print(f"🔄 Transcribing {len(jobs)} file(s) with {workers} worker(s)...")
+
+    failed = []
+    try:
+        with TranscriptionPool(workers, args.backend, args.model) as pool:
+            for done, (path, success, msg) in enumerate(pool.run(jobs, chunks, sources), 1):
+                name = path.stem
+                if success:
+                    print(f"✅ [{done}/{len(jobs)}] Done: {name} ({msg})")
+                    match = re.match(r"^(\d+)-", name)
+                    if match:
+                        update_episode_status(match.group(1), "transcript", True)
+                else:
+                    print(f"❌ [{done}/{len(jobs)}] Failed: {name} - {msg}")
+                    failed.append(path)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 1
 
     print()
     if failed:
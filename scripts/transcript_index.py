@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""On-disk inverted index of transcript segments, for cross-episode search.
+
+The index is an SQLite file next to the transcripts. For every word it stores,
+per transcript, the indices of the segments containing it; segment start
+times and text are kept alongside so hits need no JSON parsing. Each
+transcript's size and mtime are recorded, so refresh() re-reads only new or
+changed transcripts and drops deleted ones.
+
+Queries rank segments by how many of the query words they contain, then by
+BM25 (without length normalization; Whisper segments are similar in size).
+Query words of PREFIX_MIN characters or more also match longer words, which
+covers Polish inflection ("paxos" finds "Paxosa", "Paxosem").
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import sqlite3
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from transcript_reader import Segment, iter_segments
+
+SCRIPT_DIR = Path(__file__).parent.parent
+TRANSCRIPTS_DIR = SCRIPT_DIR / "youtube/pl/transcripts"
+ARCHIVE_TRANSCRIPTS_DIR = SCRIPT_DIR / "archive/pl/transcripts"
+INDEX_FILE = SCRIPT_DIR / "youtube/pl/.transcript-index.db"
+INDEX_VERSION = 1
+
+TERM = re.compile(r"\w{2,}")
+PREFIX_MIN = 4
+SEARCH_LIMIT = 20
+BM25_K1 = 1.2
+# Words in more segments than this only rescore hits of rarer query words
+COMMON_FRACTION = 0.05
+UINT_SIZE = array("I").itemsize
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    file INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    start REAL NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (file, idx)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    file INTEGER NOT NULL,
+    segments BLOB NOT NULL,
+    PRIMARY KEY (term, file)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_file ON postings (file);
+"""
+
+
+@dataclass
+class Hit:
+    """A segment matching a query."""
+
+    episode: str
+    segment: int
+    start: float
+    text: str
+    score: float
+    matched: int
+
+
+def terms(text: str) -> list[str]:
+    """Lowercased words of at least two characters."""
+    return TERM.findall(text.lower())
+
+
+def transcript_files() -> list[Path]:
+    """Current and archived transcripts."""
+    return sorted(TRANSCRIPTS_DIR.glob("*.json")) + sorted(ARCHIVE_TRANSCRIPTS_DIR.glob("*.json"))
+
+
+class TranscriptIndex:
+    """Segments of every indexed transcript, by word."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        # (path, error) of transcripts the last refresh() could not read
+        self.unreadable: list[tuple[Path, str]] = []
+
+    @classmethod
+    def open(cls, path: Path | None = None) -> TranscriptIndex:
+        """Open (or create) the index; one written by another version is rebuilt."""
+        path = path or INDEX_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS segments;"
+                "DROP TABLE IF EXISTS postings;"
+            )
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        conn.executescript(SCHEMA)
+        return cls(conn)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> TranscriptIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def refresh(self, paths: Iterable[Path]) -> tuple[int, int]:
+        """Sync with the transcripts on disk: (transcripts indexed, transcripts dropped).
+
+        Only transcripts whose size or mtime changed are read. Transcripts
+        that cannot be read are left out of the index (so the next refresh
+        tries them again) and listed in self.unreadable.
+        """
+        known = {
+            path: (file_id, size, mtime_ns)
+            for file_id, path, size, mtime_ns in self.conn.execute(
+                "SELECT id, path, size, mtime_ns FROM files"
+            )
+        }
+        indexed = 0
+        self.unreadable = []
+        with self.conn:
+            for path in paths:
+                stat = path.stat()
+                old = known.pop(str(path), None)
+                if old and old[1:] == (stat.st_size, stat.st_mtime_ns):
+                    continue
+                if old:
+                    self._drop(old[0])
+                try:
+                    segments = list(iter_segments(path))
+                except (OSError, ValueError) as e:
+                    self.unreadable.append((path, str(e)))
+                    continue
+                self._add(path, stat.st_size, stat.st_mtime_ns, segments)
+                indexed += 1
+            for file_id, _, _ in known.values():
+                self._drop(file_id)
+        return indexed, len(known)
+
+    def _drop(self, file_id: int) -> None:
+        for table, column in (("postings", "file"), ("segments", "file"), ("files", "id")):
+            self.conn.execute(f"DELETE FROM {table} WHERE {column} = ?", (file_id,))
+
+    def _add(self, path: Path, size: int, mtime_ns: int, segments: list[Segment]) -> None:
+        file_id = self.conn.execute(
+            "INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)",
+            (str(path), size, mtime_ns),
+        ).lastrowid
+        postings: dict[str, array] = defaultdict(lambda: array("I"))
+        rows = []
+        for idx, (start, _, text) in enumerate(segments):
+            text = text.strip()
+            rows.append((file_id, idx, start, text))
+            # A word used twice in a segment is listed twice: its term frequency
+            for term in terms(text):
+                postings[term].append(idx)
+        self.conn.executemany("INSERT INTO segments VALUES (?, ?, ?, ?)", rows)
+        self.conn.executemany(
+            "INSERT INTO postings VALUES (?, ?, ?)",
+            ((term, file_id, indices.tobytes()) for term, indices in postings.items()),
+        )
+
+    def _postings(self, term: str) -> list[tuple[int, bytes]]:
+        """(file, packed segment indices) of term, or of the words it starts."""
+        if len(term) >= PREFIX_MIN:
+            return self.conn.execute(
+                "SELECT file, segments FROM postings WHERE term >= ? AND term < ?",
+                (term, term + "\U0010ffff"),
+            ).fetchall()
+        return self.conn.execute(
+            "SELECT file, segments FROM postings WHERE term = ?", (term,)
+        ).fetchall()
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list[Hit]:
+        """Best segments for query, those containing the most query words first.
+
+        Words are scored rarest first. Once rarer words have matched limit
+        segments, a word in more than COMMON_FRACTION of all segments only
+        adds to segments already found (the rest would rank below them), so
+        "Raft jest" does not score every segment with "jest".
+        """
+        total = self.conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        postings = {term: self._postings(term) for term in dict.fromkeys(terms(query))}
+        occurrences = {
+            term: sum(len(blob) for _, blob in rows) // UINT_SIZE for term, rows in postings.items()
+        }
+        scores: Counter = Counter()
+        matched: Counter = Counter()
+        for term in sorted(postings, key=occurrences.get):
+            df = min(occurrences[term], total)
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            common = len(scores) >= limit and df > COMMON_FRACTION * total
+            found = {file_id for file_id, _ in scores} if common else None
+            # A prefix expands to several words; merge them so the query word counts once
+            frequencies: Counter = Counter()
+            for file_id, blob in postings[term]:
+                if found is not None and file_id not in found:
+                    continue
+                indices = array("I")
+                indices.frombytes(blob)
+                for idx, tf in Counter(indices).items():
+                    key = (file_id, idx)
+                    if not common or key in scores:
+                        frequencies[key] += tf
+            for key, tf in frequencies.items():
+                scores[key] += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1)
+                matched[key] += 1
+
+        best = heapq.nlargest(limit, scores, key=lambda key: (matched[key], scores[key]))
+        hits = []
+        for file_id, idx in best:
+            path, start, text = self.conn.execute(
+                "SELECT path, start, text FROM segments JOIN files ON files.id = file "
+                "WHERE file = ? AND idx = ?",
+                (file_id, idx),
+            ).fetchone()
+            hits.append(
+                Hit(Path(path).stem, idx, start, text, scores[file_id, idx], matched[file_id, idx])
+            )
+        return hits
+
+    def stats(self) -> tuple[int, int, int]:
+        """(transcripts, segments, distinct words) in the index."""
+        return (
+            self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            self.conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0],
+            self.conn.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0],
+        )
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Stream the segments of a Whisper transcript without loading the whole file.
+
+Whisper's JSON keeps the full text, and for every segment its token IDs,
+log probabilities and (with word timestamps) per-word entries. Batch
+analysis only needs each segment's start, end and text, so iter_segments()
+reads the file in CHUNK_SIZE pieces, decodes one segment object at a time
+and yields it as a compact Segment tuple. The top-level "text" string is
+skipped without being decoded, so memory stays flat however long the
+transcript is.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple, TextIO
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+# Contents of a JSON string up to its closing quote
+STRING_BODY = re.compile(r'(?:[^"\\]+|\\.)*', re.DOTALL)
+
+_decoder = json.JSONDecoder()
+
+
+class Segment(NamedTuple):
+    """Start and end in seconds, and the text of one transcript segment."""
+
+    start: float
+    end: float
+    text: str
+
+
+class _JsonStream:
+    """A window over a JSON text file, refilled as values are consumed."""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping what was consumed; False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it ("" at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos : self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in transcript JSON, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number or literal ending the window may continue in the next chunk
+            if end < len(self.buf) or not self._fill():
+                self.pos = end
+                return value
+
+    def skip_string(self) -> None:
+        """Consume a string value without decoding or keeping it."""
+        self.expect('"')
+        while True:
+            # Stops before a backslash ending the window, whose escape is in the next chunk
+            self.pos = STRING_BODY.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) and self.buf[self.pos] == '"':
+                self.pos += 1
+                return
+            if not self._fill():
+                raise ValueError("Unterminated string in transcript JSON")
+
+
+def _segments(stream: _JsonStream) -> Iterator[Segment]:
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.pos += 1
+        return
+    while True:
+        segment = stream.value()
+        yield Segment(
+            float(segment.get("start", 0.0)),
+            float(segment.get("end", 0.0)),
+            segment.get("text", ""),
+        )
+        if stream.expect(",]") == "]":
+            return
+
+
+def iter_segments(path: Path) -> Iterator[Segment]:
+    """Segments of a transcript, read one at a time.
+
+    Raises ValueError if the file is not a JSON object (segments read
+    before the error have already been yielded).
+    """
+    with path.open(encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key == "segments":
+                yield from _segments(stream)
+            elif stream.peek() == '"':
+                stream.skip_string()
+            else:
+                stream.value()
+            if stream.expect(",}") == "}":
+                return
@@ -23,7 +23,7 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from status_utils import update_episode_field, update_episode_status
+from status_utils import status_transaction
 from youtube_config import settings
 
 if TYPE_CHECKING:
@@ -374,8 +374,9 @@ Examples:
     print(f"   Studio: https://studio.youtube.com/video/{video_id}/edit")
     print(f"   Public: {video_url}")
 
-    update_episode_status(ep_num, "uploaded", True)
-    update_episode_field(ep_num, "youtube_url", video_url)
+    with status_transaction() as transaction:
+        transaction.set(ep_num, "uploaded", True)
+        transaction.set(ep_num, "youtube_url", video_url)
 
     return 0
 
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
-"""Verify video has no black frames at start/end and correct duration."""
+"""Verify video has no black frames at start/end and correct duration.
+
+Uses the single-pass ffmpeg check from generate_video (ffprobe for audio +
+one ffmpeg decode of the first/last seconds of the video).
+"""
 
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
+from generate_video import analyze_video, format_black_intervals
+
 
 def run_cmd(cmd: list[str]) -> str:
     """Run command and return stdout."""
@@ -30,47 +35,18 @@ def get_duration(file_path: Path) -> float:
     return float(output)
 
 
-def extract_frames(video: Path, output_dir: Path, start: bool, count: int = 3) -> list[Path]:
-    """Extract frames from start or end of video."""
-    frames = []
-    for i in range(count):
-        frame_path = output_dir / f"{'start' if start else 'end'}_{i:02d}.png"
-        timestamp = str(i) if start else str(get_duration(video) - count + i)
-
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-y",
-                "-v",
-                "error",
-                "-ss",
-                timestamp,
-                "-i",
-                str(video),
-                "-vframes",
-                "1",
-                str(frame_path),
-            ],
-            check=True,
-        )
-        frames.append(frame_path)
-    return frames
-
-
-def get_brightness(image: Path) -> float:
-    """Get average brightness of image (0-1 scale)."""
-    output = run_cmd(
-        ["magick", str(image), "-colorspace", "Gray", "-format", "%[fx:mean]", "info:"]
-    )
-    return float(output)
-
-
 def verify_video(video_path: Path, audio_path: Path) -> bool:
     """Verify video duration and no black frames."""
     print(f"🔍 Verifying: {video_path.name}")
 
-    video_duration = get_duration(video_path)
     audio_duration = get_duration(audio_path)
+    try:
+        check = analyze_video(video_path)
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        return False
+
+    video_duration = check.duration
     expected_duration = audio_duration + 5.0
 
     print(f"   Audio duration: {audio_duration:.2f}s")
@@ -83,31 +59,18 @@ def verify_video(video_path: Path, audio_path: Path) -> bool:
     else:
         print(f"   ❌ Duration mismatch: {video_duration - expected_duration:+.2f}s")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmppath = Path(tmpdir)
-
-        print("   Checking start frames...")
-        start_frames = extract_frames(video_path, tmppath, start=True)
-        start_ok = True
-        for frame in start_frames:
-            brightness = get_brightness(frame)
-            is_black = brightness < 0.05
-            status = "❌ BLACK" if is_black else "✅"
-            print(f"      {frame.name}: brightness={brightness:.3f} {status}")
-            if is_black:
-                start_ok = False
-
-        print("   Checking end frames...")
-        end_frames = extract_frames(video_path, tmppath, start=False)
-        end_ok = True
-        for frame in end_frames:
-            brightness = get_brightness(frame)
-            is_black = brightness < 0.05
-            status = "❌ BLACK" if is_black else "✅"
-            print(f"      {frame.name}: brightness={brightness:.3f} {status}")
-            if is_black:
-                end_ok = False
+    print("   Checking start frames...")
+    status = "✅" if check.start_ok else "❌ BLACK"
+    print(f"      min brightness={check.start_brightness:.3f} {status}")
+
+    print("   Checking end frames...")
+    status = "✅" if check.end_ok else "❌ BLACK"
+    print(f"      min brightness={check.end_brightness:.3f} {status}")
+
+    if check.black_intervals:
+        print(f"   Black intervals: {format_black_intervals(check.black_intervals)}")
 
+    start_ok, end_ok = check.start_ok, check.end_ok
     all_ok = duration_ok and start_ok and end_ok
 
     if all_ok: